@@ -0,0 +1,81 @@
+"""Add client normalized_name with trigram index
+
+Revision ID: 3c7a91d4b2e8
+Revises: f68041ead56e
+Create Date: 2026-10-17 10:12:04.118233
+
+"""
+import re
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '3c7a91d4b2e8'
+down_revision: Union[str, Sequence[str], None] = 'f68041ead56e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+# Frozen copy of models.core.normalize_client_name at this revision
+_WHITESPACE_REGEX = re.compile(r"\s+")
+_NAME_PREFIX_REGEX = re.compile(r"^(mr|mrs|ms|dr|prof)\.?\s*")
+_NAME_SUFFIX_REGEX = re.compile(r"\s*(jr|sr|ii|iii|iv)\.?$")
+
+
+def _normalize_client_name(name: str) -> str:
+    normalized = _WHITESPACE_REGEX.sub(" ", name.lower().strip())
+    normalized = _NAME_PREFIX_REGEX.sub("", normalized)
+    return _NAME_SUFFIX_REGEX.sub("", normalized)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column('clients', sa.Column('normalized_name', sa.String(), nullable=True))
+
+    # Backfill in Python so existing rows match the application's normalization
+    clients = sa.table(
+        'clients',
+        sa.column('id', sa.UUID()),
+        sa.column('name', sa.String()),
+        sa.column('normalized_name', sa.String()),
+    )
+    update = (
+        clients.update()
+        .where(clients.c.id == sa.bindparam('client_id'))
+        .values(normalized_name=sa.bindparam('client_normalized_name'))
+    )
+    bind = op.get_bind()
+    rows = bind.execute(sa.select(clients.c.id, clients.c.name)).all()
+    for start in range(0, len(rows), BACKFILL_BATCH_SIZE):
+        batch = rows[start:start + BACKFILL_BATCH_SIZE]
+        bind.execute(update, [
+            {'client_id': row.id, 'client_normalized_name': _normalize_client_name(row.name)}
+            for row in batch
+        ])
+
+    op.create_index(
+        'idx_clients_org_normalized_name',
+        'clients',
+        ['organization_id', 'normalized_name'],
+        unique=False,
+    )
+    op.create_index(
+        'idx_clients_normalized_name_trgm',
+        'clients',
+        ['normalized_name'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'normalized_name': 'gin_trgm_ops'},
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_clients_normalized_name_trgm', table_name='clients')
+    op.drop_index('idx_clients_org_normalized_name', table_name='clients')
+    op.drop_column('clients', 'normalized_name')
+    # pg_trgm is left installed; other objects may depend on it
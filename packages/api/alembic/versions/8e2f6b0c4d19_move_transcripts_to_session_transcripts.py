@@ -0,0 +1,97 @@
+"""Move transcripts out of session_metadata into session_transcripts
+
+Revision ID: 8e2f6b0c4d19
+Revises: 3c7a91d4b2e8
+Create Date: 2026-10-17 11:40:27.503961
+
+"""
+import hashlib
+import zlib
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '8e2f6b0c4d19'
+down_revision: Union[str, Sequence[str], None] = '3c7a91d4b2e8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 100  # Transcripts can be up to ~1MB each
+
+session_transcripts = sa.table(
+    'session_transcripts',
+    sa.column('session_id', sa.UUID()),
+    sa.column('content', sa.LargeBinary()),
+    sa.column('compression', sa.String()),
+    sa.column('content_hash', sa.String()),
+    sa.column('original_size', sa.Integer()),
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('session_transcripts',
+    sa.Column('session_id', sa.UUID(), nullable=False),
+    sa.Column('content', sa.LargeBinary(), nullable=False),
+    sa.Column('compression', sa.String(), nullable=False),
+    sa.Column('content_hash', sa.String(length=64), nullable=False),
+    sa.Column('original_size', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.ForeignKeyConstraint(['session_id'], ['sessions.id'], ),
+    sa.PrimaryKeyConstraint('session_id')
+    )
+
+    # Copy transcripts out of the JSONB column in keyset-paginated batches
+    bind = op.get_bind()
+    select_batch = sa.text(
+        "SELECT id, session_metadata->>'transcript_text' AS transcript_text "
+        "FROM sessions "
+        "WHERE session_metadata ? 'transcript_text' AND id > :last_id "
+        "ORDER BY id LIMIT :batch_size"
+    )
+    last_id = '00000000-0000-0000-0000-000000000000'
+    while True:
+        rows = bind.execute(
+            select_batch, {'last_id': last_id, 'batch_size': BACKFILL_BATCH_SIZE}
+        ).all()
+        if not rows:
+            break
+        transcripts = []
+        for row in rows:
+            raw = (row.transcript_text or '').encode('utf-8')
+            transcripts.append({
+                'session_id': row.id,
+                'content': zlib.compress(raw, 6),
+                'compression': 'zlib',
+                'content_hash': hashlib.sha256(raw).hexdigest(),
+                'original_size': len(raw),
+            })
+        bind.execute(session_transcripts.insert(), transcripts)
+        last_id = rows[-1].id
+
+    op.execute(
+        "UPDATE sessions SET session_metadata = session_metadata - 'transcript_text' "
+        "WHERE session_metadata ? 'transcript_text'"
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    bind = op.get_bind()
+    restore = sa.text(
+        "UPDATE sessions SET session_metadata = "
+        "COALESCE(session_metadata, '{}'::jsonb) || jsonb_build_object('transcript_text', CAST(:text AS text)) "
+        "WHERE id = :session_id"
+    )
+    rows = bind.execute(
+        sa.select(session_transcripts.c.session_id, session_transcripts.c.content)
+    )
+    for row in rows.yield_per(BACKFILL_BATCH_SIZE):
+        bind.execute(restore, {
+            'session_id': row.session_id,
+            'text': zlib.decompress(row.content).decode('utf-8'),
+        })
+
+    op.drop_table('session_transcripts')
@@ -0,0 +1,28 @@
+"""Add segment index to session transcripts
+
+Revision ID: 9d3b7c5e1a42
+Revises: c4e8a2f61d07
+Create Date: 2026-10-17 18:05:12.847210
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '9d3b7c5e1a42'
+down_revision: Union[str, Sequence[str], None] = 'c4e8a2f61d07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing transcripts have no timing data; NULL means "no index"
+    op.add_column('session_transcripts', sa.Column('segment_index', sa.LargeBinary(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('session_transcripts', 'segment_index')
@@ -0,0 +1,34 @@
+"""Add transcript hash and idempotency key to sessions for upload deduplication
+
+Revision ID: c4e8a2f61d07
+Revises: 5b1d9e7a3f20
+Create Date: 2026-10-17 16:42:37.504116
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e8a2f61d07'
+down_revision: Union[str, Sequence[str], None] = '5b1d9e7a3f20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Existing sessions keep a NULL hash; NULLs never conflict in the unique indexes
+    op.add_column('sessions', sa.Column('transcript_hash', sa.String(length=64), nullable=True))
+    op.add_column('sessions', sa.Column('idempotency_key', sa.String(length=255), nullable=True))
+    op.create_index('idx_sessions_coach_transcript_hash', 'sessions', ['coach_id', 'transcript_hash'], unique=True)
+    op.create_index('idx_sessions_coach_idempotency_key', 'sessions', ['coach_id', 'idempotency_key'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_sessions_coach_idempotency_key', table_name='sessions')
+    op.drop_index('idx_sessions_coach_transcript_hash', table_name='sessions')
+    op.drop_column('sessions', 'idempotency_key')
+    op.drop_column('sessions', 'transcript_hash')
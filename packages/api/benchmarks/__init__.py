@@ -0,0 +1,5 @@
+"""
+Micro-benchmarks for the API hot paths.
+
+Run from packages/api, e.g. ``python -m benchmarks.bench_docx_extraction``.
+"""
@@ -0,0 +1,113 @@
+"""
+Benchmark batch ingestion: archive streaming and parsing of a 1,000-file zip.
+
+Parses one synthetic archive with the parse pool disabled (every file decoded
+inline on the event loop, as a loop of single uploads would) and with process
+pools of increasing size, and reports files/sec for each.
+
+Usage (from packages/api, with DATABASE_URL set as for any entry point):
+    python -m benchmarks.bench_batch_ingestion --files 1000 --workers 0 2 4
+
+The database stage is not measured here; run bench_load-style against a live
+server to include it.
+"""
+
+import argparse
+import asyncio
+import io
+import random
+import time
+import zipfile
+from datetime import date
+from unittest.mock import patch
+
+from fastapi import UploadFile
+
+from src.services import batch_ingestion
+from src.services.executor import WorkloadExecutor
+
+FIRST_NAMES = ["Alex", "Priya", "Sam", "Jordan", "Maria", "Chen", "Omar", "Lena"]
+LAST_NAMES = ["Johnson", "Patel", "Lee", "Garcia", "Nguyen", "Haddad", "Smith"]
+SENTENCES = [
+    "I've been working on the goals we set last week.",
+    "That's a great insight, can you say more about it?",
+    "Honestly, the deadlines made it hard to focus.",
+    "Let's capture that as an action item for Friday.",
+]
+
+
+def build_archive(files: int, size_kb: int) -> bytes:
+    """Zip of ``files`` transcripts of roughly ``size_kb`` each."""
+    rng = random.Random(42)
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for n in range(files):
+            speakers = ["Coach Maria"] + [
+                f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}" for _ in range(3)
+            ]
+            lines, size = [], 0
+            while size < size_kb * 1024:
+                line = f"{rng.choice(speakers)}: {' '.join(rng.sample(SENTENCES, 2))}\n"
+                lines.append(line)
+                size += len(line)
+            day = 1 + n % 28
+            archive.writestr(f"sessions/2024-01-{day:02d}-session-{n}.txt", "".join(lines))
+    return buffer.getvalue()
+
+
+async def parse_archive(archive: bytes, concurrency: int) -> list:
+    upload = UploadFile(file=io.BytesIO(archive), filename="batch.zip")
+    return await batch_ingestion.parse_batch(
+        [upload],
+        default_session_date=date(2024, 1, 1),
+        concurrency=concurrency,
+        max_files=10 ** 6,
+    )
+
+
+def measure(archive: bytes, files: int, workers: int, concurrency: int, repeat: int) -> None:
+    executor = WorkloadExecutor(
+        parse_workers=workers, db_workers=1, max_queue_depth=concurrency
+    )
+    loop = asyncio.new_event_loop()
+    best = float("inf")
+    try:
+        with patch.object(batch_ingestion, "workload_executor", executor):
+            # Warm-up spawns the worker processes outside the timed runs
+            loop.run_until_complete(parse_archive(archive, concurrency))
+            for _ in range(repeat):
+                start = time.perf_counter()
+                results = loop.run_until_complete(parse_archive(archive, concurrency))
+                best = min(best, time.perf_counter() - start)
+    finally:
+        executor.shutdown()
+        loop.close()
+
+    failed = sum(1 for result in results if result.error)
+    label = "inline" if workers <= 0 else f"{workers} workers"
+    print(
+        f"{label:<12} best {best * 1000:8.1f} ms   {files / best:8.1f} files/s"
+        f"   failed {failed}"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--files", type=int, default=1000)
+    parser.add_argument("--size-kb", type=int, default=8)
+    parser.add_argument("--workers", type=int, nargs="+", default=[0, 2, 4])
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    archive = build_archive(args.files, args.size_kb)
+    print(
+        f"{args.files} files of ~{args.size_kb} KB, "
+        f"{len(archive) / 1e6:.2f} MB zipped"
+    )
+    for workers in args.workers:
+        measure(archive, args.files, workers, args.concurrency, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark fuzzy client matching: full-organization scan vs pg_trgm candidates.
+
+Needs a PostgreSQL database migrated to head (pg_trgm installed). All rows are
+written inside one transaction that is rolled back, so nothing is kept.
+
+Usage (from packages/api):
+    DATABASE_URL=postgresql://... python -m benchmarks.bench_client_matching \\
+        --sizes 1000 10000 100000
+"""
+
+import argparse
+import random
+import time
+from unittest.mock import patch
+from uuid import uuid4
+
+from sqlalchemy import insert, text
+
+from src.models.core import Client, Organization
+from src.models.database import SessionLocal
+from src.repositories.clients import ClientRepository
+
+FIRST_NAMES = [
+    "Alex", "Priya", "Sam", "Jordan", "Maria", "Chen", "Omar", "Lena",
+    "Tomas", "Aisha", "Kenji", "Sofia", "Rahul", "Ingrid", "Mateo", "Zara",
+]
+LAST_NAMES = [
+    "Johnson", "Patel", "Lee", "Garcia", "Nguyen", "Haddad", "Smith", "Okafor",
+    "Kowalski", "Silva", "Tanaka", "Moreau", "Fischer", "Rossi", "Novak", "Ali",
+]
+INSERT_BATCH_SIZE = 5000
+
+
+def make_names(start: int, stop: int, rng: random.Random) -> list[str]:
+    """Unique client names with a numeric disambiguator."""
+    return [
+        f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}-{i}"
+        for i in range(start, stop)
+    ]
+
+
+def time_lookups(repo: ClientRepository, organization_id, queries, trigram: bool) -> float:
+    """Average milliseconds per _find_client_fuzzy call."""
+    with patch.object(ClientRepository, "_supports_trigram_search", return_value=trigram):
+        start = time.perf_counter()
+        for query in queries:
+            repo._find_client_fuzzy(query, organization_id)
+        elapsed = time.perf_counter() - start
+    return elapsed * 1000 / len(queries)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--lookups", type=int, default=20)
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    db = SessionLocal()
+    try:
+        organization = Organization(name="Benchmark Organization")
+        db.add(organization)
+        db.flush()
+        repo = ClientRepository(db)
+
+        names: list[str] = []
+        print(f"{'clients':>8}  {'python scan':>12}  {'pg_trgm':>10}")
+        for size in sorted(args.sizes):
+            new_names = make_names(len(names), size, rng)
+            for start in range(0, len(new_names), INSERT_BATCH_SIZE):
+                db.execute(insert(Client), [
+                    {"id": uuid4(), "name": name, "organization_id": organization.id}
+                    for name in new_names[start:start + INSERT_BATCH_SIZE]
+                ])
+            names.extend(new_names)
+            db.execute(text("ANALYZE clients"))
+
+            # Mix of exact, case-changed and unknown names
+            queries = [rng.choice(names) for _ in range(args.lookups // 2)]
+            queries += [q.upper() for q in queries[: args.lookups // 4]]
+            queries += [f"Unknown Person {i}" for i in range(args.lookups // 4)]
+
+            scan_ms = time_lookups(repo, organization.id, queries, trigram=False)
+            trigram_ms = time_lookups(repo, organization.id, queries, trigram=True)
+            print(f"{size:>8}  {scan_ms:>9.1f} ms  {trigram_ms:>7.1f} ms")
+    finally:
+        db.rollback()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""
+Benchmark DOCX text extraction: python-docx via a temp file vs in-memory streaming.
+
+Usage (from packages/api):
+    python -m benchmarks.bench_docx_extraction --pages 300
+
+Peak memory comes from tracemalloc, which only sees Python allocations; the
+lxml tree built by python-docx lives in C memory, so its peak is understated.
+Like any entry point importing ``src``, DATABASE_URL must be set (no
+connection is made).
+"""
+
+import argparse
+import io
+import os
+import tempfile
+import time
+import tracemalloc
+
+from docx import Document
+
+from src.services.docx_extraction import iter_docx_paragraphs
+
+# Roughly one page of transcript: ~20 speaker turns
+TURNS_PER_PAGE = 20
+SPEAKERS = ["Coach Maria", "Alex Johnson", "Priya Patel", "Sam Lee"]
+
+
+def build_transcript_docx(pages: int) -> bytes:
+    """Build a multi-page transcript document in memory."""
+    doc = Document()
+    for turn in range(pages * TURNS_PER_PAGE):
+        speaker = SPEAKERS[turn % len(SPEAKERS)]
+        doc.add_paragraph(
+            f"{speaker}: This is turn {turn} of the workshop where we talk "
+            "through goals, progress since last week and next actions."
+        )
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+def extract_python_docx(data: bytes) -> str:
+    """Previous implementation: temp file + python-docx."""
+    with tempfile.NamedTemporaryFile(suffix=".docx", delete=False) as temp_file:
+        temp_file.write(data)
+        temp_file_path = temp_file.name
+    try:
+        doc = Document(temp_file_path)
+        return "\n".join(
+            p.text.strip() for p in doc.paragraphs if p.text.strip()
+        )
+    finally:
+        os.unlink(temp_file_path)
+
+
+def extract_streaming(data: bytes) -> str:
+    """Current implementation: zip member streamed through XMLPullParser."""
+    return "\n".join(
+        text.strip() for text in iter_docx_paragraphs(memoryview(data)) if text.strip()
+    )
+
+
+def measure(label: str, func, data: bytes, repeat: int) -> str:
+    """Time a function and record its peak traced memory."""
+    best = float("inf")
+    result = ""
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(data)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    func(data)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"{label:<14} best {best * 1000:8.1f} ms   peak {peak / 1e6:7.1f} MB")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=300)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    data = build_transcript_docx(args.pages)
+    print(f"{args.pages} pages, {len(data) / 1e6:.2f} MB .docx")
+
+    baseline = measure("python-docx", extract_python_docx, data, args.repeat)
+    streaming = measure("streaming", extract_streaming, data, args.repeat)
+    assert baseline == streaming, "extraction outputs differ"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Load benchmark: requests/sec on /health and /api/v1/sessions/upload.
+
+Run the API twice against the same PostgreSQL database, once per data-access
+stack, and point this script at each:
+
+    ASYNC_DATABASE_ENABLED=false uvicorn src.main:app --port 8000
+    ASYNC_DATABASE_ENABLED=true  uvicorn src.main:app --port 8001
+
+    python -m benchmarks.bench_load --base-url http://localhost:8000
+    python -m benchmarks.bench_load --base-url http://localhost:8001
+
+The upload endpoint writes real sessions for the temporary coach and
+organization, which must exist in the target database.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Callable, List
+
+import httpx
+
+TRANSCRIPT = "\n".join(
+    f"{speaker}: {line}"
+    for speaker, line in [
+        ("Coach Maria", "Welcome back, how did the week go?"),
+        ("Alex Johnson", "Busy, but I kept the morning planning habit."),
+        ("Priya Patel", "Same here, although Thursday fell apart."),
+        ("Coach Maria", "What made Thursday different?"),
+    ]
+    * 20
+)
+
+
+def upload_request(client: httpx.AsyncClient):
+    return client.post("/api/v1/sessions/upload", json={
+        "transcript_text": TRANSCRIPT,
+        "session_date": "2024-01-15",
+        "session_type": "group",
+    })
+
+
+def health_request(client: httpx.AsyncClient):
+    return client.get("/health")
+
+
+async def run_load(
+    base_url: str,
+    make_request: Callable,
+    concurrency: int,
+    duration: float,
+) -> None:
+    latencies: List[float] = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+
+    async def worker(client: httpx.AsyncClient) -> None:
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            response = await make_request(client)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                errors += 1
+
+    limits = httpx.Limits(max_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker(client) for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    p95 = latencies[int(len(latencies) * 0.95) - 1] if latencies else 0.0
+    print(
+        f"{make_request.__name__:<16} {len(latencies) / elapsed:8.1f} req/s   "
+        f"p50 {statistics.median(latencies) * 1000:7.1f} ms   "
+        f"p95 {p95 * 1000:7.1f} ms   errors {errors}"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--duration", type=float, default=15.0)
+    args = parser.parse_args()
+
+    print(f"{args.base_url}, concurrency {args.concurrency}, {args.duration:.0f}s per endpoint")
+    for make_request in (health_request, upload_request):
+        await run_load(args.base_url, make_request, args.concurrency, args.duration)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
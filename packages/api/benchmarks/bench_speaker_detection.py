@@ -0,0 +1,107 @@
+"""
+Benchmark speaker detection: seven regex passes vs the single-scan engine.
+
+Usage (from packages/api, with DATABASE_URL set as for any entry point):
+    python -m benchmarks.bench_speaker_detection --size-mb 1 --speakers 12
+"""
+
+import argparse
+import random
+import re
+import time
+from typing import Set
+
+from src.services.participant_extraction import ParticipantExtractor
+
+# The per-pattern implementation that ParticipantExtractor used previously
+LEGACY_SPEAKER_PATTERNS = [
+    r'([A-Z][a-zA-Z\s]+):\s*',
+    r'\[([A-Z][a-zA-Z\s]+)\]:\s*',
+    r'Speaker\s+([A-Z][a-zA-Z\s]+):\s*',
+    r'Coach\s+([A-Z][a-zA-Z\s]+):\s*',
+    r'Client\s+([A-Z][a-zA-Z\s]+):\s*',
+    r'([A-Z][a-zA-Z\s]+)\s*\(Coach\):\s*',
+    r'([A-Z][a-zA-Z\s]+)\s*\(Client\):\s*',
+]
+
+FIRST_NAMES = ["Alex", "Priya", "Sam", "Jordan", "Maria", "Chen", "Omar", "Lena"]
+LAST_NAMES = ["Johnson", "Patel", "Lee", "Garcia", "Nguyen", "Haddad", "Smith"]
+SENTENCES = [
+    "I've been working on the goals we set last week.",
+    "That's a great insight, can you say more about it?",
+    "Honestly, the deadlines made it hard to focus.",
+    "Let's capture that as an action item for Friday.",
+]
+
+
+def legacy_is_valid_name(name: str) -> bool:
+    if not name or len(name) < 2:
+        return False
+    if name.lower() in ParticipantExtractor.FILTER_NAMES:
+        return False
+    if not re.search(r'[a-zA-Z]', name):
+        return False
+    if len(name) > 50:
+        return False
+    return bool(re.match(r"^[a-zA-Z\s\-'\.]+$", name))
+
+
+def legacy_find_speaker_names(transcript: str) -> Set[str]:
+    found: Set[str] = set()
+    for pattern in LEGACY_SPEAKER_PATTERNS:
+        for match in re.finditer(pattern, transcript, re.MULTILINE | re.IGNORECASE):
+            name = match.group(1).strip()
+            if legacy_is_valid_name(name):
+                found.add(name)
+    return found
+
+
+def single_scan_find_speaker_names(transcript: str) -> Set[str]:
+    return {p.name for p in ParticipantExtractor._find_speaker_names(transcript)}
+
+
+def build_transcript(size_mb: float, speakers: int) -> str:
+    """Build a workshop transcript of roughly the requested size."""
+    rng = random.Random(42)
+    names = [
+        f"{FIRST_NAMES[i % len(FIRST_NAMES)]} {LAST_NAMES[i % len(LAST_NAMES)]}"
+        for i in range(speakers)
+    ]
+    names[0] = f"Coach {names[0]}"
+
+    lines = []
+    size = 0
+    target = int(size_mb * 1024 * 1024)
+    while size < target:
+        line = f"{rng.choice(names)}: {' '.join(rng.sample(SENTENCES, 2))}\n"
+        lines.append(line)
+        size += len(line)
+    return "".join(lines)
+
+
+def measure(label: str, func, transcript: str, repeat: int) -> None:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(transcript)
+        best = min(best, time.perf_counter() - start)
+    mb = len(transcript) / (1024 * 1024)
+    print(f"{label:<12} best {best * 1000:8.1f} ms   {mb / best:8.1f} MB/s")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=float, default=1.0)
+    parser.add_argument("--speakers", type=int, default=12)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    transcript = build_transcript(args.size_mb, args.speakers)
+    print(f"{len(transcript) / 1e6:.2f} MB transcript, {args.speakers} speakers")
+
+    measure("seven-pass", legacy_find_speaker_names, transcript, args.repeat)
+    measure("single-scan", single_scan_find_speaker_names, transcript, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
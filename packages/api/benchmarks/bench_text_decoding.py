@@ -0,0 +1,87 @@
+"""
+Benchmark .txt decoding: full-content chardet vs tiered detection.
+
+Usage (from packages/api):
+    python -m benchmarks.bench_text_decoding --size-mb 4
+
+The corpus is one transcript encoded as UTF-8, UTF-8 with BOM, UTF-16 with
+and without BOM, and cp1252, so each decoding tier is exercised. Like any
+entry point importing ``src``, DATABASE_URL must be set (no connection is
+made).
+"""
+
+import argparse
+import time
+
+import chardet
+
+from src.services.file_processing import FileProcessingService
+
+SPEAKERS = ["Coach María", "Alex Johnson", "Priya Patel", "Zoë Lefèvre"]
+# Latin-1 range only, so every corpus encoding can represent the text
+LINE = "{speaker}: Déjà vu – we agreed on “one small habit” per week, café included.\n"
+
+CORPUS_ENCODINGS = [
+    ("utf-8", "utf-8"),
+    ("utf-8 bom", "utf-8-sig"),
+    ("utf-16 bom", "utf-16"),
+    ("utf-16-le", "utf-16-le"),
+    ("cp1252", "cp1252"),
+]
+
+
+def build_transcript(size_mb: float) -> str:
+    """Build a transcript of roughly ``size_mb`` megabytes of text."""
+    lines = []
+    total = 0
+    turn = 0
+    while total < size_mb * 1024 * 1024:
+        line = LINE.format(speaker=SPEAKERS[turn % len(SPEAKERS)])
+        lines.append(line)
+        total += len(line)
+        turn += 1
+    return "".join(lines)
+
+
+def decode_full_detection(data: bytearray) -> str:
+    """Previous implementation: chardet over the whole file."""
+    encoding = chardet.detect(data).get("encoding") or "utf-8"
+    try:
+        return str(data, encoding)
+    except (UnicodeDecodeError, LookupError):
+        return str(data, "utf-8", errors="replace")
+
+
+def best_time(func, data: bytearray, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(data)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size-mb", type=float, default=1.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    text = build_transcript(args.size_mb)
+    print(f"{len(text) / 1e6:.2f}M characters per file")
+    print(f"{'file':<12} {'tier':<8} {'encoding':<13} {'full chardet':>13} {'tiered':>10}  correct")
+
+    for label, encoding in CORPUS_ENCODINGS:
+        data = bytearray(text.encode(encoding))
+        decoded = FileProcessingService._decode_text(data)
+        full = best_time(decode_full_detection, data, args.repeat)
+        tiered = best_time(FileProcessingService._decode_text, data, args.repeat)
+        print(
+            f"{label:<12} {decoded.tier:<8} {decoded.encoding:<13} "
+            f"{full * 1000:10.1f} ms {tiered * 1000:7.1f} ms  "
+            f"{decoded.text == text} (was {decode_full_detection(data) == text})"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -24,6 +24,14 @@ class Settings(BaseSettings):
     database_url: str = ""
     database_test_url: Optional[str] = None
 
+    # Connection Pool (applies to the sync and async engines)
+    db_pool_size: int = 5
+    db_max_overflow: int = 10  # Extra connections allowed beyond db_pool_size
+    db_pool_timeout: float = 30.0  # Seconds to wait for a connection before failing
+    db_pool_recycle: int = 300  # Seconds before a connection is replaced
+    db_pool_pre_ping: bool = True  # Test connections on checkout (pessimistic)
+    db_echo: bool = False  # Log every SQL statement
+
     # Security
     secret_key: str = ""
     algorithm: str = "HS256"
@@ -53,6 +61,62 @@ class Settings(BaseSettings):
     upload_path: str = "/tmp/uploads"
     max_file_size_mb: int = 100
 
+    # Content Scanning
+    content_scan_extra_patterns: str = ""  # Comma-separated, added to the built-in suspicious patterns
+
+    # Chunked Uploads (staged under upload_path)
+    upload_chunk_max_mb: int = 8  # Largest accepted chunk
+    upload_ttl_seconds: float = 86400.0  # Idle time before an unfinished upload is removed
+    upload_cleanup_interval: float = 600.0  # Seconds between cleanup sweeps
+
+    # Batch Uploads
+    batch_max_files: int = 1000  # Files per batch request, archive entries included
+    batch_parse_concurrency: int = 8  # Entries read but not yet parsed at once
+    batch_commit_size: int = 100  # Sessions written per transaction
+
+    # Participant Extraction Cache
+    extraction_cache_enabled: bool = True
+    extraction_cache_max_entries: int = 1024  # Results kept per process
+    extraction_cache_ttl: float = 3600.0  # Seconds a cached result stays valid
+    extraction_cache_backend: str = "memory"  # "memory" or "redis" (shared, uses redis_url)
+
+    # Async data access (asyncpg); the sync engine is still used by Alembic
+    async_database_enabled: bool = False
+
+    # Workload Executors
+    parse_workers: int = 2  # Process pool for CPU-bound parsing; 0 runs inline
+    db_workers: int = 8  # Thread pool for blocking database calls
+    executor_max_queue_depth: int = 32  # Pending tasks per pool before 429
+
+    # Client Name Index
+    client_name_index_enabled: bool = True
+    client_name_index_max_organizations: int = 256  # LRU bound across organizations
+    client_name_index_ttl_seconds: int = 300  # Reload interval for clients added elsewhere; 0 never expires
+
+    # Metrics
+    metrics_enabled: bool = True  # Per-route HTTP metrics and the /metrics endpoint
+    internal_endpoints_enabled: bool = False  # Unauthenticated /internal diagnostics; keep off in production
+
+    # Job Queue (post-upload processing)
+    job_queue_enabled: bool = True  # Enqueue a processing job for each upload
+    job_worker_processes: int = 1
+    job_worker_concurrency: int = 4  # Jobs run at once per worker process
+    job_poll_interval: float = 1.0  # Seconds between polls when the queue is idle
+    job_visibility_timeout: float = 300.0  # Seconds before an unfinished claim is retried
+    job_max_attempts: int = 5
+    job_retry_backoff_base: float = 2.0  # Retry delay is base**attempt seconds, with jitter
+    job_retry_backoff_max: float = 300.0
+
+    # Health Checks
+    health_probe_interval: float = 5.0  # Seconds between background database probes
+    health_probe_timeout: float = 2.0  # Probe is failed after this many seconds
+    health_cache_ttl: float = 15.0  # Cached probe age before /health re-probes and /ready fails
+    health_max_pool_saturation: float = 1.0  # Checked-out fraction at which /ready fails
+
+    # Request Tracing
+    tracing_enabled: bool = True  # Log a per-stage timing breakdown for each request
+    server_timing_enabled: bool = False  # Also expose it in a Server-Timing header
+
     # Email
     smtp_host: Optional[str] = None
     smtp_port: int = 587
@@ -86,6 +150,8 @@ class TestingSettings(Settings):
 
     environment: str = "testing"
     log_level: str = "DEBUG"
+    parse_workers: int = 0
+    client_name_index_enabled: bool = False
 
     def __init__(self, **kwargs: Any) -> None:
         super().__init__(**kwargs)
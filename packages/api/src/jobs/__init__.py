@@ -0,0 +1,18 @@
+"""
+Durable job queue and workers for post-upload processing.
+"""
+
+from .handlers import SESSION_PROCESSING_JOB, SessionProcessingHandler
+from .queue import DatabaseJobQueue, InMemoryJobQueue, Job, JobQueue
+from .worker import JobHandler, JobWorker
+
+__all__ = [
+    "SESSION_PROCESSING_JOB",
+    "SessionProcessingHandler",
+    "DatabaseJobQueue",
+    "InMemoryJobQueue",
+    "Job",
+    "JobQueue",
+    "JobHandler",
+    "JobWorker",
+]
@@ -0,0 +1,79 @@
+"""
+Job worker entry point.
+
+Usage:
+    python -m src.jobs [--processes N] [--concurrency N]
+
+Each process runs one asyncio worker; SIGINT/SIGTERM stop claiming new jobs
+and let in-flight jobs finish.
+"""
+
+import argparse
+import asyncio
+import logging
+import multiprocessing
+import signal
+
+from ..config import settings
+
+
+def run_worker(concurrency: int) -> None:
+    """Run a single worker until signalled."""
+    from ..models.database import SessionLocal
+    from .handlers import SessionProcessingHandler
+    from .queue import DatabaseJobQueue
+    from .worker import JobWorker
+
+    logging.basicConfig(
+        level=getattr(logging, settings.log_level.upper()),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
+    worker = JobWorker(
+        queue=DatabaseJobQueue(SessionLocal),
+        handlers=[SessionProcessingHandler(SessionLocal)],
+        concurrency=concurrency,
+        poll_interval=settings.job_poll_interval,
+        visibility_timeout=settings.job_visibility_timeout,
+        backoff_base=settings.job_retry_backoff_base,
+        backoff_max=settings.job_retry_backoff_max,
+    )
+
+    async def main() -> None:
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(signum, stop.set)
+        await worker.run(stop)
+
+    asyncio.run(main())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Run job queue workers.")
+    parser.add_argument("--processes", type=int, default=settings.job_worker_processes)
+    parser.add_argument("--concurrency", type=int, default=settings.job_worker_concurrency)
+    args = parser.parse_args()
+
+    if args.processes <= 1:
+        run_worker(args.concurrency)
+        return
+
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(target=run_worker, args=(args.concurrency,), name=f"job-worker-{i}")
+        for i in range(args.processes)
+    ]
+    for process in processes:
+        process.start()
+    # Ctrl-C reaches the children directly; forward SIGTERM for graceful shutdown
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(
+        signal.SIGTERM, lambda *_: [process.terminate() for process in processes]
+    )
+    for process in processes:
+        process.join()
+
+
+if __name__ == "__main__":
+    main()
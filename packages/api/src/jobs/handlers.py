@@ -0,0 +1,84 @@
+"""
+Job handlers for post-upload session processing.
+
+Sessions move through ``processing_status`` as the worker runs their job:
+
+    uploaded -> processing -> processed
+                    |   ^
+                    v   |
+                  retrying  -> failed (retries exhausted)
+"""
+
+import logging
+from typing import Callable, Sequence
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from ..repositories.sessions import SessionRepository
+from ..repositories.transcripts import TranscriptRepository
+from .queue import Job
+
+logger = logging.getLogger(__name__)
+
+SESSION_PROCESSING_JOB = "process_session"
+
+# Session.processing_status values
+STATUS_UPLOADED = "uploaded"  # Stored and queued for processing
+STATUS_PROCESSING = "processing"
+STATUS_RETRYING = "retrying"  # Last attempt failed; waiting for backoff
+STATUS_PROCESSED = "processed"
+STATUS_FAILED = "failed"
+
+# A processing step receives the worker's DB session, the session id and the
+# transcript text; it raises to fail the attempt
+ProcessingStep = Callable[[Session, UUID, str], None]
+
+
+class SessionProcessingHandler:
+    """
+    Runs the post-upload pipeline for one session.
+
+    Heavier analysis (AI summaries and the like) plugs in as ``steps``; each
+    attempt runs every step in order and commits once all have succeeded.
+    """
+
+    kind = SESSION_PROCESSING_JOB
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        steps: Sequence[ProcessingStep] = (),
+    ):
+        self._session_factory = session_factory
+        self.steps = list(steps)
+
+    def run(self, job: Job) -> None:
+        session_id = job.session_id
+        with self._session_factory() as db:
+            sessions = SessionRepository(db)
+            if not sessions.update_processing_status(session_id, STATUS_PROCESSING):
+                raise LookupError(f"Session {session_id} not found")
+            db.commit()
+
+            transcript_text = TranscriptRepository(db).get_transcript_text(session_id)
+            if transcript_text is None:
+                raise LookupError(f"Session {session_id} has no transcript")
+
+            for step in self.steps:
+                step(db, session_id, transcript_text)
+
+            sessions.update_processing_status(session_id, STATUS_PROCESSED)
+            db.commit()
+
+    def retrying(self, job: Job, error: str) -> None:
+        self._set_status(job.session_id, STATUS_RETRYING)
+
+    def failed(self, job: Job, error: str) -> None:
+        logger.error(f"Processing failed for session {job.session_id}: {error}")
+        self._set_status(job.session_id, STATUS_FAILED)
+
+    def _set_status(self, session_id: UUID, status: str) -> None:
+        with self._session_factory() as db:
+            SessionRepository(db).update_processing_status(session_id, status)
+            db.commit()
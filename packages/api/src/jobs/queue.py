@@ -0,0 +1,467 @@
+"""
+Durable job queue backed by the ``processing_jobs`` table.
+
+Workers claim jobs with ``SELECT ... FOR UPDATE SKIP LOCKED``, so concurrent
+workers never block on or double-claim the same rows. A claimed job stays
+invisible for the visibility timeout; if its worker dies, the job becomes
+claimable again once that timeout passes. Each claim increments ``attempts``,
+which also serves as a fencing token: a worker whose claim expired cannot
+complete or fail a job another worker has since reclaimed.
+
+``InMemoryJobQueue`` implements the same interface for tests.
+
+Every enqueue operation has an ``_async`` twin for callers on the event loop;
+given an ``AsyncSession`` it inserts in that session's transaction.
+"""
+
+import asyncio
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any, Callable, Dict, List, Optional, Protocol
+from uuid import UUID
+
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ..models.core import ProcessingJob
+from ..models.database import SessionLocal
+
+# Job states; a running job whose visibility timeout passed is claimable again
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+CLAIMABLE_STATES = (QUEUED, RUNNING)
+
+
+@dataclass
+class Job:
+    """A claimed unit of work."""
+
+    id: UUID
+    kind: str
+    payload: Dict[str, Any] = field(default_factory=dict)
+    session_id: Optional[UUID] = None
+    attempts: int = 0
+    max_attempts: int = 5
+
+    @property
+    def exhausted(self) -> bool:
+        """Whether this claim is past the retry budget."""
+        return self.attempts > self.max_attempts
+
+
+class JobQueue(Protocol):
+    """Operations workers need from a queue backend."""
+
+    def enqueue(
+        self,
+        kind: str,
+        payload: Dict[str, Any],
+        session_id: Optional[UUID] = None,
+        max_attempts: int = 5,
+        db: Optional[Session] = None,
+    ) -> UUID: ...
+
+    def enqueue_many(
+        self,
+        kind: str,
+        session_ids: List[UUID],
+        max_attempts: int = 5,
+        db: Optional[Session] = None,
+    ) -> int: ...
+
+    async def enqueue_async(
+        self,
+        kind: str,
+        payload: Dict[str, Any],
+        session_id: Optional[UUID] = None,
+        max_attempts: int = 5,
+        db: Optional[AsyncSession] = None,
+    ) -> UUID: ...
+
+    async def enqueue_many_async(
+        self,
+        kind: str,
+        session_ids: List[UUID],
+        max_attempts: int = 5,
+        db: Optional[AsyncSession] = None,
+    ) -> int: ...
+
+    def claim(self, worker_id: str, limit: int, visibility_timeout: float) -> List[Job]: ...
+
+    def complete(self, job: Job) -> bool: ...
+
+    def fail(self, job: Job, error: str, retry_in: Optional[float]) -> bool: ...
+
+    def stats(self) -> Dict[str, int]: ...
+
+
+def job_insert_statement(
+    kind: str,
+    payload: Dict[str, Any],
+    session_id: Optional[UUID] = None,
+    max_attempts: int = 5,
+):
+    """The new job's id and the INSERT that queues it."""
+    job_id = uuid.uuid4()
+    return job_id, insert(ProcessingJob).values(
+        id=job_id,
+        kind=kind,
+        session_id=session_id,
+        payload=payload,
+        status=QUEUED,
+        attempts=0,
+        max_attempts=max_attempts,
+    )
+
+
+def job_rows(
+    kind: str,
+    session_ids: List[UUID],
+    max_attempts: int = 5,
+) -> List[Dict[str, Any]]:
+    """Rows for a bulk INSERT of one queued job per session."""
+    return [
+        {
+            "id": uuid.uuid4(),
+            "kind": kind,
+            "session_id": session_id,
+            "payload": {},
+            "status": QUEUED,
+            "attempts": 0,
+            "max_attempts": max_attempts,
+        }
+        for session_id in session_ids
+    ]
+
+
+class DatabaseJobQueue:
+    """Job queue stored in PostgreSQL; each operation commits its own transaction."""
+
+    def __init__(self, session_factory: Callable[[], Session]):
+        self._session_factory = session_factory
+
+    def enqueue(
+        self,
+        kind: str,
+        payload: Dict[str, Any],
+        session_id: Optional[UUID] = None,
+        max_attempts: int = 5,
+        db: Optional[Session] = None,
+    ) -> UUID:
+        """
+        Add a job to the queue.
+
+        With ``db`` the job is inserted in the caller's transaction and is
+        only visible to workers once the caller commits; otherwise it is
+        committed immediately.
+        """
+        job_id, statement = job_insert_statement(kind, payload, session_id, max_attempts)
+        if db is not None:
+            db.execute(statement)
+            return job_id
+
+        with self._session_factory() as session:
+            session.execute(statement)
+            session.commit()
+        return job_id
+
+    def enqueue_many(
+        self,
+        kind: str,
+        session_ids: List[UUID],
+        max_attempts: int = 5,
+        db: Optional[Session] = None,
+    ) -> int:
+        """Queue one job per session with a single INSERT; ``db`` as for enqueue."""
+        rows = job_rows(kind, session_ids, max_attempts)
+        if not rows:
+            return 0
+        if db is not None:
+            db.execute(insert(ProcessingJob), rows)
+            return len(rows)
+
+        with self._session_factory() as session:
+            session.execute(insert(ProcessingJob), rows)
+            session.commit()
+        return len(rows)
+
+    async def enqueue_async(
+        self,
+        kind: str,
+        payload: Dict[str, Any],
+        session_id: Optional[UUID] = None,
+        max_attempts: int = 5,
+        db: Optional[AsyncSession] = None,
+    ) -> UUID:
+        """enqueue for the event loop; ``db`` is an AsyncSession whose transaction to join."""
+        if db is None:
+            return await asyncio.to_thread(self.enqueue, kind, payload, session_id, max_attempts)
+
+        job_id, statement = job_insert_statement(kind, payload, session_id, max_attempts)
+        await db.execute(statement)
+        return job_id
+
+    async def enqueue_many_async(
+        self,
+        kind: str,
+        session_ids: List[UUID],
+        max_attempts: int = 5,
+        db: Optional[AsyncSession] = None,
+    ) -> int:
+        """enqueue_many for the event loop; ``db`` as for enqueue_async."""
+        if db is None:
+            return await asyncio.to_thread(self.enqueue_many, kind, session_ids, max_attempts)
+
+        rows = job_rows(kind, session_ids, max_attempts)
+        if not rows:
+            return 0
+        await db.execute(insert(ProcessingJob), rows)
+        return len(rows)
+
+    def claim(self, worker_id: str, limit: int, visibility_timeout: float) -> List[Job]:
+        """Claim up to ``limit`` available jobs, skipping rows other workers hold."""
+        now = func.now()
+        candidates = (
+            select(ProcessingJob.id)
+            .where(
+                ProcessingJob.status.in_(CLAIMABLE_STATES),
+                ProcessingJob.available_at <= now,
+            )
+            .order_by(ProcessingJob.available_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        statement = (
+            update(ProcessingJob)
+            .where(ProcessingJob.id.in_(candidates))
+            .values(
+                status=RUNNING,
+                attempts=ProcessingJob.attempts + 1,
+                locked_by=worker_id,
+                available_at=now + timedelta(seconds=visibility_timeout),
+                updated_at=now,
+            )
+            .returning(
+                ProcessingJob.id,
+                ProcessingJob.kind,
+                ProcessingJob.payload,
+                ProcessingJob.session_id,
+                ProcessingJob.attempts,
+                ProcessingJob.max_attempts,
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+        with self._session_factory() as session:
+            rows = session.execute(statement).all()
+            session.commit()
+
+        return [
+            Job(
+                id=row.id,
+                kind=row.kind,
+                payload=row.payload or {},
+                session_id=row.session_id,
+                attempts=row.attempts,
+                max_attempts=row.max_attempts,
+            )
+            for row in rows
+        ]
+
+    def complete(self, job: Job) -> bool:
+        """Mark a job succeeded; False if the claim expired and was taken over."""
+        now = func.now()
+        return self._update_claimed(
+            job,
+            status=SUCCEEDED,
+            locked_by=None,
+            completed_at=now,
+            updated_at=now,
+        )
+
+    def fail(self, job: Job, error: str, retry_in: Optional[float]) -> bool:
+        """
+        Record a failed attempt, re-queueing it after ``retry_in`` seconds or
+        failing it permanently when ``retry_in`` is None.
+        """
+        now = func.now()
+        values: Dict[str, Any] = {"locked_by": None, "last_error": error, "updated_at": now}
+        if retry_in is None:
+            values.update(status=FAILED, completed_at=now)
+        else:
+            values.update(status=QUEUED, available_at=now + timedelta(seconds=retry_in))
+        return self._update_claimed(job, **values)
+
+    def stats(self) -> Dict[str, int]:
+        """Job counts by status."""
+        with self._session_factory() as session:
+            rows = session.execute(
+                select(ProcessingJob.status, func.count()).group_by(ProcessingJob.status)
+            ).all()
+        return {status: count for status, count in rows}
+
+    def _update_claimed(self, job: Job, **values: Any) -> bool:
+        statement = (
+            update(ProcessingJob)
+            .where(
+                ProcessingJob.id == job.id,
+                ProcessingJob.status == RUNNING,
+                ProcessingJob.attempts == job.attempts,
+            )
+            .values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        with self._session_factory() as session:
+            result = session.execute(statement)
+            session.commit()
+        return result.rowcount > 0
+
+
+@dataclass
+class _JobRecord:
+    job: Job
+    status: str = QUEUED
+    available_at: float = 0.0
+    locked_by: Optional[str] = None
+    last_error: Optional[str] = None
+
+
+class InMemoryJobQueue:
+    """
+    In-process queue with the same claim, visibility and fencing semantics.
+
+    Intended for tests and local development; jobs are lost on restart.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._records: Dict[UUID, _JobRecord] = {}
+        self._lock = threading.Lock()
+
+    def enqueue(
+        self,
+        kind: str,
+        payload: Dict[str, Any],
+        session_id: Optional[UUID] = None,
+        max_attempts: int = 5,
+        db: Optional[Session] = None,
+    ) -> UUID:
+        job = Job(
+            id=uuid.uuid4(),
+            kind=kind,
+            payload=dict(payload),
+            session_id=session_id,
+            max_attempts=max_attempts,
+        )
+        with self._lock:
+            self._records[job.id] = _JobRecord(job=job, available_at=self._clock())
+        return job.id
+
+    def enqueue_many(
+        self,
+        kind: str,
+        session_ids: List[UUID],
+        max_attempts: int = 5,
+        db: Optional[Session] = None,
+    ) -> int:
+        for session_id in session_ids:
+            self.enqueue(kind, {}, session_id=session_id, max_attempts=max_attempts)
+        return len(session_ids)
+
+    async def enqueue_async(
+        self,
+        kind: str,
+        payload: Dict[str, Any],
+        session_id: Optional[UUID] = None,
+        max_attempts: int = 5,
+        db: Optional[AsyncSession] = None,
+    ) -> UUID:
+        return self.enqueue(kind, payload, session_id=session_id, max_attempts=max_attempts)
+
+    async def enqueue_many_async(
+        self,
+        kind: str,
+        session_ids: List[UUID],
+        max_attempts: int = 5,
+        db: Optional[AsyncSession] = None,
+    ) -> int:
+        return self.enqueue_many(kind, session_ids, max_attempts=max_attempts)
+
+    def claim(self, worker_id: str, limit: int, visibility_timeout: float) -> List[Job]:
+        now = self._clock()
+        with self._lock:
+            available = sorted(
+                (
+                    record
+                    for record in self._records.values()
+                    if record.status in CLAIMABLE_STATES and record.available_at <= now
+                ),
+                key=lambda record: record.available_at,
+            )[:limit]
+
+            claimed = []
+            for record in available:
+                record.status = RUNNING
+                record.locked_by = worker_id
+                record.available_at = now + visibility_timeout
+                record.job.attempts += 1
+                # Hand out a copy so a stale worker keeps its old fencing token
+                claimed.append(Job(**vars(record.job)))
+            return claimed
+
+    def complete(self, job: Job) -> bool:
+        with self._lock:
+            record = self._claimed_record(job)
+            if record is None:
+                return False
+            record.status = SUCCEEDED
+            record.locked_by = None
+            return True
+
+    def fail(self, job: Job, error: str, retry_in: Optional[float]) -> bool:
+        with self._lock:
+            record = self._claimed_record(job)
+            if record is None:
+                return False
+            record.locked_by = None
+            record.last_error = error
+            if retry_in is None:
+                record.status = FAILED
+            else:
+                record.status = QUEUED
+                record.available_at = self._clock() + retry_in
+            return True
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            counts: Dict[str, int] = {}
+            for record in self._records.values():
+                counts[record.status] = counts.get(record.status, 0) + 1
+            return counts
+
+    def status(self, job_id: UUID) -> Optional[str]:
+        with self._lock:
+            record = self._records.get(job_id)
+            return record.status if record else None
+
+    def last_error(self, job_id: UUID) -> Optional[str]:
+        with self._lock:
+            record = self._records.get(job_id)
+            return record.last_error if record else None
+
+    def _claimed_record(self, job: Job) -> Optional[_JobRecord]:
+        record = self._records.get(job.id)
+        if record is None or record.status != RUNNING or record.job.attempts != job.attempts:
+            return None
+        return record
+
+
+# Global queue instance
+job_queue = DatabaseJobQueue(SessionLocal)
@@ -0,0 +1,195 @@
+"""
+Asynchronous job worker.
+
+A worker polls its queue for as many jobs as it has free slots, runs each
+handler in its own thread pool (handlers do blocking database work) and
+reports the outcome back to the queue. Failed attempts are retried with
+exponential backoff and jitter until the job's ``max_attempts`` is spent.
+"""
+
+import asyncio
+import logging
+import os
+import random
+import socket
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Protocol, Set
+
+from ..monitoring.metrics import registry
+from .queue import Job, JobQueue
+
+logger = logging.getLogger(__name__)
+
+jobs_processed_total = registry.counter(
+    "jobs_processed_total",
+    "Job attempts by outcome (succeeded, retried, failed, lost)",
+    ["kind", "outcome"],
+)
+job_duration_seconds = registry.histogram(
+    "job_duration_seconds",
+    "Handler run time per job attempt",
+    ["kind"],
+)
+
+
+class JobHandler(Protocol):
+    """Handles one job kind. ``run`` raises to signal a failed attempt."""
+
+    kind: str
+
+    def run(self, job: Job) -> None: ...
+
+    def retrying(self, job: Job, error: str) -> None: ...
+
+    def failed(self, job: Job, error: str) -> None: ...
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+class JobWorker:
+    """Claims and runs jobs with bounded concurrency."""
+
+    def __init__(
+        self,
+        queue: JobQueue,
+        handlers: List[JobHandler],
+        concurrency: int = 4,
+        poll_interval: float = 1.0,
+        visibility_timeout: float = 300.0,
+        backoff_base: float = 2.0,
+        backoff_max: float = 300.0,
+        worker_id: Optional[str] = None,
+    ):
+        self.queue = queue
+        self.handlers: Dict[str, JobHandler] = {handler.kind: handler for handler in handlers}
+        self.concurrency = max(1, concurrency)
+        self.poll_interval = poll_interval
+        self.visibility_timeout = visibility_timeout
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.worker_id = worker_id or default_worker_id()
+        # One thread per job slot, plus one so queue calls never wait on handlers
+        self._threads = ThreadPoolExecutor(
+            max_workers=self.concurrency + 1, thread_name_prefix="job-worker"
+        )
+        self._active: Set[asyncio.Task] = set()
+
+    def retry_delay(self, attempts: int) -> float:
+        """Exponential backoff with jitter: base**attempts, capped, scaled by 0.5-1.0."""
+        delay = min(self.backoff_max, self.backoff_base ** attempts)
+        return delay * random.uniform(0.5, 1.0)
+
+    async def run(self, stop: asyncio.Event) -> None:
+        """Process jobs until ``stop`` is set, then drain in-flight jobs."""
+        logger.info(
+            "Job worker %s started (concurrency %d)", self.worker_id, self.concurrency
+        )
+        stopping = asyncio.ensure_future(stop.wait())
+        try:
+            while not stop.is_set():
+                await self._fill_slots()
+                # Sleep until a slot frees up, the worker is stopped or it is time to poll
+                await asyncio.wait(
+                    self._active | {stopping},
+                    timeout=self.poll_interval,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+        finally:
+            stopping.cancel()
+            if self._active:
+                await asyncio.gather(*self._active, return_exceptions=True)
+            self._threads.shutdown(wait=True)
+            logger.info("Job worker %s stopped", self.worker_id)
+
+    async def run_once(self) -> int:
+        """Claim one batch, run it to completion and return the number of jobs."""
+        claimed = await self._fill_slots()
+        if self._active:
+            await asyncio.gather(*self._active, return_exceptions=True)
+        return claimed
+
+    async def _fill_slots(self) -> int:
+        free = self.concurrency - len(self._active)
+        if free <= 0:
+            return 0
+
+        loop = asyncio.get_running_loop()
+        try:
+            jobs = await loop.run_in_executor(
+                self._threads,
+                self.queue.claim,
+                self.worker_id,
+                free,
+                self.visibility_timeout,
+            )
+        except Exception:
+            logger.exception("Failed to claim jobs")
+            return 0
+
+        for job in jobs:
+            task = asyncio.ensure_future(self._process(job))
+            self._active.add(task)
+            task.add_done_callback(self._active.discard)
+        return len(jobs)
+
+    async def _process(self, job: Job) -> None:
+        loop = asyncio.get_running_loop()
+        handler = self.handlers.get(job.kind)
+
+        if handler is None:
+            await self._finish(job, None, f"No handler for job kind {job.kind!r}", final=True)
+            return
+        if job.exhausted:
+            # Claimed again after its last attempt timed out without reporting back
+            await self._finish(job, handler, "Visibility timeout expired on final attempt", final=True)
+            return
+
+        start = time.perf_counter()
+        try:
+            await loop.run_in_executor(self._threads, handler.run, job)
+        except Exception as e:
+            job_duration_seconds.labels(job.kind).observe(time.perf_counter() - start)
+            error = f"{type(e).__name__}: {e}"
+            final = job.attempts >= job.max_attempts
+            logger.warning(
+                "Job %s (%s) attempt %d/%d failed: %s",
+                job.id,
+                job.kind,
+                job.attempts,
+                job.max_attempts,
+                error,
+            )
+            await self._finish(job, handler, error, final=final)
+            return
+
+        job_duration_seconds.labels(job.kind).observe(time.perf_counter() - start)
+        completed = await loop.run_in_executor(self._threads, self.queue.complete, job)
+        jobs_processed_total.labels(job.kind, "succeeded" if completed else "lost").inc()
+        if not completed:
+            logger.warning("Job %s finished after its claim expired; result discarded", job.id)
+
+    async def _finish(
+        self, job: Job, handler: Optional[JobHandler], error: str, final: bool
+    ) -> None:
+        """Report a failed attempt to the queue and notify the handler."""
+        loop = asyncio.get_running_loop()
+        retry_in = None if final else self.retry_delay(job.attempts)
+
+        try:
+            recorded = await loop.run_in_executor(
+                self._threads, self.queue.fail, job, error, retry_in
+            )
+            if not recorded:
+                jobs_processed_total.labels(job.kind, "lost").inc()
+                return
+
+            jobs_processed_total.labels(job.kind, "failed" if final else "retried").inc()
+            if handler is not None:
+                callback = handler.failed if final else handler.retrying
+                await loop.run_in_executor(self._threads, callback, job, error)
+        except Exception:
+            logger.exception("Failed to record failure for job %s", job.id)
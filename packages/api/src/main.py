@@ -7,7 +7,12 @@ from fastapi.middleware.cors import CORSMiddleware
 import logging
 
 from .config import settings
-from .routes import health, sessions
+from .models.database import dispose_async_engine
+from .monitoring.middleware import MetricsMiddleware, TracingMiddleware
+from .routes import health, internal, metrics, sessions
+from .services.chunked_uploads import chunked_upload_store
+from .services.executor import workload_executor
+from .services.health import health_prober
 
 # Configure logging
 logging.basicConfig(
@@ -32,9 +37,56 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Per-request stage timings for logs and the Server-Timing header
+if settings.tracing_enabled:
+    app.add_middleware(TracingMiddleware, server_timing=settings.server_timing_enabled)
+
+# Per-route latency and size metrics, outermost so CORS time is included
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+
 # Include routers
 app.include_router(health.router, tags=["Health"])
 app.include_router(sessions.router, tags=["Sessions"])
+app.include_router(internal.router, tags=["Internal"])
+if settings.metrics_enabled:
+    app.include_router(metrics.router, tags=["Metrics"])
+
+
+@app.on_event("startup")
+async def start_health_prober() -> None:
+    """Begin background database health probes."""
+    health_prober.start()
+
+
+@app.on_event("shutdown")
+async def stop_health_prober() -> None:
+    """Stop background database health probes."""
+    await health_prober.stop()
+
+
+@app.on_event("startup")
+async def start_upload_cleanup() -> None:
+    """Begin removing expired chunked uploads in the background."""
+    chunked_upload_store.start()
+
+
+@app.on_event("shutdown")
+async def stop_upload_cleanup() -> None:
+    """Stop the chunked upload cleanup loop."""
+    await chunked_upload_store.stop()
+
+
+@app.on_event("shutdown")
+def shutdown_executors() -> None:
+    """Stop the parse and database worker pools."""
+    workload_executor.shutdown()
+
+
+@app.on_event("shutdown")
+async def shutdown_async_engine() -> None:
+    """Close pooled asyncpg connections."""
+    await dispose_async_engine()
 
 
 @app.get("/")
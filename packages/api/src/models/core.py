@@ -16,10 +16,12 @@ from sqlalchemy import (
     UniqueConstraint,
     Index,
     Date,
+    LargeBinary,
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, validates
 from sqlalchemy.sql import func
+import re
 import uuid
 
 from .database import Base
@@ -70,24 +72,102 @@ class Session(Base):
     participant_count = Column(Integer)
     processing_status = Column(String, default="pending")
     session_metadata = Column(JSONB)
+    transcript_hash = Column(String(64))  # Normalized content hash, for deduplication
+    idempotency_key = Column(String(255))  # Client-supplied Idempotency-Key header
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
     coach = relationship("Coach", back_populates="sessions")
     client_sessions = relationship("ClientSession", back_populates="session")
+    # Loaded only on access so session queries skip transcript bytes
+    transcript = relationship(
+        "SessionTranscript", back_populates="session", uselist=False, lazy="select"
+    )
 
     # Indexes
     __table_args__ = (
         Index("idx_sessions_coach_date", "coach_id", "session_date"),
         Index("idx_sessions_processing", "processing_status"),
+        # Repeat uploads per coach resolve to the existing session
+        Index("idx_sessions_coach_transcript_hash", "coach_id", "transcript_hash", unique=True),
+        Index("idx_sessions_coach_idempotency_key", "coach_id", "idempotency_key", unique=True),
     )
 
 
+class SessionTranscript(Base):
+    __tablename__ = "session_transcripts"
+
+    session_id = Column(UUID(as_uuid=True), ForeignKey("sessions.id"), primary_key=True)
+    content = Column(LargeBinary, nullable=False)  # Compressed UTF-8 text
+    compression = Column(String, nullable=False, default="zlib")
+    content_hash = Column(String(64), nullable=False)  # SHA-256 of the UTF-8 text
+    original_size = Column(Integer, nullable=False)
+    # Compressed speaker/offset/time index of timed turns (see repositories.transcripts)
+    segment_index = Column(LargeBinary)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Relationships
+    session = relationship("Session", back_populates="transcript")
+
+
+class ProcessingJob(Base):
+    __tablename__ = "processing_jobs"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    kind = Column(String, nullable=False)
+    session_id = Column(UUID(as_uuid=True), ForeignKey("sessions.id"))
+    payload = Column(JSONB, nullable=False, default=dict)
+    status = Column(String, nullable=False, default="queued")  # queued, running, succeeded, failed
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=5)
+    # Next time the job may be claimed: retry backoff, or the visibility timeout while running
+    available_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    locked_by = Column(String)
+    last_error = Column(Text)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())
+    completed_at = Column(DateTime(timezone=True))
+
+    # Indexes
+    __table_args__ = (
+        Index(
+            "idx_processing_jobs_claimable",
+            "available_at",
+            postgresql_where="status IN ('queued', 'running')",
+        ),
+        Index("idx_processing_jobs_session", "session_id"),
+    )
+
+
+_WHITESPACE_REGEX = re.compile(r"\s+")
+_NAME_PREFIX_REGEX = re.compile(r"^(mr|mrs|ms|dr|prof)\.?\s*")
+_NAME_SUFFIX_REGEX = re.compile(r"\s*(jr|sr|ii|iii|iv)\.?$")
+
+
+def normalize_client_name(name: str) -> str:
+    """Normalize a client name for matching (case, spacing, titles, suffixes)."""
+    # Convert to lowercase, remove extra spaces
+    normalized = _WHITESPACE_REGEX.sub(" ", name.lower().strip())
+
+    # Remove common prefixes/suffixes
+    normalized = _NAME_PREFIX_REGEX.sub("", normalized)
+    normalized = _NAME_SUFFIX_REGEX.sub("", normalized)
+
+    return normalized
+
+
+def _default_normalized_name(context) -> str | None:
+    name = context.get_current_parameters().get("name")
+    return normalize_client_name(name) if name is not None else None
+
+
 class Client(Base):
     __tablename__ = "clients"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String, nullable=False)
+    # Derived from name for fuzzy matching; filled on insert, including bulk inserts
+    normalized_name = Column(String, default=_default_normalized_name)
     email = Column(String)
     organization_id = Column(
         UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False
@@ -102,7 +182,21 @@ class Client(Base):
     follow_ups = relationship("FollowUp", back_populates="client")
 
     # Indexes
-    __table_args__ = (Index("idx_clients_org", "organization_id"),)
+    __table_args__ = (
+        Index("idx_clients_org", "organization_id"),
+        Index("idx_clients_org_normalized_name", "organization_id", "normalized_name"),
+        Index(
+            "idx_clients_normalized_name_trgm",
+            "normalized_name",
+            postgresql_using="gin",
+            postgresql_ops={"normalized_name": "gin_trgm_ops"},
+        ),
+    )
+
+    @validates("name")
+    def _sync_normalized_name(self, key, name):
+        self.normalized_name = normalize_client_name(name) if name is not None else None
+        return name
 
 
 class ClientSession(Base):
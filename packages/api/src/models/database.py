@@ -3,25 +3,52 @@ Database configuration and session management.
 """
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from typing import Generator
-from sqlalchemy.pool import QueuePool
+from typing import Any, AsyncGenerator, Dict, Generator, Optional
 try:
     from ..config import settings
+    from ..monitoring.pool import (
+        InstrumentedAsyncAdaptedQueuePool,
+        InstrumentedQueuePool,
+        instrument_engine,
+    )
 except ImportError:
     # For alembic migrations
     import os
     from config import settings
+    from monitoring.pool import (
+        InstrumentedAsyncAdaptedQueuePool,
+        InstrumentedQueuePool,
+        instrument_engine,
+    )
+
+
+def pool_options() -> Dict[str, Any]:
+    """Engine keyword arguments for the configured connection pool."""
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": settings.db_pool_pre_ping,
+        "echo": settings.db_echo,
+    }
+
 
 engine = create_engine(
     settings.database_url,
-    poolclass=QueuePool,
-    pool_size=5,
-    pool_pre_ping=True,
-    pool_recycle=300,
-    echo=settings.environment == "development",
+    poolclass=InstrumentedQueuePool,
+    **pool_options(),
 )
+instrument_engine(engine, "sync")
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -35,3 +62,57 @@ def get_db() -> Generator[Session, None, None]:
         yield db
     finally:
         db.close()
+
+
+# Async engine (asyncpg). Created on first use so the sync-only paths, such as
+# Alembic and the test suite, do not need the asyncpg driver installed.
+_async_engine: Optional[AsyncEngine] = None
+_async_sessionmaker: Optional[async_sessionmaker[AsyncSession]] = None
+
+
+def async_database_url(url: str) -> str:
+    """Rewrite a PostgreSQL URL to use the asyncpg driver."""
+    parsed = make_url(url)
+    if parsed.get_backend_name() == "postgresql":
+        parsed = parsed.set(drivername="postgresql+asyncpg")
+    return parsed.render_as_string(hide_password=False)
+
+
+def get_async_engine() -> AsyncEngine:
+    """Shared AsyncEngine for the configured database."""
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_engine(
+            async_database_url(settings.database_url),
+            poolclass=InstrumentedAsyncAdaptedQueuePool,
+            **pool_options(),
+        )
+        instrument_engine(_async_engine.sync_engine, "async")
+    return _async_engine
+
+
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    """Session factory bound to the async engine."""
+    global _async_sessionmaker
+    if _async_sessionmaker is None:
+        _async_sessionmaker = async_sessionmaker(
+            get_async_engine(),
+            autoflush=False,
+            expire_on_commit=False,
+        )
+    return _async_sessionmaker
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Dependency to get an async database session."""
+    async with get_async_sessionmaker()() as db:
+        yield db
+
+
+async def dispose_async_engine() -> None:
+    """Close pooled async connections; the engine is recreated on next use."""
+    global _async_engine, _async_sessionmaker
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    _async_engine = None
+    _async_sessionmaker = None
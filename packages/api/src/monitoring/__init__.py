@@ -0,0 +1,23 @@
+"""
+Runtime metrics and instrumentation.
+"""
+
+from .exposition import render as render_prometheus
+from .metrics import Counter, Gauge, Histogram, MetricsRegistry, registry
+from .middleware import MetricsMiddleware, TracingMiddleware
+from .tracing import RequestTrace, current_trace, span, traced
+
+__all__ = [
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsMiddleware",
+    "MetricsRegistry",
+    "RequestTrace",
+    "TracingMiddleware",
+    "current_trace",
+    "registry",
+    "render_prometheus",
+    "span",
+    "traced",
+]
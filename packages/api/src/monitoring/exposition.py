@@ -0,0 +1,59 @@
+"""
+Prometheus text exposition (format 0.0.4) for the metrics registry.
+"""
+
+import math
+from typing import List, Sequence
+
+from .metrics import Histogram, MetricsRegistry, registry as default_registry
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values))
+    return "{" + pairs + "}"
+
+
+def _number(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def render(registry: MetricsRegistry = default_registry) -> str:
+    """Render every metric family in the Prometheus text format."""
+    lines: List[str] = []
+
+    for family in sorted(registry.families(), key=lambda f: f.name):
+        children = sorted(family.children(), key=lambda child: child[0])
+        if not children:
+            continue
+
+        lines.append(f"# HELP {family.name} {_escape(family.documentation)}")
+        lines.append(f"# TYPE {family.name} {family.kind}")
+
+        for label_values, metric in children:
+            if isinstance(metric, Histogram):
+                snapshot = metric.snapshot()
+                for bound, cumulative in snapshot.cumulative():
+                    bucket_labels = _labels(
+                        family.labelnames + ("le",), label_values + (_number(bound),)
+                    )
+                    lines.append(f"{family.name}_bucket{bucket_labels} {cumulative}")
+                labels = _labels(family.labelnames, label_values)
+                lines.append(f"{family.name}_sum{labels} {_number(snapshot.sum)}")
+                lines.append(f"{family.name}_count{labels} {snapshot.count}")
+            else:
+                labels = _labels(family.labelnames, label_values)
+                lines.append(f"{family.name}{labels} {_number(metric.value)}")
+
+    return "\n".join(lines) + "\n"
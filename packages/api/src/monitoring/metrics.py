@@ -0,0 +1,245 @@
+"""
+Low-contention in-process metrics.
+
+Counters, gauges and histograms keep one cell per writing thread. A thread
+only ever updates its own cell, so the hot path takes no lock; readers sum the
+cells when a snapshot is requested. Locks are only taken when a thread or a
+label combination is seen for the first time.
+"""
+
+import bisect
+import math
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+# Latency buckets in seconds, from sub-millisecond pool checkouts to slow uploads
+DEFAULT_LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+    0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+LabelValues = Tuple[str, ...]
+
+
+class _ThreadCells:
+    """Per-thread storage cells created by ``factory``."""
+
+    def __init__(self, factory: Callable[[], list]):
+        self._factory = factory
+        self._local = threading.local()
+        self._cells: List[list] = []
+        self._lock = threading.Lock()
+
+    def get(self) -> list:
+        cell = getattr(self._local, "cell", None)
+        if cell is None:
+            cell = self._factory()
+            with self._lock:
+                self._cells.append(cell)
+            self._local.cell = cell
+        return cell
+
+    def all(self) -> List[list]:
+        with self._lock:
+            return list(self._cells)
+
+
+class Counter:
+    """Monotonically increasing value."""
+
+    def __init__(self):
+        self._cells = _ThreadCells(lambda: [0.0])
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._cells.get()[0] += amount
+
+    @property
+    def value(self) -> float:
+        return sum(cell[0] for cell in self._cells.all())
+
+
+class Gauge:
+    """
+    Value that can go up and down.
+
+    Either track it with inc/dec (per-thread deltas) or bind a callback that
+    reports the current value when read.
+    """
+
+    def __init__(self, callback: Optional[Callable[[], float]] = None):
+        self._cells = _ThreadCells(lambda: [0.0])
+        self._callback = callback
+
+    def inc(self, amount: float = 1.0) -> None:
+        self._cells.get()[0] += amount
+
+    def dec(self, amount: float = 1.0) -> None:
+        self._cells.get()[0] -= amount
+
+    def set_function(self, callback: Callable[[], float]) -> None:
+        self._callback = callback
+
+    @property
+    def value(self) -> float:
+        if self._callback is not None:
+            return float(self._callback())
+        return sum(cell[0] for cell in self._cells.all())
+
+
+class Histogram:
+    """Distribution of observations over fixed upper-bound buckets."""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        size = len(self.buckets) + 1  # Trailing +Inf bucket
+        # Cell layout: [bucket counts..., +Inf count, sum]
+        self._cells = _ThreadCells(lambda: [0] * size + [0.0])
+
+    def observe(self, value: float) -> None:
+        cell = self._cells.get()
+        cell[bisect.bisect_left(self.buckets, value)] += 1
+        cell[-1] += value
+
+    def snapshot(self) -> "HistogramSnapshot":
+        size = len(self.buckets) + 1
+        counts = [0] * size
+        total = 0.0
+        for cell in self._cells.all():
+            for i in range(size):
+                counts[i] += cell[i]
+            total += cell[-1]
+        return HistogramSnapshot(self.buckets, counts, total)
+
+
+class HistogramSnapshot:
+    """Point-in-time copy of a histogram with quantile estimates."""
+
+    def __init__(self, buckets: Tuple[float, ...], counts: List[int], total: float):
+        self.buckets = buckets
+        self.counts = counts
+        self.sum = total
+        self.count = sum(counts)
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        """(upper bound, cumulative count) pairs ending with +Inf."""
+        running = 0
+        pairs = []
+        for bound, count in zip(self.buckets + (math.inf,), self.counts):
+            running += count
+            pairs.append((bound, running))
+        return pairs
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile by linear interpolation inside its bucket."""
+        if not self.count:
+            return 0.0
+        rank = q * self.count
+        lower = 0.0
+        running = 0
+        for bound, count in zip(self.buckets, self.counts):
+            if count and running + count >= rank:
+                return lower + (bound - lower) * (rank - running) / count
+            running += count
+            lower = bound
+        # Falls in the +Inf bucket: the largest finite bound is the best estimate
+        return self.buckets[-1] if self.buckets else 0.0
+
+    def to_dict(self, scale: float = 1.0) -> Dict[str, float]:
+        """Summary with quantiles; ``scale`` converts units (e.g. 1000 for ms)."""
+        return {
+            "count": self.count,
+            "sum": round(self.sum * scale, 3),
+            "p50": round(self.quantile(0.50) * scale, 3),
+            "p95": round(self.quantile(0.95) * scale, 3),
+            "p99": round(self.quantile(0.99) * scale, 3),
+        }
+
+
+class _Family:
+    """A named metric with optional labels; children are created on demand."""
+
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str], factory):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._factory = factory
+        self._children: Dict[LabelValues, object] = {}
+        self._lock = threading.Lock()
+
+    def labels(self, *values: str):
+        key = tuple(str(v) for v in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}")
+            with self._lock:
+                child = self._children.setdefault(key, self._factory())
+        return child
+
+    def children(self) -> Iterable[Tuple[LabelValues, object]]:
+        with self._lock:
+            return list(self._children.items())
+
+
+class CounterFamily(_Family):
+    kind = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        super().__init__(name, documentation, labelnames, Counter)
+
+
+class GaugeFamily(_Family):
+    kind = "gauge"
+
+    def __init__(self, name, documentation, labelnames=()):
+        super().__init__(name, documentation, labelnames, Gauge)
+
+
+class HistogramFamily(_Family):
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_LATENCY_BUCKETS):
+        super().__init__(name, documentation, labelnames, lambda: Histogram(buckets))
+
+
+class MetricsRegistry:
+    """Collection of metric families, keyed by name."""
+
+    def __init__(self):
+        self._families: Dict[str, _Family] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> CounterFamily:
+        return self._register(CounterFamily(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> GaugeFamily:
+        return self._register(GaugeFamily(name, documentation, labelnames))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_LATENCY_BUCKETS,
+    ) -> HistogramFamily:
+        return self._register(HistogramFamily(name, documentation, labelnames, buckets))
+
+    def families(self) -> List[_Family]:
+        with self._lock:
+            return list(self._families.values())
+
+    def _register(self, family: _Family):
+        with self._lock:
+            existing = self._families.get(family.name)
+            if existing is not None:
+                if type(existing) is not type(family) or existing.labelnames != family.labelnames:
+                    raise ValueError(f"Metric {family.name} already registered differently")
+                return existing
+            self._families[family.name] = family
+            return family
+
+
+# Global registry instance
+registry = MetricsRegistry()
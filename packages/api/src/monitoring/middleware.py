@@ -0,0 +1,145 @@
+"""
+ASGI middleware recording per-route HTTP metrics and request traces.
+"""
+
+import logging
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .metrics import registry
+from .tracing import end_trace, start_trace
+
+logger = logging.getLogger(__name__)
+
+# Request/response body sizes in bytes, up to the 100MB upload limit
+SIZE_BUCKETS = (
+    256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216, 104857600,
+)
+
+# Label for requests no route matched, so unknown paths cannot explode cardinality
+UNMATCHED_ROUTE = "<unmatched>"
+
+requests_in_flight = registry.gauge(
+    "http_requests_in_flight",
+    "HTTP requests currently being served",
+    ["method"],
+)
+request_duration_seconds = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template and status code",
+    ["method", "route", "status"],
+)
+request_size_bytes = registry.histogram(
+    "http_request_size_bytes",
+    "HTTP request body size",
+    ["method", "route"],
+    buckets=SIZE_BUCKETS,
+)
+response_size_bytes = registry.histogram(
+    "http_response_size_bytes",
+    "HTTP response body size",
+    ["method", "route"],
+    buckets=SIZE_BUCKETS,
+)
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware (no BaseHTTPMiddleware buffering) that records
+    latency, body sizes and in-flight requests for every HTTP request.
+
+    Routes are labelled by their template (``/api/v1/sessions/{session_id}``)
+    as resolved by the router, never by the raw path.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+        received = 0
+        sent = 0
+
+        async def counting_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+            return message
+
+        async def counting_send(message: Message) -> None:
+            nonlocal status_code, sent
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            elif message["type"] == "http.response.body":
+                sent += len(message.get("body", b""))
+            await send(message)
+
+        in_flight = requests_in_flight.labels(method)
+        in_flight.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, counting_receive, counting_send)
+        finally:
+            elapsed = time.perf_counter() - start
+            in_flight.dec()
+
+            # The router stores the matched route on the shared scope
+            route = scope.get("route")
+            template = getattr(route, "path", None) or UNMATCHED_ROUTE
+
+            request_duration_seconds.labels(method, template, status_code).observe(elapsed)
+            request_size_bytes.labels(method, template).observe(received)
+            response_size_bytes.labels(method, template).observe(sent)
+
+
+class TracingMiddleware:
+    """
+    Pure ASGI middleware that binds a ``RequestTrace`` to each HTTP request.
+
+    When any spans were recorded, the stage breakdown is logged once the
+    response completes and, if enabled, sent in a ``Server-Timing`` header.
+    """
+
+    def __init__(self, app: ASGIApp, server_timing: bool = False):
+        self.app = app
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        trace, token = start_trace()
+        status_code = 500
+
+        async def traced_send(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Handlers have returned by now, so the workflow spans are final
+                if self.server_timing and trace.breakdown():
+                    headers = MutableHeaders(scope=message)
+                    headers.append("Server-Timing", trace.server_timing())
+            await send(message)
+
+        try:
+            await self.app(scope, receive, traced_send)
+        finally:
+            end_trace(token)
+            if trace.breakdown():
+                logger.info(
+                    "%s %s %d in %.1fms: %s",
+                    scope["method"],
+                    scope["path"],
+                    status_code,
+                    trace.elapsed_ms,
+                    trace.format_log(),
+                )
@@ -0,0 +1,156 @@
+"""
+Connection pool instrumentation.
+
+Checkouts are timed around the public ``Pool.connect``. Opening a new DBAPI
+connection during a checkout is timed separately, between the ``do_connect``
+dialect event and the ``connect`` pool event, and subtracted, so checkout
+wait only counts time spent blocked on a busy pool. Connection churn is
+counted through SQLAlchemy pool events, and in-use/overflow gauges read the
+live pool.
+"""
+
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from .metrics import registry
+
+CHECKOUT_WAIT_BUCKETS = (
+    0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0,
+)
+
+checkout_wait_seconds = registry.histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a pooled connection",
+    ["pool"],
+    buckets=CHECKOUT_WAIT_BUCKETS,
+)
+connect_seconds = registry.histogram(
+    "db_pool_connect_seconds",
+    "Time spent opening new database connections",
+    ["pool"],
+    buckets=CHECKOUT_WAIT_BUCKETS,
+)
+checkout_timeouts_total = registry.counter(
+    "db_pool_checkout_timeouts_total",
+    "Checkouts that gave up after pool_timeout",
+    ["pool"],
+)
+connection_events_total = registry.counter(
+    "db_pool_connection_events_total",
+    "Connection churn by event (connect, close, invalidate, soft_invalidate)",
+    ["pool", "event"],
+)
+pool_connections = registry.gauge(
+    "db_pool_connections",
+    "Pooled connections by state (checked_out, checked_in, overflow, size)",
+    ["pool", "state"],
+)
+
+
+# ConnectionRecord.info keys for the connect timing handed to the checkout
+_CONNECT_STARTED = "metrics_connect_started"
+_CONNECT_SECONDS = "metrics_connect_seconds"
+
+
+class _CheckoutTimingMixin:
+    """Times ``connect`` minus new-connection time into the checkout wait histogram."""
+
+    _metrics_name: Optional[str] = None
+
+    def connect(self):
+        if self._metrics_name is None:
+            return super().connect()
+
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            checkout_timeouts_total.labels(self._metrics_name).inc()
+            checkout_wait_seconds.labels(self._metrics_name).observe(
+                time.perf_counter() - start
+            )
+            raise
+
+        elapsed = time.perf_counter() - start
+        connecting = connection.info.pop(_CONNECT_SECONDS, 0.0)
+        checkout_wait_seconds.labels(self._metrics_name).observe(
+            max(elapsed - connecting, 0.0)
+        )
+        return connection
+
+    def recreate(self):
+        # engine.dispose() swaps in a recreated pool; keep it instrumented
+        pool = super().recreate()
+        pool._metrics_name = self._metrics_name
+        return pool
+
+
+class InstrumentedQueuePool(_CheckoutTimingMixin, QueuePool):
+    """QueuePool that records checkout wait time."""
+
+
+class InstrumentedAsyncAdaptedQueuePool(_CheckoutTimingMixin, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that records checkout wait time."""
+
+
+def instrument_engine(engine: Engine, name: str) -> None:
+    """
+    Attach pool metrics to an engine under the ``pool`` label ``name``.
+
+    For an AsyncEngine pass ``async_engine.sync_engine``.
+    """
+    if isinstance(engine.pool, _CheckoutTimingMixin):
+        engine.pool._metrics_name = name
+
+    for event_name in ("connect", "close", "invalidate", "soft_invalidate"):
+        counter = connection_events_total.labels(name, event_name)
+        event.listen(engine, event_name, lambda *args, _counter=counter: _counter.inc())
+
+    connect_histogram = connect_seconds.labels(name)
+
+    def connect_started(dialect, connection_record, cargs, cparams) -> None:
+        connection_record.info[_CONNECT_STARTED] = time.perf_counter()
+
+    def connected(dbapi_connection, connection_record) -> None:
+        started = connection_record.info.pop(_CONNECT_STARTED, None)
+        if started is None:
+            return
+        elapsed = time.perf_counter() - started
+        connection_record.info[_CONNECT_SECONDS] = elapsed
+        connect_histogram.observe(elapsed)
+
+    event.listen(engine, "do_connect", connect_started)
+    event.listen(engine, "connect", connected)
+
+    # Read the live pool each time; dispose() replaces engine.pool
+    states = {
+        "checked_out": lambda: engine.pool.checkedout(),
+        "checked_in": lambda: engine.pool.checkedin(),
+        "overflow": lambda: max(engine.pool.overflow(), 0),
+        "size": lambda: engine.pool.size(),
+    }
+    for state, read in states.items():
+        pool_connections.labels(name, state).set_function(read)
+
+
+def pool_stats() -> Dict[str, Any]:
+    """Per-pool gauges, churn counters and checkout wait summary (ms)."""
+    stats: Dict[str, Dict[str, Any]] = {}
+
+    for (name, state), gauge in pool_connections.children():
+        stats.setdefault(name, {})[state] = int(gauge.value)
+    for (name, event_name), counter in connection_events_total.children():
+        stats.setdefault(name, {}).setdefault("events", {})[event_name] = int(counter.value)
+    for (name,), counter in checkout_timeouts_total.children():
+        stats.setdefault(name, {})["checkout_timeouts"] = int(counter.value)
+    for (name,), histogram in checkout_wait_seconds.children():
+        stats.setdefault(name, {})["checkout_wait_ms"] = histogram.snapshot().to_dict(scale=1000)
+    for (name,), histogram in connect_seconds.children():
+        stats.setdefault(name, {})["connect_ms"] = histogram.snapshot().to_dict(scale=1000)
+
+    return stats
@@ -0,0 +1,150 @@
+"""
+Lightweight request-scoped spans for attributing latency to workflow stages.
+
+A ``RequestTrace`` is bound to a context variable for the duration of a
+request. ``span()`` and ``traced()`` record into whichever trace is active and
+cost a single context-variable lookup when none is. Spans are named by their
+nesting path (``persist_session.resolve_clients``), so the same stage called
+from different places stays distinguishable.
+"""
+
+import functools
+import inspect
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+# Bound distinct span names per request so runaway loops cannot grow a trace
+MAX_SPANS_PER_TRACE = 64
+
+_current_trace: ContextVar[Optional["RequestTrace"]] = ContextVar(
+    "current_trace", default=None
+)
+_current_path: ContextVar[str] = ContextVar("current_span_path", default="")
+
+
+class RequestTrace:
+    """
+    Timings recorded for one request.
+
+    Spans may finish on worker threads (the DB thread pool runs with a copy of
+    the request context), so recording takes a lock.
+    """
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        # path -> [first start offset (ms), total duration (ms), calls]
+        self._spans: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, path: str, start: float, elapsed_ms: float) -> None:
+        with self._lock:
+            entry = self._spans.get(path)
+            if entry is None:
+                if len(self._spans) >= MAX_SPANS_PER_TRACE:
+                    return
+                offset_ms = (start - self.start) * 1000
+                self._spans[path] = [offset_ms, elapsed_ms, 1]
+            else:
+                entry[1] += elapsed_ms
+                entry[2] += 1
+
+    @property
+    def elapsed_ms(self) -> float:
+        return (time.perf_counter() - self.start) * 1000
+
+    def breakdown(self) -> List[Tuple[str, float, int]]:
+        """(span path, total ms, calls) in the order spans first started."""
+        with self._lock:
+            entries = sorted(self._spans.items(), key=lambda item: item[1][0])
+        return [(path, entry[1], int(entry[2])) for path, entry in entries]
+
+    def format_log(self) -> str:
+        """Breakdown as ``stage=12.3ms`` pairs, with call counts when repeated."""
+        parts = []
+        for path, total_ms, calls in self.breakdown():
+            suffix = f"x{calls}" if calls > 1 else ""
+            parts.append(f"{path}={total_ms:.1f}ms{suffix}")
+        return " ".join(parts)
+
+    def server_timing(self) -> str:
+        """Breakdown as a ``Server-Timing`` header value, including the total."""
+        metrics = [f"{path};dur={total_ms:.1f}" for path, total_ms, _ in self.breakdown()]
+        metrics.append(f"total;dur={self.elapsed_ms:.1f}")
+        return ", ".join(metrics)
+
+
+def start_trace() -> Tuple[RequestTrace, Any]:
+    """Bind a new trace to the current context; pass the token to ``end_trace``."""
+    trace = RequestTrace()
+    return trace, _current_trace.set(trace)
+
+
+def end_trace(token: Any) -> None:
+    _current_trace.reset(token)
+
+
+def current_trace() -> Optional[RequestTrace]:
+    return _current_trace.get()
+
+
+class span:
+    """
+    Time a block as a named stage of the active request trace.
+
+    Usage:
+        with span("session_insert"):
+            ...
+    """
+
+    __slots__ = ("name", "_trace", "_token", "_start")
+
+    def __init__(self, name: str):
+        self.name = name
+        self._trace = None
+
+    def __enter__(self) -> "span":
+        trace = _current_trace.get()
+        if trace is not None:
+            self._trace = trace
+            parent = _current_path.get()
+            path = f"{parent}.{self.name}" if parent else self.name
+            self._token = _current_path.set(path)
+            self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        trace = self._trace
+        if trace is None:
+            return
+        elapsed_ms = (time.perf_counter() - self._start) * 1000
+        path = _current_path.get()
+        _current_path.reset(self._token)
+        trace.record(path, self._start, elapsed_ms)
+        self._trace = None
+
+
+def traced(name: str) -> Callable[[F], F]:
+    """Decorator recording each call of a function (sync or async) as a span."""
+
+    def decorator(func: F) -> F:
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with span(name):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper  # type: ignore[return-value]
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with span(name):
+                return func(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
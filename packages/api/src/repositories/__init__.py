@@ -4,9 +4,16 @@ Repository exports for data access layer.
 
 from .sessions import SessionRepository
 from .clients import ClientRepository, ClientSessionRepository
+from .transcripts import TranscriptRepository
+from .async_sessions import AsyncSessionRepository
+from .async_clients import AsyncClientRepository, AsyncClientSessionRepository
 
 __all__ = [
     "SessionRepository",
     "ClientRepository", 
     "ClientSessionRepository",
+    "TranscriptRepository",
+    "AsyncSessionRepository",
+    "AsyncClientRepository",
+    "AsyncClientSessionRepository",
 ]
\ No newline at end of file
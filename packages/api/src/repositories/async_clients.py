@@ -0,0 +1,358 @@
+"""
+Async repository for client data access operations.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import make_transient_to_detached
+
+from ..models.core import Client, ClientSession
+from ..monitoring.tracing import traced
+from .client_name_index import OrganizationNameIndex
+from .clients import (
+    BulkResolutionResult,
+    ClientMatchingBase,
+    ClientResolution,
+    client_session_rows,
+    session_link_rows,
+)
+
+
+class AsyncClientRepository(ClientMatchingBase):
+    """Async repository for client database operations."""
+    
+    db: AsyncSession
+    
+    async def find_or_create_client(
+        self,
+        name: str,
+        organization_id: UUID,
+        email: Optional[str] = None,
+    ) -> tuple[Client, bool]:
+        """
+        Find existing client by name or create a new one.
+        
+        Args:
+            name: Client's name
+            organization_id: Organization the client belongs to
+            email: Client's email (optional)
+            
+        Returns:
+            Tuple of (client_model, was_created)
+            
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        try:
+            # Warm organizations answer exact names from memory
+            indexed = await self._find_in_name_index(name, organization_id, exact_only=True)
+            if indexed:
+                return await self._attach_indexed_client(indexed, organization_id), False
+            
+            # Then an exact match in the database, which also sees clients
+            # other processes added since the index was loaded
+            existing_client = await self._find_client_by_name(name, organization_id)
+            if existing_client:
+                return existing_client, False
+            
+            # Only then fuzzy match from the index, so a stale fuzzy hit
+            # never beats an exact match
+            indexed = await self._find_in_name_index(name, organization_id)
+            if indexed:
+                return await self._attach_indexed_client(indexed, organization_id), False
+            
+            # Try fuzzy matching if no exact match
+            fuzzy_client = await self._find_client_fuzzy(name, organization_id)
+            if fuzzy_client:
+                return fuzzy_client, False
+            
+            # Create new client if no match found
+            new_client = await self._create_new_client(name, organization_id, email)
+            return new_client, True
+            
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            raise e
+    
+    @traced("resolve_clients")
+    async def resolve_clients_bulk(
+        self,
+        names: Iterable[str],
+        organization_id: UUID,
+        similarity_threshold: float = 0.8,
+    ) -> BulkResolutionResult:
+        """
+        Find or create clients for many names with a fixed number of queries.
+        
+        Same matching rules as ClientRepository.resolve_clients_bulk.
+        
+        Args:
+            names: Client names to resolve
+            organization_id: Organization the clients belong to
+            similarity_threshold: Minimum fuzzy similarity score (0-1)
+            
+        Returns:
+            BulkResolutionResult keyed by stripped name, with the number of
+            database round trips used
+            
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        unique_names = list(dict.fromkeys(n.strip() for n in names if n.strip()))
+        resolutions: Dict[str, ClientResolution] = {}
+        round_trips = 0
+        
+        if not unique_names:
+            return BulkResolutionResult(resolutions=resolutions, round_trips=0)
+        
+        try:
+            index, loaded = await self._get_name_index(organization_id)
+            round_trips += loaded
+            
+            pending = []
+            for name in unique_names:
+                indexed = self._lookup_in_index(
+                    index, name, similarity_threshold, exact_only=True
+                )
+                if not indexed:
+                    pending.append(name)
+                    continue
+                resolutions[name] = ClientResolution(
+                    name=name,
+                    client_id=indexed[0],
+                    client_name=indexed[1],
+                    was_created=False,
+                )
+            
+            candidates: List[Client] = []
+            candidate_filter = self._candidate_clients_filter(pending) if pending else None
+            if candidate_filter is not None:
+                candidates = list(await self.db.scalars(
+                    select(Client).where(
+                        Client.organization_id == organization_id, candidate_filter
+                    )
+                ))
+                round_trips += 1
+            
+            new_rows = self._resolve_in_memory(
+                pending, candidates, organization_id, similarity_threshold, resolutions
+            )
+            
+            if new_rows:
+                await self.db.execute(insert(Client), new_rows)
+                round_trips += 1
+                self._queue_name_index_update(
+                    organization_id, [(row["id"], row["name"]) for row in new_rows]
+                )
+            
+            return BulkResolutionResult(resolutions=resolutions, round_trips=round_trips)
+            
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            raise e
+    
+    async def _get_name_index(
+        self,
+        organization_id: UUID,
+    ) -> Tuple[Optional[OrganizationNameIndex], int]:
+        """The organization's name index and the number of queries used to load it."""
+        if not self._name_index_enabled():
+            return None, 0
+        
+        index, generation = self.name_index.get(organization_id)
+        if index is not None:
+            return index, 0
+        
+        rows = await self.db.execute(self._name_index_rows_statement(organization_id))
+        index = OrganizationNameIndex((row.id, row.name) for row in rows)
+        self.name_index.put(organization_id, index, generation)
+        return index, 1
+    
+    async def _find_in_name_index(
+        self,
+        name: str,
+        organization_id: UUID,
+        similarity_threshold: float = 0.8,
+        exact_only: bool = False,
+    ) -> Optional[Tuple[UUID, str]]:
+        """Resolve a name from the name index; None means ask the database."""
+        index, _ = await self._get_name_index(organization_id)
+        return self._lookup_in_index(index, name, similarity_threshold, exact_only)
+    
+    async def _attach_indexed_client(
+        self,
+        indexed: Tuple[UUID, str],
+        organization_id: UUID,
+    ) -> Client:
+        """Session-bound Client for an index hit, without a database round trip."""
+        client_id, client_name = indexed
+        client = Client(id=client_id, name=client_name, organization_id=organization_id)
+        make_transient_to_detached(client)
+        return await self.db.merge(client, load=False)
+    
+    async def _find_client_by_name(
+        self,
+        name: str,
+        organization_id: UUID
+    ) -> Optional[Client]:
+        """Find client by exact name match."""
+        return await self.db.scalar(
+            select(Client)
+            .where(
+                Client.name.ilike(name.strip()),  # Case-insensitive exact match
+                Client.organization_id == organization_id
+            )
+            .limit(1)
+        )
+    
+    async def _find_client_fuzzy(
+        self,
+        name: str,
+        organization_id: UUID,
+        similarity_threshold: float = 0.8
+    ) -> Optional[Client]:
+        """Find client using fuzzy matching on name."""
+        normalized_search = self._normalize_name(name)
+        
+        clients = await self.db.scalars(
+            select(Client).where(
+                Client.organization_id == organization_id,
+                *self._fuzzy_candidate_filters(normalized_search),
+            )
+        )
+        
+        return self._best_fuzzy_match(normalized_search, clients, similarity_threshold)
+    
+    async def _create_new_client(
+        self,
+        name: str,
+        organization_id: UUID,
+        email: Optional[str] = None
+    ) -> Client:
+        """Create a new client record."""
+        client = self._build_new_client(name, organization_id, email)
+        
+        self.db.add(client)
+        await self.db.flush()  # Get the ID without committing
+        self._queue_name_index_update(organization_id, [(client.id, client.name)])
+        
+        return client
+    
+    async def get_client_by_id(self, client_id: UUID) -> Optional[Client]:
+        """Get client by ID."""
+        return await self.db.get(Client, client_id)
+
+
+class AsyncClientSessionRepository:
+    """Async repository for client-session relationship operations."""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    async def create_client_session(
+        self,
+        client_id: UUID,
+        session_id: UUID,
+        speaking_time_seconds: Optional[int] = None,
+        engagement_level: Optional[str] = None,
+    ) -> ClientSession:
+        """
+        Create a client-session relationship.
+        
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        try:
+            client_session = ClientSession(
+                client_id=client_id,
+                session_id=session_id,
+                speaking_time_seconds=speaking_time_seconds,
+                engagement_level=engagement_level,
+                breakthrough_detected=False,  # Default value
+                priority_score=0.0,  # Default value
+            )
+            
+            self.db.add(client_session)
+            await self.db.flush()
+            
+            return client_session
+            
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            raise e
+    
+    @traced("link_clients")
+    async def create_client_sessions_bulk(
+        self,
+        session_id: UUID,
+        client_ids: Iterable[UUID],
+        speaking_time_seconds: Optional[Dict[UUID, int]] = None,
+        engagement_levels: Optional[Dict[UUID, str]] = None,
+    ) -> int:
+        """
+        Link many clients to a session with a single bulk INSERT.
+        
+        Returns:
+            Number of client-session rows inserted
+            
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        rows = client_session_rows(
+            session_id, client_ids, speaking_time_seconds, engagement_levels
+        )
+        if not rows:
+            return 0
+        
+        try:
+            await self.db.execute(insert(ClientSession), rows)
+            return len(rows)
+            
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            raise e
+    
+    @traced("link_clients_bulk")
+    async def link_sessions_bulk(
+        self,
+        links: Dict[UUID, Iterable[UUID]],
+        engagement_level: Optional[str] = None,
+        speaking_time_seconds: Optional[Dict[UUID, Dict[UUID, int]]] = None,
+        engagement_levels: Optional[Dict[UUID, Dict[UUID, str]]] = None,
+    ) -> int:
+        """
+        Link clients to many sessions with a single bulk INSERT.
+        
+        Returns:
+            Number of client-session rows inserted
+            
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        rows = session_link_rows(
+            links, engagement_level, speaking_time_seconds, engagement_levels
+        )
+        if not rows:
+            return 0
+        
+        try:
+            await self.db.execute(insert(ClientSession), rows)
+            return len(rows)
+            
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            raise e
+    
+    async def get_client_sessions_for_session(
+        self,
+        session_id: UUID
+    ) -> List[ClientSession]:
+        """Get all client sessions for a specific session."""
+        result = await self.db.scalars(
+            select(ClientSession).where(ClientSession.session_id == session_id)
+        )
+        return list(result)
@@ -0,0 +1,274 @@
+"""
+Async repository for session data access operations.
+"""
+
+import asyncio
+from datetime import date
+from typing import Any, Dict, Iterable, List, Optional
+from uuid import UUID
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import defer, joinedload, load_only
+
+from ..models.core import Session as SessionModel, ClientSession, Client
+from ..monitoring.tracing import traced
+from .sessions import build_session
+from .transcripts import compress_transcript
+
+
+class AsyncSessionRepository:
+    """Async repository for session database operations."""
+    
+    def __init__(self, db: AsyncSession):
+        self.db = db
+    
+    @traced("session_insert")
+    async def create_session(
+        self,
+        coach_id: UUID,
+        transcript_text: str,
+        session_date: date,
+        session_type: Optional[str] = None,
+        duration_minutes: Optional[int] = None,
+        participant_count: Optional[int] = None,
+        notes: Optional[str] = None,
+        transcript_hash: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+        segment_index: Optional[bytes] = None,
+    ) -> SessionModel:
+        """
+        Create a new session record.
+        
+        Args:
+            coach_id: ID of the coach conducting the session
+            transcript_text: Full transcript text
+            session_date: Date the session occurred
+            session_type: Type of session (optional)
+            duration_minutes: Session duration (optional)
+            participant_count: Number of participants (optional)
+            notes: Additional notes (optional)
+            transcript_hash: Normalized content hash (optional)
+            idempotency_key: Client idempotency key (optional)
+            segment_index: Encoded segment index of a timed transcript (optional)
+            
+        Returns:
+            Created session model
+            
+        Raises:
+            IntegrityError: If the coach already has a session with this
+                transcript hash or idempotency key
+            SQLAlchemyError: If database operation fails
+        """
+        try:
+            # Prepare metadata
+            metadata = {}
+            if notes:
+                metadata['notes'] = notes
+            
+            # Create session model
+            session = SessionModel(
+                coach_id=coach_id,
+                session_date=session_date,
+                session_type=session_type,
+                duration_minutes=duration_minutes,
+                participant_count=participant_count,
+                processing_status="uploaded",
+                session_metadata=metadata,
+                transcript_hash=transcript_hash,
+                idempotency_key=idempotency_key,
+            )
+            
+            # Compress off the event loop; transcripts can be ~1MB
+            if transcript_text:
+                session.transcript = await asyncio.to_thread(
+                    compress_transcript, transcript_text, segment_index
+                )
+            
+            self.db.add(session)
+            await self.db.flush()  # Get the ID without committing
+            
+            return session
+            
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            raise e
+    
+    @traced("session_insert_bulk")
+    async def create_sessions_bulk(
+        self,
+        coach_id: UUID,
+        sessions: Iterable[Dict[str, Any]],
+    ) -> List[SessionModel]:
+        """
+        Create many session records (with transcripts) in one flush.
+        
+        Returns:
+            Created session models, in input order
+            
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        fields = list(sessions)
+        try:
+            # Build and compress off the event loop
+            models = await asyncio.to_thread(
+                lambda: [build_session(coach_id=coach_id, **f) for f in fields]
+            )
+            self.db.add_all(models)
+            await self.db.flush()
+            
+            return models
+            
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            raise e
+    
+    async def get_session_by_id(self, session_id: UUID) -> Optional[SessionModel]:
+        """
+        Retrieve a session by its ID.
+        
+        Args:
+            session_id: Session identifier
+            
+        Returns:
+            Session model or None if not found
+        """
+        return await self.db.scalar(
+            select(SessionModel).where(SessionModel.id == session_id)
+        )
+    
+    @traced("find_duplicate")
+    async def find_by_upload_keys(
+        self,
+        coach_id: UUID,
+        transcript_hash: str,
+        idempotency_key: Optional[str] = None,
+    ) -> List[SessionModel]:
+        """Find a coach's sessions with this transcript hash or idempotency key."""
+        keys = SessionModel.transcript_hash == transcript_hash
+        if idempotency_key is not None:
+            keys = or_(keys, SessionModel.idempotency_key == idempotency_key)
+        
+        result = await self.db.execute(
+            select(SessionModel)
+            .options(
+                load_only(
+                    SessionModel.id,
+                    SessionModel.processing_status,
+                    SessionModel.transcript_hash,
+                    SessionModel.idempotency_key,
+                ),
+                joinedload(SessionModel.client_sessions)
+                .load_only(ClientSession.client_id)
+                .joinedload(ClientSession.client)
+                .load_only(Client.name),
+            )
+            .where(SessionModel.coach_id == coach_id, keys)
+        )
+        return list(result.unique().scalars().all())
+    
+    async def find_ids_by_hashes(
+        self,
+        coach_id: UUID,
+        transcript_hashes: Iterable[str],
+    ) -> Dict[str, UUID]:
+        """Existing session ids keyed by transcript hash, in one query."""
+        hashes = list(set(transcript_hashes))
+        if not hashes:
+            return {}
+        
+        result = await self.db.execute(
+            select(SessionModel.transcript_hash, SessionModel.id).where(
+                SessionModel.coach_id == coach_id,
+                SessionModel.transcript_hash.in_(hashes),
+            )
+        )
+        return {transcript_hash: session_id for transcript_hash, session_id in result.all()}
+    
+    @traced("load_session")
+    async def get_session_with_participants(
+        self,
+        session_id: UUID,
+    ) -> Optional[SessionModel]:
+        """
+        Retrieve a session with its client sessions and clients in one query.
+        
+        Args:
+            session_id: Session identifier
+            
+        Returns:
+            Session model with client_sessions and their clients loaded, or
+            None if not found
+        """
+        result = await self.db.execute(
+            select(SessionModel)
+            .options(
+                defer(SessionModel.session_metadata),
+                joinedload(SessionModel.client_sessions)
+                .load_only(
+                    ClientSession.client_id,
+                    ClientSession.engagement_level,
+                    ClientSession.speaking_time_seconds,
+                )
+                .joinedload(ClientSession.client)
+                .load_only(Client.name, Client.email),
+            )
+            .where(SessionModel.id == session_id)
+        )
+        return result.unique().scalar_one_or_none()
+    
+    async def update_processing_status(
+        self,
+        session_id: UUID,
+        status: str
+    ) -> bool:
+        """
+        Update the processing status of a session.
+        
+        Args:
+            session_id: Session identifier
+            status: New processing status
+            
+        Returns:
+            True if update succeeded, False otherwise
+        """
+        try:
+            result = await self.db.execute(
+                update(SessionModel)
+                .where(SessionModel.id == session_id)
+                .values(processing_status=status)
+            )
+            
+            return result.rowcount > 0
+            
+        except SQLAlchemyError:
+            await self.db.rollback()
+            return False
+    
+    async def get_sessions_by_coach(
+        self,
+        coach_id: UUID,
+        limit: int = 50,
+        offset: int = 0
+    ) -> list[SessionModel]:
+        """
+        Get sessions for a specific coach.
+        
+        Args:
+            coach_id: Coach identifier
+            limit: Maximum number of sessions to return
+            offset: Number of sessions to skip
+            
+        Returns:
+            List of session models
+        """
+        result = await self.db.scalars(
+            select(SessionModel)
+            .where(SessionModel.coach_id == coach_id)
+            .order_by(SessionModel.session_date.desc())
+            .limit(limit)
+            .offset(offset)
+        )
+        return list(result)
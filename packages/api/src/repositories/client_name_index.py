@@ -0,0 +1,346 @@
+"""
+In-memory client name index for warm organizations.
+
+Holds each organization's client names with precomputed normalized keys, a
+word-token inverted index for the Jaccard path and a character-trigram index
+for substring candidates, so name resolution can skip the database entirely
+once an organization is warm.
+
+Clients created through a session are added to cached indexes once that
+session commits, via the ``after_commit`` hook below; rolled back clients
+never reach the cache.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from ..models.core import normalize_client_name
+
+TRIGRAM_SIZE = 3
+
+# Session.info key holding (cache, organization_id, clients) updates that
+# wait for the session to commit
+PENDING_UPDATES_KEY = "client_name_index_updates"
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i:i + TRIGRAM_SIZE] for i in range(len(text) - TRIGRAM_SIZE + 1)}
+
+
+class OrganizationNameIndex:
+    """
+    Name lookup structures for one organization's clients.
+
+    ``find`` reproduces ClientRepository's exact-then-fuzzy rules: it only
+    narrows which clients are scored, never how they are scored.
+
+    ``add`` may run while other threads call ``find``: writers are serialized
+    by ClientNameIndexCache, list entries are appended before any lookup
+    structure refers to them, and readers copy shared sets before iterating.
+    """
+
+    def __init__(self, clients: Iterable[Tuple[UUID, str]]):
+        # Position in these lists preserves load order for tie-breaking
+        self._ids: List[UUID] = []
+        self._names: List[str] = []
+        self._normalized: List[str] = []
+        self._by_lower: Dict[str, int] = {}
+        self._by_normalized: Dict[str, List[int]] = {}
+        self._by_token: Dict[str, Set[int]] = {}
+        self._by_trigram: Dict[str, Set[int]] = {}
+        self._token_counts: List[int] = []
+        self._normalized_lengths: Set[int] = set()
+        self._known_ids: Set[UUID] = set()
+
+        for client_id, name in clients:
+            self.add(client_id, name)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def find(
+        self,
+        name: str,
+        similarity: Callable[[str, str], float],
+        similarity_threshold: float,
+    ) -> Optional[Tuple[UUID, str]]:
+        """
+        Best matching (client_id, client_name) for a name, or None.
+
+        Args:
+            name: Name to resolve
+            similarity: Scoring function over normalized names
+            similarity_threshold: Minimum fuzzy similarity score (0-1)
+        """
+        # Case-insensitive exact match first
+        exact = self.find_exact(name)
+        if exact is not None:
+            return exact
+
+        normalized_search = normalize_client_name(name)
+        best_position = None
+        best_score = 0.0
+
+        candidates = self._candidates(normalized_search, similarity_threshold)
+        for position in sorted(candidates):
+            score = similarity(normalized_search, self._normalized[position])
+            if score >= similarity_threshold and score > best_score:
+                best_position = position
+                best_score = score
+
+        if best_position is None:
+            return None
+        return self._ids[best_position], self._names[best_position]
+
+    def find_exact(self, name: str) -> Optional[Tuple[UUID, str]]:
+        """(client_id, client_name) of a case-insensitive exact match, or None."""
+        position = self._by_lower.get(name.strip().lower())
+        if position is None:
+            return None
+        return self._ids[position], self._names[position]
+
+    def add(self, client_id: UUID, name: str) -> None:
+        """Index one client; clients already indexed are ignored."""
+        if client_id in self._known_ids:
+            return
+        self._known_ids.add(client_id)
+        position = len(self._ids)
+        normalized = normalize_client_name(name)
+
+        self._ids.append(client_id)
+        self._names.append(name)
+        self._normalized.append(normalized)
+        self._by_lower.setdefault(name.lower(), position)
+        self._by_normalized.setdefault(normalized, []).append(position)
+        self._normalized_lengths.add(len(normalized))
+        tokens = set(normalized.split())
+        self._token_counts.append(len(tokens))
+        for token in tokens:
+            self._by_token.setdefault(token, set()).add(position)
+        for trigram in _trigrams(normalized):
+            self._by_trigram.setdefault(trigram, set()).add(position)
+
+    def _candidates(self, normalized_search: str, similarity_threshold: float) -> Set[int]:
+        """Positions of every client that can reach the threshold."""
+        if not normalized_search:
+            # The empty string is contained in every name
+            return set(range(len(self._ids)))
+
+        # Word overlap: keep clients whose Jaccard score reaches the threshold
+        search_tokens = set(normalized_search.split())
+        shared: Dict[int, int] = {}
+        for token in search_tokens:
+            for position in tuple(self._by_token.get(token, ())):
+                shared[position] = shared.get(position, 0) + 1
+        candidates: Set[int] = {
+            position
+            for position, overlap in shared.items()
+            if overlap >= similarity_threshold * (
+                len(search_tokens) + self._token_counts[position] - overlap
+            )
+        }
+
+        # Search name within a client name
+        if len(normalized_search) >= TRIGRAM_SIZE:
+            postings = [
+                self._by_trigram.get(trigram, set())
+                for trigram in _trigrams(normalized_search)
+            ]
+            postings.sort(key=len)
+            containing = set(postings[0]).intersection(*postings[1:])
+            candidates.update(
+                p for p in containing if normalized_search in self._normalized[p]
+            )
+        else:
+            candidates.update(
+                p for p, normalized in enumerate(self._normalized)
+                if normalized_search in normalized
+            )
+
+        # Client name within the search name
+        search_length = len(normalized_search)
+        for length in tuple(self._normalized_lengths):
+            if length > search_length:
+                continue
+            if length == 0:
+                candidates.update(self._by_normalized[""])
+                continue
+            for start in range(search_length - length + 1):
+                candidates.update(
+                    self._by_normalized.get(normalized_search[start:start + length], ())
+                )
+
+        return candidates
+
+
+class ClientNameIndexCache:
+    """
+    LRU of OrganizationNameIndex instances, shared across repositories.
+
+    Committed clients are added to a cached index in place (``add``); a
+    build that started before a change to its organization is discarded
+    rather than cached. Indexes expire ``ttl_seconds`` after they were
+    loaded, which bounds how long clients added by other processes stay
+    invisible; callers must still treat a failed lookup as a miss and
+    consult the database.
+    """
+
+    def __init__(self, max_organizations: int, ttl_seconds: float = 0):
+        self.max_organizations = max_organizations
+        self.ttl_seconds = ttl_seconds  # 0 disables expiry
+        # organization_id -> (index, monotonic load time), least recent first
+        self._indexes: "OrderedDict[UUID, Tuple[OrganizationNameIndex, float]]" = OrderedDict()
+        # Builds are stamped with the change clock when they start; the
+        # organizations changed most recently remember the clock of their
+        # last change, and anything older is covered by _forgotten_through
+        self._clock = 0
+        self._changed_at: "OrderedDict[UUID, int]" = OrderedDict()
+        self._forgotten_through = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.builds = 0
+        self.invalidations = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.updates = 0
+
+    def get_or_build(
+        self,
+        organization_id: UUID,
+        loader: Callable[[], Iterable[Tuple[UUID, str]]],
+    ) -> OrganizationNameIndex:
+        """Cached index for an organization, building it with ``loader`` if cold."""
+        index, generation = self.get(organization_id)
+        if index is not None:
+            return index
+
+        index = OrganizationNameIndex(loader())
+        self.put(organization_id, index, generation)
+        return index
+
+    def get(self, organization_id: UUID) -> Tuple[Optional[OrganizationNameIndex], int]:
+        """
+        Cached index (or None) and the generation to pass to ``put``.
+
+        Lets callers that load asynchronously build the index themselves.
+        """
+        with self._lock:
+            entry = self._indexes.get(organization_id)
+            if entry is None:
+                return None, self._clock
+            index, loaded_at = entry
+            if self.ttl_seconds and time.monotonic() - loaded_at > self.ttl_seconds:
+                del self._indexes[organization_id]
+                self.expirations += 1
+                return None, self._clock
+            self._indexes.move_to_end(organization_id)
+            return index, self._clock
+
+    def put(
+        self,
+        organization_id: UUID,
+        index: OrganizationNameIndex,
+        generation: int,
+    ) -> None:
+        """Cache a built index unless the organization changed meanwhile."""
+        with self._lock:
+            self.builds += 1
+            if self._changed_at.get(organization_id, self._forgotten_through) > generation:
+                return
+            self._indexes[organization_id] = (index, time.monotonic())
+            self._indexes.move_to_end(organization_id)
+            while len(self._indexes) > self.max_organizations:
+                self._indexes.popitem(last=False)
+                self.evictions += 1
+
+    def add(self, organization_id: UUID, clients: Iterable[Tuple[UUID, str]]) -> None:
+        """Add committed clients to the organization's index, if cached."""
+        with self._lock:
+            self._mark_changed(organization_id)
+            entry = self._indexes.get(organization_id)
+            if entry is None:
+                return
+            for client_id, name in clients:
+                entry[0].add(client_id, name)
+            self.updates += 1
+
+    def invalidate(self, organization_id: UUID) -> None:
+        """Drop an organization's index after its clients change."""
+        with self._lock:
+            self._mark_changed(organization_id)
+            if self._indexes.pop(organization_id, None) is not None:
+                self.invalidations += 1
+
+    def _mark_changed(self, organization_id: UUID) -> None:
+        """Advance the change clock so builds already running are discarded."""
+        self._clock += 1
+        self._changed_at[organization_id] = self._clock
+        self._changed_at.move_to_end(organization_id)
+        while len(self._changed_at) > self.max_organizations:
+            _, self._forgotten_through = self._changed_at.popitem(last=False)
+
+    def record(self, hit: bool) -> None:
+        """Count a lookup answered (hit) or not answered (miss) by an index."""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def clear(self) -> None:
+        """Drop every cached index."""
+        with self._lock:
+            self._indexes.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss counters and current size."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "organizations": len(self._indexes),
+                "max_organizations": self.max_organizations,
+                "clients": sum(len(index) for index, _ in self._indexes.values()),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "builds": self.builds,
+                "invalidations": self.invalidations,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "updates": self.updates,
+            }
+
+
+def queue_index_update(
+    session,
+    cache: ClientNameIndexCache,
+    organization_id: UUID,
+    clients: Iterable[Tuple[UUID, str]],
+) -> None:
+    """Add clients created in ``session`` to the cache once it commits."""
+    session.info.setdefault(PENDING_UPDATES_KEY, []).append(
+        (cache, organization_id, list(clients))
+    )
+
+
+def has_pending_index_updates(session) -> bool:
+    """Whether ``session`` created clients that are not committed yet."""
+    return bool(session.info.get(PENDING_UPDATES_KEY))
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_index_updates(session: Session) -> None:
+    for cache, organization_id, clients in session.info.pop(PENDING_UPDATES_KEY, ()):
+        cache.add(organization_id, clients)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_index_updates(session: Session) -> None:
+    session.info.pop(PENDING_UPDATES_KEY, None)
@@ -2,21 +2,369 @@
 Repository for client data access operations.
 """
 
-from typing import Optional, List
-from uuid import UUID
+from dataclasses import dataclass
+from typing import Optional, List, Dict, Iterable, Tuple
+from uuid import UUID, uuid4
 
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, make_transient_to_detached
 from sqlalchemy.exc import SQLAlchemyError
-from sqlalchemy import or_, func
+from sqlalchemy import or_, insert, literal, select
 
-from ..models.core import Client, ClientSession, Organization
+from ..config import settings
+from ..models.core import Client, ClientSession, Organization, normalize_client_name
+from ..monitoring.tracing import traced
+from .client_name_index import (
+    ClientNameIndexCache,
+    OrganizationNameIndex,
+    has_pending_index_updates,
+    queue_index_update,
+)
+from .query_counter import QueryCounter
 
 
-class ClientRepository:
-    """Repository for client database operations."""
+@dataclass
+class ClientResolution:
+    """Outcome of resolving one participant name to a client."""
+    name: str
+    client_id: UUID
+    client_name: str
+    was_created: bool
+
+
+@dataclass
+class BulkResolutionResult:
+    """Clients resolved for a batch of names."""
+    resolutions: Dict[str, ClientResolution]
+    round_trips: int
+
+
+def client_session_rows(
+    session_id: UUID,
+    client_ids: Iterable[UUID],
+    speaking_time_seconds: Optional[Dict[UUID, int]] = None,
+    engagement_levels: Optional[Dict[UUID, str]] = None,
+) -> List[Dict]:
+    """ClientSession rows for a bulk INSERT, one per distinct client."""
+    speaking_time_seconds = speaking_time_seconds or {}
+    engagement_levels = engagement_levels or {}
     
-    def __init__(self, db: Session):
+    return [
+        {
+            "id": uuid4(),
+            "client_id": client_id,
+            "session_id": session_id,
+            "speaking_time_seconds": speaking_time_seconds.get(client_id),
+            "engagement_level": engagement_levels.get(client_id),
+            "breakthrough_detected": False,  # Default value
+            "priority_score": 0.0,  # Default value
+        }
+        for client_id in dict.fromkeys(client_ids)
+    ]
+
+
+def session_link_rows(
+    links: Dict[UUID, Iterable[UUID]],
+    engagement_level: Optional[str] = None,
+    speaking_time_seconds: Optional[Dict[UUID, Dict[UUID, int]]] = None,
+    engagement_levels: Optional[Dict[UUID, Dict[UUID, str]]] = None,
+) -> List[Dict]:
+    """
+    ClientSession rows linking clients to many sessions.
+    
+    Per-client metrics are keyed by session id, then client id;
+    ``engagement_level`` applies to clients without a level of their own.
+    """
+    speaking_time_seconds = speaking_time_seconds or {}
+    engagement_levels = engagement_levels or {}
+    
+    rows = []
+    for session_id, client_ids in links.items():
+        client_ids = list(client_ids)
+        levels = {client_id: engagement_level for client_id in client_ids}
+        levels.update(engagement_levels.get(session_id, {}))
+        rows.extend(client_session_rows(
+            session_id,
+            client_ids,
+            speaking_time_seconds=speaking_time_seconds.get(session_id),
+            engagement_levels=levels,
+        ))
+    return rows
+
+
+class ClientMatchingBase:
+    """
+    Name matching shared by the sync and async client repositories.
+    
+    Holds the scoring rules, the candidate filters and the
+    in-memory name index; subclasses only add database I/O.
+    """
+    
+    # Shared across requests and both repository flavours; see ClientNameIndexCache
+    name_index_cache = ClientNameIndexCache(
+        max_organizations=settings.client_name_index_max_organizations,
+        ttl_seconds=settings.client_name_index_ttl_seconds,
+    )
+    
+    def __init__(self, db):
         self.db = db
+        self.name_index: Optional[ClientNameIndexCache] = (
+            self.name_index_cache if settings.client_name_index_enabled else None
+        )
+    
+    def _name_index_enabled(self) -> bool:
+        """
+        Whether this repository may read and populate the name index.
+        
+        Not while the session holds uncommitted clients: the index cannot
+        match them, and a build would cache rows other sessions cannot see.
+        """
+        return self.name_index is not None and not has_pending_index_updates(self.db)
+    
+    def _name_index_rows_statement(self, organization_id: UUID):
+        """SELECT of (id, name) for every client in an organization."""
+        return select(Client.id, Client.name).where(
+            Client.organization_id == organization_id
+        )
+    
+    def _lookup_in_index(
+        self,
+        index: Optional[OrganizationNameIndex],
+        name: str,
+        similarity_threshold: float,
+        exact_only: bool = False,
+    ) -> Optional[Tuple[UUID, str]]:
+        """Resolve a name from a loaded name index, recording hit or miss."""
+        if index is None:
+            return None
+        
+        if exact_only:
+            match = index.find_exact(name)
+        else:
+            match = index.find(name, self._calculate_name_similarity, similarity_threshold)
+        self.name_index.record(hit=match is not None)
+        return match
+    
+    def _resolve_in_memory(
+        self,
+        names: List[str],
+        candidates: Iterable[Client],
+        organization_id: UUID,
+        similarity_threshold: float,
+        resolutions: Dict[str, ClientResolution],
+    ) -> List[Dict]:
+        """
+        Match names against candidate clients, planning inserts for the rest.
+        
+        Fills ``resolutions`` and returns the Client rows to bulk insert.
+        Clients planned earlier in the batch are matchable by later names.
+        """
+        # (id, name, normalized name) for everything matchable so far
+        pool: List[Tuple[UUID, str, str]] = [
+            (c.id, c.name, self._normalize_name(c.name)) for c in candidates
+        ]
+        new_rows = []
+        
+        for name in names:
+            match = self._match_in_pool(name, pool, similarity_threshold)
+            if match:
+                client_id, client_name = match
+                resolutions[name] = ClientResolution(
+                    name=name,
+                    client_id=client_id,
+                    client_name=client_name,
+                    was_created=False,
+                )
+                continue
+            
+            client_id = uuid4()
+            new_rows.append({
+                "id": client_id,
+                "name": name,
+                "organization_id": organization_id,
+                "engagement_score": 0.0,  # Default engagement score
+            })
+            pool.append((client_id, name, self._normalize_name(name)))
+            resolutions[name] = ClientResolution(
+                name=name,
+                client_id=client_id,
+                client_name=name,
+                was_created=True,
+            )
+        
+        return new_rows
+    
+    def _candidate_clients_filter(self, names: List[str]):
+        """
+        Filter for clients that could match any of the names, or None.
+        
+        On PostgreSQL the pg_trgm index selects candidates per name. Elsewhere
+        a client can only score as a match if it shares a word with a search
+        name, contains one (then it contains each of its words) or is
+        contained in one, so candidates are clients whose normalized name
+        contains any search word or lies within any search name.
+        """
+        normalized_names = {self._normalize_name(name) for name in names}
+        normalized_names.discard("")
+        if not normalized_names:
+            return None
+        
+        if self._supports_trigram_search():
+            return or_(
+                *[self._trigram_candidate_filter(n) for n in normalized_names]
+            )
+        
+        words = {word for n in normalized_names for word in n.split()}
+        return or_(
+            *[Client.normalized_name.contains(word, autoescape=True) for word in words],
+            *[self._contained_in_filter(n) for n in normalized_names],
+        )
+    
+    def _contained_in_filter(self, normalized_search: str):
+        """
+        Clients whose normalized name lies within the search name.
+        
+        ``:search LIKE '%' || normalized_name || '%'``; wildcard characters in
+        stored names can only widen the candidate set, which is rescored in
+        Python anyway.
+        """
+        return literal(normalized_search).contains(Client.normalized_name)
+    
+    def _fuzzy_candidate_filters(self, normalized_search: str) -> list:
+        """Extra filters narrowing fuzzy candidates, if the database can."""
+        if self._supports_trigram_search():
+            # Let the pg_trgm index narrow the organization to likely matches
+            return [self._trigram_candidate_filter(normalized_search)]
+        # Pure-Python fallback (e.g. SQLite): score every client
+        return []
+    
+    def _best_fuzzy_match(
+        self,
+        normalized_search: str,
+        clients: Iterable[Client],
+        similarity_threshold: float,
+    ) -> Optional[Client]:
+        """Best scoring client at or above the threshold."""
+        best_match = None
+        best_score = 0.0
+        
+        for client in clients:
+            normalized_client = self._normalize_name(client.name)
+            score = self._calculate_name_similarity(normalized_search, normalized_client)
+            
+            if score >= similarity_threshold and score > best_score:
+                best_match = client
+                best_score = score
+        
+        return best_match
+    
+    def _build_new_client(
+        self,
+        name: str,
+        organization_id: UUID,
+        email: Optional[str] = None
+    ) -> Client:
+        """Unsaved Client for a name that matched nothing."""
+        return Client(
+            name=name.strip(),
+            email=email,
+            organization_id=organization_id,
+            engagement_score=0.0,  # Default engagement score
+        )
+    
+    def _supports_trigram_search(self) -> bool:
+        """Whether the bound database has the pg_trgm operators."""
+        return self.db.get_bind().dialect.name == "postgresql"
+    
+    def _trigram_candidate_filter(self, normalized_search: str):
+        """
+        Index-backed filter for clients that may score against a name.
+        
+        Covers every way _calculate_name_similarity can reach the threshold:
+        word overlap via trigram similarity, the search name inside a client
+        name via an indexed LIKE, and a client name inside the search name
+        (any substring, e.g. "jan" in "jane smith") via a reversed LIKE. The
+        reversed LIKE cannot use the trigram index, so it is evaluated over
+        the organization's rows only.
+        """
+        normalized_column = Client.normalized_name
+        return or_(
+            normalized_column.op("%")(normalized_search),
+            normalized_column.contains(normalized_search, autoescape=True),
+            self._contained_in_filter(normalized_search),
+        )
+    
+    def _match_in_pool(
+        self,
+        name: str,
+        pool: List[Tuple[UUID, str, str]],
+        similarity_threshold: float,
+    ) -> Optional[Tuple[UUID, str]]:
+        """Match a name against (id, name, normalized) entries in memory."""
+        # Case-insensitive exact match first, as in _find_client_by_name
+        name_lower = name.lower()
+        for client_id, client_name, _ in pool:
+            if client_name.lower() == name_lower:
+                return client_id, client_name
+        
+        # Then the best fuzzy match above the threshold
+        normalized_search = self._normalize_name(name)
+        best_match = None
+        best_score = 0.0
+        
+        for client_id, client_name, normalized_client in pool:
+            score = self._calculate_name_similarity(normalized_search, normalized_client)
+            if score >= similarity_threshold and score > best_score:
+                best_match = (client_id, client_name)
+                best_score = score
+        
+        return best_match
+    
+    def _queue_name_index_update(
+        self,
+        organization_id: UUID,
+        clients: Iterable[Tuple[UUID, str]],
+    ) -> None:
+        """Add created (id, name) clients to the name index when the session commits."""
+        if self.name_index is not None:
+            queue_index_update(self.db, self.name_index, organization_id, clients)
+    
+    def _normalize_name(self, name: str) -> str:
+        """Normalize name for comparison."""
+        return normalize_client_name(name)
+    
+    def _calculate_name_similarity(self, name1: str, name2: str) -> float:
+        """
+        Calculate similarity between two names using simple string matching.
+        
+        Returns:
+            Similarity score between 0 and 1
+        """
+        # Simple implementation - can be enhanced with more sophisticated algorithms
+        if name1 == name2:
+            return 1.0
+        
+        # Check if one name is contained in the other
+        if name1 in name2 or name2 in name1:
+            return 0.9
+        
+        # Split into words and check overlap
+        words1 = set(name1.split())
+        words2 = set(name2.split())
+        
+        if not words1 or not words2:
+            return 0.0
+        
+        # Calculate Jaccard similarity
+        intersection = len(words1.intersection(words2))
+        union = len(words1.union(words2))
+        
+        return intersection / union if union > 0 else 0.0
+
+
+class ClientRepository(ClientMatchingBase):
+    """Repository for client database operations."""
+    
+    db: Session
     
     def find_or_create_client(
         self,
@@ -39,12 +387,24 @@ class ClientRepository:
             SQLAlchemyError: If database operation fails
         """
         try:
-            # First, try to find existing client by exact name match
+            # Warm organizations answer exact names from memory
+            indexed = self._find_in_name_index(name, organization_id, exact_only=True)
+            if indexed:
+                return self._attach_indexed_client(indexed, organization_id), False
+            
+            # Then an exact match in the database, which also sees clients
+            # other processes added since the index was loaded
             existing_client = self._find_client_by_name(name, organization_id)
             
             if existing_client:
                 return existing_client, False
             
+            # Only then fuzzy match from the index, so a stale fuzzy hit
+            # never beats an exact match
+            indexed = self._find_in_name_index(name, organization_id)
+            if indexed:
+                return self._attach_indexed_client(indexed, organization_id), False
+            
             # Try fuzzy matching if no exact match
             fuzzy_client = self._find_client_fuzzy(name, organization_id)
             if fuzzy_client:
@@ -58,6 +418,140 @@ class ClientRepository:
             self.db.rollback()
             raise e
     
+    @traced("resolve_clients")
+    def resolve_clients_bulk(
+        self,
+        names: Iterable[str],
+        organization_id: UUID,
+        similarity_threshold: float = 0.8,
+    ) -> BulkResolutionResult:
+        """
+        Find or create clients for many names with a fixed number of queries.
+        
+        Candidate clients for every name are fetched in one query and matched
+        in memory with the same exact/fuzzy rules as find_or_create_client.
+        Names that match nothing are inserted together in one bulk INSERT.
+        Clients created earlier in the batch are matchable by later names.
+        Only exact matches are taken from the name index, so a stale index
+        never outranks the database.
+        
+        Args:
+            names: Client names to resolve
+            organization_id: Organization the clients belong to
+            similarity_threshold: Minimum fuzzy similarity score (0-1)
+            
+        Returns:
+            BulkResolutionResult keyed by stripped name, with the number of
+            database round trips used
+            
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        unique_names = list(dict.fromkeys(n.strip() for n in names if n.strip()))
+        resolutions: Dict[str, ClientResolution] = {}
+        
+        if not unique_names:
+            return BulkResolutionResult(resolutions=resolutions, round_trips=0)
+        
+        try:
+            with QueryCounter(self.db) as counter:
+                index = self._get_name_index(organization_id)
+                pending = []
+                for name in unique_names:
+                    indexed = self._lookup_in_index(
+                        index, name, similarity_threshold, exact_only=True
+                    )
+                    if not indexed:
+                        pending.append(name)
+                        continue
+                    resolutions[name] = ClientResolution(
+                        name=name,
+                        client_id=indexed[0],
+                        client_name=indexed[1],
+                        was_created=False,
+                    )
+                
+                candidates = (
+                    self._find_candidate_clients(pending, organization_id)
+                    if pending else []
+                )
+                new_rows = self._resolve_in_memory(
+                    pending, candidates, organization_id, similarity_threshold, resolutions
+                )
+                
+                if new_rows:
+                    self.db.execute(insert(Client), new_rows)
+                    self._queue_name_index_update(
+                        organization_id, [(row["id"], row["name"]) for row in new_rows]
+                    )
+            
+            return BulkResolutionResult(
+                resolutions=resolutions,
+                round_trips=counter.count,
+            )
+            
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise e
+    
+    def _find_candidate_clients(
+        self,
+        names: List[str],
+        organization_id: UUID,
+    ) -> List[Client]:
+        """Fetch clients that could match any of the names, in one query."""
+        candidate_filter = self._candidate_clients_filter(names)
+        if candidate_filter is None:
+            return []
+        
+        return (
+            self.db.query(Client)
+            .filter(Client.organization_id == organization_id, candidate_filter)
+            .all()
+        )
+    
+    def _get_name_index(self, organization_id: UUID) -> Optional[OrganizationNameIndex]:
+        """The organization's cached name index, loading it if cold."""
+        if not self._name_index_enabled():
+            return None
+        
+        def load() -> List[Tuple[UUID, str]]:
+            return [
+                (row.id, row.name)
+                for row in self.db.execute(self._name_index_rows_statement(organization_id))
+            ]
+        
+        return self.name_index.get_or_build(organization_id, load)
+    
+    def _find_in_name_index(
+        self,
+        name: str,
+        organization_id: UUID,
+        similarity_threshold: float = 0.8,
+        exact_only: bool = False,
+    ) -> Optional[Tuple[UUID, str]]:
+        """
+        Resolve a name from the name index as (client_id, client_name).
+        
+        None means the caller must fall back to the database, which also
+        covers clients added by other processes since the index was built.
+        """
+        return self._lookup_in_index(
+            self._get_name_index(organization_id), name, similarity_threshold, exact_only
+        )
+    
+    def _attach_indexed_client(
+        self,
+        indexed: Tuple[UUID, str],
+        organization_id: UUID,
+    ) -> Client:
+        """Session-bound Client for an index hit, without a database round trip."""
+        client_id, client_name = indexed
+        client = Client(id=client_id, name=client_name, organization_id=organization_id)
+        make_transient_to_detached(client)
+        # Other attributes load lazily on first access
+        return self.db.merge(client, load=False)
+    
     def _find_client_by_name(
         self,
         name: str,
@@ -93,66 +587,16 @@ class ClientRepository:
         # Normalize the search name
         normalized_search = self._normalize_name(name)
         
-        # Get all clients in the organization
         clients = (
             self.db.query(Client)
-            .filter(Client.organization_id == organization_id)
+            .filter(
+                Client.organization_id == organization_id,
+                *self._fuzzy_candidate_filters(normalized_search),
+            )
             .all()
         )
         
-        best_match = None
-        best_score = 0.0
-        
-        for client in clients:
-            normalized_client = self._normalize_name(client.name)
-            score = self._calculate_name_similarity(normalized_search, normalized_client)
-            
-            if score >= similarity_threshold and score > best_score:
-                best_match = client
-                best_score = score
-        
-        return best_match
-    
-    def _normalize_name(self, name: str) -> str:
-        """Normalize name for comparison."""
-        import re
-        
-        # Convert to lowercase, remove extra spaces
-        normalized = re.sub(r'\s+', ' ', name.lower().strip())
-        
-        # Remove common prefixes/suffixes
-        normalized = re.sub(r'^(mr|mrs|ms|dr|prof)\.?\s*', '', normalized)
-        normalized = re.sub(r'\s*(jr|sr|ii|iii|iv)\.?$', '', normalized)
-        
-        return normalized
-    
-    def _calculate_name_similarity(self, name1: str, name2: str) -> float:
-        """
-        Calculate similarity between two names using simple string matching.
-        
-        Returns:
-            Similarity score between 0 and 1
-        """
-        # Simple implementation - can be enhanced with more sophisticated algorithms
-        if name1 == name2:
-            return 1.0
-        
-        # Check if one name is contained in the other
-        if name1 in name2 or name2 in name1:
-            return 0.9
-        
-        # Split into words and check overlap
-        words1 = set(name1.split())
-        words2 = set(name2.split())
-        
-        if not words1 or not words2:
-            return 0.0
-        
-        # Calculate Jaccard similarity
-        intersection = len(words1.intersection(words2))
-        union = len(words1.union(words2))
-        
-        return intersection / union if union > 0 else 0.0
+        return self._best_fuzzy_match(normalized_search, clients, similarity_threshold)
     
     def _create_new_client(
         self,
@@ -161,15 +605,11 @@ class ClientRepository:
         email: Optional[str] = None
     ) -> Client:
         """Create a new client record."""
-        client = Client(
-            name=name.strip(),
-            email=email,
-            organization_id=organization_id,
-            engagement_score=0.0,  # Default engagement score
-        )
+        client = self._build_new_client(name, organization_id, email)
         
         self.db.add(client)
         self.db.flush()  # Get the ID without committing
+        self._queue_name_index_update(organization_id, [(client.id, client.name)])
         
         return client
     
@@ -252,6 +692,80 @@ class ClientSessionRepository:
             self.db.rollback()
             raise e
     
+    @traced("link_clients")
+    def create_client_sessions_bulk(
+        self,
+        session_id: UUID,
+        client_ids: Iterable[UUID],
+        speaking_time_seconds: Optional[Dict[UUID, int]] = None,
+        engagement_levels: Optional[Dict[UUID, str]] = None,
+    ) -> int:
+        """
+        Link many clients to a session with a single bulk INSERT.
+        
+        Args:
+            session_id: Session identifier
+            client_ids: Clients to link; duplicates are linked once
+            speaking_time_seconds: Speaking time per client (optional)
+            engagement_levels: Engagement level per client (optional)
+            
+        Returns:
+            Number of client-session rows inserted
+            
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        rows = client_session_rows(
+            session_id, client_ids, speaking_time_seconds, engagement_levels
+        )
+        if not rows:
+            return 0
+        
+        try:
+            self.db.execute(insert(ClientSession), rows)
+            return len(rows)
+            
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise e
+    
+    @traced("link_clients_bulk")
+    def link_sessions_bulk(
+        self,
+        links: Dict[UUID, Iterable[UUID]],
+        engagement_level: Optional[str] = None,
+        speaking_time_seconds: Optional[Dict[UUID, Dict[UUID, int]]] = None,
+        engagement_levels: Optional[Dict[UUID, Dict[UUID, str]]] = None,
+    ) -> int:
+        """
+        Link clients to many sessions with a single bulk INSERT.
+        
+        Args:
+            links: Client ids to link, keyed by session id
+            engagement_level: Default engagement level for every link (optional)
+            speaking_time_seconds: Speaking time per client, keyed by session id (optional)
+            engagement_levels: Engagement level per client, keyed by session id (optional)
+            
+        Returns:
+            Number of client-session rows inserted
+            
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        rows = session_link_rows(
+            links, engagement_level, speaking_time_seconds, engagement_levels
+        )
+        if not rows:
+            return 0
+        
+        try:
+            self.db.execute(insert(ClientSession), rows)
+            return len(rows)
+            
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise e
+    
     def get_client_sessions_for_session(
         self,
         session_id: UUID
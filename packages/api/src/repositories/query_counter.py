@@ -0,0 +1,40 @@
+"""
+Round-trip accounting for repository operations.
+"""
+
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+
+class QueryCounter:
+    """
+    Count statements sent to the database on a session's connection.
+
+    An executemany (bulk INSERT) counts once, matching how it is sent.
+
+    Usage:
+        with QueryCounter(db) as counter:
+            ...
+        counter.count
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+        self.count = 0
+        self._connection: Connection | None = None
+
+    def __enter__(self) -> "QueryCounter":
+        self._connection = self.db.connection()
+        event.listen(self._connection, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        if self._connection is not None:
+            event.remove(self._connection, "before_cursor_execute", self._on_execute)
+            self._connection = None
+
+    def _on_execute(self, *args: Any) -> None:
+        self.count += 1
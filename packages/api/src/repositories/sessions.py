@@ -3,14 +3,55 @@ Repository for session data access operations.
 """
 
 from datetime import date
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterable, List
 from uuid import UUID
 
-from sqlalchemy.orm import Session
+from sqlalchemy import or_
+from sqlalchemy.orm import Session, defer, joinedload, load_only
 from sqlalchemy.exc import SQLAlchemyError
 
-from ..models.core import Session as SessionModel
+from ..models.core import Session as SessionModel, ClientSession, Client
+from ..monitoring.tracing import traced
 from ..schemas.sessions import SessionUploadRequest
+from .transcripts import compress_transcript
+
+
+def build_session(
+    coach_id: UUID,
+    transcript_text: str,
+    session_date: date,
+    session_type: Optional[str] = None,
+    duration_minutes: Optional[int] = None,
+    participant_count: Optional[int] = None,
+    notes: Optional[str] = None,
+    transcript_hash: Optional[str] = None,
+    idempotency_key: Optional[str] = None,
+    segment_index: Optional[bytes] = None,
+) -> SessionModel:
+    """Build an unsaved session model with its compressed transcript."""
+    # Prepare metadata
+    metadata = {}
+    if notes:
+        metadata['notes'] = notes
+    
+    # Create session model
+    session = SessionModel(
+        coach_id=coach_id,
+        session_date=session_date,
+        session_type=session_type,
+        duration_minutes=duration_minutes,
+        participant_count=participant_count,
+        processing_status="uploaded",
+        session_metadata=metadata,
+        transcript_hash=transcript_hash,
+        idempotency_key=idempotency_key,
+    )
+    
+    # Transcript is stored compressed in its own table
+    if transcript_text:
+        session.transcript = compress_transcript(transcript_text, segment_index)
+    
+    return session
 
 
 class SessionRepository:
@@ -19,6 +60,7 @@ class SessionRepository:
     def __init__(self, db: Session):
         self.db = db
     
+    @traced("session_insert")
     def create_session(
         self,
         coach_id: UUID,
@@ -28,6 +70,9 @@ class SessionRepository:
         duration_minutes: Optional[int] = None,
         participant_count: Optional[int] = None,
         notes: Optional[str] = None,
+        transcript_hash: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+        segment_index: Optional[bytes] = None,
     ) -> SessionModel:
         """
         Create a new session record.
@@ -40,30 +85,30 @@ class SessionRepository:
             duration_minutes: Session duration (optional)
             participant_count: Number of participants (optional)
             notes: Additional notes (optional)
+            transcript_hash: Normalized content hash (optional)
+            idempotency_key: Client idempotency key (optional)
+            segment_index: Encoded segment index of a timed transcript (optional)
             
         Returns:
             Created session model
             
         Raises:
+            IntegrityError: If the coach already has a session with this
+                transcript hash or idempotency key
             SQLAlchemyError: If database operation fails
         """
         try:
-            # Prepare metadata
-            metadata = {}
-            if notes:
-                metadata['notes'] = notes
-            if transcript_text:
-                metadata['transcript_text'] = transcript_text
-            
-            # Create session model
-            session = SessionModel(
+            session = build_session(
                 coach_id=coach_id,
+                transcript_text=transcript_text,
                 session_date=session_date,
                 session_type=session_type,
                 duration_minutes=duration_minutes,
                 participant_count=participant_count,
-                processing_status="uploaded",
-                session_metadata=metadata,
+                notes=notes,
+                transcript_hash=transcript_hash,
+                idempotency_key=idempotency_key,
+                segment_index=segment_index,
             )
             
             self.db.add(session)
@@ -89,6 +134,128 @@ class SessionRepository:
             SessionModel.id == session_id
         ).first()
     
+    @traced("session_insert_bulk")
+    def create_sessions_bulk(
+        self,
+        coach_id: UUID,
+        sessions: Iterable[Dict[str, Any]],
+    ) -> List[SessionModel]:
+        """
+        Create many session records (with transcripts) in one flush.
+        
+        Args:
+            coach_id: ID of the coach conducting the sessions
+            sessions: Keyword arguments for each session, as accepted by
+                create_session (transcript_text, session_date, ...)
+            
+        Returns:
+            Created session models, in input order
+            
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        try:
+            models = [build_session(coach_id=coach_id, **fields) for fields in sessions]
+            self.db.add_all(models)
+            self.db.flush()  # Batched INSERTs for sessions and transcripts
+            
+            return models
+            
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise e
+    
+    @traced("find_duplicate")
+    def find_by_upload_keys(
+        self,
+        coach_id: UUID,
+        transcript_hash: str,
+        idempotency_key: Optional[str] = None,
+    ) -> List[SessionModel]:
+        """
+        Find a coach's sessions with this transcript hash or idempotency key.
+        
+        Served by the unique (coach_id, transcript_hash) and
+        (coach_id, idempotency_key) indexes. Client links are loaded so a
+        duplicate response can list participants.
+        
+        Returns:
+            Up to two sessions (one per key)
+        """
+        keys = SessionModel.transcript_hash == transcript_hash
+        if idempotency_key is not None:
+            keys = or_(keys, SessionModel.idempotency_key == idempotency_key)
+        
+        return (
+            self.db.query(SessionModel)
+            .options(
+                load_only(
+                    SessionModel.id,
+                    SessionModel.processing_status,
+                    SessionModel.transcript_hash,
+                    SessionModel.idempotency_key,
+                ),
+                joinedload(SessionModel.client_sessions)
+                .load_only(ClientSession.client_id)
+                .joinedload(ClientSession.client)
+                .load_only(Client.name),
+            )
+            .filter(SessionModel.coach_id == coach_id, keys)
+            .all()
+        )
+    
+    def find_ids_by_hashes(
+        self,
+        coach_id: UUID,
+        transcript_hashes: Iterable[str],
+    ) -> Dict[str, UUID]:
+        """Existing session ids keyed by transcript hash, in one query."""
+        hashes = list(set(transcript_hashes))
+        if not hashes:
+            return {}
+        
+        rows = (
+            self.db.query(SessionModel.transcript_hash, SessionModel.id)
+            .filter(
+                SessionModel.coach_id == coach_id,
+                SessionModel.transcript_hash.in_(hashes),
+            )
+            .all()
+        )
+        return {transcript_hash: session_id for transcript_hash, session_id in rows}
+    
+    @traced("load_session")
+    def get_session_with_participants(self, session_id: UUID) -> Optional[SessionModel]:
+        """
+        Retrieve a session with its client sessions and clients in one query.
+        
+        Heavy columns the participant view never reads (session_metadata,
+        client tags) are deferred.
+        
+        Args:
+            session_id: Session identifier
+            
+        Returns:
+            Session model with client_sessions and their clients loaded, or
+            None if not found
+        """
+        return (
+            self.db.query(SessionModel)
+            .options(
+                defer(SessionModel.session_metadata),
+                joinedload(SessionModel.client_sessions)
+                .load_only(
+                    ClientSession.client_id,
+                    ClientSession.engagement_level,
+                    ClientSession.speaking_time_seconds,
+                )
+                .joinedload(ClientSession.client)
+                .load_only(Client.name, Client.email),
+            )
+            .filter(SessionModel.id == session_id)
+            .one_or_none()
+        )
+    
     def update_processing_status(
         self,
         session_id: UUID,
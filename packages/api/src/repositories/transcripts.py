@@ -0,0 +1,221 @@
+"""
+Repository for session transcript storage.
+
+Transcripts live in their own table, compressed, so session rows stay small
+and transcript bytes are only read when a transcript is actually needed.
+Timed transcripts also carry a segment index (speaker, character offsets and
+times per turn), which answers time-range and speaking-time queries without
+loading or re-parsing the text.
+"""
+
+import hashlib
+import json
+import zlib
+from typing import Dict, Iterable, List, NamedTuple, Optional
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+from sqlalchemy.exc import SQLAlchemyError
+
+from ..models.core import SessionTranscript
+
+COMPRESSION = "zlib"
+COMPRESSION_LEVEL = 6
+SEGMENT_INDEX_VERSION = 1
+
+
+class TranscriptSegment(NamedTuple):
+    """One timed speaker turn; ``text[start_offset:end_offset]`` is its raw text."""
+
+    speaker: str
+    start_offset: int
+    end_offset: int
+    start_seconds: float
+    # None when neither the turn nor a following one gives an end time
+    end_seconds: Optional[float]
+
+
+def compress_transcript(text: str, segment_index: Optional[bytes] = None) -> SessionTranscript:
+    """Build an unsaved SessionTranscript holding compressed text (and its segment index)."""
+    raw = text.encode("utf-8")
+    return SessionTranscript(
+        content=zlib.compress(raw, COMPRESSION_LEVEL),
+        compression=COMPRESSION,
+        content_hash=hashlib.sha256(raw).hexdigest(),
+        original_size=len(raw),
+        segment_index=segment_index,
+    )
+
+
+def decompress_transcript(transcript: SessionTranscript) -> str:
+    """Return the text stored in a SessionTranscript."""
+    if transcript.compression != COMPRESSION:
+        raise ValueError(f"Unsupported transcript compression: {transcript.compression}")
+    return zlib.decompress(transcript.content).decode("utf-8")
+
+
+def encode_segment_index(segments: Iterable[TranscriptSegment]) -> bytes:
+    """
+    Pack segments compactly: speaker names once, then one row of integers
+    per segment (speaker position, offsets, times in milliseconds).
+    """
+    speakers: Dict[str, int] = {}
+    rows = []
+    for segment in segments:
+        rows.append([
+            speakers.setdefault(segment.speaker, len(speakers)),
+            segment.start_offset,
+            segment.end_offset,
+            round(segment.start_seconds * 1000),
+            None if segment.end_seconds is None else round(segment.end_seconds * 1000),
+        ])
+    payload = {"version": SEGMENT_INDEX_VERSION, "speakers": list(speakers), "segments": rows}
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return zlib.compress(raw, COMPRESSION_LEVEL)
+
+
+def decode_segment_index(data: bytes) -> List[TranscriptSegment]:
+    """Unpack segments written by ``encode_segment_index``."""
+    payload = json.loads(zlib.decompress(data))
+    if payload.get("version") != SEGMENT_INDEX_VERSION:
+        raise ValueError(f"Unsupported segment index version: {payload.get('version')}")
+    speakers = payload["speakers"]
+    return [
+        TranscriptSegment(
+            speakers[speaker],
+            start_offset,
+            end_offset,
+            start_ms / 1000,
+            None if end_ms is None else end_ms / 1000,
+        )
+        for speaker, start_offset, end_offset, start_ms, end_ms in payload["segments"]
+    ]
+
+
+def segments_in_range(
+    segments: Iterable[TranscriptSegment],
+    start_seconds: Optional[float] = None,
+    end_seconds: Optional[float] = None,
+    speaker: Optional[str] = None,
+) -> List[TranscriptSegment]:
+    """Segments overlapping ``[start_seconds, end_seconds]``, optionally for one speaker."""
+    selected = []
+    for segment in segments:
+        if speaker is not None and segment.speaker != speaker:
+            continue
+        segment_end = segment.start_seconds if segment.end_seconds is None else segment.end_seconds
+        if end_seconds is not None and segment.start_seconds > end_seconds:
+            continue
+        if start_seconds is not None and segment_end < start_seconds:
+            continue
+        selected.append(segment)
+    return selected
+
+
+def speaking_times(segments: Iterable[TranscriptSegment]) -> Dict[str, float]:
+    """Seconds spoken per speaker, from segments with an end time."""
+    totals: Dict[str, float] = {}
+    for segment in segments:
+        if segment.end_seconds is None:
+            continue
+        totals[segment.speaker] = (
+            totals.get(segment.speaker, 0.0) + segment.end_seconds - segment.start_seconds
+        )
+    return totals
+
+
+class TranscriptRepository:
+    """Repository for session transcript operations."""
+    
+    def __init__(self, db: Session):
+        self.db = db
+    
+    def save_transcript(
+        self,
+        session_id: UUID,
+        text: str,
+        segment_index: Optional[bytes] = None,
+    ) -> SessionTranscript:
+        """
+        Store (or replace) the transcript for a session.
+        
+        Args:
+            session_id: Session identifier
+            text: Full transcript text
+            segment_index: Encoded segment index for timed transcripts
+            
+        Returns:
+            Stored transcript model
+            
+        Raises:
+            SQLAlchemyError: If database operation fails
+        """
+        try:
+            transcript = compress_transcript(text, segment_index)
+            transcript.session_id = session_id
+            transcript = self.db.merge(transcript)
+            self.db.flush()
+            
+            return transcript
+            
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            raise e
+    
+    def get_transcript_text(self, session_id: UUID) -> Optional[str]:
+        """
+        Load and decompress a session's transcript.
+        
+        Args:
+            session_id: Session identifier
+            
+        Returns:
+            Transcript text or None if the session has no transcript
+        """
+        transcript = self.db.get(SessionTranscript, session_id)
+        if transcript is None:
+            return None
+        return decompress_transcript(transcript)
+    
+    def get_segments(
+        self,
+        session_id: UUID,
+        start_seconds: Optional[float] = None,
+        end_seconds: Optional[float] = None,
+        speaker: Optional[str] = None,
+    ) -> Optional[List[TranscriptSegment]]:
+        """
+        Timed segments of a session's transcript, read from its segment index.
+        
+        Only the index column is loaded; the transcript text is not.
+        
+        Args:
+            session_id: Session identifier
+            start_seconds: Keep segments ending at or after this time
+            end_seconds: Keep segments starting at or before this time
+            speaker: Keep only this speaker's segments
+            
+        Returns:
+            Matching segments in transcript order, or None if the session's
+            transcript has no segment index
+        """
+        data = (
+            self.db.query(SessionTranscript.segment_index)
+            .filter(SessionTranscript.session_id == session_id)
+            .scalar()
+        )
+        if data is None:
+            return None
+        return segments_in_range(decode_segment_index(data), start_seconds, end_seconds, speaker)
+    
+    def get_speaking_times(self, session_id: UUID) -> Optional[Dict[str, float]]:
+        """
+        Seconds spoken per speaker, summed from the segment index.
+        
+        Returns:
+            Totals per speaker, or None if the transcript has no segment index
+        """
+        segments = self.get_segments(session_id)
+        if segments is None:
+            return None
+        return speaking_times(segments)
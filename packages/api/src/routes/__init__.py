@@ -2,6 +2,6 @@
 API route exports.
 """
 
-from . import health, sessions
+from . import health, internal, metrics, sessions
 
-__all__ = ["health", "sessions"]
\ No newline at end of file
+__all__ = ["health", "internal", "metrics", "sessions"]
\ No newline at end of file
@@ -2,73 +2,109 @@
 Health check endpoint for API monitoring and database connectivity.
 """
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from sqlalchemy import text
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import JSONResponse
 from datetime import datetime
-from typing import Dict, Any, cast
+from typing import Dict, Any
 import logging
 
-from ..models.database import get_db
 from ..config import settings
+from ..services.health import health_prober
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
 @router.get("/health", response_model=Dict[str, Any])
-async def health_check(db: Session = Depends(get_db)) -> Dict[str, Any]:
+async def health_check() -> Dict[str, Any]:
     """
     Health check endpoint that verifies database connectivity and system status.
 
+    Served from the background prober's cache, so it never checks out a pooled
+    connection; the database is probed on demand only when the cached result
+    is older than HEALTH_CACHE_TTL.
+
     Returns:
-        Dict containing health status, database connectivity, and system info
+        Dict containing health status, database connectivity, pool usage and
+        system info
     """
-    health_status = {
-        "status": "healthy",
-        "timestamp": datetime.utcnow().isoformat(),
-        "environment": settings.environment,
-        "version": settings.version,
-        "database": {"status": "unknown", "connection": False, "error": None},
-        "system": {"api_name": settings.app_name, "environment": settings.environment},
-    }
-
-    # Test database connectivity
-    try:
-        # Simple database connectivity test
-        result = db.execute(text("SELECT 1 as test"))
-        test_value = result.scalar()
-
-        db_status = cast(Dict[str, Any], health_status["database"])
-        if test_value == 1:
-            db_status["status"] = "healthy"
-            db_status["connection"] = True
-            logger.info("Database connectivity check passed")
-        else:
-            db_status["status"] = "unhealthy"
-            db_status["error"] = "Unexpected result"
-            health_status["status"] = "degraded"
-            logger.warning("Database connectivity check returned unexpected result")
-
-    except Exception as e:
-        health_status["status"] = "unhealthy"
-        db_status = cast(Dict[str, Any], health_status["database"])
-        db_status["status"] = "unhealthy"
-        db_status["connection"] = False
-        db_status["error"] = str(e)
-        logger.error(f"Database connectivity check failed: {e}")
+    probe = await health_prober.current()
+    pool = health_prober.pool()
 
+    if not probe.healthy:
         # Return 503 Service Unavailable if database is down
         raise HTTPException(
             status_code=503,
             detail={
                 "message": "Service temporarily unavailable - database failed",
                 "timestamp": datetime.utcnow().isoformat(),
-                "database_error": str(e),
+                "database_error": probe.error,
             },
         )
 
-    return health_status
+    return {
+        "status": "degraded" if pool["saturated"] else "healthy",
+        "timestamp": datetime.utcnow().isoformat(),
+        "environment": settings.environment,
+        "version": settings.version,
+        "database": {
+            "status": "healthy",
+            "connection": True,
+            "error": None,
+            "latency_ms": probe.latency_ms,
+            "checked_at": probe.checked_at.isoformat(),
+            "age_seconds": round(probe.age_seconds(), 3),
+        },
+        "pool": pool,
+        "system": {"api_name": settings.app_name, "environment": settings.environment},
+    }
+
+
+@router.get("/health/live")
+async def liveness_check() -> Dict[str, Any]:
+    """
+    Liveness probe: the process is up and its event loop is serving requests.
+
+    Has no dependencies, so a database outage never restarts the API.
+    """
+    return {
+        "status": "alive",
+        "timestamp": datetime.utcnow().isoformat(),
+        "uptime_seconds": round(health_prober.uptime_seconds(), 3),
+    }
+
+
+@router.get("/health/ready")
+async def readiness_check() -> JSONResponse:
+    """
+    Readiness probe: whether this instance should receive traffic.
+
+    Reads only the cached probe result and never waits on the database. Not
+    ready before the first probe, when the last probe failed or is older than
+    HEALTH_CACHE_TTL, or when the connection pool is saturated.
+    """
+    probe = health_prober.last_result
+    pool = health_prober.pool()
+
+    reasons = []
+    if probe is None:
+        reasons.append("database not probed yet")
+    elif not probe.healthy:
+        reasons.append(f"database unhealthy: {probe.error}")
+    elif probe.age_seconds() > health_prober.cache_ttl:
+        reasons.append("database status is stale")
+    if pool["saturated"]:
+        reasons.append("connection pool saturated")
+
+    return JSONResponse(
+        status_code=503 if reasons else 200,
+        content={
+            "status": "not_ready" if reasons else "ready",
+            "timestamp": datetime.utcnow().isoformat(),
+            "reasons": reasons,
+            "pool": pool,
+        },
+    )
 
 
 @router.get("/health/simple")
@@ -0,0 +1,88 @@
+"""
+Internal operational endpoints for runtime diagnostics.
+
+The endpoints are unauthenticated, so they answer 404 unless
+``internal_endpoints_enabled`` is set.
+"""
+
+from typing import Any, Dict
+
+from fastapi import APIRouter, Depends, HTTPException
+
+from ..config import settings
+from ..jobs.queue import job_queue
+from ..monitoring.pool import pool_stats
+from ..repositories.clients import ClientRepository
+from ..services.executor import workload_executor
+from ..services.extraction_cache import extraction_cache
+
+
+def require_internal_endpoints() -> None:
+    """Hide the internal endpoints unless they are explicitly enabled."""
+    if not settings.internal_endpoints_enabled:
+        raise HTTPException(status_code=404, detail="Not Found")
+
+
+router = APIRouter(prefix="/internal", dependencies=[Depends(require_internal_endpoints)])
+
+
+@router.get("/executor", response_model=Dict[str, Any])
+async def executor_stats() -> Dict[str, Any]:
+    """
+    Executor saturation and per-stage timings.
+
+    Reports pending work and rejections for the parse and database pools,
+    plus count/avg/max timings for each workload stage.
+    """
+    return workload_executor.stats()
+
+
+@router.get("/client-index", response_model=Dict[str, Any])
+async def client_index_stats() -> Dict[str, Any]:
+    """
+    Client name index usage.
+
+    Reports cached organizations, lookups answered from memory (hits) or
+    passed to the database (misses), and builds, invalidations and evictions.
+    """
+    return {
+        "enabled": settings.client_name_index_enabled,
+        **ClientRepository.name_index_cache.stats(),
+    }
+
+
+@router.get("/extraction-cache", response_model=Dict[str, Any])
+async def extraction_cache_stats() -> Dict[str, Any]:
+    """
+    Participant extraction cache usage.
+
+    Reports this worker's cached results, lookups answered locally (hits) or
+    from the shared backend (shared_hits), misses, the hit ratio, and entries
+    dropped by the size bound (evictions) or the TTL (expirations).
+    """
+    return extraction_cache.stats()
+
+
+@router.get("/pool", response_model=Dict[str, Any])
+async def pool_stats_endpoint() -> Dict[str, Any]:
+    """
+    Database connection pool telemetry.
+
+    Reports checked-out, checked-in and overflow connections per pool,
+    connection churn (connects, closes, invalidations), checkout timeouts,
+    and checkout wait and new-connection time percentiles in milliseconds.
+    """
+    return pool_stats()
+
+
+@router.get("/jobs", response_model=Dict[str, Any])
+async def job_queue_stats() -> Dict[str, Any]:
+    """
+    Post-upload processing queue.
+
+    Reports job counts by status (queued, running, succeeded, failed).
+    """
+    return {
+        "enabled": settings.job_queue_enabled,
+        "jobs": await workload_executor.run_io("job_stats", job_queue.stats),
+    }
@@ -0,0 +1,21 @@
+"""
+Prometheus metrics exposition endpoint.
+"""
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from ..monitoring.exposition import CONTENT_TYPE, render
+
+router = APIRouter()
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def metrics() -> PlainTextResponse:
+    """
+    Application metrics in the Prometheus text format.
+
+    Includes per-route HTTP latency histograms, body sizes and in-flight
+    requests, plus connection pool telemetry.
+    """
+    return PlainTextResponse(render(), media_type=CONTENT_TYPE)
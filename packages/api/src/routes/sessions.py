@@ -2,22 +2,47 @@
 Session upload API endpoints.
 """
 
-from typing import Annotated
+from datetime import datetime
+from typing import Annotated, List, Optional, Union
 from uuid import UUID, uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    Form,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    UploadFile,
+)
 from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from ..models.database import get_db
+from ..config import settings
+from ..models.database import get_db, get_async_db
 from ..schemas.sessions import (
+    BatchUploadResponse,
+    ChunkedUploadInit,
+    ChunkedUploadStatus,
     SessionUploadRequest,
     SessionUploadResponse,
     FileUploadMetadata,
     ErrorResponse,
 )
 from ..services.session_management import SessionManagementService
+from ..services.async_session_management import AsyncSessionManagementService
 from ..services.file_processing import FileProcessingService
+from ..services.participant_extraction import ParticipantExtractor
+from ..services.batch_ingestion import parse_batch
+from ..services.chunked_uploads import UploadState, chunked_upload_store
+from ..services.deduplication import transcript_fingerprint, validate_idempotency_key
+from ..services.extraction_cache import extraction_cache
+from ..services.executor import workload_executor
+from ..services.transcript_parser import build_segment_index
 
 
 router = APIRouter(prefix="/api/v1/sessions", tags=["Session Upload"])
@@ -28,13 +53,96 @@ router = APIRouter(prefix="/api/v1/sessions", tags=["Session Upload"])
 TEMP_COACH_ID = UUID("12345678-1234-5678-9abc-123456789012")  # Fixed UUID for consistency
 TEMP_ORGANIZATION_ID = UUID("87654321-4321-8765-cba9-876543210987")  # Fixed UUID for consistency
 
+# Data-access stack for these routes, chosen once at startup
+get_session_db = get_async_db if settings.async_database_enabled else get_db
+SessionDB = Union[Session, AsyncSession]
+
+
+async def _create_session(
+    db: SessionDB,
+    upload_request: SessionUploadRequest,
+    idempotency_key: Optional[str] = None,
+) -> SessionUploadResponse:
+    """
+    Run the upload workflow without blocking the event loop.
+    
+    The transcript is fingerprinted in the parse pool first; a repeat upload
+    (same content or Idempotency-Key) returns the coach's existing session
+    without extracting participants. Otherwise participant extraction and
+    the segment index of timed turns are computed in the parse pool. The
+    database workflow is awaited directly on an
+    async session, or runs in the DB thread pool on a sync one.
+    """
+    idempotency_key = validate_idempotency_key(idempotency_key)
+    transcript_hash = await workload_executor.run_cpu(
+        "fingerprint_transcript",
+        transcript_fingerprint,
+        upload_request.transcript_text,
+    )
+    
+    async_service = None
+    service = None
+    if isinstance(db, AsyncSession):
+        async_service = AsyncSessionManagementService(db)
+        duplicate = await async_service.find_duplicate_upload(
+            TEMP_COACH_ID, transcript_hash, idempotency_key
+        )
+    else:
+        service = SessionManagementService(db)
+        duplicate = await workload_executor.run_io(
+            "find_duplicate",
+            service.find_duplicate_upload,
+            TEMP_COACH_ID,
+            transcript_hash,
+            idempotency_key,
+        )
+    if duplicate is not None:
+        return duplicate
+    
+    participants = None
+    if not upload_request.participants:
+        participants = await extraction_cache.extract_async(
+            upload_request.transcript_text,
+            lambda text: workload_executor.run_cpu(
+                "extract_participants", ParticipantExtractor.extract_participants, text
+            ),
+        )
+    segment_index = await workload_executor.run_cpu(
+        "index_segments", build_segment_index, upload_request.transcript_text
+    )
+    
+    if async_service is not None:
+        return await async_service.create_session_from_upload(
+            upload_request=upload_request,
+            coach_id=TEMP_COACH_ID,
+            organization_id=TEMP_ORGANIZATION_ID,
+            participants=participants,
+            transcript_hash=transcript_hash,
+            idempotency_key=idempotency_key,
+            segment_index=segment_index,
+        )
+    
+    return await workload_executor.run_io(
+        "persist_session",
+        service.create_session_from_upload,
+        upload_request=upload_request,
+        coach_id=TEMP_COACH_ID,
+        organization_id=TEMP_ORGANIZATION_ID,
+        participants=participants,
+        transcript_hash=transcript_hash,
+        idempotency_key=idempotency_key,
+        segment_index=segment_index,
+    )
+
 
 @router.post(
     "/upload",
     response_model=SessionUploadResponse,
     responses={
         400: {"model": ErrorResponse, "description": "Invalid request data"},
+        409: {"model": ErrorResponse, "description": "Idempotency-Key reused for a different transcript"},
         422: {"model": ErrorResponse, "description": "Processing failed"},
+        429: {"model": ErrorResponse, "description": "Server busy, retry later"},
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
     summary="Upload session transcript text",
@@ -42,7 +150,11 @@ TEMP_ORGANIZATION_ID = UUID("87654321-4321-8765-cba9-876543210987")  # Fixed UUI
 )
 async def upload_session_text(
     upload_request: SessionUploadRequest,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[SessionDB, Depends(get_session_db)],
+    idempotency_key: Annotated[
+        Optional[str],
+        Header(alias="Idempotency-Key", description="Retries with the same key return the original session"),
+    ] = None,
 ) -> SessionUploadResponse:
     """
     Upload session transcript as text content.
@@ -51,15 +163,7 @@ async def upload_session_text(
     such as session date, type, and optional participant information.
     """
     try:
-        service = SessionManagementService(db)
-        
-        response = service.create_session_from_upload(
-            upload_request=upload_request,
-            coach_id=TEMP_COACH_ID,
-            organization_id=TEMP_ORGANIZATION_ID,
-        )
-        
-        return response
+        return await _create_session(db, upload_request, idempotency_key)
         
     except HTTPException:
         raise
@@ -75,24 +179,30 @@ async def upload_session_text(
     response_model=SessionUploadResponse,
     responses={
         400: {"model": ErrorResponse, "description": "Invalid file or metadata"},
+        409: {"model": ErrorResponse, "description": "Idempotency-Key reused for a different transcript"},
         413: {"model": ErrorResponse, "description": "File too large"},
         422: {"model": ErrorResponse, "description": "File processing failed"},
+        429: {"model": ErrorResponse, "description": "Server busy, retry later"},
         500: {"model": ErrorResponse, "description": "Internal server error"},
     },
     summary="Upload session transcript file",
-    description="Upload a session transcript file (.txt or .docx) with metadata.",
+    description="Upload a session transcript file (.txt, .docx, .vtt or .srt) with metadata.",
 )
 async def upload_session_file(
-    db: Annotated[Session, Depends(get_db)],
-    file: Annotated[UploadFile, File(description="Transcript file (.txt or .docx, max 10MB)")],
+    db: Annotated[SessionDB, Depends(get_session_db)],
+    file: Annotated[UploadFile, File(description="Transcript file (.txt, .docx, .vtt or .srt, max 10MB)")],
     session_date: Annotated[str, Form(description="Session date (YYYY-MM-DD)")],
     session_type: Annotated[str, Form(description="Session type")] = None,
     notes: Annotated[str, Form(description="Additional notes")] = None,
+    idempotency_key: Annotated[
+        Optional[str],
+        Header(alias="Idempotency-Key", description="Retries with the same key return the original session"),
+    ] = None,
 ) -> SessionUploadResponse:
     """
     Upload session transcript as a file.
     
-    This endpoint accepts .txt or .docx files containing session transcripts.
+    This endpoint accepts .txt, .docx, .vtt or .srt files containing session transcripts.
     File content is extracted and processed the same way as text uploads.
     """
     try:
@@ -118,14 +228,222 @@ async def upload_session_file(
         )
         
         # Process through session management service
+        return await _create_session(db, upload_request, idempotency_key)
+        
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Unexpected error during file upload: {str(e)}"
+        )
+
+
+@router.post(
+    "/upload-batch",
+    response_model=BatchUploadResponse,
+    responses={
+        400: {"model": ErrorResponse, "description": "Invalid archive or metadata"},
+        413: {"model": ErrorResponse, "description": "Batch too large"},
+        429: {"model": ErrorResponse, "description": "Server busy, retry later"},
+        500: {"model": ErrorResponse, "description": "Internal server error"},
+    },
+    summary="Upload a batch of session transcripts",
+    description=(
+        "Upload many transcript files (.txt, .docx, .vtt or .srt) and/or .zip archives of them. "
+        "Returns a result for every file."
+    ),
+)
+async def upload_session_batch(
+    db: Annotated[SessionDB, Depends(get_session_db)],
+    files: Annotated[List[UploadFile], File(description="Transcript files and .zip archives")],
+    session_date: Annotated[str, Form(description="Default session date (YYYY-MM-DD)")],
+    session_type: Annotated[str, Form(description="Session type for every file")] = None,
+    notes: Annotated[str, Form(description="Notes for every file")] = None,
+) -> BatchUploadResponse:
+    """
+    Upload a batch of session transcripts.
+    
+    Files are parsed in parallel in the parse pool, participants are resolved
+    to clients once for the whole batch and sessions are committed in chunks.
+    A file whose name contains a YYYY-MM-DD date uses that date instead of
+    ``session_date``. Failures are reported per file and do not fail the
+    request.
+    """
+    try:
+        try:
+            default_date = datetime.strptime(session_date, "%Y-%m-%d").date()
+        except ValueError:
+            raise HTTPException(
+                status_code=400,
+                detail="Invalid date format. Use YYYY-MM-DD format."
+            )
+        
+        transcripts = await parse_batch(files, default_date)
+        
+        if isinstance(db, AsyncSession):
+            return await AsyncSessionManagementService(db).create_sessions_batch(
+                transcripts,
+                coach_id=TEMP_COACH_ID,
+                organization_id=TEMP_ORGANIZATION_ID,
+                session_type=session_type,
+                notes=notes,
+            )
+        
         service = SessionManagementService(db)
         
-        response = service.create_session_from_upload(
-            upload_request=upload_request,
+        return await workload_executor.run_io(
+            "persist_batch",
+            service.create_sessions_batch,
+            transcripts,
             coach_id=TEMP_COACH_ID,
             organization_id=TEMP_ORGANIZATION_ID,
+            session_type=session_type,
+            notes=notes,
         )
         
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Unexpected error during batch upload: {str(e)}"
+        )
+
+
+def _upload_status(state: UploadState) -> ChunkedUploadStatus:
+    return ChunkedUploadStatus(
+        upload_id=state.upload_id,
+        filename=state.filename,
+        total_size=state.total_size,
+        received_bytes=state.received_bytes,
+        complete=state.complete,
+        expires_at=state.expires_at,
+    )
+
+
+@router.post(
+    "/uploads",
+    response_model=ChunkedUploadStatus,
+    status_code=201,
+    responses={
+        400: {"model": ErrorResponse, "description": "Unsupported file type"},
+        413: {"model": ErrorResponse, "description": "File too large"},
+    },
+    summary="Start a resumable chunked upload",
+    description="Start a chunked upload of a transcript file (.txt, .docx, .vtt or .srt).",
+)
+async def create_chunked_upload(init: ChunkedUploadInit) -> ChunkedUploadStatus:
+    """
+    Start a resumable upload.
+    
+    Send the file with PUT /uploads/{upload_id}/chunks, then create the
+    session with POST /uploads/{upload_id}/finalize.
+    """
+    state = await chunked_upload_store.create(init.filename, init.total_size, init.sha256)
+    return _upload_status(state)
+
+
+@router.get(
+    "/uploads/{upload_id}",
+    response_model=ChunkedUploadStatus,
+    responses={404: {"model": ErrorResponse, "description": "Upload not found or expired"}},
+    summary="Get chunked upload status",
+    description="Bytes received so far; resume by sending the chunk at received_bytes.",
+)
+async def get_chunked_upload(upload_id: UUID) -> ChunkedUploadStatus:
+    """Get the resume point of a chunked upload."""
+    return _upload_status(await chunked_upload_store.status(upload_id))
+
+
+@router.put(
+    "/uploads/{upload_id}/chunks",
+    response_model=ChunkedUploadStatus,
+    responses={
+        400: {"model": ErrorResponse, "description": "Chunk checksum mismatch"},
+        404: {"model": ErrorResponse, "description": "Upload not found or expired"},
+        409: {"model": ErrorResponse, "description": "Offset does not match received bytes"},
+        413: {"model": ErrorResponse, "description": "Chunk too large"},
+    },
+    summary="Upload one chunk",
+    description="Append the request body at ``offset``; X-Chunk-SHA256 is its hex SHA-256.",
+)
+async def put_upload_chunk(
+    upload_id: UUID,
+    request: Request,
+    offset: Annotated[int, Query(ge=0, description="Byte offset of this chunk")],
+    checksum: Annotated[str, Header(alias="X-Chunk-SHA256", description="Hex SHA-256 of the chunk")],
+) -> ChunkedUploadStatus:
+    """
+    Upload one chunk of a file.
+    
+    Retrying a chunk that was already stored is acknowledged without
+    writing it again.
+    """
+    limit = chunked_upload_store.max_chunk_size
+    data = bytearray()
+    async for part in request.stream():
+        data += part
+        if len(data) > limit:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Chunk too large. Maximum size is {limit} bytes"
+            )
+    
+    state = await chunked_upload_store.write_chunk(upload_id, offset, bytes(data), checksum)
+    return _upload_status(state)
+
+
+@router.post(
+    "/uploads/{upload_id}/finalize",
+    response_model=SessionUploadResponse,
+    responses={
+        404: {"model": ErrorResponse, "description": "Upload not found or expired"},
+        409: {"model": ErrorResponse, "description": "Upload incomplete, or Idempotency-Key reused"},
+        422: {"model": ErrorResponse, "description": "Checksum mismatch or processing failed"},
+        429: {"model": ErrorResponse, "description": "Server busy, retry later"},
+        500: {"model": ErrorResponse, "description": "Internal server error"},
+    },
+    summary="Finalize a chunked upload",
+    description="Assemble the uploaded file and create the session from it.",
+)
+async def finalize_chunked_upload(
+    upload_id: UUID,
+    metadata: FileUploadMetadata,
+    db: Annotated[SessionDB, Depends(get_session_db)],
+    idempotency_key: Annotated[
+        Optional[str],
+        Header(alias="Idempotency-Key", description="Retries with the same key return the original session"),
+    ] = None,
+) -> SessionUploadResponse:
+    """
+    Finalize a chunked upload.
+    
+    The assembled file goes through the same extraction and session workflow
+    as POST /upload-file. The staged file is removed once the session is
+    created; if anything fails first it is kept, so finalize can be retried
+    (with the same Idempotency-Key) without re-sending the file.
+    """
+    try:
+        upload = await chunked_upload_store.assemble(upload_id)
+        try:
+            transcript_text = await FileProcessingService.process_file_content(
+                upload.content, upload.filename
+            )
+            
+            upload_request = SessionUploadRequest(
+                transcript_text=transcript_text,
+                session_date=metadata.session_date,
+                session_type=metadata.session_type,
+                notes=metadata.notes,
+            )
+            
+            response = await _create_session(db, upload_request, idempotency_key)
+        except Exception:
+            await chunked_upload_store.release(upload_id)
+            raise
+        
+        await chunked_upload_store.complete(upload_id)
         return response
         
     except HTTPException:
@@ -133,10 +451,22 @@ async def upload_session_file(
     except Exception as e:
         raise HTTPException(
             status_code=500,
-            detail=f"Unexpected error during file upload: {str(e)}"
+            detail=f"Unexpected error during upload finalize: {str(e)}"
         )
 
 
+@router.delete(
+    "/uploads/{upload_id}",
+    status_code=204,
+    responses={404: {"model": ErrorResponse, "description": "Upload not found"}},
+    summary="Abandon a chunked upload",
+)
+async def delete_chunked_upload(upload_id: UUID) -> Response:
+    """Discard a chunked upload and its staged data."""
+    await chunked_upload_store.delete(upload_id)
+    return Response(status_code=204)
+
+
 @router.get(
     "/{session_id}",
     summary="Get session details",
@@ -144,12 +474,18 @@ async def upload_session_file(
 )
 async def get_session(
     session_id: UUID,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[SessionDB, Depends(get_session_db)],
 ):
     """Get session details by ID."""
     try:
-        service = SessionManagementService(db)
-        session_data = service.get_session_with_participants(session_id)
+        if isinstance(db, AsyncSession):
+            service = AsyncSessionManagementService(db)
+            session_data = await service.get_session_with_participants(session_id)
+        else:
+            service = SessionManagementService(db)
+            session_data = await workload_executor.run_io(
+                "get_session", service.get_session_with_participants, session_id
+            )
         
         if not session_data:
             raise HTTPException(
@@ -176,12 +512,18 @@ async def get_session(
 async def update_session_status(
     session_id: UUID,
     status: str,
-    db: Annotated[Session, Depends(get_db)],
+    db: Annotated[SessionDB, Depends(get_session_db)],
 ):
     """Update session processing status."""
     try:
-        service = SessionManagementService(db)
-        success = service.update_session_status(session_id, status)
+        if isinstance(db, AsyncSession):
+            service = AsyncSessionManagementService(db)
+            success = await service.update_session_status(session_id, status)
+        else:
+            service = SessionManagementService(db)
+            success = await workload_executor.run_io(
+                "update_session_status", service.update_session_status, session_id, status
+            )
         
         if not success:
             raise HTTPException(
@@ -6,6 +6,10 @@ from .sessions import (
     SessionUploadRequest,
     SessionUploadResponse,
     FileUploadMetadata,
+    BatchFileResult,
+    BatchUploadResponse,
+    ChunkedUploadInit,
+    ChunkedUploadStatus,
     ErrorResponse,
 )
 from .clients import (
@@ -18,6 +22,10 @@ __all__ = [
     "SessionUploadRequest",
     "SessionUploadResponse", 
     "FileUploadMetadata",
+    "BatchFileResult",
+    "BatchUploadResponse",
+    "ChunkedUploadInit",
+    "ChunkedUploadStatus",
     "ErrorResponse",
     "ClientCreate",
     "ClientResponse",
@@ -2,7 +2,8 @@
 Pydantic schemas for session upload endpoints.
 """
 
-from datetime import date
+import re
+from datetime import date, datetime
 from typing import List, Optional
 from uuid import UUID
 
@@ -99,6 +100,123 @@ class FileUploadMetadata(BaseModel):
     )
 
 
+class BatchFileResult(BaseModel):
+    """Outcome for one transcript in a batch upload."""
+    
+    filename: str = Field(
+        ...,
+        description="File name, or archive path for files inside a zip"
+    )
+    status: str = Field(
+        ...,
+        description="'uploaded', 'duplicate' or 'failed'"
+    )
+    session_id: Optional[UUID] = Field(
+        None,
+        description="Created session, or the existing one for a duplicate"
+    )
+    session_date: Optional[date] = Field(
+        None,
+        description="Session date used (from the file name or the batch default)"
+    )
+    participants_identified: List[str] = Field(
+        default_factory=list,
+        description="Participants identified in the transcript"
+    )
+    clients_created: List[str] = Field(
+        default_factory=list,
+        description="New clients created for this transcript"
+    )
+    clients_matched: List[str] = Field(
+        default_factory=list,
+        description="Existing clients matched for this transcript"
+    )
+    error: Optional[str] = Field(
+        None,
+        description="Why the file failed, when it did"
+    )
+
+
+class BatchUploadResponse(BaseModel):
+    """Schema for a batch upload response."""
+    
+    total: int = Field(
+        ...,
+        description="Transcripts found in the batch"
+    )
+    uploaded: int = Field(
+        ...,
+        description="Transcripts stored as sessions"
+    )
+    duplicates: int = Field(
+        0,
+        description="Transcripts already uploaded, resolved to existing sessions"
+    )
+    failed: int = Field(
+        ...,
+        description="Transcripts that could not be processed"
+    )
+    results: List[BatchFileResult] = Field(
+        ...,
+        description="Per-file results, in upload order"
+    )
+
+
+class ChunkedUploadInit(BaseModel):
+    """Schema for starting a resumable chunked upload."""
+    
+    filename: str = Field(
+        ...,
+        min_length=1,
+        max_length=255,
+        description="Original file name (.txt, .docx, .vtt or .srt)"
+    )
+    total_size: int = Field(
+        ...,
+        ge=1,
+        description="Size of the complete file in bytes"
+    )
+    sha256: Optional[str] = Field(
+        None,
+        description="Hex SHA-256 of the complete file, verified on finalize"
+    )
+
+    @validator('sha256')
+    def validate_sha256(cls, v):
+        if v is not None and not re.fullmatch(r'[0-9a-fA-F]{64}', v):
+            raise ValueError('sha256 must be 64 hex characters')
+        return v.lower() if v else v
+
+
+class ChunkedUploadStatus(BaseModel):
+    """Schema for the state of a chunked upload."""
+    
+    upload_id: UUID = Field(
+        ...,
+        description="Identifier to send chunks to"
+    )
+    filename: str = Field(
+        ...,
+        description="Original file name"
+    )
+    total_size: int = Field(
+        ...,
+        description="Size of the complete file in bytes"
+    )
+    received_bytes: int = Field(
+        ...,
+        description="Bytes stored so far; the offset of the next chunk"
+    )
+    complete: bool = Field(
+        ...,
+        description="Whether every byte has been received"
+    )
+    expires_at: datetime = Field(
+        ...,
+        description="When the upload is discarded if not finalized"
+    )
+
+
 class ErrorResponse(BaseModel):
     """Schema for error responses."""
     
@@ -5,9 +5,11 @@ Services module for business logic.
 from .file_processing import FileProcessingService
 from .participant_extraction import ParticipantExtractor
 from .session_management import SessionManagementService
+from .async_session_management import AsyncSessionManagementService
 
 __all__ = [
     "FileProcessingService",
     "ParticipantExtractor", 
     "SessionManagementService",
+    "AsyncSessionManagementService",
 ]
\ No newline at end of file
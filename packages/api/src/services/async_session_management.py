@@ -0,0 +1,290 @@
+"""
+Async session management service backed by the asyncpg data-access stack.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Set
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..config import settings
+from ..jobs.handlers import SESSION_PROCESSING_JOB
+from ..jobs.queue import JobQueue, job_queue as default_job_queue
+from ..monitoring.tracing import span
+from ..repositories.async_clients import AsyncClientRepository, AsyncClientSessionRepository
+from ..repositories.async_sessions import AsyncSessionRepository
+from ..schemas.sessions import BatchUploadResponse, SessionUploadRequest, SessionUploadResponse
+from ..services.batch_ingestion import (
+    ParsedTranscript,
+    batch_response,
+    chunked,
+    session_fields,
+    session_links,
+    split_duplicates,
+)
+from ..services.deduplication import (
+    duplicate_response,
+    pick_duplicate,
+    transcript_fingerprint,
+)
+from ..services.participant_extraction import ParticipantInfo
+from ..services.session_management import SessionWorkflowBase
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncSessionManagementService(SessionWorkflowBase):
+    """
+    Async counterpart of SessionManagementService.
+    
+    Same workflow and responses, shared through SessionWorkflowBase; database
+    calls are awaited on the event loop instead of running in the DB thread
+    pool.
+    """
+    
+    def __init__(self, db: AsyncSession, job_queue: Optional[JobQueue] = None):
+        self.db = db
+        self.job_queue = job_queue or default_job_queue
+        self.session_repo = AsyncSessionRepository(db)
+        self.client_repo = AsyncClientRepository(db)
+        self.client_session_repo = AsyncClientSessionRepository(db)
+    
+    async def create_session_from_upload(
+        self,
+        upload_request: SessionUploadRequest,
+        coach_id: UUID,
+        organization_id: UUID,
+        participants: Optional[List[ParticipantInfo]] = None,
+        transcript_hash: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+        segment_index: Optional[bytes] = None,
+    ) -> SessionUploadResponse:
+        """
+        Create a session from upload request with full workflow.
+        
+        Args:
+            upload_request: Session upload data
+            coach_id: ID of the coach creating the session
+            organization_id: Organization context
+            participants: Participants already extracted off the event loop
+                (optional; extracted here when omitted)
+            transcript_hash: Normalized content hash (optional; computed
+                here when omitted)
+            idempotency_key: Client Idempotency-Key header (optional)
+            segment_index: Encoded segment index of a timed transcript
+                (optional; see transcript_parser.build_segment_index)
+            
+        Returns:
+            SessionUploadResponse with session details, or the existing
+            session if a concurrent upload stored the same transcript first
+            
+        Raises:
+            HTTPException: If workflow fails
+        """
+        if transcript_hash is None:
+            transcript_hash = transcript_fingerprint(upload_request.transcript_text)
+        
+        try:
+            if participants is None:
+                with span("extract_participants"):
+                    participants = self._extract_participants(upload_request)
+            
+            session = await self.session_repo.create_session(**self._session_record_fields(
+                upload_request,
+                coach_id,
+                len(participants),
+                transcript_hash,
+                idempotency_key,
+                segment_index,
+            ))
+            
+            client_results = await self._process_participants(
+                participants, session.id, organization_id
+            )
+            
+            # Queue post-upload processing in the same transaction
+            await self._enqueue_processing(session.id)
+            
+            with span("commit"):
+                await self.db.commit()
+            
+            return self._upload_response(session.id, participants, client_results)
+                
+        except HTTPException:
+            raise
+        except IntegrityError as e:
+            # Lost a race with an identical upload; resolve to its session
+            await self.db.rollback()
+            duplicate = await self.find_duplicate_upload(coach_id, transcript_hash, idempotency_key)
+            if duplicate is not None:
+                return duplicate
+            raise self._upload_error(e)
+        except Exception as e:
+            raise self._upload_error(e)
+    
+    async def create_sessions_batch(
+        self,
+        transcripts: List[ParsedTranscript],
+        coach_id: UUID,
+        organization_id: UUID,
+        session_type: Optional[str] = None,
+        notes: Optional[str] = None,
+    ) -> BatchUploadResponse:
+        """Store a parsed batch; see SessionManagementService.create_sessions_batch."""
+        results, candidates = self._batch_candidates(transcripts)
+        
+        try:
+            with span("find_duplicates"):
+                existing = await self.session_repo.find_ids_by_hashes(
+                    coach_id, [transcript.fingerprint for _, transcript in candidates]
+                )
+            pending, repeats = split_duplicates(candidates, existing)
+            
+            with span("resolve_clients"):
+                resolutions = (await self.client_repo.resolve_clients_bulk(
+                    [name for _, transcript in pending for name in transcript.client_names],
+                    organization_id,
+                )).resolutions
+            with span("commit"):
+                await self.db.commit()
+        except SQLAlchemyError as e:
+            await self.db.rollback()
+            self._mark_failed(
+                results, candidates, f"Database error during client resolution: {str(e)}"
+            )
+            return batch_response(results)
+        
+        credited: Set[UUID] = set()
+        for chunk in chunked(pending, settings.batch_commit_size):
+            try:
+                sessions = await self.session_repo.create_sessions_bulk(
+                    coach_id,
+                    [session_fields(transcript, session_type, notes) for _, transcript in chunk],
+                )
+                session_ids = [session.id for session in sessions]
+                links, speaking_time_seconds, engagement_levels = session_links(
+                    sessions, [transcript for _, transcript in chunk], resolutions
+                )
+                await self.client_session_repo.link_sessions_bulk(
+                    links,
+                    engagement_level="unknown",
+                    speaking_time_seconds=speaking_time_seconds,
+                    engagement_levels=engagement_levels,
+                )
+                if settings.job_queue_enabled:
+                    with span("enqueue_processing"):
+                        await self.job_queue.enqueue_many_async(
+                            SESSION_PROCESSING_JOB,
+                            session_ids,
+                            max_attempts=settings.job_max_attempts,
+                            db=self.db,
+                        )
+                with span("commit"):
+                    await self.db.commit()
+            except SQLAlchemyError as e:
+                await self.db.rollback()
+                logger.error(f"Batch chunk of {len(chunk)} sessions failed: {str(e)}")
+                self._mark_failed(
+                    results, chunk, f"Database error during session creation: {str(e)}"
+                )
+                continue
+            
+            self._mark_uploaded(results, session_ids, chunk, resolutions, credited)
+        
+        return self._batch_response(results, pending, repeats, existing)
+    
+    async def find_duplicate_upload(
+        self,
+        coach_id: UUID,
+        transcript_hash: str,
+        idempotency_key: Optional[str] = None,
+    ) -> Optional[SessionUploadResponse]:
+        """Resolve a repeat upload; see SessionManagementService.find_duplicate_upload."""
+        matches = await self.session_repo.find_by_upload_keys(
+            coach_id, transcript_hash, idempotency_key
+        )
+        session = pick_duplicate(matches, transcript_hash, idempotency_key)
+        return duplicate_response(session) if session is not None else None
+    
+    async def _enqueue_processing(self, session_id: UUID) -> None:
+        """Queue the background processing job for a new session."""
+        if not settings.job_queue_enabled:
+            return
+        
+        with span("enqueue_processing"):
+            await self.job_queue.enqueue_async(
+                SESSION_PROCESSING_JOB,
+                {},
+                session_id=session_id,
+                max_attempts=settings.job_max_attempts,
+                db=self.db,
+            )
+    
+    async def _process_participants(
+        self,
+        participants: List[ParticipantInfo],
+        session_id: UUID,
+        organization_id: UUID,
+    ) -> Dict[str, List[str]]:
+        """
+        Process participants to create or match clients.
+        
+        All participants are resolved and linked together in the upload's
+        transaction, so a database error fails the whole upload.
+        
+        Returns:
+            Dictionary with 'created' and 'matched' client name lists
+        """
+        names = self._client_names(participants)
+        
+        resolution = await self.client_repo.resolve_clients_bulk(
+            names=names,
+            organization_id=organization_id,
+        )
+        resolved, speaking_time_seconds, engagement_levels = self._resolved_clients(
+            participants, names, resolution
+        )
+        
+        await self.client_session_repo.create_client_sessions_bulk(
+            session_id=session_id,
+            client_ids=[r.client_id for r in resolved],
+            speaking_time_seconds=speaking_time_seconds,
+            engagement_levels=engagement_levels,
+        )
+        
+        return self._client_results(
+            resolved, resolution.round_trips + (1 if resolved else 0)
+        )
+    
+    async def get_session_with_participants(
+        self,
+        session_id: UUID
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Get session details with participant information.
+        
+        Args:
+            session_id: Session identifier
+            
+        Returns:
+            Dictionary with session and participant details
+        """
+        session = await self.session_repo.get_session_with_participants(session_id)
+        if not session:
+            return None
+        
+        return self._session_details(session)
+    
+    async def update_session_status(
+        self,
+        session_id: UUID,
+        status: str
+    ) -> bool:
+        """Update session processing status, committing the change."""
+        updated = await self.session_repo.update_processing_status(session_id, status)
+        if updated:
+            await self.db.commit()
+        return updated
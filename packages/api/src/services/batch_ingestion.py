@@ -0,0 +1,401 @@
+"""
+Batch transcript ingestion: archive streaming and parallel parsing.
+
+Uploads may mix transcript files (.txt, .docx, .vtt, .srt) and .zip archives
+of them. Entries are read one at a time and handed to the parse pool as they
+arrive, with a bound on how many are in flight, so a large archive never sits
+fully decompressed in memory. Failures are recorded per file and never abort
+the batch.
+"""
+
+import asyncio
+import re
+import zipfile
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from pathlib import PurePosixPath
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+from uuid import UUID
+
+from fastapi import HTTPException, UploadFile
+
+from ..config import settings
+from ..repositories.clients import ClientResolution
+from ..schemas.sessions import BatchFileResult, BatchUploadResponse
+from .deduplication import transcript_fingerprint
+from .executor import workload_executor
+from .file_processing import FileProcessingService
+from .participant_extraction import ParticipantExtractor, ParticipantInfo
+from .speaker_metrics import client_metrics
+from .transcript_parser import build_segment_index
+
+ARCHIVE_EXTENSION = ".zip"
+
+# Guard against zip bombs across the whole batch
+MAX_BATCH_UNCOMPRESSED_SIZE = 1024 * 1024 * 1024  # 1GB
+
+_FILENAME_DATE_REGEX = re.compile(r"(\d{4}-\d{2}-\d{2})")
+
+
+@dataclass
+class BatchEntry:
+    """One transcript file read from the batch."""
+
+    filename: str
+    extension: str
+    data: Optional[bytes] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class ParsedTranscript:
+    """A batch entry after decoding and participant extraction."""
+
+    filename: str
+    session_date: date
+    transcript_text: Optional[str] = None
+    participants: List[ParticipantInfo] = field(default_factory=list)
+    fingerprint: Optional[str] = None
+    segment_index: Optional[bytes] = None
+    error: Optional[str] = None
+
+    @property
+    def client_names(self) -> List[str]:
+        """Participant names to resolve as clients (coaches excluded)."""
+        return [p.name for p in self.participants if p.role != "coach"]
+
+
+def parse_transcript_file(
+    data: bytes, extension: str
+) -> Tuple[str, List[ParticipantInfo], str, Optional[bytes]]:
+    """
+    Decode one transcript file, extract its participants, fingerprint it and
+    index its timed turns (CPU-bound).
+
+    Module-level so it can be shipped to the parse process pool.
+    """
+    text = FileProcessingService._decode_upload(data, extension)
+    return (
+        text,
+        ParticipantExtractor.extract_participants(text),
+        transcript_fingerprint(text),
+        build_segment_index(text),
+    )
+
+
+def session_date_for(filename: str, default: date) -> date:
+    """Session date from a YYYY-MM-DD in the file name, else the batch default."""
+    match = _FILENAME_DATE_REGEX.search(PurePosixPath(filename).name)
+    if match:
+        try:
+            return datetime.strptime(match.group(1), "%Y-%m-%d").date()
+        except ValueError:
+            pass
+    return default
+
+
+def _is_archive_noise(name: str) -> bool:
+    """Directories and OS metadata that archives commonly contain."""
+    path = PurePosixPath(name)
+    return (
+        name.endswith("/")
+        or "__MACOSX" in path.parts
+        or any(part.startswith(".") for part in path.parts)
+    )
+
+
+class BatchReader:
+    """Reads transcript entries from uploaded files and archives."""
+
+    def __init__(self, max_files: int):
+        self.max_files = max_files
+        self.count = 0
+        self.uncompressed_size = 0
+
+    async def iter_entries(self, files: List[UploadFile]) -> AsyncIterator[BatchEntry]:
+        """
+        Yield entries in upload order, expanding archives.
+
+        Raises:
+            HTTPException: 400 for unreadable archives, 413 when the batch
+                exceeds the file count or total uncompressed size limits
+        """
+        for file in files:
+            extension = FileProcessingService._get_file_extension(file.filename)
+            if extension == ARCHIVE_EXTENSION:
+                async for entry in self._iter_archive(file):
+                    yield entry
+                continue
+
+            self._count_entry()
+            if extension not in FileProcessingService.SUPPORTED_EXTENSIONS:
+                yield BatchEntry(file.filename, extension, error="Unsupported file type")
+                continue
+            try:
+                buffer = await FileProcessingService._read_upload(file, extension)
+            except HTTPException as e:
+                yield BatchEntry(file.filename, extension, error=str(e.detail))
+                continue
+            yield BatchEntry(file.filename, extension, data=bytes(buffer))
+
+    async def _iter_archive(self, file: UploadFile) -> AsyncIterator[BatchEntry]:
+        # The spooled upload is seekable, so the archive is read in place
+        try:
+            archive = zipfile.ZipFile(file.file)
+        except zipfile.BadZipFile:
+            raise HTTPException(
+                status_code=400,
+                detail=f"{file.filename} is not a valid zip archive"
+            )
+
+        with archive:
+            for info in archive.infolist():
+                if _is_archive_noise(info.filename):
+                    continue
+
+                name = f"{file.filename}/{info.filename}"
+                extension = PurePosixPath(info.filename).suffix.lower()
+                self._count_entry()
+
+                if extension not in FileProcessingService.SUPPORTED_EXTENSIONS:
+                    yield BatchEntry(name, extension, error="Unsupported file type")
+                    continue
+                if info.file_size > FileProcessingService.MAX_FILE_SIZE:
+                    yield BatchEntry(name, extension, error="File too large")
+                    continue
+
+                self.uncompressed_size += info.file_size
+                if self.uncompressed_size > MAX_BATCH_UNCOMPRESSED_SIZE:
+                    raise HTTPException(
+                        status_code=413,
+                        detail="Batch too large once decompressed"
+                    )
+
+                try:
+                    # Decompress off the event loop
+                    data = await asyncio.to_thread(archive.read, info)
+                except (zipfile.BadZipFile, zipfile.LargeZipFile, NotImplementedError) as e:
+                    yield BatchEntry(name, extension, error=f"Unreadable archive entry: {e}")
+                    continue
+                yield BatchEntry(name, extension, data=data)
+
+    def _count_entry(self) -> None:
+        self.count += 1
+        if self.count > self.max_files:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Too many files in batch. Maximum is {self.max_files}"
+            )
+
+
+async def parse_batch(
+    files: List[UploadFile],
+    default_session_date: date,
+    concurrency: Optional[int] = None,
+    max_files: Optional[int] = None,
+) -> List[ParsedTranscript]:
+    """
+    Read and parse every transcript in a batch through the parse pool.
+
+    At most ``concurrency`` entries are read but not yet parsed at any time,
+    which also keeps the batch below the executor's queue-depth limit.
+
+    Returns:
+        Parsed transcripts in upload order, failures included
+
+    Raises:
+        HTTPException: If the batch itself is invalid (see BatchReader)
+    """
+    concurrency = concurrency or settings.batch_parse_concurrency
+    reader = BatchReader(max_files or settings.batch_max_files)
+    slots = asyncio.Semaphore(concurrency)
+    tasks: List[asyncio.Task] = []
+
+    async def parse(entry: BatchEntry) -> ParsedTranscript:
+        try:
+            result = ParsedTranscript(
+                filename=entry.filename,
+                session_date=session_date_for(entry.filename, default_session_date),
+                error=entry.error,
+            )
+            if entry.error is not None:
+                return result
+            try:
+                (
+                    result.transcript_text,
+                    result.participants,
+                    result.fingerprint,
+                    result.segment_index,
+                ) = await workload_executor.run_cpu(
+                    "parse_batch_file", parse_transcript_file, entry.data, entry.extension
+                )
+            except HTTPException as e:
+                result.error = str(e.detail)
+            except Exception as e:
+                result.error = f"Failed to process file: {str(e)}"
+            return result
+        finally:
+            slots.release()
+
+    try:
+        async for entry in reader.iter_entries(files):
+            await slots.acquire()
+            tasks.append(asyncio.ensure_future(parse(entry)))
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
+    return list(await asyncio.gather(*tasks))
+
+
+def chunked(items: List, size: int) -> Iterator[List]:
+    """Split a list into consecutive chunks of at most ``size`` items."""
+    size = max(1, size)
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def session_fields(
+    transcript: ParsedTranscript,
+    session_type: Optional[str],
+    notes: Optional[str],
+) -> Dict[str, Any]:
+    """Session repository arguments for one parsed transcript."""
+    return {
+        "transcript_text": transcript.transcript_text,
+        "session_date": transcript.session_date,
+        "session_type": session_type,
+        "participant_count": len(transcript.participants),
+        "notes": notes,
+        "transcript_hash": transcript.fingerprint,
+        "segment_index": transcript.segment_index,
+    }
+
+
+def linked_client_ids(
+    transcript: ParsedTranscript,
+    resolutions: Dict[str, ClientResolution],
+) -> List[UUID]:
+    """Resolved client ids for a transcript's participants."""
+    return [
+        resolutions[name].client_id
+        for name in dict.fromkeys(n.strip() for n in transcript.client_names)
+        if name in resolutions
+    ]
+
+
+def session_links(
+    sessions: Iterable,
+    transcripts: Iterable[ParsedTranscript],
+    resolutions: Dict[str, ClientResolution],
+) -> Tuple[Dict[UUID, List[UUID]], Dict[UUID, Dict[UUID, int]], Dict[UUID, Dict[UUID, str]]]:
+    """
+    Client links and talk metrics for sessions created from ``transcripts``.
+
+    Returns the arguments for ``link_sessions_bulk``: client ids, speaking
+    time and engagement level per client, each keyed by session id.
+    """
+    links, speaking_time_seconds, engagement_levels = {}, {}, {}
+    for session, transcript in zip(sessions, transcripts):
+        links[session.id] = linked_client_ids(transcript, resolutions)
+        speaking_time_seconds[session.id], engagement_levels[session.id] = client_metrics(
+            [p for p in transcript.participants if p.role != "coach"], resolutions
+        )
+    return links, speaking_time_seconds, engagement_levels
+
+
+def uploaded_result(
+    transcript: ParsedTranscript,
+    session_id: UUID,
+    resolutions: Dict[str, ClientResolution],
+    credited: Set[UUID],
+) -> BatchFileResult:
+    """
+    Result for a stored transcript.
+
+    A client created by the batch is reported as created for the first file
+    naming it and as matched for later ones; ``credited`` tracks this.
+    """
+    created, matched = [], []
+    for name in dict.fromkeys(n.strip() for n in transcript.client_names):
+        resolution = resolutions.get(name)
+        if resolution is None:
+            continue
+        if resolution.was_created and resolution.client_id not in credited:
+            credited.add(resolution.client_id)
+            created.append(name)
+        else:
+            matched.append(name)
+
+    return BatchFileResult(
+        filename=transcript.filename,
+        status="uploaded",
+        session_id=session_id,
+        session_date=transcript.session_date,
+        participants_identified=[p.name for p in transcript.participants],
+        clients_created=created,
+        clients_matched=matched,
+    )
+
+
+def split_duplicates(
+    pending: List[Tuple[int, ParsedTranscript]],
+    existing: Dict[str, UUID],
+) -> Tuple[List[Tuple[int, ParsedTranscript]], List[Tuple[int, ParsedTranscript]]]:
+    """
+    Separate transcripts to store from repeats.
+    
+    A repeat is a transcript the coach already has (``existing``, keyed by
+    fingerprint) or a later copy of one earlier in the batch.
+    """
+    unique, repeats = [], []
+    seen: Set[str] = set()
+    for index, transcript in pending:
+        if transcript.fingerprint in existing or transcript.fingerprint in seen:
+            repeats.append((index, transcript))
+        else:
+            seen.add(transcript.fingerprint)
+            unique.append((index, transcript))
+    return unique, repeats
+
+
+def repeat_result(
+    transcript: ParsedTranscript,
+    existing: Dict[str, UUID],
+    stored: Dict[str, BatchFileResult],
+) -> BatchFileResult:
+    """Result for a repeat, pointing at the session it resolved to."""
+    session_id = existing.get(transcript.fingerprint)
+    if session_id is None:
+        original = stored[transcript.fingerprint]
+        if original.status != "uploaded":
+            return failed_result(transcript, f"Duplicate of {original.filename}, which failed")
+        session_id = original.session_id
+
+    return BatchFileResult(
+        filename=transcript.filename,
+        status="duplicate",
+        session_id=session_id,
+        session_date=transcript.session_date,
+    )
+
+
+def failed_result(transcript: ParsedTranscript, error: str) -> BatchFileResult:
+    return BatchFileResult(
+        filename=transcript.filename,
+        status="failed",
+        session_date=transcript.session_date,
+        error=error,
+    )
+
+
+def batch_response(results: List[BatchFileResult]) -> BatchUploadResponse:
+    statuses = [result.status for result in results]
+    return BatchUploadResponse(
+        total=len(results),
+        uploaded=statuses.count("uploaded"),
+        duplicates=statuses.count("duplicate"),
+        failed=statuses.count("failed"),
+        results=results,
+    )
@@ -0,0 +1,168 @@
+"""
+Streaming parsers for timed caption exports (WebVTT and SubRip).
+
+Zoom and Teams recordings export transcripts as .vtt or .srt files. Cues are
+read block by block from a text stream and mapped to speakers with the
+conventions participant extraction uses: a WebVTT voice tag
+(``<v Alex Johnson>``, as Teams writes them) or a speaker label at the start
+of the cue text (``Alex Johnson: ...``, as Zoom writes them), validated with
+``ParticipantExtractor``. A cue without a speaker continues the previous
+cue's speaker, since long utterances are split across cues.
+
+``render_transcript`` turns cues into the plain transcript format the rest
+of the pipeline reads, one line per speaker turn prefixed with its time
+range, which participant extraction and the segment index both understand:
+
+    [00:01:15.250 --> 00:01:18.000] Alex Johnson: Kept the habit going.
+"""
+
+import html
+import re
+from typing import Iterable, Iterator, List, NamedTuple, Optional
+
+from .participant_extraction import ParticipantExtractor
+from .speaker_metrics import parse_timestamp
+from .transcript_parser import TranscriptSource, iter_lines
+
+# "00:01:15.250 --> 00:01:18.000" (WebVTT, hours optional) or
+# "00:01:15,250 --> 00:01:18,000" (SubRip); cue settings may follow
+_TIMING_REGEX = re.compile(
+    r'^[ \t]*(?P<start>(?:\d+:)?\d{1,2}:\d{2}[.,]\d{1,3})'
+    r'[ \t]*-->[ \t]*(?P<end>(?:\d+:)?\d{1,2}:\d{2}[.,]\d{1,3})'
+)
+_VOICE_TAG_REGEX = re.compile(r'<v(?:\.[^\s>]*)?[ \t]+([^>]+)>', re.IGNORECASE)
+# Voice, class, styling and inline timestamp tags
+_MARKUP_REGEX = re.compile(r'<[^>]*>')
+
+# Consecutive cues from one speaker separated by at most this many seconds
+# are rendered as a single turn
+MAX_MERGE_GAP_SECONDS = 2.0
+
+
+class Cue(NamedTuple):
+    """One caption cue with its speaker resolved."""
+
+    start_seconds: float
+    end_seconds: float
+    # Validated speaker name; None before the first labelled cue or for
+    # voices that are not valid names
+    speaker: Optional[str]
+    # The speaker label as written ("Coach Maria", "Dr. Priya Patel"), so
+    # extraction still sees role hints and honorifics
+    label: Optional[str]
+    # Cue text without markup or speaker label
+    text: str
+
+
+def iter_cues(source: TranscriptSource) -> Iterator[Cue]:
+    """
+    Yield cues from a WebVTT or SubRip stream.
+
+    Blocks are separated by blank lines; a block is a cue when one of its
+    lines is a timing line, and the lines after it are the cue text. Headers,
+    cue numbers and identifiers, NOTE, STYLE and REGION blocks are skipped.
+    """
+    speaker: Optional[str] = None
+    label: Optional[str] = None
+    timing = None
+    lines: List[str] = []
+
+    for _, line in iter_lines(source):
+        if not line.strip():
+            if timing is not None and lines:
+                cue = _make_cue(timing, lines, speaker, label)
+                speaker, label = cue.speaker, cue.label
+                if cue.text:
+                    yield cue
+            timing, lines = None, []
+            continue
+        if timing is None:
+            timing = _TIMING_REGEX.match(line)
+            continue
+        lines.append(line.strip())
+
+    if timing is not None and lines:
+        cue = _make_cue(timing, lines, speaker, label)
+        if cue.text:
+            yield cue
+
+
+def render_transcript(cues: Iterable[Cue]) -> str:
+    """Plain transcript text with one time-ranged line per speaker turn."""
+    return "\n".join(_iter_rendered_lines(cues))
+
+
+def _iter_rendered_lines(cues: Iterable[Cue]) -> Iterator[str]:
+    turn: Optional[Cue] = None
+    parts: List[str] = []
+
+    for cue in cues:
+        if (
+            turn is not None
+            and cue.label == turn.label
+            and cue.start_seconds - turn.end_seconds <= MAX_MERGE_GAP_SECONDS
+        ):
+            turn = turn._replace(end_seconds=max(turn.end_seconds, cue.end_seconds))
+            parts.append(cue.text)
+            continue
+        if turn is not None:
+            yield _render_line(turn, parts)
+        turn, parts = cue, [cue.text]
+
+    if turn is not None:
+        yield _render_line(turn, parts)
+
+
+def _render_line(turn: Cue, parts: List[str]) -> str:
+    time_range = f"[{format_timestamp(turn.start_seconds)} --> {format_timestamp(turn.end_seconds)}]"
+    text = " ".join(parts)
+    if turn.label is None:
+        return f"{time_range} {text}"
+    return f"{time_range} {turn.label}: {text}"
+
+
+def format_timestamp(seconds: float) -> str:
+    """Format seconds as "HH:MM:SS.mmm"."""
+    milliseconds = round(seconds * 1000)
+    hours, milliseconds = divmod(milliseconds, 3_600_000)
+    minutes, milliseconds = divmod(milliseconds, 60_000)
+    return f"{hours:02d}:{minutes:02d}:{milliseconds // 1000:02d}.{milliseconds % 1000:03d}"
+
+
+def _make_cue(timing: re.Match, lines: List[str], speaker: Optional[str], label: Optional[str]) -> Cue:
+    """Build a cue, resolving its speaker or inheriting the previous one."""
+    text = " ".join(lines)
+
+    voice = _VOICE_TAG_REGEX.search(text)
+    text = " ".join(html.unescape(_MARKUP_REGEX.sub(" ", text)).split())
+    if voice is not None:
+        # Read the voice as a label line would be ("Coach Maria" is Maria);
+        # voices extraction would not accept (e.g. "Speaker 1") keep their
+        # label but name no participant
+        label = " ".join(voice.group(1).split())
+        match = ParticipantExtractor.SPEAKER_LINE_REGEX.match(label + ":")
+        speaker = _speaker_name(match)
+    else:
+        match = ParticipantExtractor.SPEAKER_LINE_REGEX.match(text)
+        name = _speaker_name(match)
+        if name is not None:
+            speaker = name
+            label = text[:match.end()].rstrip().rstrip(":").rstrip()
+            text = text[match.end():].strip()
+
+    return Cue(
+        parse_timestamp(timing.group("start")),
+        parse_timestamp(timing.group("end")),
+        speaker,
+        label,
+        text,
+    )
+
+
+def _speaker_name(match: Optional[re.Match]) -> Optional[str]:
+    """The valid speaker name of a ``SPEAKER_LINE_REGEX`` match, if any."""
+    if match is None:
+        return None
+    # Only one alternative matches, and its name group closes last
+    name = match.group(match.lastindex).strip()
+    return name if ParticipantExtractor._is_valid_name(name) else None
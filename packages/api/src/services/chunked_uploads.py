@@ -0,0 +1,360 @@
+"""
+Resumable chunked uploads staged on disk.
+
+A client starts an upload with the file's name and size, then sends the file
+in chunks, each with its offset and SHA-256. Chunks are appended to a staging
+file under ``upload_path``; the staging file's size is the authoritative
+resume point, so after a dropped connection the client asks for the status
+and continues from ``received_bytes``. Finalize claims the upload, verifies
+the whole file and hands it to the normal extraction pipeline; the staged
+file is only removed once the session exists, and a failed finalize puts it
+back so the client can retry without re-sending anything.
+
+Appends hold an exclusive ``flock`` on the staging file, so concurrent chunk
+requests for one upload (from any worker process) cannot interleave.
+Uploads not finalized within the TTL are removed by a background sweep.
+"""
+
+import asyncio
+import fcntl
+import hashlib
+import json
+import logging
+import os
+import shutil
+import time
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Optional, Tuple
+from uuid import UUID, uuid4
+
+from fastapi import HTTPException
+
+from ..config import settings
+from .file_processing import FileProcessingService
+
+logger = logging.getLogger(__name__)
+
+META_FILE = "meta.json"
+DATA_FILE = "data.part"
+# Suffix for an upload claimed by a finalize call
+FINALIZING_SUFFIX = ".finalizing"
+
+
+@dataclass
+class UploadMeta:
+    """Upload parameters fixed at init."""
+
+    filename: str
+    total_size: int
+    sha256: Optional[str]
+    created_at: float
+
+
+@dataclass
+class UploadState:
+    """Current state of a chunked upload."""
+
+    upload_id: UUID
+    filename: str
+    total_size: int
+    received_bytes: int
+    expires_at: datetime
+
+    @property
+    def complete(self) -> bool:
+        return self.received_bytes == self.total_size
+
+
+@dataclass
+class AssembledUpload:
+    """A finalized upload's content."""
+
+    filename: str
+    content: bytes
+
+
+class ChunkedUploadStore:
+    """Stages chunked uploads in a directory, one subdirectory per upload."""
+
+    def __init__(
+        self,
+        root: Path,
+        ttl: float,
+        max_chunk_size: int,
+        max_file_size: int = FileProcessingService.MAX_FILE_SIZE,
+        cleanup_interval: float = 600.0,
+    ):
+        self.root = Path(root)
+        self.ttl = ttl
+        self.max_chunk_size = max_chunk_size
+        self.max_file_size = max_file_size
+        self.cleanup_interval = cleanup_interval
+        self._task: Optional[asyncio.Task] = None
+
+    async def create(
+        self, filename: str, total_size: int, sha256: Optional[str] = None
+    ) -> UploadState:
+        """
+        Start an upload.
+
+        Raises:
+            HTTPException: 400 for unsupported file types, 413 when the file
+                is larger than the extraction pipeline accepts
+        """
+        extension = FileProcessingService._get_file_extension(filename)
+        FileProcessingService._validate_file_extension(extension)
+        if total_size > self.max_file_size:
+            raise HTTPException(
+                status_code=413,
+                detail=f"File too large. Maximum size is {self.max_file_size // (1024*1024)}MB"
+            )
+
+        upload_id = uuid4()
+        meta = UploadMeta(filename, total_size, sha256, time.time())
+        await asyncio.to_thread(self._create, upload_id, meta)
+        return self._state(upload_id, meta, 0, meta.created_at)
+
+    async def status(self, upload_id: UUID) -> UploadState:
+        """
+        Current state of an upload, for resuming.
+
+        Raises:
+            HTTPException: 404 if the upload does not exist or has expired
+        """
+        meta, received, active_at = await asyncio.to_thread(self._read, upload_id)
+        return self._state(upload_id, meta, received, active_at)
+
+    async def write_chunk(
+        self, upload_id: UUID, offset: int, data: bytes, checksum: str
+    ) -> UploadState:
+        """
+        Append a chunk at ``offset``.
+
+        A chunk that ends at or before the bytes already stored was received
+        before (e.g. its response was lost) and is acknowledged without
+        writing, so retrying a chunk is always safe.
+
+        Raises:
+            HTTPException: 400 on a checksum mismatch, 404 for unknown uploads,
+                409 if ``offset`` is not the current resume point, 413 if the
+                chunk is too large or runs past the declared size
+        """
+        if len(data) > self.max_chunk_size:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Chunk too large. Maximum size is {self.max_chunk_size} bytes"
+            )
+        if hashlib.sha256(data).hexdigest() != checksum.lower():
+            raise HTTPException(status_code=400, detail="Chunk checksum mismatch")
+
+        meta, received = await asyncio.to_thread(self._append, upload_id, offset, data)
+        return self._state(upload_id, meta, received, time.time())
+
+    async def assemble(self, upload_id: UUID) -> AssembledUpload:
+        """
+        Claim a complete upload and return its content.
+
+        While claimed, the upload is hidden from status, chunk and finalize
+        requests (a concurrent finalize gets a 404). The caller must end the
+        claim with ``complete`` once the content is stored, or ``release`` to
+        make the upload available again. A checksum mismatch cannot be
+        retried, so that upload is removed.
+
+        Raises:
+            HTTPException: 404 for unknown uploads, 409 while bytes are
+                missing, 422 if the whole-file checksum does not match
+        """
+        return await asyncio.to_thread(self._assemble, upload_id)
+
+    async def complete(self, upload_id: UUID) -> None:
+        """Remove a claimed upload after its content was stored."""
+        await asyncio.to_thread(shutil.rmtree, self._claimed_directory(upload_id), True)
+
+    async def release(self, upload_id: UUID) -> None:
+        """Return a claimed upload to the store so finalize can be retried."""
+        await asyncio.to_thread(self._release, upload_id)
+
+    async def delete(self, upload_id: UUID) -> None:
+        """
+        Abandon an upload.
+
+        Raises:
+            HTTPException: 404 if the upload does not exist
+        """
+        directory = self._directory(upload_id)
+        if not await asyncio.to_thread(directory.is_dir):
+            raise self._not_found()
+        await asyncio.to_thread(shutil.rmtree, directory, True)
+
+    def cleanup_expired(self) -> int:
+        """Remove uploads idle for longer than the TTL; returns how many."""
+        if not self.root.is_dir():
+            return 0
+
+        cutoff = time.time() - self.ttl
+        removed = 0
+        for directory in self.root.iterdir():
+            try:
+                if directory.is_dir() and self._last_activity(directory) < cutoff:
+                    shutil.rmtree(directory, ignore_errors=True)
+                    removed += 1
+            except OSError:
+                # Removed concurrently by a finalize or another sweeper
+                continue
+        if removed:
+            logger.info("Removed %d expired chunked uploads", removed)
+        return removed
+
+    def start(self) -> None:
+        """Start the background cleanup loop on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.to_thread(self.cleanup_expired)
+            except Exception:
+                logger.exception("Chunked upload cleanup failed")
+            await asyncio.sleep(self.cleanup_interval)
+
+    def _create(self, upload_id: UUID, meta: UploadMeta) -> None:
+        directory = self._directory(upload_id)
+        directory.mkdir(parents=True)
+        (directory / DATA_FILE).touch()
+        (directory / META_FILE).write_text(json.dumps(asdict(meta)))
+
+    def _read(self, upload_id: UUID) -> Tuple[UploadMeta, int, float]:
+        directory = self._directory(upload_id)
+        try:
+            meta = UploadMeta(**json.loads((directory / META_FILE).read_text()))
+            received = (directory / DATA_FILE).stat().st_size
+            active_at = self._last_activity(directory)
+        except FileNotFoundError:
+            raise self._not_found()
+        if active_at < time.time() - self.ttl:
+            raise self._not_found()
+        return meta, received, active_at
+
+    def _append(self, upload_id: UUID, offset: int, data: bytes) -> Tuple[UploadMeta, int]:
+        meta, _, _ = self._read(upload_id)
+        path = self._directory(upload_id) / DATA_FILE
+
+        try:
+            fd = os.open(path, os.O_WRONLY | os.O_APPEND)
+        except FileNotFoundError:
+            raise self._not_found()
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            received = os.fstat(fd).st_size
+
+            if offset + len(data) <= received:
+                return meta, received
+            if offset != received:
+                raise HTTPException(
+                    status_code=409,
+                    detail=f"Chunk offset {offset} does not match received bytes {received}"
+                )
+            if received + len(data) > meta.total_size:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"Chunk exceeds declared file size of {meta.total_size} bytes"
+                )
+
+            try:
+                os.write(fd, data)
+            except OSError:
+                # Never leave a partial chunk behind the resume point
+                os.ftruncate(fd, received)
+                raise
+            return meta, received + len(data)
+        finally:
+            os.close(fd)
+
+    def _assemble(self, upload_id: UUID) -> AssembledUpload:
+        meta, received, _ = self._read(upload_id)
+        if received != meta.total_size:
+            raise HTTPException(
+                status_code=409,
+                detail=f"Upload incomplete: {received} of {meta.total_size} bytes received"
+            )
+
+        # Renaming claims the upload, so concurrent finalizes cannot both succeed
+        claimed = self._claimed_directory(upload_id)
+        try:
+            self._directory(upload_id).rename(claimed)
+        except FileNotFoundError:
+            raise self._not_found()
+        # Count the claim as activity so the sweep leaves it alone meanwhile
+        os.utime(claimed)
+
+        try:
+            content = (claimed / DATA_FILE).read_bytes()
+        except OSError:
+            self._release(upload_id)
+            raise
+
+        if meta.sha256 and hashlib.sha256(content).hexdigest() != meta.sha256:
+            shutil.rmtree(claimed, ignore_errors=True)
+            raise HTTPException(status_code=422, detail="File checksum mismatch")
+        return AssembledUpload(filename=meta.filename, content=content)
+
+    def _release(self, upload_id: UUID) -> None:
+        try:
+            self._claimed_directory(upload_id).rename(self._directory(upload_id))
+        except FileNotFoundError:
+            # Already removed, e.g. by the expiry sweep
+            pass
+
+    def _directory(self, upload_id: UUID) -> Path:
+        # UUID formatting keeps client input out of the path
+        return self.root / UUID(str(upload_id)).hex
+
+    def _claimed_directory(self, upload_id: UUID) -> Path:
+        directory = self._directory(upload_id)
+        return directory.with_name(directory.name + FINALIZING_SUFFIX)
+
+    def _last_activity(self, directory: Path) -> float:
+        # Appends only touch the data file, so check it as well as the directory
+        times = [directory.stat().st_mtime]
+        for name in (META_FILE, DATA_FILE):
+            try:
+                times.append((directory / name).stat().st_mtime)
+            except FileNotFoundError:
+                pass
+        return max(times)
+
+    def _state(
+        self, upload_id: UUID, meta: UploadMeta, received: int, active_at: float
+    ) -> UploadState:
+        return UploadState(
+            upload_id=upload_id,
+            filename=meta.filename,
+            total_size=meta.total_size,
+            received_bytes=received,
+            expires_at=datetime.utcfromtimestamp(active_at + self.ttl),
+        )
+
+    @staticmethod
+    def _not_found() -> HTTPException:
+        return HTTPException(status_code=404, detail="Upload not found or expired")
+
+
+# Global store, staged under the configured upload path
+chunked_upload_store = ChunkedUploadStore(
+    root=Path(settings.upload_path) / "chunked",
+    ttl=settings.upload_ttl_seconds,
+    max_chunk_size=settings.upload_chunk_max_mb * 1024 * 1024,
+    cleanup_interval=settings.upload_cleanup_interval,
+)
@@ -0,0 +1,120 @@
+"""
+Content-addressed deduplication of uploaded transcripts.
+
+Transcripts are identified by a SHA-256 over a normalized form of the text:
+Unicode NFC, any line-ending style, whitespace runs collapsed and blank lines
+dropped. Re-exports and copy-pastes of the same session therefore hash the
+same. The hash is computed incrementally, line by line, without building a
+normalized copy of the transcript.
+"""
+
+import hashlib
+import re
+import unicodedata
+from typing import Iterable, Optional
+
+from fastapi import HTTPException
+
+from ..models.core import Session as SessionModel
+from ..schemas.sessions import SessionUploadResponse
+
+IDEMPOTENCY_KEY_MAX_LENGTH = 255
+
+_LINE_BREAK_REGEX = re.compile(r"\r\n|\r|\n")
+_WHITESPACE_REGEX = re.compile(r"\s+")
+_HASH_CHUNK_SIZE = 64 * 1024
+
+
+class TranscriptHasher:
+    """Incremental SHA-256 of a normalized transcript."""
+
+    def __init__(self):
+        self._digest = hashlib.sha256()
+        # Text after the last line break, completed by the next update
+        self._pending = ""
+
+    def update(self, text: str) -> None:
+        lines = _LINE_BREAK_REGEX.split(self._pending + text)
+        self._pending = lines.pop()
+        for line in lines:
+            self._add_line(self._digest, line)
+
+    def hexdigest(self) -> str:
+        digest = self._digest.copy()
+        self._add_line(digest, self._pending)
+        return digest.hexdigest()
+
+    @staticmethod
+    def _add_line(digest, line: str) -> None:
+        line = _WHITESPACE_REGEX.sub(" ", unicodedata.normalize("NFC", line)).strip()
+        if line:
+            digest.update(line.encode("utf-8"))
+            digest.update(b"\n")
+
+
+def transcript_fingerprint(text: str) -> str:
+    """Normalized content hash of a transcript (CPU-bound for large texts)."""
+    hasher = TranscriptHasher()
+    for start in range(0, len(text), _HASH_CHUNK_SIZE):
+        hasher.update(text[start:start + _HASH_CHUNK_SIZE])
+    return hasher.hexdigest()
+
+
+def validate_idempotency_key(key: Optional[str]) -> Optional[str]:
+    """
+    Validate an Idempotency-Key header value.
+
+    Raises:
+        HTTPException: 400 if the key is blank or too long
+    """
+    if key is None:
+        return None
+    key = key.strip()
+    if not key or len(key) > IDEMPOTENCY_KEY_MAX_LENGTH:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Idempotency-Key must be 1-{IDEMPOTENCY_KEY_MAX_LENGTH} characters"
+        )
+    return key
+
+
+def pick_duplicate(
+    matches: Iterable[SessionModel],
+    transcript_hash: str,
+    idempotency_key: Optional[str] = None,
+) -> Optional[SessionModel]:
+    """
+    Choose the existing session an upload resolves to.
+
+    A session stored under the same idempotency key wins over a content
+    match. Reusing a key for a different transcript is a client error.
+
+    Raises:
+        HTTPException: 409 if the idempotency key belongs to another transcript
+    """
+    by_content = None
+    for session in matches:
+        if idempotency_key is not None and session.idempotency_key == idempotency_key:
+            if session.transcript_hash != transcript_hash:
+                raise HTTPException(
+                    status_code=409,
+                    detail="Idempotency-Key was already used for a different transcript"
+                )
+            return session
+        if session.transcript_hash == transcript_hash:
+            by_content = session
+    return by_content
+
+
+def duplicate_response(session: SessionModel) -> SessionUploadResponse:
+    """Upload response pointing at the session a repeat upload resolved to."""
+    names = [link.client.name for link in session.client_sessions if link.client is not None]
+    return SessionUploadResponse(
+        session_id=session.id,
+        status="duplicate",
+        participants_identified=names,
+        clients_created=[],
+        clients_matched=names,
+        processing_status=session.processing_status or "pending",
+        next_steps="Identical transcript already uploaded; returning the existing session",
+    )
@@ -0,0 +1,101 @@
+"""
+In-memory DOCX text extraction.
+
+A .docx file is a zip archive whose body text lives in ``word/document.xml``.
+This module reads that single member straight from the upload buffer and
+streams it through an incremental XML parser, so no temporary file is written
+and the full document tree is never built.
+"""
+
+import io
+import zipfile
+from typing import Iterator, Union
+from xml.etree.ElementTree import XMLPullParser
+
+WORD_NAMESPACE = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+DOCUMENT_PART = "word/document.xml"
+
+# Guard against zip bombs: refuse document parts that inflate beyond this size
+MAX_DOCUMENT_XML_SIZE = 200 * 1024 * 1024  # 200MB uncompressed XML
+XML_READ_CHUNK_SIZE = 64 * 1024
+
+_W = f"{{{WORD_NAMESPACE}}}"
+_BODY = f"{_W}body"
+_PARAGRAPH = f"{_W}p"
+_TEXT = f"{_W}t"
+_TAB = f"{_W}tab"
+_BREAKS = {f"{_W}br", f"{_W}cr"}
+
+
+def iter_docx_paragraphs(data: Union[bytes, bytearray, memoryview]) -> Iterator[str]:
+    """
+    Yield the text of each body-level paragraph in a DOCX document.
+
+    Mirrors python-docx's ``Document.paragraphs`` text: runs are concatenated,
+    ``w:tab`` becomes a tab and ``w:br``/``w:cr`` become newlines. Paragraphs
+    nested in tables or text boxes are skipped, as python-docx does.
+
+    Args:
+        data: Raw bytes of the .docx upload
+
+    Yields:
+        Paragraph text, one paragraph at a time
+
+    Raises:
+        zipfile.BadZipFile: If the data is not a zip archive
+        KeyError: If the archive has no word/document.xml part
+        ValueError: If the document part exceeds MAX_DOCUMENT_XML_SIZE
+        xml.etree.ElementTree.ParseError: If the document XML is malformed
+    """
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        info = archive.getinfo(DOCUMENT_PART)
+        if info.file_size > MAX_DOCUMENT_XML_SIZE:
+            raise ValueError("DOCX document part is too large")
+
+        with archive.open(info) as document_xml:
+            yield from _iter_body_paragraphs(document_xml)
+
+
+def _iter_body_paragraphs(stream: io.BufferedIOBase) -> Iterator[str]:
+    """Stream paragraphs that are direct children of ``w:body``."""
+    parser = XMLPullParser(events=("start", "end"))
+    stack: list[str] = []
+    body = None
+
+    while True:
+        chunk = stream.read(XML_READ_CHUNK_SIZE)
+        if chunk:
+            parser.feed(chunk)
+        else:
+            parser.close()
+
+        for event, element in parser.read_events():
+            if event == "start":
+                stack.append(element.tag)
+                if element.tag == _BODY:
+                    body = element
+                continue
+
+            stack.pop()
+            if stack and stack[-1] == _BODY:
+                if element.tag == _PARAGRAPH:
+                    yield _paragraph_text(element)
+                # Drop finished body children so memory stays flat
+                body.remove(element)
+
+        if not chunk:
+            return
+
+
+def _paragraph_text(paragraph) -> str:
+    """Concatenate run text for a paragraph element."""
+    parts = []
+    for element in paragraph.iter():
+        tag = element.tag
+        if tag == _TEXT:
+            parts.append(element.text or "")
+        elif tag == _TAB:
+            parts.append("\t")
+        elif tag in _BREAKS:
+            parts.append("\n")
+    return "".join(parts)
@@ -0,0 +1,238 @@
+"""
+Executor layer for keeping blocking work off the event loop.
+
+CPU-bound parsing (encoding detection, DOCX parsing, participant extraction)
+runs in a bounded process pool; blocking SQLAlchemy calls run in a thread
+pool. Each pool has a queue-depth limit and rejects new work with a 429 once
+saturated, and every call is timed per stage.
+"""
+
+import asyncio
+import contextvars
+import functools
+import logging
+import multiprocessing
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+from fastapi import HTTPException
+
+from ..config import settings
+from ..monitoring.tracing import span
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class _WorkerHTTPException(Exception):
+    """Picklable carrier for HTTPExceptions raised inside worker processes."""
+
+    def __init__(self, status_code: int, detail: Any):
+        super().__init__(status_code, detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+def _call_in_worker(func: Callable[..., T], args: tuple) -> T:
+    """Run a function in a worker process, keeping HTTP errors picklable."""
+    try:
+        return func(*args)
+    except HTTPException as e:
+        raise _WorkerHTTPException(e.status_code, e.detail)
+
+
+@dataclass
+class StageStats:
+    """Aggregated timings for one workload stage."""
+
+    count: int = 0
+    total_ms: float = 0.0
+    max_ms: float = 0.0
+
+    def record(self, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "total_ms": round(self.total_ms, 3),
+            "avg_ms": round(self.total_ms / self.count, 3) if self.count else 0.0,
+            "max_ms": round(self.max_ms, 3),
+        }
+
+
+class _BoundedPool:
+    """Queue-depth accounting for one executor."""
+
+    def __init__(self, name: str, workers: int, max_queue_depth: int):
+        self.name = name
+        self.workers = workers
+        self.max_queue_depth = max_queue_depth
+        self.pending = 0
+        self.rejected = 0
+
+    def acquire(self) -> None:
+        if self.pending >= self.max_queue_depth:
+            self.rejected += 1
+            logger.warning(
+                "%s pool saturated (%d pending), rejecting request",
+                self.name,
+                self.pending,
+            )
+            raise HTTPException(
+                status_code=429,
+                detail="Server is busy processing other uploads. Please retry shortly.",
+                headers={"Retry-After": "1"},
+            )
+        self.pending += 1
+
+    def release(self) -> None:
+        self.pending -= 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "pending": self.pending,
+            "max_queue_depth": self.max_queue_depth,
+            "rejected": self.rejected,
+        }
+
+
+class WorkloadExecutor:
+    """
+    Runs CPU-bound and blocking work outside the event loop.
+
+    Queue accounting and stage statistics are only touched from the event
+    loop thread, so they need no locking.
+    """
+
+    def __init__(
+        self,
+        parse_workers: int,
+        db_workers: int,
+        max_queue_depth: int,
+    ):
+        self._parse = _BoundedPool("parse", parse_workers, max_queue_depth)
+        self._db = _BoundedPool("db", db_workers, max_queue_depth)
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._stages: Dict[str, StageStats] = {}
+
+    @property
+    def parse_inline(self) -> bool:
+        """Whether CPU-bound work runs inline (process pool disabled)."""
+        return self._parse.workers <= 0
+
+    async def run_cpu(self, stage: str, func: Callable[..., T], *args: Any) -> T:
+        """
+        Run CPU-bound work in the process pool.
+
+        ``func`` and ``args`` must be picklable. With ``parse_workers=0`` the
+        work runs inline instead, which keeps tests and patches in-process.
+
+        Raises:
+            HTTPException: 429 when the parse queue is saturated, or any
+                HTTPException raised by ``func``
+        """
+        self._parse.acquire()
+        start = time.perf_counter()
+        try:
+            with span(stage):
+                return await self._call_cpu(func, args)
+        finally:
+            self._parse.release()
+            self._record(stage, start)
+
+    async def _call_cpu(self, func: Callable[..., T], args: tuple) -> T:
+        if self.parse_inline:
+            return func(*args)
+
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(
+                self._get_process_pool(), _call_in_worker, func, args
+            )
+        except _WorkerHTTPException as e:
+            raise HTTPException(status_code=e.status_code, detail=e.detail)
+
+    async def run_io(
+        self, stage: str, func: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> T:
+        """
+        Run blocking work (database calls) in the thread pool.
+
+        The work runs in a copy of the caller's context, so spans it records
+        land in the current request trace.
+
+        Raises:
+            HTTPException: 429 when the database queue is saturated
+        """
+        self._db.acquire()
+        start = time.perf_counter()
+        try:
+            with span(stage):
+                context = contextvars.copy_context()
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(
+                    self._get_thread_pool(),
+                    functools.partial(context.run, func, *args, **kwargs),
+                )
+        finally:
+            self._db.release()
+            self._record(stage, start)
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of pool saturation and per-stage timings."""
+        return {
+            "parse": {
+                **self._parse.to_dict(),
+                "mode": "inline" if self.parse_inline else "process",
+            },
+            "db": {**self._db.to_dict(), "mode": "thread"},
+            "stages": {
+                name: stats.to_dict() for name, stats in self._stages.items()
+            },
+        }
+
+    def shutdown(self) -> None:
+        """Stop worker pools; they are recreated lazily on next use."""
+        pools: list[Optional[Executor]] = [self._process_pool, self._thread_pool]
+        self._process_pool = None
+        self._thread_pool = None
+        for pool in pools:
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+    def _record(self, stage: str, start: float) -> None:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self._stages.setdefault(stage, StageStats()).record(elapsed_ms)
+        logger.debug("Stage %s took %.1fms", stage, elapsed_ms)
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(
+                max_workers=self._parse.workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._process_pool
+
+    def _get_thread_pool(self) -> ThreadPoolExecutor:
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(
+                max_workers=max(1, self._db.workers),
+                thread_name_prefix="db-worker",
+            )
+        return self._thread_pool
+
+
+# Global executor instance
+workload_executor = WorkloadExecutor(
+    parse_workers=settings.parse_workers,
+    db_workers=settings.db_workers,
+    max_queue_depth=settings.executor_max_queue_depth,
+)
@@ -0,0 +1,264 @@
+"""
+Memoized participant extraction.
+
+``ParticipantExtractor.extract_participants`` is a pure function of the
+transcript text, so its results are cached by a fast content hash of the
+exact text plus the extractor version. Each process keeps a bounded LRU with
+a TTL; an optional shared backend (Redis) lets results survive restarts and
+be reused across uvicorn workers.
+
+Lookups happen in the API process around the parse-pool call, so a hit skips
+the pool entirely. The shared backend is best effort: its errors are counted
+and treated as misses, never surfaced to uploads.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, replace
+from typing import Awaitable, Callable, Dict, List, Optional, Protocol, Tuple
+
+from ..config import settings
+from ..monitoring.metrics import registry
+from .participant_extraction import ParticipantExtractor, ParticipantInfo
+
+logger = logging.getLogger(__name__)
+
+cache_requests_total = registry.counter(
+    "extraction_cache_requests_total",
+    "Participant extraction cache lookups by result (hit, shared_hit, miss)",
+    ["result"],
+)
+cache_evictions_total = registry.counter(
+    "extraction_cache_evictions_total",
+    "Extraction results dropped from the local cache to stay within its bound",
+)
+
+
+class CacheBackend(Protocol):
+    """Shared store for serialized extraction results."""
+
+    name: str
+
+    def get(self, key: str) -> Optional[bytes]: ...
+
+    def set(self, key: str, value: bytes, ttl: float) -> None: ...
+
+
+class RedisCacheBackend:
+    """Extraction results in Redis, expiring with the cache TTL."""
+
+    name = "redis"
+
+    def __init__(self, url: str, prefix: str = "extraction:"):
+        import redis  # Optional dependency, only needed for the shared cache
+
+        self._client = redis.Redis.from_url(url, socket_timeout=0.5)
+        self._prefix = prefix
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._client.get(self._prefix + key)
+
+    def set(self, key: str, value: bytes, ttl: float) -> None:
+        self._client.set(self._prefix + key, value, ex=max(1, int(ttl)))
+
+
+def serialize(participants: List[ParticipantInfo]) -> bytes:
+    return json.dumps([asdict(p) for p in participants]).encode("utf-8")
+
+
+def deserialize(value: bytes) -> List[ParticipantInfo]:
+    return [ParticipantInfo(**fields) for fields in json.loads(value)]
+
+
+class ExtractionCache:
+    """Bounded LRU + TTL cache of extraction results, with an optional shared tier."""
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl: float,
+        backend: Optional[CacheBackend] = None,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.max_entries = max(1, max_entries)
+        self.ttl = ttl
+        self.backend = backend
+        self.enabled = enabled
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, List[ParticipantInfo]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.backend_errors = 0
+
+    @staticmethod
+    def key_for(text: str) -> str:
+        """Cache key: extractor version plus a BLAKE2b digest of the exact text."""
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).hexdigest()
+        return f"v{ParticipantExtractor.VERSION}:{digest}"
+
+    def extract(
+        self,
+        text: str,
+        compute: Callable[[str], List[ParticipantInfo]] = ParticipantExtractor.extract_participants,
+    ) -> List[ParticipantInfo]:
+        """Cached extraction for blocking callers."""
+        if not self.enabled:
+            return compute(text)
+
+        key = self.key_for(text)
+        found = self._lookup(key)
+        if found is None and self.backend is not None:
+            found = self._shared_get(key)
+        if found is not None:
+            return found
+
+        participants = compute(text)
+        self._store(key, participants)
+        if self.backend is not None:
+            self._shared_set(key, participants)
+        return _copy(participants)
+
+    async def extract_async(
+        self,
+        text: str,
+        compute: Callable[[str], Awaitable[List[ParticipantInfo]]],
+    ) -> List[ParticipantInfo]:
+        """Cached extraction on the event loop; ``compute`` runs only on a miss."""
+        if not self.enabled:
+            return await compute(text)
+
+        key = self.key_for(text)
+        found = self._lookup(key)
+        if found is None and self.backend is not None:
+            found = await asyncio.to_thread(self._shared_get, key)
+        if found is not None:
+            return found
+
+        participants = await compute(text)
+        self._store(key, participants)
+        if self.backend is not None:
+            await asyncio.to_thread(self._shared_set, key, participants)
+        return _copy(participants)
+
+    def clear(self) -> None:
+        """Drop every local entry (the shared tier expires on its own)."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        """Hit ratio, evictions and current size."""
+        with self._lock:
+            lookups = self.hits + self.shared_hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "backend": self.backend.name if self.backend is not None else "memory",
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "shared_hits": self.shared_hits,
+                "misses": self.misses,
+                "hit_ratio": round((self.hits + self.shared_hits) / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "backend_errors": self.backend_errors,
+            }
+
+    def _lookup(self, key: str) -> Optional[List[ParticipantInfo]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= self._clock():
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            elif self.backend is None:
+                self.misses += 1
+        if entry is None:
+            if self.backend is None:
+                cache_requests_total.labels("miss").inc()
+            return None
+        cache_requests_total.labels("hit").inc()
+        return _copy(entry[1])
+
+    def _store(self, key: str, participants: List[ParticipantInfo]) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl, _copy(participants))
+            self._entries.move_to_end(key)
+            evicted = 0
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                evicted += 1
+            self.evictions += evicted
+        if evicted:
+            cache_evictions_total.labels().inc(evicted)
+
+    def _shared_get(self, key: str) -> Optional[List[ParticipantInfo]]:
+        try:
+            value = self.backend.get(key)
+            participants = deserialize(value) if value is not None else None
+        except Exception as e:
+            participants = None
+            with self._lock:
+                self.backend_errors += 1
+            logger.warning(f"Extraction cache backend read failed: {str(e)}")
+
+        with self._lock:
+            if participants is None:
+                self.misses += 1
+            else:
+                self.shared_hits += 1
+        if participants is None:
+            cache_requests_total.labels("miss").inc()
+            return None
+
+        cache_requests_total.labels("shared_hit").inc()
+        self._store(key, participants)
+        return participants
+
+    def _shared_set(self, key: str, participants: List[ParticipantInfo]) -> None:
+        try:
+            self.backend.set(key, serialize(participants), self.ttl)
+        except Exception as e:
+            with self._lock:
+                self.backend_errors += 1
+            logger.warning(f"Extraction cache backend write failed: {str(e)}")
+
+
+def _copy(participants: List[ParticipantInfo]) -> List[ParticipantInfo]:
+    # Callers may adjust the returned objects; cached ones must stay intact
+    return [replace(p) for p in participants]
+
+
+def _build_backend() -> Optional[CacheBackend]:
+    if settings.extraction_cache_backend != "redis":
+        return None
+    try:
+        return RedisCacheBackend(settings.redis_url)
+    except ImportError:
+        logger.warning(
+            "EXTRACTION_CACHE_BACKEND=redis but the redis package is not installed; "
+            "using the per-process cache only"
+        )
+        return None
+
+
+# Global cache instance
+extraction_cache = ExtractionCache(
+    max_entries=settings.extraction_cache_max_entries,
+    ttl=settings.extraction_cache_ttl,
+    backend=_build_backend(),
+    enabled=settings.extraction_cache_enabled,
+)
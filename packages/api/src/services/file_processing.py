@@ -2,28 +2,64 @@
 File processing service for handling uploaded transcript files.
 """
 
-import os
-import tempfile
-from typing import Dict, Any
+import codecs
+import logging
+from dataclasses import dataclass
+from typing import Dict, Any, Optional
 from pathlib import Path
 
 import chardet
-from docx import Document
 from fastapi import UploadFile, HTTPException
 
+from ..monitoring.tracing import span
+from .caption_parsing import iter_cues, render_transcript
+from .content_scanner import ScanMatch, content_scanner
+from .docx_extraction import iter_docx_paragraphs
+from .executor import workload_executor
+
+logger = logging.getLogger(__name__)
+
+# Byte order marks, longest first: the UTF-32LE mark begins with the UTF-16LE one
+BYTE_ORDER_MARKS = (
+    (codecs.BOM_UTF32_LE, 'utf-32'),
+    (codecs.BOM_UTF32_BE, 'utf-32'),
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+)
+
+
+@dataclass
+class DecodedText:
+    """Decoded .txt content and how its encoding was determined."""
+    
+    text: str
+    encoding: str
+    # "bom", "utf-8", "sample", "full" or "fallback" (utf-8 with replacement)
+    tier: str
+
 
 class FileProcessingService:
     """Service for processing uploaded transcript files."""
     
     MAX_FILE_SIZE = 10 * 1024 * 1024  # 10MB
     MAX_TEXT_SIZE = 1 * 1024 * 1024   # 1MB text content
-    SUPPORTED_EXTENSIONS = {'.txt', '.docx'}
+    SUPPORTED_EXTENSIONS = {'.txt', '.docx', '.vtt', '.srt'}
+    TEXT_EXTENSIONS = {'.txt', '.vtt', '.srt'}  # Plain text on disk, scanned while reading
+    CAPTION_EXTENSIONS = {'.vtt', '.srt'}
+    READ_CHUNK_SIZE = 64 * 1024       # 64KB per read from the spooled upload
+    DETECTION_SAMPLE_SIZE = 64 * 1024 # Bytes given to chardet before trying the whole file
+    MIN_SAMPLE_CONFIDENCE = 0.5       # Below this, sample detection is not trusted
     
     @classmethod
     async def process_uploaded_file(cls, file: UploadFile) -> str:
         """
         Process an uploaded file and extract text content.
         
+        The upload is streamed once into a single buffer; size limits are
+        enforced while reading and the same buffer is handed to decoding and
+        content validation.
+        
         Args:
             file: FastAPI UploadFile object
             
@@ -33,36 +69,96 @@ class FileProcessingService:
         Raises:
             HTTPException: If file processing fails
         """
-        # Validate file size
-        await cls._validate_file_size(file)
-        
-        # Validate file extension
+        # Validate file extension before reading any content
         file_extension = cls._get_file_extension(file.filename)
         cls._validate_file_extension(file_extension)
         
-        # Process file based on type
-        content = await cls._extract_text_content(file, file_extension)
-        
-        # Validate content size and format
-        cls._validate_content(content)
+        # Stream the upload into memory, aborting early on oversize or
+        # suspicious files
+        with span("read_upload"):
+            buffer = await cls._read_upload(file, file_extension)
         
-        return content
+        # Decode and validate in the parse pool, off the event loop
+        return await workload_executor.run_cpu(
+            "decode_upload", cls._decode_upload, buffer, file_extension
+        )
     
     @classmethod
-    async def _validate_file_size(cls, file: UploadFile) -> None:
-        """Validate uploaded file size."""
-        # Read file to check size
-        content = await file.read()
-        file_size = len(content)
+    async def process_file_content(cls, buffer: bytes, filename: str) -> str:
+        """
+        Extract text from file content already held in memory.
+        
+        Used for uploads assembled outside a multipart request (e.g. chunked
+        uploads); applies the same extension, size and content checks.
         
-        if file_size > cls.MAX_FILE_SIZE:
+        Raises:
+            HTTPException: If file processing fails
+        """
+        file_extension = cls._get_file_extension(filename)
+        cls._validate_file_extension(file_extension)
+        
+        if len(buffer) > cls.MAX_FILE_SIZE:
             raise HTTPException(
                 status_code=413,
                 detail=f"File too large. Maximum size is {cls.MAX_FILE_SIZE // (1024*1024)}MB"
             )
         
-        # Reset file pointer for further processing
-        await file.seek(0)
+        return await workload_executor.run_cpu(
+            "decode_upload", cls._decode_upload, buffer, file_extension
+        )
+    
+    @classmethod
+    async def _read_upload(cls, file: UploadFile, extension: Optional[str] = None) -> bytearray:
+        """
+        Read the upload in chunks into a single buffer.
+        
+        Plain-text uploads (including captions) are scanned for suspicious
+        patterns as chunks arrive. The raw-byte scan only applies while the content looks
+        ASCII-compatible; UTF-16/32 files (NUL bytes) are left to the scan of
+        the decoded text.
+        
+        Raises:
+            HTTPException: As soon as the running size exceeds MAX_FILE_SIZE,
+                or a suspicious pattern is found
+        """
+        buffer = bytearray()
+        scan = content_scanner.stream(binary=True) if extension in cls.TEXT_EXTENSIONS else None
+        
+        while True:
+            chunk = await file.read(cls.READ_CHUNK_SIZE)
+            if not chunk:
+                break
+            
+            if len(buffer) + len(chunk) > cls.MAX_FILE_SIZE:
+                raise HTTPException(
+                    status_code=413,
+                    detail=f"File too large. Maximum size is {cls.MAX_FILE_SIZE // (1024*1024)}MB"
+                )
+            
+            if scan is not None:
+                if b'\x00' in chunk:
+                    scan = None
+                else:
+                    matches = scan.feed(chunk, first_only=True)
+                    if matches:
+                        cls._reject_suspicious(matches[0])
+            
+            buffer += chunk
+        
+        return buffer
+    
+    @classmethod
+    def _decode_upload(cls, buffer: bytearray, extension: str) -> str:
+        """Extract and validate text from an upload buffer (CPU-bound)."""
+        # Process file based on type
+        with span("extract_text"):
+            content = cls._extract_text_content(buffer, extension)
+        
+        # Validate content size and format
+        with span("validate_content"):
+            cls._validate_content(content)
+        
+        return content
     
     @classmethod
     def _get_file_extension(cls, filename: str) -> str:
@@ -85,13 +181,15 @@ class FileProcessingService:
             )
     
     @classmethod
-    async def _extract_text_content(cls, file: UploadFile, extension: str) -> str:
+    def _extract_text_content(cls, buffer: bytearray, extension: str) -> str:
         """Extract text content based on file type."""
         try:
             if extension == '.txt':
-                return await cls._process_txt_file(file)
+                return cls._process_txt_file(buffer)
             elif extension == '.docx':
-                return await cls._process_docx_file(file)
+                return cls._process_docx_file(buffer)
+            elif extension in cls.CAPTION_EXTENSIONS:
+                return cls._process_caption_file(buffer)
             else:
                 raise HTTPException(
                     status_code=400,
@@ -106,51 +204,102 @@ class FileProcessingService:
             )
     
     @classmethod
-    async def _process_txt_file(cls, file: UploadFile) -> str:
-        """Process .txt file with encoding detection."""
-        content_bytes = await file.read()
-        
-        # Detect encoding
-        detected = chardet.detect(content_bytes)
-        encoding = detected.get('encoding', 'utf-8')
+    def _process_txt_file(cls, buffer: bytearray) -> str:
+        """Decode .txt content with tiered encoding detection."""
+        with span("decode_text"):
+            decoded = cls._decode_text(buffer)
+        logger.debug(f"Decoded .txt upload as {decoded.encoding} ({decoded.tier} tier)")
         
-        try:
-            content = content_bytes.decode(encoding)
-        except UnicodeDecodeError:
-            # Fallback to utf-8 with error handling
-            content = content_bytes.decode('utf-8', errors='replace')
+        return decoded.text.strip()
+    
+    @classmethod
+    def _process_caption_file(cls, buffer: bytearray) -> str:
+        """
+        Render .vtt/.srt cues as a transcript with one time-ranged line per
+        speaker turn (see caption_parsing).
+        """
+        with span("decode_text"):
+            decoded = cls._decode_text(buffer)
         
-        return content.strip()
+        with span("parse_captions"):
+            return render_transcript(iter_cues(decoded.text))
     
     @classmethod
-    async def _process_docx_file(cls, file: UploadFile) -> str:
-        """Process .docx file using python-docx."""
-        content_bytes = await file.read()
+    def _decode_text(cls, buffer: bytearray) -> DecodedText:
+        """
+        Decode text bytes, trying the cheapest reliable tier first.
         
-        # Save to temporary file for processing
-        with tempfile.NamedTemporaryFile(suffix='.docx', delete=False) as temp_file:
-            temp_file.write(content_bytes)
-            temp_file_path = temp_file.name
+        A byte order mark settles the encoding outright. Most transcripts are
+        UTF-8, which a strict decode confirms without detection. Otherwise
+        the encoding is guessed from a bounded sample (NUL layout for UTF-16,
+        then chardet), and only if that guess is unsure or fails to decode
+        the whole buffer does chardet run on the full content.
+        """
+        for bom, encoding in BYTE_ORDER_MARKS:
+            if buffer.startswith(bom):
+                text = cls._try_decode(buffer, encoding)
+                if text is not None:
+                    return DecodedText(text, encoding, 'bom')
+                break
+        
+        # NUL bytes are valid UTF-8 but mean UTF-16/32 text without a BOM
+        if b'\x00' not in buffer:
+            text = cls._try_decode(buffer, 'utf-8')
+            if text is not None:
+                return DecodedText(text, 'utf-8', 'utf-8')
+        else:
+            encoding = cls._guess_utf16(buffer[:cls.DETECTION_SAMPLE_SIZE])
+            text = cls._try_decode(buffer, encoding) if encoding else None
+            if text is not None:
+                return DecodedText(text, encoding, 'sample')
+        
+        if len(buffer) > cls.DETECTION_SAMPLE_SIZE:
+            detected = chardet.detect(buffer[:cls.DETECTION_SAMPLE_SIZE])
+            encoding = detected.get('encoding')
+            if encoding and (detected.get('confidence') or 0) >= cls.MIN_SAMPLE_CONFIDENCE:
+                text = cls._try_decode(buffer, encoding)
+                if text is not None:
+                    return DecodedText(text, encoding, 'sample')
+        
+        encoding = chardet.detect(buffer).get('encoding')
+        if encoding:
+            text = cls._try_decode(buffer, encoding)
+            if text is not None:
+                return DecodedText(text, encoding, 'full')
         
+        # Fallback to utf-8 with error handling
+        return DecodedText(str(buffer, 'utf-8', errors='replace'), 'utf-8', 'fallback')
+    
+    @staticmethod
+    def _guess_utf16(sample: bytearray) -> Optional[str]:
+        """UTF-16 byte order from where NULs fall (mostly-Latin text without a BOM)."""
+        even_nuls = sample[0::2].count(0)
+        odd_nuls = sample[1::2].count(0)
+        half = len(sample) // 2
+        if odd_nuls > half // 2 and even_nuls == 0:
+            return 'utf-16-le'
+        if even_nuls > half // 2 and odd_nuls == 0:
+            return 'utf-16-be'
+        return None
+    
+    @staticmethod
+    def _try_decode(buffer: bytearray, encoding: str) -> Optional[str]:
+        """Strict decode; None if the bytes are not valid in ``encoding``."""
         try:
-            # Read document
-            doc = Document(temp_file_path)
-            
-            # Extract text from all paragraphs
-            paragraphs = []
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    paragraphs.append(paragraph.text.strip())
-            
-            content = '\n'.join(paragraphs)
-            return content
-            
-        finally:
-            # Clean up temporary file
-            try:
-                os.unlink(temp_file_path)
-            except OSError:
-                pass  # File already deleted or inaccessible
+            return str(buffer, encoding)
+        except (UnicodeDecodeError, LookupError):
+            return None
+    
+    @classmethod
+    def _process_docx_file(cls, buffer: bytearray) -> str:
+        """Extract .docx paragraphs directly from the upload buffer."""
+        paragraphs = []
+        for text in iter_docx_paragraphs(memoryview(buffer)):
+            text = text.strip()
+            if text:
+                paragraphs.append(text)
+        
+        return '\n'.join(paragraphs)
     
     @classmethod
     def _validate_content(cls, content: str) -> None:
@@ -172,20 +321,17 @@ class FileProcessingService:
     
     @classmethod
     def _scan_for_malicious_content(cls, content: str) -> None:
-        """Basic scan for potentially malicious content patterns."""
-        # Check for suspicious patterns that might indicate malicious content
-        suspicious_patterns = [
-            '<script',
-            'javascript:',
-            'eval(',
-            'document.cookie',
-            'window.location',
-        ]
-        
-        content_lower = content.lower()
-        for pattern in suspicious_patterns:
-            if pattern in content_lower:
-                raise HTTPException(
-                    status_code=400,
-                    detail="File contains potentially malicious content"
-                )
\ No newline at end of file
+        """Scan for suspicious patterns that might indicate malicious content."""
+        match = content_scanner.first_match(content)
+        if match is not None:
+            cls._reject_suspicious(match)
+    
+    @staticmethod
+    def _reject_suspicious(match: ScanMatch) -> None:
+        logger.warning(
+            f"Rejected upload: suspicious pattern {match.pattern!r} at offset {match.start}"
+        )
+        raise HTTPException(
+            status_code=400,
+            detail="File contains potentially malicious content"
+        )
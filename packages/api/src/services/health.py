@@ -0,0 +1,210 @@
+"""
+Background health prober for the database.
+
+Probes run on a fixed interval in a worker thread over a dedicated, unpooled
+connection, so health endpoints never check out an application connection
+or block the event loop. Endpoints read the cached result; ``/health`` only
+probes on demand when the cache is older than its TTL, and concurrent callers
+share that single probe.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import NullPool
+
+from ..config import settings
+from ..models.database import engine
+from ..monitoring.metrics import registry
+
+logger = logging.getLogger(__name__)
+
+probe_duration_seconds = registry.histogram(
+    "health_db_probe_duration_seconds",
+    "Latency of background database health probes",
+)
+probe_failures_total = registry.counter(
+    "health_db_probe_failures_total",
+    "Database health probes that failed or timed out",
+)
+
+
+@dataclass
+class ProbeResult:
+    """Outcome of one database probe."""
+
+    healthy: bool
+    error: Optional[str]
+    latency_ms: float
+    checked_at: datetime
+    monotonic: float
+
+    def age_seconds(self) -> float:
+        return time.monotonic() - self.monotonic
+
+
+def database_check(app_engine: Engine) -> Callable[[], None]:
+    """
+    Build a blocking ``SELECT 1`` check against the application's database.
+
+    The check uses its own NullPool engine, so probing neither consumes nor
+    waits on the application's connection pool.
+    """
+    probe_engine: Optional[Engine] = None
+
+    def check() -> None:
+        nonlocal probe_engine
+        if probe_engine is None:
+            probe_engine = create_engine(app_engine.url, poolclass=NullPool)
+        with probe_engine.connect() as connection:
+            if connection.execute(text("SELECT 1")).scalar() != 1:
+                raise RuntimeError("Unexpected result")
+
+    return check
+
+
+def pool_usage(app_engine: Engine, capacity: int) -> Callable[[], Dict[str, Any]]:
+    """Read checked-out connections and saturation from the live pool."""
+
+    def usage() -> Dict[str, Any]:
+        checked_out = app_engine.pool.checkedout()
+        return {
+            "checked_out": checked_out,
+            "capacity": capacity,
+            "saturation": round(checked_out / capacity, 3) if capacity else 0.0,
+        }
+
+    return usage
+
+
+class HealthProber:
+    """Runs database probes in the background and caches the latest result."""
+
+    def __init__(
+        self,
+        check: Callable[[], None],
+        pool_usage: Callable[[], Dict[str, Any]],
+        interval: float,
+        cache_ttl: float,
+        timeout: float,
+        max_pool_saturation: float,
+    ):
+        self._check = check
+        self._pool_usage = pool_usage
+        self.interval = interval
+        self.cache_ttl = cache_ttl
+        self.timeout = timeout
+        self.max_pool_saturation = max_pool_saturation
+        self.started_at = time.monotonic()
+        self._result: Optional[ProbeResult] = None
+        self._task: Optional[asyncio.Task] = None
+        self._inflight: Optional[asyncio.Future] = None
+        # A probe thread that outlived its timeout; no new probe starts until it ends
+        self._hung: Optional[asyncio.Future] = None
+
+    @property
+    def last_result(self) -> Optional[ProbeResult]:
+        return self._result
+
+    def start(self) -> None:
+        """Start the background probe loop on the running event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def invalidate(self) -> None:
+        """Drop the cached result so the next ``current()`` probes again."""
+        self._result = None
+
+    async def current(self) -> ProbeResult:
+        """The cached result, probing first if it is missing or expired."""
+        result = self._result
+        if result is None or result.age_seconds() > self.cache_ttl:
+            result = await self.refresh()
+        return result
+
+    async def refresh(self) -> ProbeResult:
+        """Probe now; concurrent callers share a single in-flight probe."""
+        if self._inflight is None or self._inflight.done():
+            self._inflight = asyncio.ensure_future(self._probe())
+        return await asyncio.shield(self._inflight)
+
+    def pool(self) -> Dict[str, Any]:
+        usage = self._pool_usage()
+        usage["saturated"] = usage["saturation"] >= self.max_pool_saturation
+        return usage
+
+    def uptime_seconds(self) -> float:
+        return time.monotonic() - self.started_at
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.refresh()
+            except Exception:
+                logger.exception("Health probe loop error")
+            await asyncio.sleep(self.interval)
+
+    async def _probe(self) -> ProbeResult:
+        start = time.perf_counter()
+        error: Optional[str] = None
+
+        if self._hung is not None and not self._hung.done():
+            error = "Previous database probe is still running"
+        else:
+            self._hung = None
+            probe = asyncio.ensure_future(asyncio.to_thread(self._check))
+            done, _ = await asyncio.wait({probe}, timeout=self.timeout)
+            if not done:
+                self._hung = probe
+                error = f"Database probe timed out after {self.timeout}s"
+            elif probe.exception() is not None:
+                error = str(probe.exception())
+
+        elapsed = time.perf_counter() - start
+        probe_duration_seconds.labels().observe(elapsed)
+        if error is not None:
+            probe_failures_total.labels().inc()
+
+        result = ProbeResult(
+            healthy=error is None,
+            error=error,
+            latency_ms=round(elapsed * 1000, 3),
+            checked_at=datetime.utcnow(),
+            monotonic=time.monotonic(),
+        )
+        self._log_transition(result)
+        self._result = result
+        return result
+
+    def _log_transition(self, result: ProbeResult) -> None:
+        previous = self._result
+        if not result.healthy and (previous is None or previous.healthy):
+            logger.error(f"Database health probe failed: {result.error}")
+        elif result.healthy and previous is not None and not previous.healthy:
+            logger.info("Database health probe recovered")
+
+
+# Global prober instance
+health_prober = HealthProber(
+    check=database_check(engine),
+    pool_usage=pool_usage(engine, settings.db_pool_size + settings.db_max_overflow),
+    interval=settings.health_probe_interval,
+    cache_ttl=settings.health_cache_ttl,
+    timeout=settings.health_probe_timeout,
+    max_pool_saturation=settings.health_max_pool_saturation,
+)
@@ -3,9 +3,50 @@ Participant extraction service for identifying names in transcripts.
 """
 
 import re
-from typing import List, Set, Dict, Any
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import List, Dict, Any, FrozenSet, Optional, Tuple
 from dataclasses import dataclass
 
+from ..monitoring.tracing import span
+from .speaker_metrics import SpeakerTally, engagement_level
+
+
+_LETTER_REGEX = re.compile(r'[a-zA-Z]')
+_WORD_REGEX = re.compile(r'[a-zA-Z]+')
+_NAME_CHARS_REGEX = re.compile(r"^[a-zA-Z\s\-'\.]+$")
+
+
+def _count_words(text: str, start: int, end: int) -> int:
+    """Whitespace-separated words in ``text[start:end]``."""
+    return len(text[start:end].split())
+
+
+@lru_cache(maxsize=4096)
+def _is_plausible_name(name: str, filter_names: FrozenSet[str]) -> bool:
+    """Check whether extracted text looks like a person's name."""
+    if not name or len(name) < 2:
+        return False
+    
+    # Filter out generic terms
+    if name.lower() in filter_names:
+        return False
+    
+    # Must contain at least one letter
+    if not _LETTER_REGEX.search(name):
+        return False
+    
+    # Reasonable length for a name
+    if len(name) > 50:
+        return False
+    
+    # Basic format validation - should look like a name
+    # Allow letters, spaces, hyphens, apostrophes
+    if not _NAME_CHARS_REGEX.match(name):
+        return False
+    
+    return True
+
 
 @dataclass
 class ParticipantInfo:
@@ -13,22 +54,49 @@ class ParticipantInfo:
     name: str
     role: str = "participant"  # "coach" or "participant"
     confidence: float = 1.0
+    # Talk metrics from the speaker scan; empty for names not found as speakers
+    word_count: int = 0
+    turn_count: int = 0
+    speaking_time_seconds: Optional[int] = None
+    engagement_level: str = "unknown"
 
 
 class ParticipantExtractor:
     """Service for extracting participant names from transcripts."""
     
-    # Common speaker patterns in transcripts
+    # Bump whenever extraction output changes, so cached results are not reused
+    VERSION = 3
+    
+    # Common speaker patterns in transcripts, most specific first. Names may
+    # not span lines, so each label is matched within its own line.
     SPEAKER_PATTERNS = [
-        r'([A-Z][a-zA-Z\s]+):\s*',  # "John Doe: text"
-        r'\[([A-Z][a-zA-Z\s]+)\]:\s*',  # "[John Doe]: text"
-        r'Speaker\s+([A-Z][a-zA-Z\s]+):\s*',  # "Speaker John Doe: text"
-        r'Coach\s+([A-Z][a-zA-Z\s]+):\s*',  # "Coach John: text"
-        r'Client\s+([A-Z][a-zA-Z\s]+):\s*',  # "Client Jane: text"
-        r'([A-Z][a-zA-Z\s]+)\s*\(Coach\):\s*',  # "John (Coach): text"
-        r'([A-Z][a-zA-Z\s]+)\s*\(Client\):\s*',  # "Jane (Client): text"
+        r'\[([A-Z][a-zA-Z \t]+)\]:[ \t]*',  # "[John Doe]: text"
+        r'Speaker[ \t]+([A-Z][a-zA-Z \t]+):[ \t]*',  # "Speaker John Doe: text"
+        r'Coach[ \t]+([A-Z][a-zA-Z \t]+):[ \t]*',  # "Coach John: text"
+        r'Client[ \t]+([A-Z][a-zA-Z \t]+):[ \t]*',  # "Client Jane: text"
+        r'([A-Z][a-zA-Z \t]+)[ \t]*\(Coach\):[ \t]*',  # "John (Coach): text"
+        r'([A-Z][a-zA-Z \t]+)[ \t]*\(Client\):[ \t]*',  # "Jane (Client): text"
+        r'([A-Z][a-zA-Z \t]+):[ \t]*',  # "John Doe: text"
     ]
     
+    # What may precede a speaker label at the start of a line: indentation,
+    # a timestamp ("00:12:03", "[12:03]") or a cue's time range
+    # ("[00:12:03.500 --> 00:12:07.250]") and an honorific ("Dr. ")
+    SPEAKER_LINE_PREFIX = (
+        r'^[ \t]*'
+        r'(?:\[?(?P<timestamp>\d{1,2}:\d{2}(?::\d{2})?(?:[.,]\d+)?)'
+        r'(?:[ \t]*-->[ \t]*(?P<end_timestamp>\d{1,2}:\d{2}(?::\d{2})?(?:[.,]\d+)?))?'
+        r'\]?[ \t]*(?:-[ \t]*)?)?'
+        r'(?:(?:mr|mrs|ms|dr|prof)\.[ \t]*)?'
+    )
+    
+    # All speaker patterns compiled once into a single line-anchored
+    # alternation, so the transcript is scanned in one pass
+    SPEAKER_LINE_REGEX = re.compile(
+        SPEAKER_LINE_PREFIX + '(?:' + '|'.join(SPEAKER_PATTERNS) + ')',
+        re.MULTILINE | re.IGNORECASE,
+    )
+    
     # Patterns to identify coach vs client
     COACH_INDICATORS = [
         r'coach',
@@ -38,12 +106,18 @@ class ParticipantExtractor:
         r'supervisor',
     ]
     
+    # All coach indicators, located in a single case-insensitive scan
+    COACH_INDICATOR_REGEX = re.compile('|'.join(COACH_INDICATORS), re.IGNORECASE)
+    
+    # Maximum characters between a name and a coach indicator
+    ROLE_CONTEXT_WINDOW = 50
+    
     # Common names to filter out (system/generic terms)
-    FILTER_NAMES = {
+    FILTER_NAMES = frozenset({
         'speaker', 'participant', 'user', 'client', 'coach', 'unknown',
         'person', 'individual', 'member', 'attendee', 'guest', 'host',
         'moderator', 'facilitator', 'interviewer', 'interviewee',
-    }
+    })
     
     @classmethod
     def extract_participants(cls, transcript: str) -> List[ParticipantInfo]:
@@ -56,66 +130,105 @@ class ParticipantExtractor:
         Returns:
             List of ParticipantInfo objects with identified participants
         """
-        participants = cls._find_speaker_names(transcript)
-        participants = cls._assign_roles(participants, transcript)
-        participants = cls._deduplicate_and_clean(participants)
+        with span("find_speakers"):
+            participants = cls._find_speaker_names(transcript)
+        with span("assign_roles"):
+            participants = cls._assign_roles(participants, transcript)
+        with span("deduplicate"):
+            participants = cls._deduplicate_and_clean(participants)
+        with span("score_engagement"):
+            cls._score_engagement(participants)
         
         return participants
     
     @classmethod
     def _find_speaker_names(cls, transcript: str) -> List[ParticipantInfo]:
-        """Find all potential speaker names using regex patterns."""
-        found_names: Set[str] = set()
+        """
+        Find all potential speaker names in a single scan of the transcript.
+        
+        Each valid speaker label starts a turn that runs to the next one; the
+        same scan tallies words, turns and timestamps per speaker.
+        """
+        tally = SpeakerTally()
+        # (name, timestamp, end timestamp, offset where the turn's text starts)
+        turn: Optional[Tuple[str, Optional[str], Optional[str], int]] = None
+        
+        for match in cls.SPEAKER_LINE_REGEX.finditer(transcript):
+            # Only one alternative matches, and its name group closes last
+            name = match.group(match.lastindex).strip()
+            if not cls._is_valid_name(name):
+                continue
+            if turn is not None:
+                words = _count_words(transcript, turn[3], match.start())
+                tally.add_turn(turn[0], turn[1], words, turn[2])
+            turn = (name, match.group("timestamp"), match.group("end_timestamp"), match.end())
         
-        for pattern in cls.SPEAKER_PATTERNS:
-            matches = re.finditer(pattern, transcript, re.MULTILINE | re.IGNORECASE)
-            for match in matches:
-                name = match.group(1).strip()
-                if cls._is_valid_name(name):
-                    found_names.add(name)
+        if turn is not None:
+            tally.add_turn(turn[0], turn[1], _count_words(transcript, turn[3], len(transcript)), turn[2])
         
-        return [ParticipantInfo(name=name) for name in found_names]
+        return [
+            ParticipantInfo(
+                name=name,
+                word_count=stats.word_count,
+                turn_count=stats.turn_count,
+                speaking_time_seconds=round(stats.seconds),
+            )
+            for name, stats in tally.finish().items()
+        ]
     
     @classmethod
     def _is_valid_name(cls, name: str) -> bool:
         """Validate if extracted text is likely a real name."""
-        if not name or len(name) < 2:
-            return False
-        
-        # Filter out generic terms
-        if name.lower() in cls.FILTER_NAMES:
-            return False
-        
-        # Must contain at least one letter
-        if not re.search(r'[a-zA-Z]', name):
-            return False
-        
-        # Reasonable length for a name
-        if len(name) > 50:
-            return False
-        
-        # Basic format validation - should look like a name
-        # Allow letters, spaces, hyphens, apostrophes
-        if not re.match(r"^[a-zA-Z\s\-'\.]+$", name):
-            return False
-        
-        return True
+        # Speakers repeat throughout a transcript, so results are memoized
+        return _is_plausible_name(name, cls.FILTER_NAMES)
     
     @classmethod
     def _assign_roles(cls, participants: List[ParticipantInfo], transcript: str) -> List[ParticipantInfo]:
-        """Assign roles (coach vs participant) based on context."""
-        transcript_lower = transcript.lower()
+        """
+        Assign roles (coach vs participant) based on context.
         
-        for participant in participants:
-            name_lower = participant.name.lower()
-            
+        A coach indicator counts for a participant when it appears within
+        ROLE_CONTEXT_WINDOW characters before or after one of the
+        participant's name occurrences on the same line. Names and indicators
+        are each located in one pass, so the work grows linearly with the
+        transcript regardless of how many speakers it has.
+        """
+        name_occurrences = cls._index_name_occurrences(participants, transcript)
+        indicator_starts, indicator_ends = cls._index_coach_indicators(transcript)
+        newlines = [m.start() for m in re.finditer('\n', transcript)]
+        
+        def same_line(start: int, end: int) -> bool:
+            return bisect_left(newlines, start) == bisect_left(newlines, end)
+        
+        window = cls.ROLE_CONTEXT_WINDOW
+        
+        for index, participant in enumerate(participants):
             # Look for coach indicators near the name
             coach_score = 0
             for indicator in cls.COACH_INDICATORS:
-                # Check if coach indicators appear near this name
-                pattern = rf'{re.escape(name_lower)}.{{0,50}}{indicator}|{indicator}.{{0,50}}{re.escape(name_lower)}'
-                if re.search(pattern, transcript_lower):
-                    coach_score += 1
+                starts = indicator_starts[indicator]
+                ends = indicator_ends[indicator]
+                
+                for start, end in name_occurrences[index]:
+                    # Nearest indicator starting after the name
+                    after = bisect_left(starts, end)
+                    if (
+                        after < len(starts)
+                        and starts[after] - end <= window
+                        and same_line(end, starts[after])
+                    ):
+                        coach_score += 1
+                        break
+                    
+                    # Nearest indicator ending before the name
+                    before = bisect_right(ends, start) - 1
+                    if (
+                        before >= 0
+                        and start - ends[before] <= window
+                        and same_line(ends[before], start)
+                    ):
+                        coach_score += 1
+                        break
             
             # If strong coach indicators, mark as coach
             if coach_score >= 1:
@@ -127,6 +240,60 @@ class ParticipantExtractor:
         
         return participants
     
+    @classmethod
+    def _index_name_occurrences(
+        cls,
+        participants: List[ParticipantInfo],
+        transcript: str,
+    ) -> List[List[Tuple[int, int]]]:
+        """
+        Find every (start, end) occurrence of each participant name.
+        
+        Names match case-insensitively on word boundaries. The transcript is
+        tokenized once; each word is looked up by its first word in a dict of
+        candidate names, so lookup cost does not grow with the speaker count.
+        """
+        occurrences: List[List[Tuple[int, int]]] = [[] for _ in participants]
+        by_first_word: Dict[str, List[Tuple[str, int]]] = {}
+        
+        for index, participant in enumerate(participants):
+            name_lower = participant.name.lower()
+            words = _WORD_REGEX.findall(name_lower)
+            if words:
+                by_first_word.setdefault(words[0], []).append((name_lower, index))
+        
+        for match in _WORD_REGEX.finditer(transcript):
+            candidates = by_first_word.get(match.group().lower())
+            if not candidates:
+                continue
+            
+            start = match.start()
+            for name_lower, index in candidates:
+                end = start + len(name_lower)
+                if (
+                    transcript[start:end].lower() == name_lower
+                    and not transcript[end:end + 1].isalpha()
+                ):
+                    occurrences[index].append((start, end))
+        
+        return occurrences
+    
+    @classmethod
+    def _index_coach_indicators(
+        cls,
+        transcript: str,
+    ) -> Tuple[Dict[str, List[int]], Dict[str, List[int]]]:
+        """Collect sorted start and end offsets of each coach indicator."""
+        starts: Dict[str, List[int]] = {indicator: [] for indicator in cls.COACH_INDICATORS}
+        ends: Dict[str, List[int]] = {indicator: [] for indicator in cls.COACH_INDICATORS}
+        
+        for match in cls.COACH_INDICATOR_REGEX.finditer(transcript):
+            indicator = match.group().lower()
+            starts[indicator].append(match.start())
+            ends[indicator].append(match.end())
+        
+        return starts, ends
+    
     @classmethod
     def _deduplicate_and_clean(cls, participants: List[ParticipantInfo]) -> List[ParticipantInfo]:
         """Remove duplicates and clean up participant list."""
@@ -142,11 +309,39 @@ class ParticipantExtractor:
         # For each group, pick the best representative
         final_participants = []
         for normalized_name, group in name_groups.items():
-            best_participant = cls._select_best_participant(group)
+            best_participant = cls._merge_metrics(cls._select_best_participant(group), group)
             final_participants.append(best_participant)
         
         return final_participants
     
+    @classmethod
+    def _merge_metrics(
+        cls,
+        best: ParticipantInfo,
+        group: List[ParticipantInfo],
+    ) -> ParticipantInfo:
+        """Credit the representative with the talk metrics of every variant."""
+        if len(group) > 1:
+            timed = [p.speaking_time_seconds for p in group if p.speaking_time_seconds is not None]
+            best.word_count = sum(p.word_count for p in group)
+            best.turn_count = sum(p.turn_count for p in group)
+            best.speaking_time_seconds = sum(timed) if timed else None
+        return best
+    
+    @classmethod
+    def _score_engagement(cls, participants: List[ParticipantInfo]) -> None:
+        """Set each participant's engagement level from their share of the talk."""
+        total_words = sum(p.word_count for p in participants)
+        total_turns = sum(p.turn_count for p in participants)
+        for participant in participants:
+            participant.engagement_level = engagement_level(
+                participant.word_count,
+                participant.turn_count,
+                total_words,
+                total_turns,
+                len(participants),
+            )
+    
     @classmethod
     def _normalize_name(cls, name: str) -> str:
         """Normalize name for deduplication."""
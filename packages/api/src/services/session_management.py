@@ -2,26 +2,259 @@
 Session management service for orchestrating upload workflow.
 """
 
+import logging
 from datetime import date
-from typing import List, Optional, Dict, Any, Tuple
+from typing import List, Optional, Dict, Any, Set, Tuple
 from uuid import UUID
 
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from fastapi import HTTPException
 
-from ..schemas.sessions import SessionUploadRequest, SessionUploadResponse
+from ..config import settings
+from ..jobs.handlers import SESSION_PROCESSING_JOB
+from ..jobs.queue import JobQueue, job_queue as default_job_queue
+from ..schemas.sessions import (
+    BatchFileResult,
+    BatchUploadResponse,
+    SessionUploadRequest,
+    SessionUploadResponse,
+)
 from ..repositories.sessions import SessionRepository
-from ..repositories.clients import ClientRepository, ClientSessionRepository
+from ..repositories.clients import (
+    BulkResolutionResult,
+    ClientRepository,
+    ClientResolution,
+    ClientSessionRepository,
+)
+from ..repositories.query_counter import QueryCounter
+from ..monitoring.tracing import span
+from ..services.batch_ingestion import (
+    ParsedTranscript,
+    batch_response,
+    chunked,
+    failed_result,
+    repeat_result,
+    session_fields,
+    session_links,
+    split_duplicates,
+    uploaded_result,
+)
+from ..services.deduplication import (
+    duplicate_response,
+    pick_duplicate,
+    transcript_fingerprint,
+)
+from ..services.extraction_cache import extraction_cache
+from ..services.speaker_metrics import client_metrics
 from ..services.participant_extraction import ParticipantExtractor, ParticipantInfo
 from ..models.core import Session as SessionModel, Client
 
+logger = logging.getLogger(__name__)
 
-class SessionManagementService:
+
+class SessionWorkflowBase:
+    """
+    Upload workflow shared by the sync and async session services.
+    
+    Holds participant handling, result bookkeeping and response building;
+    subclasses only add the database calls.
+    """
+    
+    def _extract_participants(
+        self,
+        upload_request: SessionUploadRequest
+    ) -> List[ParticipantInfo]:
+        """Extract participants from transcript or use provided list."""
+        if upload_request.participants:
+            # Use explicitly provided participants
+            return [ParticipantInfo(name=name.strip()) for name in upload_request.participants]
+        # Extract from transcript text
+        return extraction_cache.extract(upload_request.transcript_text)
+    
+    def _session_record_fields(
+        self,
+        upload_request: SessionUploadRequest,
+        coach_id: UUID,
+        participant_count: int,
+        transcript_hash: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+        segment_index: Optional[bytes] = None,
+    ) -> Dict[str, Any]:
+        """Arguments for the session repository's create_session."""
+        return {
+            "coach_id": coach_id,
+            "transcript_text": upload_request.transcript_text,
+            "session_date": upload_request.session_date,
+            "session_type": upload_request.session_type,
+            "duration_minutes": upload_request.duration_minutes,
+            "participant_count": participant_count,
+            "notes": upload_request.notes,
+            "transcript_hash": transcript_hash,
+            "idempotency_key": idempotency_key,
+            "segment_index": segment_index,
+        }
+    
+    def _upload_response(
+        self,
+        session_id: UUID,
+        participants: List[ParticipantInfo],
+        client_results: Dict[str, List[str]],
+    ) -> SessionUploadResponse:
+        """Response for a newly stored upload."""
+        return SessionUploadResponse(
+            session_id=session_id,
+            status="uploaded",
+            participants_identified=[p.name for p in participants],
+            clients_created=client_results["created"],
+            clients_matched=client_results["matched"],
+            processing_status="pending",
+            next_steps="Session ready for AI analysis"
+        )
+    
+    def _upload_error(self, error: Exception) -> HTTPException:
+        """HTTP error for a failed upload: 500 for database errors, else 422."""
+        if isinstance(error, SQLAlchemyError):
+            return HTTPException(
+                status_code=500,
+                detail=f"Database error during session creation: {str(error)}"
+            )
+        return HTTPException(
+            status_code=422,
+            detail=f"Failed to process session upload: {str(error)}"
+        )
+    
+    def _client_names(self, participants: List[ParticipantInfo]) -> List[str]:
+        """Participant names to resolve as clients."""
+        return [
+            participant.name
+            for participant in participants
+            # Skip if this looks like the coach (basic heuristic)
+            if participant.role != "coach"
+        ]
+    
+    def _resolved_clients(
+        self,
+        participants: List[ParticipantInfo],
+        names: List[str],
+        resolution: BulkResolutionResult,
+    ) -> Tuple[List[ClientResolution], Dict[UUID, int], Dict[UUID, str]]:
+        """Resolved clients in name order, with their talk metrics by client id."""
+        resolved = [
+            resolution.resolutions[name]
+            for name in dict.fromkeys(n.strip() for n in names)
+            if name in resolution.resolutions
+        ]
+        speaking_time_seconds, engagement_levels = client_metrics(
+            participants, resolution.resolutions
+        )
+        return resolved, speaking_time_seconds, engagement_levels
+    
+    def _client_results(
+        self,
+        resolved: List[ClientResolution],
+        round_trips: int,
+    ) -> Dict[str, List[str]]:
+        """Dictionary with 'created' and 'matched' client name lists."""
+        logger.info(
+            "Resolved %d participants in %d database round trips",
+            len(resolved),
+            round_trips,
+        )
+        
+        return {
+            "created": [r.name for r in resolved if r.was_created],
+            "matched": [r.name for r in resolved if not r.was_created],
+        }
+    
+    def _batch_candidates(
+        self,
+        transcripts: List[ParsedTranscript],
+    ) -> Tuple[List[Optional[BatchFileResult]], List[Tuple[int, ParsedTranscript]]]:
+        """Per-file results with parse failures filled in, and the files left to store."""
+        results: List[Optional[BatchFileResult]] = [None] * len(transcripts)
+        candidates: List[Tuple[int, ParsedTranscript]] = []
+        for index, transcript in enumerate(transcripts):
+            if transcript.error is not None:
+                results[index] = failed_result(transcript, transcript.error)
+            else:
+                candidates.append((index, transcript))
+        return results, candidates
+    
+    def _mark_failed(
+        self,
+        results: List[Optional[BatchFileResult]],
+        entries: List[Tuple[int, ParsedTranscript]],
+        error: str,
+    ) -> None:
+        """Record the same failure for several files."""
+        for index, transcript in entries:
+            results[index] = failed_result(transcript, error)
+    
+    def _mark_uploaded(
+        self,
+        results: List[Optional[BatchFileResult]],
+        session_ids: List[UUID],
+        chunk: List[Tuple[int, ParsedTranscript]],
+        resolutions: Dict[str, ClientResolution],
+        credited: Set[UUID],
+    ) -> None:
+        """
+        Record the sessions stored for a committed chunk.
+        
+        Takes ids read before the commit: commit expires the ORM objects, and
+        reading ``id`` afterwards would reload each session with its own query.
+        """
+        for session_id, (index, transcript) in zip(session_ids, chunk):
+            results[index] = uploaded_result(transcript, session_id, resolutions, credited)
+    
+    def _batch_response(
+        self,
+        results: List[Optional[BatchFileResult]],
+        pending: List[Tuple[int, ParsedTranscript]],
+        repeats: List[Tuple[int, ParsedTranscript]],
+        existing: Dict[str, UUID],
+    ) -> BatchUploadResponse:
+        """Resolve repeats to the stored or existing session and build the response."""
+        stored = {transcript.fingerprint: results[index] for index, transcript in pending}
+        for index, transcript in repeats:
+            results[index] = repeat_result(transcript, existing, stored)
+        
+        return batch_response(results)
+    
+    def _session_details(self, session: SessionModel) -> Dict[str, Any]:
+        """Session and participant details of a loaded session."""
+        participants = [
+            {
+                "name": cs.client.name,
+                "email": cs.client.email,
+                "engagement_level": cs.engagement_level,
+                "speaking_time_seconds": cs.speaking_time_seconds,
+            }
+            for cs in session.client_sessions
+            if cs.client
+        ]
+        
+        return {
+            "session": {
+                "id": session.id,
+                "session_date": session.session_date.isoformat(),
+                "session_type": session.session_type,
+                "duration_minutes": session.duration_minutes,
+                "processing_status": session.processing_status,
+                "participant_count": session.participant_count,
+                "created_at": session.created_at.isoformat(),
+            },
+            "participants": participants,
+        }
+
+
+class SessionManagementService(SessionWorkflowBase):
     """Service for managing session upload and processing workflow."""
     
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, job_queue: Optional[JobQueue] = None):
         self.db = db
+        self.job_queue = job_queue or default_job_queue
         self.session_repo = SessionRepository(db)
         self.client_repo = ClientRepository(db)
         self.client_session_repo = ClientSessionRepository(db)
@@ -32,6 +265,10 @@ class SessionManagementService:
         upload_request: SessionUploadRequest,
         coach_id: UUID,
         organization_id: UUID,
+        participants: Optional[List[ParticipantInfo]] = None,
+        transcript_hash: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+        segment_index: Optional[bytes] = None,
     ) -> SessionUploadResponse:
         """
         Create a session from upload request with full workflow.
@@ -40,20 +277,38 @@ class SessionManagementService:
             upload_request: Session upload data
             coach_id: ID of the coach creating the session
             organization_id: Organization context
+            participants: Participants already extracted off the event loop
+                (optional; extracted here when omitted)
+            transcript_hash: Normalized content hash (optional; computed
+                here when omitted)
+            idempotency_key: Client Idempotency-Key header (optional)
+            segment_index: Encoded segment index of a timed transcript
+                (optional; see transcript_parser.build_segment_index)
             
         Returns:
-            SessionUploadResponse with session details
+            SessionUploadResponse with session details, or the existing
+            session if a concurrent upload stored the same transcript first
             
         Raises:
             HTTPException: If workflow fails
         """
+        if transcript_hash is None:
+            transcript_hash = transcript_fingerprint(upload_request.transcript_text)
+        
         try:
             # Extract participants from transcript first (validation step)
-            participants = self._extract_participants(upload_request)
+            if participants is None:
+                with span("extract_participants"):
+                    participants = self._extract_participants(upload_request)
             
             # Create the session record
             session = self._create_session_record(
-                upload_request, coach_id, len(participants)
+                upload_request,
+                coach_id,
+                len(participants),
+                transcript_hash,
+                idempotency_key,
+                segment_index,
             )
             
             # Process participants and create client relationships
@@ -61,66 +316,176 @@ class SessionManagementService:
                 participants, session.id, organization_id
             )
             
-            # Commit the transaction
-            self.db.commit()
+            # Queue post-upload processing in the same transaction
+            self._enqueue_processing(session.id)
             
-            # Build response
-            response = SessionUploadResponse(
-                session_id=session.id,
-                status="uploaded",
-                participants_identified=[p.name for p in participants],
-                clients_created=client_results["created"],
-                clients_matched=client_results["matched"],
-                processing_status="pending",
-                next_steps="Session ready for AI analysis"
-            )
+            # Commit the transaction
+            with span("commit"):
+                self.db.commit()
             
-            return response
+            return self._upload_response(session.id, participants, client_results)
                 
-        except SQLAlchemyError as e:
-            raise HTTPException(
-                status_code=500,
-                detail=f"Database error during session creation: {str(e)}"
-            )
+        except HTTPException:
+            raise
+        except IntegrityError as e:
+            # Lost a race with an identical upload; resolve to its session
+            self.db.rollback()
+            duplicate = self.find_duplicate_upload(coach_id, transcript_hash, idempotency_key)
+            if duplicate is not None:
+                return duplicate
+            raise self._upload_error(e)
         except Exception as e:
-            raise HTTPException(
-                status_code=422,
-                detail=f"Failed to process session upload: {str(e)}"
-            )
+            raise self._upload_error(e)
     
-    def _extract_participants(
+    def create_sessions_batch(
         self,
-        upload_request: SessionUploadRequest
-    ) -> List[ParticipantInfo]:
-        """Extract participants from transcript or use provided list."""
-        if upload_request.participants:
-            # Use explicitly provided participants
-            participants = []
-            for name in upload_request.participants:
-                participants.append(ParticipantInfo(name=name.strip()))
-            return participants
-        else:
-            # Extract from transcript text
-            return self.participant_extractor.extract_participants(
-                upload_request.transcript_text
+        transcripts: List[ParsedTranscript],
+        coach_id: UUID,
+        organization_id: UUID,
+        session_type: Optional[str] = None,
+        notes: Optional[str] = None,
+    ) -> BatchUploadResponse:
+        """
+        Store a parsed batch of transcripts.
+        
+        Transcripts the coach already uploaded, and repeats within the batch,
+        resolve to the existing session. Participants of the rest are
+        resolved to clients for the whole batch in one pass, then sessions,
+        client links and processing jobs are written in chunks of
+        ``batch_commit_size``, one transaction per chunk. A failed chunk
+        marks only its own files as failed.
+        
+        Args:
+            transcripts: Parsed transcripts in upload order (failures included)
+            coach_id: ID of the coach creating the sessions
+            organization_id: Organization context
+            session_type: Session type applied to every file (optional)
+            notes: Notes applied to every file (optional)
+            
+        Returns:
+            BatchUploadResponse with one result per file, in upload order
+        """
+        results, candidates = self._batch_candidates(transcripts)
+        
+        try:
+            with span("find_duplicates"):
+                existing = self.session_repo.find_ids_by_hashes(
+                    coach_id, [transcript.fingerprint for _, transcript in candidates]
+                )
+            pending, repeats = split_duplicates(candidates, existing)
+            
+            with span("resolve_clients"):
+                resolutions = self.client_repo.resolve_clients_bulk(
+                    [name for _, transcript in pending for name in transcript.client_names],
+                    organization_id,
+                ).resolutions
+            with span("commit"):
+                self.db.commit()
+        except SQLAlchemyError as e:
+            self.db.rollback()
+            self._mark_failed(
+                results, candidates, f"Database error during client resolution: {str(e)}"
             )
+            return batch_response(results)
+        
+        credited: Set[UUID] = set()
+        for chunk in chunked(pending, settings.batch_commit_size):
+            try:
+                sessions = self.session_repo.create_sessions_bulk(
+                    coach_id,
+                    [session_fields(transcript, session_type, notes) for _, transcript in chunk],
+                )
+                session_ids = [session.id for session in sessions]
+                links, speaking_time_seconds, engagement_levels = session_links(
+                    sessions, [transcript for _, transcript in chunk], resolutions
+                )
+                self.client_session_repo.link_sessions_bulk(
+                    links,
+                    engagement_level="unknown",
+                    speaking_time_seconds=speaking_time_seconds,
+                    engagement_levels=engagement_levels,
+                )
+                if settings.job_queue_enabled:
+                    with span("enqueue_processing"):
+                        self.job_queue.enqueue_many(
+                            SESSION_PROCESSING_JOB,
+                            session_ids,
+                            max_attempts=settings.job_max_attempts,
+                            db=self.db,
+                        )
+                with span("commit"):
+                    self.db.commit()
+            except SQLAlchemyError as e:
+                self.db.rollback()
+                logger.error(f"Batch chunk of {len(chunk)} sessions failed: {str(e)}")
+                self._mark_failed(
+                    results, chunk, f"Database error during session creation: {str(e)}"
+                )
+                continue
+            
+            self._mark_uploaded(results, session_ids, chunk, resolutions, credited)
+        
+        return self._batch_response(results, pending, repeats, existing)
+    
+    def find_duplicate_upload(
+        self,
+        coach_id: UUID,
+        transcript_hash: str,
+        idempotency_key: Optional[str] = None,
+    ) -> Optional[SessionUploadResponse]:
+        """
+        Resolve a repeat upload to the coach's existing session.
+        
+        Args:
+            coach_id: ID of the uploading coach
+            transcript_hash: Normalized content hash of the new transcript
+            idempotency_key: Client Idempotency-Key header (optional)
+            
+        Returns:
+            Response for the existing session, or None for a new transcript
+            
+        Raises:
+            HTTPException: 409 if the idempotency key was used for a
+                different transcript
+        """
+        matches = self.session_repo.find_by_upload_keys(
+            coach_id, transcript_hash, idempotency_key
+        )
+        session = pick_duplicate(matches, transcript_hash, idempotency_key)
+        return duplicate_response(session) if session is not None else None
     
     def _create_session_record(
         self,
         upload_request: SessionUploadRequest,
         coach_id: UUID,
         participant_count: int,
+        transcript_hash: Optional[str] = None,
+        idempotency_key: Optional[str] = None,
+        segment_index: Optional[bytes] = None,
     ) -> SessionModel:
         """Create the main session database record."""
-        return self.session_repo.create_session(
-            coach_id=coach_id,
-            transcript_text=upload_request.transcript_text,
-            session_date=upload_request.session_date,
-            session_type=upload_request.session_type,
-            duration_minutes=upload_request.duration_minutes,
-            participant_count=participant_count,
-            notes=upload_request.notes,
-        )
+        return self.session_repo.create_session(**self._session_record_fields(
+            upload_request,
+            coach_id,
+            participant_count,
+            transcript_hash,
+            idempotency_key,
+            segment_index,
+        ))
+    
+    def _enqueue_processing(self, session_id: UUID) -> None:
+        """Queue the background processing job for a new session."""
+        if not settings.job_queue_enabled:
+            return
+        
+        with span("enqueue_processing"):
+            self.job_queue.enqueue(
+                SESSION_PROCESSING_JOB,
+                {},
+                session_id=session_id,
+                max_attempts=settings.job_max_attempts,
+                db=self.db,
+            )
     
     def _process_participants(
         self,
@@ -131,47 +496,33 @@ class SessionManagementService:
         """
         Process participants to create or match clients.
         
+        All participants are resolved and linked together in the upload's
+        transaction, so a database error fails the whole upload.
+        
         Returns:
             Dictionary with 'created' and 'matched' client name lists
         """
-        created_clients = []
-        matched_clients = []
+        names = self._client_names(participants)
         
-        for participant in participants:
-            # Skip if this looks like the coach (basic heuristic)
-            if participant.role == "coach":
-                continue
-            
-            try:
-                # Find or create client
-                client, was_created = self.client_repo.find_or_create_client(
-                    name=participant.name,
-                    organization_id=organization_id,
-                )
-                
-                # Create client-session relationship
-                self.client_session_repo.create_client_session(
-                    client_id=client.id,
-                    session_id=session_id,
-                    engagement_level="unknown",  # Default, will be analyzed later
-                )
-                
-                # Track results
-                if was_created:
-                    created_clients.append(participant.name)
-                else:
-                    matched_clients.append(participant.name)
-                    
-            except Exception as e:
-                # Log error but continue with other participants
-                import logging
-                logging.warning(f"Failed to process participant {participant.name}: {e}")
-                continue
+        # Resolve every client with one candidate query and one bulk insert
+        resolution = self.client_repo.resolve_clients_bulk(
+            names=names,
+            organization_id=organization_id,
+        )
+        resolved, speaking_time_seconds, engagement_levels = self._resolved_clients(
+            participants, names, resolution
+        )
         
-        return {
-            "created": created_clients,
-            "matched": matched_clients,
-        }
+        # Create client-session relationships, with talk metrics, in a single insert
+        with QueryCounter(self.db) as counter:
+            self.client_session_repo.create_client_sessions_bulk(
+                session_id=session_id,
+                client_ids=[r.client_id for r in resolved],
+                speaking_time_seconds=speaking_time_seconds,
+                engagement_levels=engagement_levels,
+            )
+        
+        return self._client_results(resolved, resolution.round_trips + counter.count)
     
     def get_session_with_participants(
         self,
@@ -186,42 +537,20 @@ class SessionManagementService:
         Returns:
             Dictionary with session and participant details
         """
-        session = self.session_repo.get_session_by_id(session_id)
+        # Session, client sessions and clients arrive in a single query
+        session = self.session_repo.get_session_with_participants(session_id)
         if not session:
             return None
         
-        # Get client sessions
-        client_sessions = self.client_session_repo.get_client_sessions_for_session(session_id)
-        
-        # Build participant list
-        participants = []
-        for cs in client_sessions:
-            client = self.client_repo.get_client_by_id(cs.client_id)
-            if client:
-                participants.append({
-                    "name": client.name,
-                    "email": client.email,
-                    "engagement_level": cs.engagement_level,
-                    "speaking_time_seconds": cs.speaking_time_seconds,
-                })
-        
-        return {
-            "session": {
-                "id": session.id,
-                "session_date": session.session_date.isoformat(),
-                "session_type": session.session_type,
-                "duration_minutes": session.duration_minutes,
-                "processing_status": session.processing_status,
-                "participant_count": session.participant_count,
-                "created_at": session.created_at.isoformat(),
-            },
-            "participants": participants,
-        }
+        return self._session_details(session)
     
     def update_session_status(
         self,
         session_id: UUID,
         status: str
     ) -> bool:
-        """Update session processing status."""
-        return self.session_repo.update_processing_status(session_id, status)
\ No newline at end of file
+        """Update session processing status, committing the change."""
+        updated = self.session_repo.update_processing_status(session_id, status)
+        if updated:
+            self.db.commit()
+        return updated
@@ -0,0 +1,127 @@
+"""
+Per-speaker talk metrics gathered during participant extraction.
+
+Turns are tallied as the speaker scan finds them: word and turn counts per
+speaker, and speaking time taken from the turn's own time range when it has
+one (caption cues), from the gap to the next turn's timestamp when both turns
+carry one, or estimated from ``WORDS_PER_MINUTE`` otherwise.
+Engagement compares a speaker's share of the words and turns with an even
+split between all speakers.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+from uuid import UUID
+
+WORDS_PER_MINUTE = 150  # Conversational speaking rate for untimed turns
+
+# Share of words and turns relative to an even split between speakers
+HIGH_ENGAGEMENT_RATIO = 0.75
+MEDIUM_ENGAGEMENT_RATIO = 0.35
+
+
+@dataclass
+class SpeakerStats:
+    """Running totals for one speaker."""
+
+    word_count: int = 0
+    turn_count: int = 0
+    seconds: float = 0.0
+
+
+class SpeakerTally:
+    """
+    Accumulates turns in transcript order.
+
+    Without an end timestamp, a turn's timed duration depends on the next
+    turn's timestamp, so each turn is held until the next one (or ``finish``)
+    arrives.
+    """
+
+    def __init__(self):
+        self.speakers: Dict[str, SpeakerStats] = {}
+        self._pending: Optional[Tuple[str, Optional[float], Optional[float], int]] = None
+
+    def add_turn(
+        self,
+        speaker: str,
+        timestamp: Optional[str],
+        word_count: int,
+        end_timestamp: Optional[str] = None,
+    ) -> None:
+        start = parse_timestamp(timestamp)
+        if self._pending is not None:
+            self._close(start)
+        self._pending = (speaker, start, parse_timestamp(end_timestamp), word_count)
+
+    def finish(self) -> Dict[str, SpeakerStats]:
+        """Totals per speaker, in order of first appearance."""
+        if self._pending is not None:
+            self._close(None)
+            self._pending = None
+        return self.speakers
+
+    def _close(self, next_start: Optional[float]) -> None:
+        speaker, start, end, word_count = self._pending
+        stats = self.speakers.setdefault(speaker, SpeakerStats())
+        stats.word_count += word_count
+        stats.turn_count += 1
+        if start is not None and end is not None and end >= start:
+            stats.seconds += end - start
+        elif start is not None and next_start is not None and next_start > start:
+            stats.seconds += next_start - start
+        else:
+            stats.seconds += word_count * 60 / WORDS_PER_MINUTE
+
+
+def parse_timestamp(value: Optional[str]) -> Optional[float]:
+    """Seconds from "HH:MM:SS", "MM:SS" or either with a fraction ("00:01:02.5")."""
+    if not value:
+        return None
+    seconds = 0.0
+    for part in value.replace(",", ".").split(":"):
+        seconds = seconds * 60 + float(part)
+    return seconds
+
+
+def engagement_level(
+    word_count: int,
+    turn_count: int,
+    total_words: int,
+    total_turns: int,
+    speakers: int,
+) -> str:
+    """Engagement by share of the conversation: high, medium, low, or unknown without turns."""
+    if turn_count == 0 or total_turns == 0:
+        return "unknown"
+
+    word_share = word_count / total_words if total_words else 0.0
+    ratio = (word_share + turn_count / total_turns) / 2 * speakers
+    if ratio >= HIGH_ENGAGEMENT_RATIO:
+        return "high"
+    if ratio >= MEDIUM_ENGAGEMENT_RATIO:
+        return "medium"
+    return "low"
+
+
+def client_metrics(
+    participants: Iterable,
+    resolutions: Dict,
+) -> Tuple[Dict[UUID, int], Dict[UUID, str]]:
+    """
+    Speaking time and engagement level per resolved client id.
+
+    Args:
+        participants: ParticipantInfo objects from extraction
+        resolutions: ClientResolution per stripped participant name
+    """
+    speaking_time_seconds: Dict[UUID, int] = {}
+    engagement_levels: Dict[UUID, str] = {}
+    for participant in participants:
+        resolution = resolutions.get(participant.name.strip())
+        if resolution is None:
+            continue
+        if participant.speaking_time_seconds is not None:
+            speaking_time_seconds[resolution.client_id] = participant.speaking_time_seconds
+        engagement_levels[resolution.client_id] = participant.engagement_level
+    return speaking_time_seconds, engagement_levels
@@ -0,0 +1,140 @@
+"""
+Incremental parsing of transcripts into speaker turns.
+
+A turn starts at a line carrying a speaker label, recognized with the same
+``SPEAKER_LINE_REGEX`` and name validation that participant extraction uses,
+and runs until the next labelled line. Input is consumed as a stream of text
+chunks (a string, a text file object or any iterable of strings), and turns
+are yielded as soon as they close, so memory stays bounded by the longest
+turn rather than the transcript. ``build_segment_index`` records the timed
+turns for storage alongside the transcript.
+"""
+
+from typing import Iterable, Iterator, List, NamedTuple, Optional, TextIO, Tuple, Union
+
+from ..repositories.transcripts import TranscriptSegment, encode_segment_index
+from .participant_extraction import ParticipantExtractor
+from .speaker_metrics import parse_timestamp
+
+READ_CHUNK_SIZE = 64 * 1024  # Characters read at a time from file objects
+
+TranscriptSource = Union[str, TextIO, Iterable[str]]
+
+
+class SpeakerTurn(NamedTuple):
+    """One speaker turn; ``source[start_offset:end_offset]`` is its raw text."""
+
+    # None for text before the first speaker label
+    speaker: Optional[str]
+    start_offset: int
+    end_offset: int
+    # The turn's content without the speaker label, one line per line
+    text: str
+    # Times from the label line's timestamp or cue range, when it has them
+    start_seconds: Optional[float] = None
+    end_seconds: Optional[float] = None
+
+
+def iter_turns(source: TranscriptSource) -> Iterator[SpeakerTurn]:
+    """
+    Yield speaker turns from a transcript stream.
+
+    Offsets count characters from the start of the stream. A turn spans
+    from the start of its label line to the end of its last non-blank line.
+    """
+    speaker: Optional[str] = None
+    start: Optional[int] = None
+    end = 0
+    parts: List[str] = []
+    times: Tuple[Optional[float], Optional[float]] = (None, None)
+
+    for offset, line in iter_lines(source):
+        match = ParticipantExtractor.SPEAKER_LINE_REGEX.match(line)
+        # Only one alternative matches, and its name group closes last
+        name = match.group(match.lastindex).strip() if match else None
+
+        if name and ParticipantExtractor._is_valid_name(name):
+            if start is not None:
+                yield SpeakerTurn(speaker, start, end, "\n".join(parts), *times)
+            content = line[match.end():].strip()
+            speaker, start, parts = name, offset, [content] if content else []
+            times = (
+                parse_timestamp(match.group("timestamp")),
+                parse_timestamp(match.group("end_timestamp")),
+            )
+            end = offset + len(line.rstrip())
+            continue
+
+        content = line.strip()
+        if not content:
+            continue
+        if start is None:
+            speaker, start = None, offset
+        parts.append(content)
+        end = offset + len(line.rstrip())
+
+    if start is not None:
+        yield SpeakerTurn(speaker, start, end, "\n".join(parts), *times)
+
+
+def build_segment_index(source: TranscriptSource) -> Optional[bytes]:
+    """
+    Encoded segment index of a transcript's timed speaker turns.
+
+    A turn without its own end time ends where the next turn starts, if that
+    turn is timed. Offsets point into the transcript text as given.
+
+    Returns:
+        Index bytes for ``TranscriptSegment`` rows, or None when no speaker
+        turn carries a timestamp
+    """
+    segments: List[TranscriptSegment] = []
+    # Whether the last segment is waiting for the next turn's start as its end
+    open_ended = False
+
+    for turn in iter_turns(source):
+        if turn.speaker is None:
+            continue
+        if open_ended and turn.start_seconds is not None and turn.start_seconds >= segments[-1].start_seconds:
+            segments[-1] = segments[-1]._replace(end_seconds=turn.start_seconds)
+        open_ended = False
+        if turn.start_seconds is None:
+            continue
+        segments.append(TranscriptSegment(
+            turn.speaker, turn.start_offset, turn.end_offset, turn.start_seconds, turn.end_seconds
+        ))
+        open_ended = turn.end_seconds is None
+
+    return encode_segment_index(segments) if segments else None
+
+
+def iter_lines(source: TranscriptSource) -> Iterator[Tuple[int, str]]:
+    """(offset, line) pairs, without line terminators, from a text stream."""
+    offset = 0
+    # Text after the last line break, completed by the next chunk
+    pending = ""
+
+    for chunk in _iter_chunks(source):
+        pending += chunk
+        position = 0
+        while True:
+            newline = pending.find("\n", position)
+            if newline == -1:
+                break
+            line_end = newline - 1 if newline > position and pending[newline - 1] == "\r" else newline
+            yield offset + position, pending[position:line_end]
+            position = newline + 1
+        offset += position
+        pending = pending[position:]
+
+    if pending:
+        yield offset, pending
+
+
+def _iter_chunks(source: TranscriptSource) -> Iterator[str]:
+    if isinstance(source, str):
+        yield source
+    elif hasattr(source, "read"):
+        yield from iter(lambda: source.read(READ_CHUNK_SIZE), "")
+    else:
+        yield from source
@@ -5,7 +5,7 @@ Pytest configuration and fixtures for Mindscribe API tests.
 import pytest
 import asyncio
 from typing import Generator, AsyncGenerator
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import StaticPool
 from fastapi.testclient import TestClient
@@ -33,6 +33,11 @@ def test_engine(test_database_url):
         pool_pre_ping=True
     )
     
+    # Trigram indexes need pg_trgm (installed by migrations in real deployments)
+    if engine.dialect.name == "postgresql":
+        with engine.begin() as connection:
+            connection.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    
     # Create all tables
     Base.metadata.create_all(bind=engine)
     
@@ -0,0 +1,80 @@
+"""
+Integration tests for client candidate queries against a real database.
+"""
+
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.models.core import Client, Organization
+from src.repositories.clients import ClientRepository
+
+
+def create_organization(db: Session, *client_names: str):
+    """Create an organization with the given clients; returns its id."""
+    organization = Organization(name=f"Matching Organization {uuid4()}")
+    db.add(organization)
+    db.flush()
+    organization_id = organization.id
+
+    for name in client_names:
+        db.add(Client(name=name, organization_id=organization_id))
+    db.commit()
+    return organization_id
+
+
+@pytest.fixture(params=["fallback", "trigram"])
+def client_repo(request, test_db_session: Session):
+    """Repository using the portable candidate filter or the pg_trgm one."""
+    repo = ClientRepository(test_db_session)
+    if request.param == "trigram":
+        if not repo._supports_trigram_search():
+            pytest.skip("pg_trgm requires PostgreSQL")
+        yield repo
+    else:
+        with patch.object(ClientRepository, "_supports_trigram_search", return_value=False):
+            yield repo
+
+
+class TestCandidateQueries:
+    """Candidate filters must keep every client the scoring could match."""
+
+    @pytest.mark.parametrize("search, expected", [
+        ("Samantha Jones", "Sam"),  # client name within the search name
+        ("Jane Smith", "Jan"),
+        ("Smith", "Jane Smith"),  # search name within the client name
+        ("Bob Green", "Bob Green"),
+    ])
+    def test_candidates_include_matchable_clients(
+        self, client_repo: ClientRepository, search: str, expected: str
+    ):
+        """Each scorable client is fetched by the candidate query."""
+        organization_id = create_organization(
+            client_repo.db, "Sam", "Jan", "Jane Smith", "Bob Green"
+        )
+
+        candidates = client_repo._find_candidate_clients([search], organization_id)
+
+        assert expected in {client.name for client in candidates}
+
+    def test_unrelated_clients_are_not_fetched(self, client_repo: ClientRepository):
+        """Clients sharing nothing with the search name stay out of the candidates."""
+        organization_id = create_organization(client_repo.db, "Sam", "Bob Green")
+
+        candidates = client_repo._find_candidate_clients(["Samantha Jones"], organization_id)
+
+        assert [client.name for client in candidates] == ["Sam"]
+
+    def test_bulk_resolution_matches_contained_names(self, client_repo: ClientRepository):
+        """Names containing an existing client's name match it instead of creating a duplicate."""
+        organization_id = create_organization(client_repo.db, "Sam", "Jan")
+
+        result = client_repo.resolve_clients_bulk(["Samantha Jones", "Jane Smith"], organization_id)
+
+        assert {name: r.client_name for name, r in result.resolutions.items()} == {
+            "Samantha Jones": "Sam",
+            "Jane Smith": "Jan",
+        }
+        assert not any(r.was_created for r in result.resolutions.values())
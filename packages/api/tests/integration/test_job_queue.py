@@ -0,0 +1,58 @@
+"""
+Integration tests for the PostgreSQL-backed job queue.
+"""
+
+from sqlalchemy import delete
+from sqlalchemy.orm import sessionmaker
+
+from src.jobs.queue import DatabaseJobQueue
+from src.models.core import ProcessingJob
+
+
+class TestDatabaseJobQueue:
+    """Claim, retry and fencing behaviour against a real database."""
+
+    def make_queue(self, test_engine) -> DatabaseJobQueue:
+        factory = sessionmaker(bind=test_engine)
+        with factory() as db:
+            db.execute(delete(ProcessingJob))
+            db.commit()
+        return DatabaseJobQueue(factory)
+
+    def test_claims_do_not_overlap(self, test_engine):
+        """Consecutive claims hand out disjoint jobs until the queue is empty."""
+        queue = self.make_queue(test_engine)
+        ids = {queue.enqueue("test", {"n": n}) for n in range(3)}
+
+        first = queue.claim("worker-a", limit=2, visibility_timeout=60)
+        second = queue.claim("worker-b", limit=2, visibility_timeout=60)
+
+        assert len(first) == 2
+        assert len(second) == 1
+        assert {job.id for job in first + second} == ids
+        assert queue.claim("worker-c", limit=2, visibility_timeout=60) == []
+
+    def test_expired_claim_is_reclaimed_and_fenced(self, test_engine):
+        """After the visibility timeout another worker takes over the job."""
+        queue = self.make_queue(test_engine)
+        queue.enqueue("test", {})
+
+        stale = queue.claim("worker-a", limit=1, visibility_timeout=0)[0]
+        current = queue.claim("worker-b", limit=1, visibility_timeout=60)[0]
+
+        assert current.id == stale.id
+        assert current.attempts == 2
+        assert queue.complete(stale) is False
+        assert queue.complete(current) is True
+        assert queue.stats() == {"succeeded": 1}
+
+    def test_failed_attempt_is_delayed(self, test_engine):
+        """A retry is not claimable until its backoff elapses."""
+        queue = self.make_queue(test_engine)
+        queue.enqueue("test", {})
+        job = queue.claim("worker-a", limit=1, visibility_timeout=60)[0]
+
+        assert queue.fail(job, "boom", retry_in=60) is True
+
+        assert queue.claim("worker-a", limit=1, visibility_timeout=60) == []
+        assert queue.stats() == {"queued": 1}
@@ -0,0 +1,72 @@
+"""
+Integration tests for query counts on session read paths.
+"""
+
+from datetime import date
+from uuid import UUID
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.models.core import Client, ClientSession, Coach, Organization, Session as SessionModel
+from src.repositories.query_counter import QueryCounter
+from src.services.session_management import SessionManagementService
+
+
+def create_group_session(db: Session, participant_count: int) -> UUID:
+    """Create a session with the given number of linked clients; returns its id."""
+    organization = Organization(name="Query Count Organization")
+    db.add(organization)
+    db.flush()
+
+    coach = Coach(
+        name="Query Count Coach",
+        email=f"coach-{participant_count}@example.com",
+        organization_id=organization.id,
+    )
+    db.add(coach)
+    db.flush()
+
+    session = SessionModel(
+        coach_id=coach.id,
+        session_date=date(2024, 1, 15),
+        session_type="group",
+        participant_count=participant_count,
+        session_metadata={"notes": "x" * 10_000},
+    )
+    db.add(session)
+    db.flush()
+    # The commit below expires the instance, so keep the id
+    session_id = session.id
+
+    for i in range(participant_count):
+        client = Client(name=f"Participant {i}", organization_id=organization.id)
+        db.add(client)
+        db.flush()
+        db.add(ClientSession(
+            client_id=client.id,
+            session_id=session_id,
+            engagement_level="unknown",
+        ))
+
+    db.commit()
+    return session_id
+
+
+class TestSessionReadQueries:
+    """Query-count guarantees for GET /api/v1/sessions/{id}."""
+
+    @pytest.mark.parametrize("participant_count", [1, 5, 40])
+    def test_get_session_with_participants_uses_one_query(
+        self, test_db_session: Session, participant_count: int
+    ):
+        """Loading a session costs one query regardless of participant count."""
+        session_id = create_group_session(test_db_session, participant_count)
+        test_db_session.expunge_all()
+        service = SessionManagementService(test_db_session)
+
+        with QueryCounter(test_db_session) as counter:
+            result = service.get_session_with_participants(session_id)
+
+        assert len(result["participants"]) == participant_count
+        assert counter.count == 1
@@ -16,6 +16,7 @@ from sqlalchemy.orm import sessionmaker
 from src.main import app
 from src.models.database import Base, get_db
 from src.models.core import Coach, Organization, Session as SessionModel, Client
+from src.repositories.transcripts import TranscriptRepository
 
 
 # Test database setup
@@ -214,7 +215,10 @@ class TestCompleteUploadWorkflow:
                     
                     assert session is not None
                     assert session.session_date == date(2024, 1, 20)
-                    assert "transcript_text" in session.session_metadata
+                    assert "transcript_text" not in session.session_metadata
+                    assert "Alex Johnson" in TranscriptRepository(db).get_transcript_text(
+                        session.id
+                    )
                     
                     # Verify client creation
                     alex_client = db.query(Client).filter(
@@ -0,0 +1,176 @@
+"""
+Unit tests for the async data-access stack.
+"""
+
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.jobs.queue import InMemoryJobQueue
+from src.main import app
+from src.models.database import async_database_url, get_db
+from src.repositories.async_clients import AsyncClientRepository
+from src.schemas.sessions import SessionUploadRequest, SessionUploadResponse
+from src.services.async_session_management import AsyncSessionManagementService
+from src.services.session_management import SessionManagementService
+from src.services.participant_extraction import ParticipantInfo
+
+
+def make_async_db(dialect_name="sqlite"):
+    """AsyncSession stand-in that passes isinstance checks."""
+    db = AsyncMock(spec=AsyncSession)
+    db.get_bind = MagicMock()
+    db.get_bind.return_value.dialect.name = dialect_name
+    db.add = MagicMock()
+    return db
+
+
+class TestAsyncDatabaseUrl:
+    """Test cases for async_database_url."""
+
+    @pytest.mark.parametrize("url", [
+        "postgresql://user:secret@db:5432/mindscribe",
+        "postgresql+psycopg2://user:secret@db:5432/mindscribe",
+    ])
+    def test_postgres_urls_use_asyncpg(self, url):
+        """PostgreSQL URLs switch to the asyncpg driver, keeping credentials."""
+        assert async_database_url(url) == "postgresql+asyncpg://user:secret@db:5432/mindscribe"
+
+    def test_other_backends_unchanged(self):
+        """Non-PostgreSQL URLs are left alone."""
+        assert async_database_url("sqlite+aiosqlite:///./test.db") == "sqlite+aiosqlite:///./test.db"
+
+
+class TestAsyncClientRepository:
+    """Test cases for AsyncClientRepository."""
+
+    @pytest.mark.asyncio
+    async def test_bulk_resolution_matches_and_inserts(self):
+        """Existing clients match; the rest are inserted in one statement."""
+        existing = SimpleNamespace(id=uuid4(), name="Jane Smith")
+        db = make_async_db()
+        db.scalars.return_value = [existing]
+        repo = AsyncClientRepository(db)
+
+        result = await repo.resolve_clients_bulk(["jane smith", "Bob Green"], uuid4())
+
+        assert result.resolutions["jane smith"].client_id == existing.id
+        assert result.resolutions["Bob Green"].was_created is True
+        db.execute.assert_awaited_once()
+        assert result.round_trips == 2
+
+    @pytest.mark.asyncio
+    async def test_find_or_create_prefers_exact_match(self):
+        """An exact name match is returned without fuzzy matching or inserts."""
+        existing = SimpleNamespace(id=uuid4(), name="Jane Smith")
+        db = make_async_db()
+        db.scalar.return_value = existing
+        repo = AsyncClientRepository(db)
+
+        client, was_created = await repo.find_or_create_client("Jane Smith", uuid4())
+
+        assert client is existing
+        assert was_created is False
+        db.scalars.assert_not_awaited()
+        db.flush.assert_not_awaited()
+
+
+class TestAsyncSessionManagementService:
+    """Test cases for AsyncSessionManagementService."""
+
+    @pytest.mark.asyncio
+    async def test_create_session_from_upload(self):
+        """The async workflow creates, links and commits in one transaction."""
+        db = make_async_db()
+        service = AsyncSessionManagementService(db)
+        session_id = uuid4()
+        service.session_repo.create_session = AsyncMock(
+            return_value=SimpleNamespace(id=session_id)
+        )
+        service._process_participants = AsyncMock(
+            return_value={"created": ["Bob Green"], "matched": []}
+        )
+        upload_request = SessionUploadRequest(
+            transcript_text="Coach Jane: Hello Bob.\n" * 10,
+            session_date=date(2024, 1, 15),
+        )
+
+        response = await service.create_session_from_upload(
+            upload_request,
+            coach_id=uuid4(),
+            organization_id=uuid4(),
+            participants=[ParticipantInfo(name="Bob Green")],
+        )
+
+        assert response.session_id == session_id
+        assert response.clients_created == ["Bob Green"]
+        db.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_processing_job_goes_through_job_queue(self):
+        """Uploads queue their processing job through the service's JobQueue."""
+        queue = InMemoryJobQueue()
+        service = AsyncSessionManagementService(make_async_db(), job_queue=queue)
+        session_id = uuid4()
+
+        with patch("src.services.async_session_management.settings.job_queue_enabled", True):
+            await service._enqueue_processing(session_id)
+
+        assert queue.stats() == {"queued": 1}
+
+    @pytest.mark.asyncio
+    async def test_status_update_commits_like_sync_service(self):
+        """Both services commit a status update, and only when a row changed."""
+        async_db = make_async_db()
+        async_service = AsyncSessionManagementService(async_db)
+        async_service.session_repo.update_processing_status = AsyncMock(return_value=True)
+        sync_db = MagicMock()
+        sync_service = SessionManagementService(sync_db)
+        sync_service.session_repo.update_processing_status = MagicMock(return_value=True)
+
+        assert await async_service.update_session_status(uuid4(), "completed") is True
+        assert sync_service.update_session_status(uuid4(), "completed") is True
+        async_db.commit.assert_awaited_once()
+        sync_db.commit.assert_called_once()
+
+        sync_db.reset_mock()
+        sync_service.session_repo.update_processing_status.return_value = False
+        assert sync_service.update_session_status(uuid4(), "completed") is False
+        sync_db.commit.assert_not_called()
+
+
+class TestAsyncRoutes:
+    """Session routes dispatch to the async service for async sessions."""
+
+    def test_upload_uses_async_service(self):
+        """An AsyncSession dependency runs the async workflow."""
+        app.dependency_overrides[get_db] = make_async_db
+        try:
+            with patch("src.routes.sessions.AsyncSessionManagementService") as service_class:
+                service_class.return_value.find_duplicate_upload = AsyncMock(return_value=None)
+                service_class.return_value.create_session_from_upload = AsyncMock(
+                    return_value=SessionUploadResponse(
+                        session_id=uuid4(),
+                        status="uploaded",
+                        participants_identified=[],
+                        clients_created=[],
+                        clients_matched=[],
+                        processing_status="pending",
+                        next_steps="Session ready for AI analysis",
+                    )
+                )
+                response = TestClient(app).post("/api/v1/sessions/upload", json={
+                    "transcript_text": "A" * 200,
+                    "session_date": "2024-01-15",
+                    "participants": ["Bob Green"],
+                })
+        finally:
+            app.dependency_overrides.pop(get_db, None)
+
+        assert response.status_code == 200
+        service_class.return_value.create_session_from_upload.assert_awaited_once()
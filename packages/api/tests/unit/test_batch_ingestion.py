@@ -0,0 +1,260 @@
+"""
+Unit tests for batch transcript ingestion.
+"""
+
+import io
+import zipfile
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException, UploadFile
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.main import app
+from src.repositories.clients import BulkResolutionResult, ClientResolution
+from src.schemas.sessions import BatchFileResult, BatchUploadResponse
+from src.services.batch_ingestion import ParsedTranscript, parse_batch, session_date_for
+from src.services.participant_extraction import ParticipantInfo
+from src.services.session_management import SessionManagementService
+
+TRANSCRIPT = (
+    "Coach Maria: Welcome back, how did the week go for everyone?\n"
+    "Alex Johnson: Busy, but I kept the morning planning habit going.\n"
+    "Priya Patel: Same here, although Thursday fell apart completely.\n"
+)
+DEFAULT_DATE = date(2024, 1, 15)
+
+
+def upload(name: str, data: bytes) -> UploadFile:
+    return UploadFile(file=io.BytesIO(data), filename=name)
+
+
+def archive(entries: dict) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zf:
+        for name, content in entries.items():
+            zf.writestr(name, content)
+    return buffer.getvalue()
+
+
+class TestParseBatch:
+    """Test cases for archive reading and parallel parsing."""
+
+    @pytest.mark.asyncio
+    async def test_parses_files_and_archive_entries_in_order(self):
+        """Loose files and archive entries are parsed in upload order."""
+        files = [
+            upload("first.txt", TRANSCRIPT.encode()),
+            upload("batch.zip", archive({"a.txt": TRANSCRIPT, "b.txt": TRANSCRIPT})),
+        ]
+
+        results = await parse_batch(files, DEFAULT_DATE, concurrency=2)
+
+        assert [r.filename for r in results] == ["first.txt", "batch.zip/a.txt", "batch.zip/b.txt"]
+        assert all(r.error is None for r in results)
+        assert sorted(results[0].client_names) == ["Alex Johnson", "Priya Patel"]
+
+    @pytest.mark.asyncio
+    async def test_archive_noise_is_skipped(self):
+        """Directories and OS metadata entries are not reported as files."""
+        data = archive({
+            "sessions/": "",
+            "__MACOSX/sessions/._a.txt": "x",
+            "sessions/.DS_Store": "x",
+            "sessions/a.txt": TRANSCRIPT,
+        })
+
+        results = await parse_batch([upload("batch.zip", data)], DEFAULT_DATE)
+
+        assert [r.filename for r in results] == ["batch.zip/sessions/a.txt"]
+
+    @pytest.mark.asyncio
+    async def test_bad_files_fail_individually(self):
+        """Unsupported or invalid files fail without affecting the batch."""
+        files = [
+            upload("notes.pdf", b"%PDF"),
+            upload("short.txt", b"too short"),
+            upload("good.txt", TRANSCRIPT.encode()),
+        ]
+
+        results = await parse_batch(files, DEFAULT_DATE)
+
+        assert results[0].error == "Unsupported file type"
+        assert results[1].error is not None
+        assert results[2].error is None
+
+    @pytest.mark.asyncio
+    async def test_too_many_files_rejected(self):
+        """Batches over the file limit are rejected with 413."""
+        data = archive({f"{n}.txt": TRANSCRIPT for n in range(3)})
+
+        with pytest.raises(HTTPException) as exc_info:
+            await parse_batch([upload("batch.zip", data)], DEFAULT_DATE, max_files=2)
+
+        assert exc_info.value.status_code == 413
+
+    @pytest.mark.asyncio
+    async def test_invalid_archive_rejected(self):
+        """A .zip upload that is not an archive is rejected with 400."""
+        with pytest.raises(HTTPException) as exc_info:
+            await parse_batch([upload("batch.zip", b"not a zip")], DEFAULT_DATE)
+
+        assert exc_info.value.status_code == 400
+
+    def test_session_date_from_filename(self):
+        """A date in the file name overrides the batch default."""
+        assert session_date_for("x.zip/2024-03-02 group.txt", DEFAULT_DATE) == date(2024, 3, 2)
+        assert session_date_for("2024/03-02.txt", DEFAULT_DATE) == DEFAULT_DATE
+        assert session_date_for("2024-13-40.txt", DEFAULT_DATE) == DEFAULT_DATE
+
+
+class TestCreateSessionsBatch:
+    """Test cases for SessionManagementService.create_sessions_batch."""
+
+    def make_service(self, names):
+        db = Mock()
+        service = SessionManagementService(db, job_queue=Mock())
+        service.client_repo = Mock()
+        service.client_repo.resolve_clients_bulk.return_value = BulkResolutionResult(
+            resolutions={
+                name: ClientResolution(name, uuid4(), name, was_created=True)
+                for name in names
+            },
+            round_trips=2,
+        )
+        service.session_repo = Mock()
+        service.session_repo.find_ids_by_hashes.return_value = {}
+        service.session_repo.create_sessions_bulk.side_effect = lambda coach_id, rows: [
+            SimpleNamespace(id=uuid4()) for _ in rows
+        ]
+        service.client_session_repo = Mock()
+        return service, db
+
+    def transcript(self, name, *clients, error=None, fingerprint=None):
+        return ParsedTranscript(
+            filename=name,
+            session_date=DEFAULT_DATE,
+            transcript_text=TRANSCRIPT,
+            participants=[ParticipantInfo(name="Maria", role="coach")]
+            + [ParticipantInfo(name=client) for client in clients],
+            fingerprint=fingerprint or name,
+            error=error,
+        )
+
+    def test_resolves_once_and_commits_in_chunks(self):
+        """Clients are resolved in one call; sessions are written per chunk."""
+        service, db = self.make_service(["Alex"])
+        transcripts = [self.transcript(f"{n}.txt", "Alex") for n in range(5)]
+
+        with patch("src.services.session_management.settings") as settings:
+            settings.batch_commit_size = 2
+            settings.job_queue_enabled = True
+            response = service.create_sessions_batch(transcripts, uuid4(), uuid4())
+
+        service.client_repo.resolve_clients_bulk.assert_called_once()
+        assert service.session_repo.create_sessions_bulk.call_count == 3
+        assert service.job_queue.enqueue_many.call_count == 3
+        assert db.commit.call_count == 4
+        assert (response.total, response.uploaded, response.failed) == (5, 5, 0)
+        # A new client is reported as created once, then as matched
+        assert response.results[0].clients_created == ["Alex"]
+        assert response.results[1].clients_created == []
+        assert response.results[1].clients_matched == ["Alex"]
+
+    def test_session_ids_are_not_read_after_commit(self):
+        """Results use ids captured before commit, which would expire the sessions."""
+        service, db = self.make_service(["Alex"])
+
+        class ExpiringSession:
+            def __init__(self):
+                self._id = uuid4()
+
+            @property
+            def id(self):
+                # After commit an ORM object's id costs a SELECT per session
+                assert not db.commit.called, "session id read after commit"
+                return self._id
+
+        def create_sessions_bulk(coach_id, rows):
+            db.commit.reset_mock()
+            return [ExpiringSession() for _ in rows]
+
+        service.session_repo.create_sessions_bulk.side_effect = create_sessions_bulk
+        transcripts = [self.transcript(f"{n}.txt", "Alex") for n in range(3)]
+
+        with patch("src.services.session_management.settings") as settings:
+            settings.batch_commit_size = 2
+            settings.job_queue_enabled = True
+            response = service.create_sessions_batch(transcripts, uuid4(), uuid4())
+
+        assert response.uploaded == 3
+        assert all(result.session_id is not None for result in response.results)
+
+    def test_failed_chunk_only_fails_its_files(self):
+        """A database error rolls back and fails only the affected chunk."""
+        service, db = self.make_service(["Alex"])
+        service.session_repo.create_sessions_bulk.side_effect = [
+            SQLAlchemyError("boom"),
+            [SimpleNamespace(id=uuid4())],
+        ]
+        transcripts = [
+            self.transcript("a.txt", "Alex"),
+            self.transcript("bad.txt", error="Unsupported file type"),
+            self.transcript("b.txt", "Alex"),
+            self.transcript("c.txt", "Alex"),
+        ]
+
+        with patch("src.services.session_management.settings") as settings:
+            settings.batch_commit_size = 2
+            settings.job_queue_enabled = False
+            response = service.create_sessions_batch(transcripts, uuid4(), uuid4())
+
+        db.rollback.assert_called_once()
+        assert [r.status for r in response.results] == ["failed", "failed", "failed", "uploaded"]
+        assert response.results[1].error == "Unsupported file type"
+        assert response.results[3].clients_created == ["Alex"]
+
+
+class TestUploadBatchEndpoint:
+    """Test cases for POST /api/v1/sessions/upload-batch."""
+
+    def test_upload_batch_success(self):
+        """Parsed files are passed to the service and its response returned."""
+        client = TestClient(app)
+        response_model = BatchUploadResponse(
+            total=1,
+            uploaded=1,
+            failed=0,
+            results=[
+                BatchFileResult(filename="a.txt", status="uploaded", session_id=uuid4())
+            ],
+        )
+
+        with patch("src.routes.sessions.SessionManagementService") as service_class:
+            service_class.return_value.create_sessions_batch.return_value = response_model
+            response = client.post(
+                "/api/v1/sessions/upload-batch",
+                files=[("files", ("a.txt", TRANSCRIPT.encode(), "text/plain"))],
+                data={"session_date": "2024-01-15"},
+            )
+
+        assert response.status_code == 200
+        assert response.json()["uploaded"] == 1
+        transcripts = service_class.return_value.create_sessions_batch.call_args[0][0]
+        assert [t.filename for t in transcripts] == ["a.txt"]
+
+    def test_upload_batch_invalid_date(self):
+        """An invalid default date is rejected with 400."""
+        client = TestClient(app)
+
+        response = client.post(
+            "/api/v1/sessions/upload-batch",
+            files=[("files", ("a.txt", TRANSCRIPT.encode(), "text/plain"))],
+            data={"session_date": "15/01/2024"},
+        )
+
+        assert response.status_code == 400
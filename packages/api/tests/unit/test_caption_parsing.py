@@ -0,0 +1,223 @@
+"""
+Unit tests for caption transcripts (.vtt/.srt) and their segment index.
+"""
+
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+from src.repositories.transcripts import (
+    TranscriptRepository,
+    TranscriptSegment,
+    decode_segment_index,
+    encode_segment_index,
+    segments_in_range,
+    speaking_times,
+)
+from src.services.batch_ingestion import parse_transcript_file
+from src.services.caption_parsing import Cue, iter_cues, render_transcript
+from src.services.file_processing import FileProcessingService
+from src.services.participant_extraction import ParticipantExtractor
+from src.services.transcript_parser import build_segment_index
+
+TEAMS_VTT = (
+    "WEBVTT\n"
+    "\n"
+    "NOTE exported by the meeting app\n"
+    "\n"
+    "3f1c-1\n"
+    "00:00:01.000 --> 00:00:04.500\n"
+    "<v Coach Maria>Welcome back, everyone.</v>\n"
+    "\n"
+    "3f1c-2\n"
+    "00:00:05.000 --> 00:00:07.000 align:start\n"
+    "<v Coach Maria>How did the week go?</v>\n"
+    "\n"
+    "3f1c-3\n"
+    "00:00:10.000 --> 00:00:14.250\n"
+    "<v Alex Johnson>Busy, but I kept the habit going &amp; it helped.</v>\n"
+)
+
+ZOOM_VTT = (
+    "WEBVTT\n"
+    "\n"
+    "1\n"
+    "00:00:01.000 --> 00:00:03.000\n"
+    "Coach Maria: Welcome back.\n"
+    "\n"
+    "2\n"
+    "00:00:03.500 --> 00:00:06.000\n"
+    "Dr. Priya Patel: Thanks. I tried the morning\n"
+    "routine all week.\n"
+    "\n"
+    "3\n"
+    "00:00:06.200 --> 00:00:08.000\n"
+    "It mostly worked.\n"
+)
+
+SRT = (
+    "1\r\n"
+    "00:00:01,000 --> 00:00:03,000\r\n"
+    "Coach Maria: Welcome back.\r\n"
+    "\r\n"
+    "2\r\n"
+    "00:00:03,500 --> 00:00:06,000\r\n"
+    "Dr. Priya Patel: Thanks. I tried the morning\r\n"
+    "routine all week.\r\n"
+    "\r\n"
+    "3\r\n"
+    "00:00:06,200 --> 00:00:08,000\r\n"
+    "It mostly worked.\r\n"
+)
+
+
+def chunks(text, size):
+    return (text[start:start + size] for start in range(0, len(text), size))
+
+
+class TestCueParsing:
+    """Test cases for streaming caption cues."""
+
+    def test_voice_tags(self):
+        """Teams voice tags name the speaker; markup and entities are removed."""
+        cues = list(iter_cues(TEAMS_VTT))
+
+        assert cues == [
+            Cue(1.0, 4.5, "Maria", "Coach Maria", "Welcome back, everyone."),
+            Cue(5.0, 7.0, "Maria", "Coach Maria", "How did the week go?"),
+            Cue(10.0, 14.25, "Alex Johnson", "Alex Johnson", "Busy, but I kept the habit going & it helped."),
+        ]
+
+    def test_unnamed_voices(self):
+        """Voices that are not valid names keep their label but name no speaker."""
+        vtt = "WEBVTT\n\n00:01.000 --> 00:02.000\n<v Speaker 1>Hello.\n"
+
+        assert list(iter_cues(vtt)) == [Cue(1.0, 2.0, None, "Speaker 1", "Hello.")]
+
+    def test_speaker_labels_and_continuations(self):
+        """Zoom labels are parsed like transcript labels; unlabelled cues continue the speaker."""
+        cues = list(iter_cues(ZOOM_VTT))
+
+        assert [(c.speaker, c.label, c.text) for c in cues] == [
+            ("Maria", "Coach Maria", "Welcome back."),
+            ("Priya Patel", "Dr. Priya Patel", "Thanks. I tried the morning routine all week."),
+            ("Priya Patel", "Dr. Priya Patel", "It mostly worked."),
+        ]
+
+    def test_srt_matches_vtt(self):
+        """SubRip cues (comma milliseconds, CRLF) parse like WebVTT ones."""
+        assert list(iter_cues(SRT)) == list(iter_cues(ZOOM_VTT))
+
+    def test_chunk_boundaries_do_not_matter(self):
+        """Any chunking of the stream yields the same cues."""
+        expected = list(iter_cues(TEAMS_VTT))
+
+        for size in [1, 3, 16]:
+            assert list(iter_cues(chunks(TEAMS_VTT, size))) == expected
+
+    def test_rendered_turns(self):
+        """Close cues from one speaker become one time-ranged line."""
+        text = render_transcript(iter_cues(TEAMS_VTT))
+
+        assert text.splitlines() == [
+            "[00:00:01.000 --> 00:00:07.000] Coach Maria: Welcome back, everyone. How did the week go?",
+            "[00:00:10.000 --> 00:00:14.250] Alex Johnson: Busy, but I kept the habit going & it helped.",
+        ]
+
+    def test_long_pauses_split_turns(self):
+        """A pause longer than the merge gap starts a new turn for the same speaker."""
+        cues = [
+            Cue(0.0, 2.0, "Alex Johnson", "Alex Johnson", "One."),
+            Cue(10.0, 11.0, "Alex Johnson", "Alex Johnson", "Two."),
+        ]
+
+        assert len(render_transcript(cues).splitlines()) == 2
+
+
+class TestCaptionExtraction:
+    """Test cases for caption transcripts in the extraction pipeline."""
+
+    def test_speaking_time_uses_cue_ranges(self):
+        """Speaking time is each turn's exact range, not the gap to the next turn."""
+        text = render_transcript(iter_cues(TEAMS_VTT))
+
+        participants = {p.name: p for p in ParticipantExtractor.extract_participants(text)}
+
+        assert participants["Maria"].speaking_time_seconds == 6
+        assert participants["Maria"].role == "coach"
+        assert participants["Alex Johnson"].speaking_time_seconds == 4
+
+    def test_caption_uploads_are_supported(self):
+        """.vtt and .srt uploads decode to rendered transcripts."""
+        data = (TEAMS_VTT * 2).encode("utf-8")
+
+        text, participants, _, segment_index = parse_transcript_file(data, ".vtt")
+
+        assert text.startswith("[00:00:01.000 --> 00:00:07.000] Coach Maria:")
+        assert {p.name for p in participants} == {"Maria", "Alex Johnson"}
+        assert segment_index is not None
+        assert {".vtt", ".srt"} <= FileProcessingService.SUPPORTED_EXTENSIONS
+
+
+class TestSegmentIndex:
+    """Test cases for the persisted segment index."""
+
+    def test_index_offsets_and_times(self):
+        """Segments carry each timed turn's offsets and times."""
+        text = render_transcript(iter_cues(ZOOM_VTT))
+
+        segments = decode_segment_index(build_segment_index(text))
+
+        assert [(s.speaker, s.start_seconds, s.end_seconds) for s in segments] == [
+            ("Maria", 1.0, 3.0),
+            ("Priya Patel", 3.5, 8.0),
+        ]
+        assert text[segments[1].start_offset:segments[1].end_offset].endswith("It mostly worked.")
+
+    def test_timestamped_text_ends_at_next_turn(self):
+        """Plain timestamps end where the next turn starts; the last turn stays open."""
+        text = "[00:00:05] Alex Johnson: Hi.\n[00:00:20] Priya Patel: Hello.\n"
+
+        segments = decode_segment_index(build_segment_index(text))
+
+        assert [(s.start_seconds, s.end_seconds) for s in segments] == [(5.0, 20.0), (20.0, None)]
+
+    def test_untimed_text_has_no_index(self):
+        """Transcripts without timestamps store no index."""
+        assert build_segment_index("Alex Johnson: Hi.\nPriya Patel: Hello.\n") is None
+
+    def test_round_trip_and_queries(self):
+        """Encoded segments decode unchanged and answer range and speaking-time queries."""
+        segments = [
+            TranscriptSegment("Maria", 0, 40, 1.0, 7.0),
+            TranscriptSegment("Alex Johnson", 41, 90, 10.0, 14.25),
+            TranscriptSegment("Maria", 91, 120, 15.5, None),
+        ]
+
+        decoded = decode_segment_index(encode_segment_index(segments))
+
+        assert decoded == segments
+        assert segments_in_range(decoded, 8.0, 15.0) == [segments[1]]
+        assert segments_in_range(decoded, speaker="Maria") == [segments[0], segments[2]]
+        assert speaking_times(decoded) == {"Maria": 6.0, "Alex Johnson": 4.25}
+
+    def test_repository_reads_only_the_index(self):
+        """Segment queries load the index column, not the transcript."""
+        db = MagicMock()
+        db.query.return_value.filter.return_value.scalar.return_value = encode_segment_index([
+            TranscriptSegment("Maria", 0, 40, 1.0, 7.0),
+            TranscriptSegment("Alex Johnson", 41, 90, 10.0, 14.25),
+        ])
+        repo = TranscriptRepository(db)
+
+        assert repo.get_segments(uuid4(), start_seconds=9.0) == [
+            TranscriptSegment("Alex Johnson", 41, 90, 10.0, 14.25)
+        ]
+        assert repo.get_speaking_times(uuid4()) == {"Maria": 6.0, "Alex Johnson": 4.25}
+        db.get.assert_not_called()
+
+    def test_repository_without_index(self):
+        """Transcripts without an index return None."""
+        db = MagicMock()
+        db.query.return_value.filter.return_value.scalar.return_value = None
+
+        assert TranscriptRepository(db).get_segments(uuid4()) is None
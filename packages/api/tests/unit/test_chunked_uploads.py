@@ -0,0 +1,274 @@
+"""
+Unit tests for resumable chunked uploads.
+"""
+
+import asyncio
+import hashlib
+import os
+import time
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from src.main import app
+from src.schemas.sessions import SessionUploadResponse
+from src.services.chunked_uploads import ChunkedUploadStore
+
+TRANSCRIPT = (
+    "Coach Maria: Welcome back, how did the week go for everyone?\n"
+    "Alex Johnson: Busy, but I kept the morning planning habit going.\n"
+    "Priya Patel: Same here, although Thursday fell apart completely.\n"
+).encode()
+
+
+def sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ChunkedUploadStore(tmp_path, ttl=60, max_chunk_size=64)
+
+
+class TestChunkedUploadStore:
+    """Test cases for staging, resuming and assembling uploads."""
+
+    def test_chunks_assemble_in_order(self, store):
+        """Chunks appended at the resume point assemble to the original file."""
+        state = run(store.create("session.txt", len(TRANSCRIPT), sha256(TRANSCRIPT)))
+
+        for offset in range(0, len(TRANSCRIPT), 64):
+            chunk = TRANSCRIPT[offset:offset + 64]
+            state = run(store.write_chunk(state.upload_id, offset, chunk, sha256(chunk)))
+
+        assert state.complete
+        upload = run(store.assemble(state.upload_id))
+        assert upload.content == TRANSCRIPT
+        assert upload.filename == "session.txt"
+
+    def test_resume_from_status(self, store):
+        """Status reports the offset the next chunk must start at."""
+        state = run(store.create("session.txt", len(TRANSCRIPT)))
+        chunk = TRANSCRIPT[:50]
+        run(store.write_chunk(state.upload_id, 0, chunk, sha256(chunk)))
+
+        assert run(store.status(state.upload_id)).received_bytes == 50
+
+    def test_wrong_offset_conflicts(self, store):
+        """A chunk past the resume point is rejected with 409."""
+        state = run(store.create("session.txt", len(TRANSCRIPT)))
+        chunk = TRANSCRIPT[10:20]
+
+        with pytest.raises(HTTPException) as exc_info:
+            run(store.write_chunk(state.upload_id, 10, chunk, sha256(chunk)))
+
+        assert exc_info.value.status_code == 409
+
+    def test_retried_chunk_is_acknowledged(self, store):
+        """Re-sending a stored chunk does not duplicate its bytes."""
+        state = run(store.create("session.txt", len(TRANSCRIPT)))
+        chunk = TRANSCRIPT[:40]
+        run(store.write_chunk(state.upload_id, 0, chunk, sha256(chunk)))
+
+        state = run(store.write_chunk(state.upload_id, 0, chunk, sha256(chunk)))
+
+        assert state.received_bytes == 40
+
+    def test_checksum_mismatch_rejected(self, store):
+        """A corrupted chunk is rejected and not stored."""
+        state = run(store.create("session.txt", len(TRANSCRIPT)))
+
+        with pytest.raises(HTTPException) as exc_info:
+            run(store.write_chunk(state.upload_id, 0, TRANSCRIPT[:40], sha256(b"other")))
+
+        assert exc_info.value.status_code == 400
+        assert run(store.status(state.upload_id)).received_bytes == 0
+
+    def test_chunk_past_declared_size_rejected(self, store):
+        """Chunks cannot grow the file beyond its declared size."""
+        state = run(store.create("session.txt", 10))
+
+        with pytest.raises(HTTPException) as exc_info:
+            run(store.write_chunk(state.upload_id, 0, TRANSCRIPT[:20], sha256(TRANSCRIPT[:20])))
+
+        assert exc_info.value.status_code == 413
+
+    def test_incomplete_upload_cannot_finalize(self, store):
+        """Finalize before every byte arrives is rejected with 409."""
+        state = run(store.create("session.txt", len(TRANSCRIPT)))
+
+        with pytest.raises(HTTPException) as exc_info:
+            run(store.assemble(state.upload_id))
+
+        assert exc_info.value.status_code == 409
+
+    def test_file_checksum_verified_and_upload_consumed(self, store):
+        """A whole-file mismatch fails finalize; the upload is gone afterwards."""
+        state = run(store.create("session.txt", 10, sha256(b"different!")))
+        chunk = TRANSCRIPT[:10]
+        run(store.write_chunk(state.upload_id, 0, chunk, sha256(chunk)))
+
+        with pytest.raises(HTTPException) as exc_info:
+            run(store.assemble(state.upload_id))
+        assert exc_info.value.status_code == 422
+
+        with pytest.raises(HTTPException) as exc_info:
+            run(store.status(state.upload_id))
+        assert exc_info.value.status_code == 404
+
+    def test_released_upload_can_be_assembled_again(self, store):
+        """A claimed upload is hidden until released, and removed once completed."""
+        state = run(store.create("session.txt", 10))
+        chunk = TRANSCRIPT[:10]
+        run(store.write_chunk(state.upload_id, 0, chunk, sha256(chunk)))
+
+        run(store.assemble(state.upload_id))
+        with pytest.raises(HTTPException) as exc_info:
+            run(store.assemble(state.upload_id))
+        assert exc_info.value.status_code == 404
+
+        run(store.release(state.upload_id))
+        assert run(store.assemble(state.upload_id)).content == chunk
+
+        run(store.complete(state.upload_id))
+        run(store.release(state.upload_id))
+        with pytest.raises(HTTPException) as exc_info:
+            run(store.status(state.upload_id))
+        assert exc_info.value.status_code == 404
+
+    def test_unsupported_type_rejected(self, store):
+        """Uploads are only accepted for supported transcript formats."""
+        with pytest.raises(HTTPException) as exc_info:
+            run(store.create("session.pdf", 10))
+
+        assert exc_info.value.status_code == 400
+
+    def test_cleanup_removes_only_expired(self, store, tmp_path):
+        """Uploads idle past the TTL are removed; active ones are kept."""
+        stale = run(store.create("stale.txt", 10))
+        fresh = run(store.create("fresh.txt", 10))
+        old = time.time() - 120
+        stale_dir = tmp_path / stale.upload_id.hex
+        for path in [stale_dir, *stale_dir.iterdir()]:
+            os.utime(path, (old, old))
+
+        assert store.cleanup_expired() == 1
+        assert not stale_dir.exists()
+        assert run(store.status(fresh.upload_id)).received_bytes == 0
+
+
+class TestChunkedUploadEndpoints:
+    """Test cases for the chunked upload HTTP protocol."""
+
+    def test_upload_and_finalize(self, store):
+        """A file sent in chunks is finalized into a session."""
+        client = TestClient(app)
+        session_response = SessionUploadResponse(
+            session_id=uuid4(),
+            status="uploaded",
+            participants_identified=["Alex Johnson"],
+            clients_created=["Alex Johnson"],
+            clients_matched=[],
+            processing_status="pending",
+            next_steps="Session ready for AI analysis",
+        )
+
+        with patch("src.routes.sessions.chunked_upload_store", store), patch(
+            "src.routes.sessions.SessionManagementService"
+        ) as service_class:
+            service_class.return_value.create_session_from_upload.return_value = session_response
+            service_class.return_value.find_duplicate_upload.return_value = None
+
+            created = client.post(
+                "/api/v1/sessions/uploads",
+                json={"filename": "session.txt", "total_size": len(TRANSCRIPT)},
+            )
+            assert created.status_code == 201
+            upload_id = created.json()["upload_id"]
+
+            for offset in range(0, len(TRANSCRIPT), 64):
+                chunk = TRANSCRIPT[offset:offset + 64]
+                response = client.put(
+                    f"/api/v1/sessions/uploads/{upload_id}/chunks",
+                    params={"offset": offset},
+                    content=chunk,
+                    headers={"X-Chunk-SHA256": sha256(chunk)},
+                )
+                assert response.status_code == 200
+            assert response.json()["complete"] is True
+
+            finalized = client.post(
+                f"/api/v1/sessions/uploads/{upload_id}/finalize",
+                json={"session_date": "2024-01-15"},
+            )
+
+        assert finalized.status_code == 200
+        upload_request = service_class.return_value.create_session_from_upload.call_args.kwargs[
+            "upload_request"
+        ]
+        assert upload_request.transcript_text == TRANSCRIPT.decode().strip()
+
+    def test_failed_finalize_can_be_retried(self, store):
+        """A failure after assembly keeps the staged file for the next finalize."""
+        client = TestClient(app)
+        state = run(store.create("session.txt", len(TRANSCRIPT)))
+        for offset in range(0, len(TRANSCRIPT), 64):
+            chunk = TRANSCRIPT[offset:offset + 64]
+            run(store.write_chunk(state.upload_id, offset, chunk, sha256(chunk)))
+        session_response = SessionUploadResponse(
+            session_id=uuid4(),
+            status="uploaded",
+            participants_identified=["Alex Johnson"],
+            clients_created=["Alex Johnson"],
+            clients_matched=[],
+            processing_status="pending",
+            next_steps="Session ready for AI analysis",
+        )
+        create_session = AsyncMock(side_effect=[
+            HTTPException(status_code=429, detail="Server busy, retry later"),
+            session_response,
+        ])
+
+        with patch("src.routes.sessions.chunked_upload_store", store), patch(
+            "src.routes.sessions._create_session", create_session
+        ):
+            url = f"/api/v1/sessions/uploads/{state.upload_id}/finalize"
+            headers = {"Idempotency-Key": "finalize-retry-1"}
+            first = client.post(url, json={"session_date": "2024-01-15"}, headers=headers)
+            second = client.post(url, json={"session_date": "2024-01-15"}, headers=headers)
+
+        assert first.status_code == 429
+        assert second.status_code == 200
+        assert second.json()["session_id"] == str(session_response.session_id)
+        assert create_session.await_args.args[2] == "finalize-retry-1"
+        with pytest.raises(HTTPException):
+            run(store.status(state.upload_id))
+
+    def test_oversized_chunk_rejected(self, store):
+        """Request bodies over the chunk limit are rejected with 413."""
+        client = TestClient(app)
+
+        with patch("src.routes.sessions.chunked_upload_store", store):
+            upload_id = client.post(
+                "/api/v1/sessions/uploads",
+                json={"filename": "session.txt", "total_size": len(TRANSCRIPT)},
+            ).json()["upload_id"]
+            response = client.put(
+                f"/api/v1/sessions/uploads/{upload_id}/chunks",
+                params={"offset": 0},
+                content=TRANSCRIPT,
+                headers={"X-Chunk-SHA256": sha256(TRANSCRIPT)},
+            )
+
+        assert response.status_code == 413
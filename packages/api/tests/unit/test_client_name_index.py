@@ -0,0 +1,334 @@
+"""
+Unit tests for the in-memory client name index.
+"""
+
+import random
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+
+from src.repositories.client_name_index import ClientNameIndexCache, OrganizationNameIndex
+from src.repositories.clients import ClientRepository
+from src.repositories.query_counter import QueryCounter
+
+
+def similarity(name1, name2):
+    return ClientRepository._calculate_name_similarity(None, name1, name2)
+
+
+def make_clients(*names):
+    return [(uuid4(), name) for name in names]
+
+
+class TestOrganizationNameIndex:
+    """Test cases for OrganizationNameIndex.find."""
+
+    def test_exact_match_is_case_insensitive(self):
+        """Exact names match regardless of case or surrounding spaces."""
+        clients = make_clients("Jane Smith", "Bob Green")
+        index = OrganizationNameIndex(clients)
+
+        assert index.find("  JANE smith ", similarity, 0.8) == clients[0]
+
+    def test_search_within_client_name(self):
+        """A shorter search name matches the client that contains it."""
+        clients = make_clients("Bob Green", "Jane Smithson")
+        index = OrganizationNameIndex(clients)
+
+        assert index.find("Smithson", similarity, 0.8) == clients[1]
+
+    def test_client_name_within_search(self):
+        """A client name contained in the search name matches."""
+        clients = make_clients("Jane", "Bob Green")
+        index = OrganizationNameIndex(clients)
+
+        assert index.find("Dr. Jane Smith", similarity, 0.8) == clients[0]
+
+    def test_word_overlap_below_threshold(self):
+        """Partial word overlap under the threshold is not a match."""
+        index = OrganizationNameIndex(make_clients("Jane Smith"))
+
+        assert index.find("Jane Doe", similarity, 0.8) is None
+
+    def test_find_exact_ignores_fuzzy_matches(self):
+        """find_exact only answers case-insensitive exact names."""
+        clients = make_clients("Jane Smithson")
+        index = OrganizationNameIndex(clients)
+
+        assert index.find_exact("jane smithson ") == clients[0]
+        assert index.find_exact("Jane Smith") is None
+
+    def test_add_is_searchable_and_idempotent(self):
+        """Added clients match like loaded ones; re-adding an id is a no-op."""
+        index = OrganizationNameIndex(make_clients("Bob Green"))
+        client_id = uuid4()
+
+        index.add(client_id, "Priya Patel")
+        index.add(client_id, "Priya Patel")
+
+        assert len(index) == 2
+        assert index.find("Dr. Priya Patel", similarity, 0.8) == (client_id, "Priya Patel")
+
+    def test_matches_repository_pool_scoring(self):
+        """Index results equal a full scan with the repository's matcher."""
+        rng = random.Random(7)
+        first = ["Jane", "Bob", "Ana", "Li", "Omar", "Priya", "Sam"]
+        last = ["Smith", "Green", "Lee", "Haddad", "Patel", "Jo"]
+        names = [
+            f"{rng.choice(first)} {rng.choice(last)}" if rng.random() < 0.8
+            else rng.choice(first)
+            for _ in range(60)
+        ]
+        clients = make_clients(*names)
+        index = OrganizationNameIndex(clients)
+        repo = ClientRepository(MagicMock())
+        pool = [(cid, name, repo._normalize_name(name)) for cid, name in clients]
+
+        queries = names + [f"Dr. {n}" for n in first] + ["an", "mi", "Zed Q", "J"]
+        for query in queries:
+            assert index.find(query, similarity, 0.8) == repo._match_in_pool(
+                query, pool, 0.8
+            ), query
+
+
+class TestClientNameIndexCache:
+    """Test cases for ClientNameIndexCache."""
+
+    def test_builds_once_per_organization(self):
+        """A warm organization is served without calling the loader."""
+        cache = ClientNameIndexCache(max_organizations=2)
+        loader = MagicMock(return_value=make_clients("Jane Smith"))
+        organization_id = uuid4()
+
+        first = cache.get_or_build(organization_id, loader)
+        second = cache.get_or_build(organization_id, loader)
+
+        assert first is second
+        loader.assert_called_once()
+
+    def test_least_recently_used_organization_evicted(self):
+        """The LRU bound drops the least recently used organization."""
+        cache = ClientNameIndexCache(max_organizations=2)
+        org_a, org_b, org_c = uuid4(), uuid4(), uuid4()
+        for org in (org_a, org_b):
+            cache.get_or_build(org, list)
+        cache.get_or_build(org_a, list)  # refresh a
+        cache.get_or_build(org_c, list)
+
+        loader = MagicMock(return_value=[])
+        cache.get_or_build(org_a, loader)
+        loader.assert_not_called()
+        cache.get_or_build(org_b, loader)
+        loader.assert_called_once()
+        assert cache.stats()["evictions"] >= 1
+
+    def test_invalidate_forces_rebuild(self):
+        """Invalidation drops the index so the next lookup reloads it."""
+        cache = ClientNameIndexCache(max_organizations=2)
+        organization_id = uuid4()
+        cache.get_or_build(organization_id, list)
+
+        cache.invalidate(organization_id)
+        loader = MagicMock(return_value=[])
+        cache.get_or_build(organization_id, loader)
+
+        loader.assert_called_once()
+        assert cache.stats()["invalidations"] == 1
+
+    def test_build_racing_invalidation_not_cached(self):
+        """A build that started before an invalidation is not kept."""
+        cache = ClientNameIndexCache(max_organizations=2)
+        organization_id = uuid4()
+
+        def loader():
+            cache.invalidate(organization_id)  # client created mid-build
+            return []
+
+        cache.get_or_build(organization_id, loader)
+
+        assert cache.stats()["organizations"] == 0
+
+    def test_add_updates_cached_index_in_place(self):
+        """Committed clients join a warm index without reloading it."""
+        cache = ClientNameIndexCache(max_organizations=2)
+        organization_id = uuid4()
+        client_id = uuid4()
+        cache.get_or_build(organization_id, list)
+
+        cache.add(organization_id, [(client_id, "Jane Smith")])
+        loader = MagicMock(return_value=[])
+        index = cache.get_or_build(organization_id, loader)
+
+        loader.assert_not_called()
+        assert index.find_exact("Jane Smith") == (client_id, "Jane Smith")
+        assert cache.stats()["updates"] == 1
+
+    def test_build_racing_add_not_cached(self):
+        """A build that may have missed committed clients is not kept."""
+        cache = ClientNameIndexCache(max_organizations=2)
+        organization_id = uuid4()
+
+        def loader():
+            cache.add(organization_id, [(uuid4(), "Jane Smith")])
+            return []
+
+        cache.get_or_build(organization_id, loader)
+
+        assert cache.stats()["organizations"] == 0
+
+    def test_expired_index_is_reloaded(self):
+        """Indexes older than the TTL are dropped and rebuilt."""
+        cache = ClientNameIndexCache(max_organizations=2, ttl_seconds=60)
+        organization_id = uuid4()
+
+        with patch("src.repositories.client_name_index.time.monotonic") as monotonic:
+            monotonic.return_value = 1000.0
+            cache.get_or_build(organization_id, list)
+            monotonic.return_value = 1061.0
+            loader = MagicMock(return_value=[])
+            cache.get_or_build(organization_id, loader)
+
+        loader.assert_called_once()
+        assert cache.stats()["expirations"] == 1
+
+    def test_change_tracking_is_bounded(self):
+        """Change records are pruned with the LRU bound and stay conservative."""
+        cache = ClientNameIndexCache(max_organizations=2)
+        org_a = uuid4()
+        _, generation = cache.get(org_a)
+
+        cache.invalidate(org_a)
+        for _ in range(5):
+            cache.invalidate(uuid4())
+        cache.put(org_a, OrganizationNameIndex([]), generation)
+
+        assert len(cache._changed_at) == 2
+        assert cache.stats()["organizations"] == 0
+
+    def test_hit_rate(self):
+        """Hits and misses are reported with a hit rate."""
+        cache = ClientNameIndexCache(max_organizations=1)
+        cache.record(hit=True)
+        cache.record(hit=True)
+        cache.record(hit=False)
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (2, 1, 0.6667)
+
+
+class TestRepositoryNameIndex:
+    """Test cases for ClientRepository with the name index enabled."""
+
+    def make_repo(self, cache):
+        repo = ClientRepository(Session(bind=create_engine("sqlite://")))
+        repo.name_index = cache
+        return repo
+
+    def test_warm_exact_hit_issues_no_statements(self):
+        """A repeat name in a warm organization is answered without the database."""
+        cache = ClientNameIndexCache(max_organizations=4)
+        organization_id = uuid4()
+        client_id = uuid4()
+        cache.get_or_build(organization_id, lambda: [(client_id, "Jane Smith")])
+        repo = self.make_repo(cache)
+
+        with QueryCounter(repo.db) as counter:
+            client, was_created = repo.find_or_create_client("jane smith", organization_id)
+
+        assert (client.id, client.name, was_created) == (client_id, "Jane Smith", False)
+        assert counter.count == 0
+        assert cache.stats()["hits"] == 1
+
+    def test_warm_organization_fuzzy_matches_without_queries(self):
+        """After both exact lookups miss, index fuzzy hits skip the fuzzy query."""
+        cache = ClientNameIndexCache(max_organizations=4)
+        organization_id = uuid4()
+        client_id = uuid4()
+        cache.get_or_build(organization_id, lambda: [(client_id, "Jane Smith")])
+        repo = self.make_repo(cache)
+
+        with patch.object(repo, "_find_client_by_name", return_value=None), \
+                patch.object(repo, "_find_client_fuzzy") as find_fuzzy, \
+                QueryCounter(repo.db) as counter:
+            client, was_created = repo.find_or_create_client("Dr. Jane Smith", organization_id)
+
+        assert (client.id, client.name, was_created) == (client_id, "Jane Smith", False)
+        assert counter.count == 0
+        find_fuzzy.assert_not_called()
+        assert cache.stats()["hits"] == 1
+
+    def test_database_exact_match_beats_index(self):
+        """A stale fuzzy index hit never outranks an exact database match."""
+        cache = ClientNameIndexCache(max_organizations=4)
+        organization_id = uuid4()
+        cache.get_or_build(organization_id, lambda: make_clients("Jane Smithson"))
+        repo = self.make_repo(cache)
+        exact = SimpleNamespace(id=uuid4(), name="Jane Smith")
+
+        with patch.object(repo, "_find_client_by_name", return_value=exact):
+            client, was_created = repo.find_or_create_client("Jane Smith", organization_id)
+
+        assert (client, was_created) == (exact, False)
+
+    def test_bulk_resolution_uses_index(self):
+        """Exact index hits in a batch skip the candidate query."""
+        cache = ClientNameIndexCache(max_organizations=4)
+        organization_id = uuid4()
+        client_id = uuid4()
+        cache.get_or_build(organization_id, lambda: [(client_id, "Jane Smith")])
+        repo = self.make_repo(cache)
+
+        result = repo.resolve_clients_bulk(["Jane Smith"], organization_id)
+
+        assert result.resolutions["Jane Smith"].client_id == client_id
+        assert result.round_trips == 0
+
+    def test_bulk_resolution_asks_database_for_fuzzy_names(self):
+        """Names without an exact index hit are matched against the database."""
+        cache = ClientNameIndexCache(max_organizations=4)
+        organization_id = uuid4()
+        cache.get_or_build(organization_id, lambda: make_clients("Jane Smithson"))
+        repo = self.make_repo(cache)
+        exact = SimpleNamespace(id=uuid4(), name="Jane Smith")
+
+        with patch.object(repo, "_find_candidate_clients", return_value=[exact]) as find:
+            result = repo.resolve_clients_bulk(["Jane Smith"], organization_id)
+
+        find.assert_called_once_with(["Jane Smith"], organization_id)
+        assert result.resolutions["Jane Smith"].client_id == exact.id
+
+    def test_created_clients_join_index_on_commit(self):
+        """Created clients reach the index after commit, and bypass it until then."""
+        cache = ClientNameIndexCache(max_organizations=4)
+        organization_id = uuid4()
+        client_id = uuid4()
+        cache.get_or_build(organization_id, list)
+        repo = self.make_repo(cache)
+        repo.db.connection()
+
+        repo._queue_name_index_update(organization_id, [(client_id, "Bob Green")])
+        assert repo._get_name_index(organization_id) is None
+
+        repo.db.commit()
+
+        index = repo._get_name_index(organization_id)
+        assert index.find_exact("Bob Green") == (client_id, "Bob Green")
+        assert cache.stats()["invalidations"] == 0
+
+    def test_rolled_back_clients_never_join_index(self):
+        """Rollback discards queued clients and re-enables the index."""
+        cache = ClientNameIndexCache(max_organizations=4)
+        organization_id = uuid4()
+        cache.get_or_build(organization_id, list)
+        repo = self.make_repo(cache)
+        repo.db.connection()
+
+        repo._queue_name_index_update(organization_id, [(uuid4(), "Bob Green")])
+        repo.db.rollback()
+
+        index = repo._get_name_index(organization_id)
+        assert index is not None
+        assert index.find_exact("Bob Green") is None
@@ -0,0 +1,233 @@
+"""
+Unit tests for bulk client resolution.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session
+
+from src.models.core import Client, _default_normalized_name, normalize_client_name
+from src.repositories.clients import ClientRepository, ClientSessionRepository
+from src.repositories.query_counter import QueryCounter
+
+
+def make_client(name):
+    """Build a stand-in for a Client row."""
+    return SimpleNamespace(id=uuid4(), name=name)
+
+
+@pytest.fixture
+def repo():
+    """ClientRepository over a mocked session with round-trip counting stubbed."""
+    with patch("src.repositories.clients.QueryCounter") as counter_cls:
+        counter_cls.return_value.__enter__.return_value = SimpleNamespace(count=2)
+        yield ClientRepository(MagicMock())
+
+
+class TestResolveClientsBulk:
+    """Test cases for ClientRepository.resolve_clients_bulk."""
+
+    def test_exact_match_is_case_insensitive(self, repo):
+        """Existing clients are matched regardless of case."""
+        existing = make_client("Jane Smith")
+
+        with patch.object(repo, "_find_candidate_clients", return_value=[existing]):
+            result = repo.resolve_clients_bulk(["jane smith"], uuid4())
+
+        resolution = result.resolutions["jane smith"]
+        assert resolution.client_id == existing.id
+        assert resolution.was_created is False
+        repo.db.execute.assert_not_called()
+
+    def test_fuzzy_match_above_threshold(self, repo):
+        """Names that only differ by honorific match the existing client."""
+        existing = make_client("Jane Watson")
+
+        with patch.object(repo, "_find_candidate_clients", return_value=[existing]):
+            result = repo.resolve_clients_bulk(["Dr. Jane Watson"], uuid4())
+
+        assert result.resolutions["Dr. Jane Watson"].client_id == existing.id
+
+    def test_unmatched_names_inserted_in_one_statement(self, repo):
+        """All new clients are created with a single bulk insert."""
+        organization_id = uuid4()
+
+        with patch.object(repo, "_find_candidate_clients", return_value=[]):
+            result = repo.resolve_clients_bulk(
+                ["Alice Brown", "Bob Green", "Carol White"], organization_id
+            )
+
+        assert all(r.was_created for r in result.resolutions.values())
+        repo.db.execute.assert_called_once()
+        rows = repo.db.execute.call_args.args[1]
+        assert [row["name"] for row in rows] == ["Alice Brown", "Bob Green", "Carol White"]
+        assert {row["organization_id"] for row in rows} == {organization_id}
+        assert [row["id"] for row in rows] == [
+            result.resolutions[name].client_id
+            for name in ["Alice Brown", "Bob Green", "Carol White"]
+        ]
+
+    def test_later_names_match_clients_created_in_batch(self, repo):
+        """A name created earlier in the batch is reused rather than duplicated."""
+        with patch.object(repo, "_find_candidate_clients", return_value=[]):
+            result = repo.resolve_clients_bulk(["Alice Brown", "alice brown"], uuid4())
+
+        assert (
+            result.resolutions["alice brown"].client_id
+            == result.resolutions["Alice Brown"].client_id
+        )
+        assert result.resolutions["alice brown"].was_created is False
+        assert len(repo.db.execute.call_args.args[1]) == 1
+
+    def test_round_trips_reported(self, repo):
+        """The counted round trips are surfaced on the result."""
+        with patch.object(repo, "_find_candidate_clients", return_value=[]):
+            result = repo.resolve_clients_bulk(["Alice Brown"], uuid4())
+
+        assert result.round_trips == 2
+
+    def test_empty_names_skip_database(self, repo):
+        """Nothing is queried when there are no names to resolve."""
+        with patch.object(repo, "_find_candidate_clients") as find:
+            result = repo.resolve_clients_bulk(["", "  "], uuid4())
+
+        find.assert_not_called()
+        assert result.resolutions == {}
+        assert result.round_trips == 0
+
+
+def make_repo_for_dialect(dialect_name, clients):
+    """ClientRepository whose mocked session reports a dialect and query rows."""
+    db = MagicMock()
+    db.get_bind.return_value.dialect.name = dialect_name
+    db.query.return_value.filter.return_value.all.return_value = clients
+    return ClientRepository(db)
+
+
+class TestFuzzyMatching:
+    """Test cases for trigram-backed and pure-Python fuzzy matching."""
+
+    def test_python_fallback_scores_whole_organization(self):
+        """Without pg_trgm every client in the organization is scored."""
+        clients = [make_client("Bob Green"), make_client("Jane Smith")]
+        repo = make_repo_for_dialect("sqlite", clients)
+
+        match = repo._find_client_fuzzy("Dr. Jane Smith", uuid4())
+
+        assert match is clients[1]
+        filters = repo.db.query.return_value.filter.call_args.args
+        assert len(filters) == 1  # organization scope only
+
+    def test_postgres_adds_trigram_candidate_filter(self):
+        """On PostgreSQL the organization is narrowed by the trigram filter."""
+        clients = [make_client("Jane Smith")]
+        repo = make_repo_for_dialect("postgresql", clients)
+
+        match = repo._find_client_fuzzy("jane smith", uuid4())
+
+        assert match is clients[0]
+        filters = repo.db.query.return_value.filter.call_args.args
+        assert len(filters) == 2
+
+    def test_python_and_postgres_paths_score_alike(self):
+        """Both paths apply the same threshold to the same candidates."""
+        clients = [make_client("Jane"), make_client("Janet Smithers")]
+
+        for dialect_name in ("sqlite", "postgresql"):
+            repo = make_repo_for_dialect(dialect_name, clients)
+            assert repo._find_client_fuzzy("Jane Smith", uuid4()) is clients[0]
+
+    def test_trigram_filter_covers_similarity_and_containment(self):
+        """The filter ORs trigram similarity with containment in both directions."""
+        repo = make_repo_for_dialect("postgresql", [])
+
+        compiled = repo._trigram_candidate_filter("jane smith").compile(
+            dialect=postgresql.psycopg2.dialect()
+        )
+        sql = str(compiled)
+
+        assert "clients.normalized_name %% " in sql
+        assert "clients.normalized_name LIKE " in sql
+        assert "jane smith" in compiled.params.values()
+
+    def test_trigram_filter_keeps_clients_contained_in_the_search(self):
+        """A client named "Jan" stays a candidate for "Jane Smith" (score 0.9)."""
+        repo = make_repo_for_dialect("postgresql", [])
+
+        compiled = repo._trigram_candidate_filter("jane smith").compile(
+            dialect=postgresql.psycopg2.dialect()
+        )
+
+        assert "LIKE '%%' || clients.normalized_name || '%%'" in str(compiled)
+        assert repo._calculate_name_similarity("jane smith", "jan") >= 0.8
+
+
+class TestNormalizedName:
+    """Test cases for the stored normalized client name."""
+
+    def test_normalize_client_name(self):
+        """Case, spacing, titles and suffixes are normalized away."""
+        assert normalize_client_name("  Dr.  Jane   SMITH Jr. ") == "jane smith"
+
+    def test_set_when_name_assigned(self):
+        """ORM objects keep normalized_name in step with name."""
+        client = Client(name="Prof. Alan Turing")
+
+        assert client.normalized_name == "alan turing"
+
+        client.name = "Grace Hopper"
+        assert client.normalized_name == "grace hopper"
+
+    def test_default_for_core_inserts(self):
+        """Bulk Core inserts derive normalized_name from the row's name."""
+        context = SimpleNamespace(get_current_parameters=lambda: {"name": "Ms. Ada Lovelace"})
+
+        assert _default_normalized_name(context) == "ada lovelace"
+
+
+class TestCreateClientSessionsBulk:
+    """Test cases for ClientSessionRepository.create_client_sessions_bulk."""
+
+    def test_duplicates_linked_once(self):
+        """Each client is linked to the session once, in one statement."""
+        repo = ClientSessionRepository(MagicMock())
+        client_id = uuid4()
+        session_id = uuid4()
+
+        created = repo.create_client_sessions_bulk(
+            session_id, [client_id, client_id], engagement_levels={client_id: "unknown"}
+        )
+
+        assert created == 1
+        repo.db.execute.assert_called_once()
+        rows = repo.db.execute.call_args.args[1]
+        assert rows[0]["session_id"] == session_id
+        assert rows[0]["engagement_level"] == "unknown"
+
+    def test_no_clients_skips_insert(self):
+        """No statement is issued when there is nothing to link."""
+        repo = ClientSessionRepository(MagicMock())
+
+        assert repo.create_client_sessions_bulk(uuid4(), []) == 0
+        repo.db.execute.assert_not_called()
+
+
+class TestQueryCounter:
+    """Test cases for QueryCounter."""
+
+    def test_counts_statements_inside_block_only(self):
+        """Statements are counted only while the block is active."""
+        db = Session(bind=create_engine("sqlite://"))
+
+        with QueryCounter(db) as counter:
+            db.execute(text("SELECT 1"))
+            db.execute(text("SELECT 2"))
+        db.execute(text("SELECT 3"))
+
+        assert counter.count == 2
+        db.close()
@@ -0,0 +1,107 @@
+"""
+Unit tests for the suspicious content scanner.
+"""
+
+import io
+
+import pytest
+from fastapi import HTTPException, UploadFile
+
+from src.services.content_scanner import DEFAULT_SUSPICIOUS_PATTERNS, ContentScanner, ScanMatch
+from src.services.file_processing import FileProcessingService
+
+
+@pytest.fixture
+def scanner():
+    return ContentScanner(DEFAULT_SUSPICIOUS_PATTERNS)
+
+
+class TestContentScanner:
+    """Test cases for single-pass pattern scanning."""
+
+    def test_clean_content_has_no_matches(self, scanner):
+        """Ordinary transcript text is not flagged."""
+        text = "Coach Maria: We evaluated the documents and the window of time. " * 100
+
+        assert scanner.scan(text) == []
+        assert scanner.first_match(text) is None
+
+    def test_reports_positions_case_insensitively(self, scanner):
+        """Every match is reported with its offsets, regardless of case."""
+        text = "ok <SCRIPT> then Eval(x) and <script"
+
+        assert scanner.scan(text) == [
+            ScanMatch("<script", 3, 10),
+            ScanMatch("eval(", 17, 22),
+            ScanMatch("<script", 29, 36),
+        ]
+        assert scanner.first_match(text) == ScanMatch("<script", 3, 10)
+
+    def test_matches_across_windows(self, scanner, monkeypatch):
+        """Patterns spanning a window boundary are found once, at the right offset."""
+        monkeypatch.setattr(ContentScanner, "WINDOW_SIZE", 8)
+        text = "abcdefJavaScript:xx document.COOKIE"
+
+        assert scanner.scan(text) == [
+            ScanMatch("javascript:", 6, 17),
+            ScanMatch("document.cookie", 20, 35),
+        ]
+
+    def test_stream_with_single_character_chunks(self, scanner):
+        """Feeding one character at a time gives the same matches."""
+        text = "x window.location y <script z"
+        stream = scanner.stream()
+        for char in text:
+            stream.feed(char)
+
+        assert stream.matches == scanner.scan(text)
+
+    def test_binary_stream_scans_raw_bytes(self, scanner):
+        """Raw upload bytes can be scanned chunk by chunk."""
+        data = "Café notes <ScRiPt>".encode("utf-8")
+        stream = scanner.stream(binary=True)
+        for start in range(0, len(data), 5):
+            stream.feed(data[start:start + 5])
+
+        assert stream.matches == [ScanMatch("<script", 12, 19)]
+
+    def test_length_changing_case_mapping_keeps_offsets(self, scanner):
+        """Characters whose lowercase form is longer do not shift offsets."""
+        text = "İstanbul eval("
+
+        assert scanner.scan(text) == [ScanMatch("eval(", 9, 14)]
+
+    def test_extra_patterns(self):
+        """The pattern list can be extended."""
+        scanner = ContentScanner(DEFAULT_SUSPICIOUS_PATTERNS + ("onerror=",))
+
+        assert scanner.first_match("<img ONERROR=x>") == ScanMatch("onerror=", 5, 13)
+
+
+class TestUploadScanning:
+    """Test cases for scanning uploads while they are read."""
+
+    @pytest.mark.asyncio
+    async def test_upload_rejected_while_reading(self, monkeypatch):
+        """A suspicious .txt upload is rejected before it is fully read."""
+        monkeypatch.setattr(FileProcessingService, "READ_CHUNK_SIZE", 16)
+        content = b"Coach Maria: hi <script>" + b"x" * 1000
+        upload = UploadFile(file=io.BytesIO(content), filename="session.txt")
+
+        with pytest.raises(HTTPException) as exc_info:
+            await FileProcessingService._read_upload(upload, ".txt")
+
+        assert exc_info.value.status_code == 400
+        assert upload.file.tell() < len(content)
+
+    @pytest.mark.asyncio
+    async def test_utf16_upload_left_to_text_scan(self):
+        """UTF-16 bytes are not scanned raw; the decoded text still is."""
+        content = ("Coach Maria: " + "notes " * 20 + "<script>").encode("utf-16")
+        upload = UploadFile(file=io.BytesIO(content), filename="session.txt")
+
+        buffer = await FileProcessingService._read_upload(upload, ".txt")
+        with pytest.raises(HTTPException) as exc_info:
+            FileProcessingService._decode_upload(buffer, ".txt")
+
+        assert exc_info.value.status_code == 400
@@ -0,0 +1,178 @@
+"""
+Unit tests for transcript fingerprinting and upload deduplication.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+from uuid import uuid4
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from src.main import app
+from src.services.batch_ingestion import ParsedTranscript, repeat_result, split_duplicates
+from src.services.deduplication import (
+    TranscriptHasher,
+    duplicate_response,
+    pick_duplicate,
+    transcript_fingerprint,
+    validate_idempotency_key,
+)
+
+TRANSCRIPT = (
+    "Coach Maria: Welcome back, how did the week go for everyone?\n"
+    "Alex Johnson: Busy, but I kept the morning planning habit going.\n"
+    "Priya Patel: Same here, although Thursday fell apart completely.\n"
+)
+
+
+def stored_session(transcript_hash, idempotency_key=None, names=()):
+    return SimpleNamespace(
+        id=uuid4(),
+        transcript_hash=transcript_hash,
+        idempotency_key=idempotency_key,
+        processing_status="processed",
+        client_sessions=[SimpleNamespace(client=SimpleNamespace(name=name)) for name in names],
+    )
+
+
+class TestTranscriptFingerprint:
+    """Test cases for the normalized content hash."""
+
+    def test_formatting_differences_hash_the_same(self):
+        """Line endings, spacing and blank lines do not change the hash."""
+        reformatted = "\r\n\r\n" + TRANSCRIPT.replace("\n", "\r\n\r\n").replace(": ", ":   \t")
+
+        assert transcript_fingerprint(reformatted) == transcript_fingerprint(TRANSCRIPT)
+
+    def test_content_changes_the_hash(self):
+        """Any change to the words produces a different hash."""
+        edited = TRANSCRIPT.replace("Thursday", "Friday")
+
+        assert transcript_fingerprint(edited) != transcript_fingerprint(TRANSCRIPT)
+
+    def test_streaming_matches_whole_text(self):
+        """Feeding arbitrary slices, even splitting CRLF, gives the same hash."""
+        text = TRANSCRIPT.replace("\n", "\r\n")
+        hasher = TranscriptHasher()
+        for start in range(0, len(text), 7):
+            hasher.update(text[start:start + 7])
+
+        assert hasher.hexdigest() == transcript_fingerprint(TRANSCRIPT)
+
+    def test_idempotency_key_validation(self):
+        """Keys are trimmed; blank or oversized keys are rejected."""
+        assert validate_idempotency_key(None) is None
+        assert validate_idempotency_key("  abc ") == "abc"
+        for key in ["   ", "k" * 256]:
+            with pytest.raises(HTTPException) as exc_info:
+                validate_idempotency_key(key)
+            assert exc_info.value.status_code == 400
+
+
+class TestPickDuplicate:
+    """Test cases for resolving a repeat upload to a session."""
+
+    def test_content_match(self):
+        """A session with the same hash is the duplicate."""
+        session = stored_session("h1")
+
+        assert pick_duplicate([session], "h1") is session
+
+    def test_idempotency_key_match_wins(self):
+        """The session stored under the key is preferred over a content match."""
+        by_content = stored_session("h1")
+        by_key = stored_session("h1", idempotency_key="key-1")
+
+        assert pick_duplicate([by_content, by_key], "h1", "key-1") is by_key
+
+    def test_reused_key_with_other_content_conflicts(self):
+        """A key reused for a different transcript is rejected with 409."""
+        with pytest.raises(HTTPException) as exc_info:
+            pick_duplicate([stored_session("h1", idempotency_key="key-1")], "h2", "key-1")
+
+        assert exc_info.value.status_code == 409
+
+    def test_duplicate_response_lists_linked_clients(self):
+        """The response points at the existing session and its clients."""
+        session = stored_session("h1", names=["Alex Johnson"])
+
+        response = duplicate_response(session)
+
+        assert response.session_id == session.id
+        assert response.status == "duplicate"
+        assert response.clients_matched == ["Alex Johnson"]
+        assert response.processing_status == "processed"
+
+
+class TestBatchRepeats:
+    """Test cases for duplicate detection within and across batches."""
+
+    def parsed(self, name, fingerprint):
+        return ParsedTranscript(filename=name, session_date=None, fingerprint=fingerprint)
+
+    def test_split_and_resolve(self):
+        """Existing and in-batch repeats resolve to the right sessions."""
+        existing_id = uuid4()
+        pending = [
+            (0, self.parsed("a.txt", "h1")),
+            (1, self.parsed("b.txt", "h2")),
+            (2, self.parsed("a-copy.txt", "h1")),
+            (3, self.parsed("c.txt", "h3")),
+        ]
+
+        unique, repeats = split_duplicates(pending, {"h3": existing_id})
+
+        assert [i for i, _ in unique] == [0, 1]
+        assert [i for i, _ in repeats] == [2, 3]
+
+        stored = {"h1": Mock(status="uploaded", session_id=uuid4())}
+        copy = repeat_result(repeats[0][1], {"h3": existing_id}, stored)
+        assert (copy.status, copy.session_id) == ("duplicate", stored["h1"].session_id)
+        assert repeat_result(repeats[1][1], {"h3": existing_id}, stored).session_id == existing_id
+
+
+class TestUploadDeduplication:
+    """Test cases for the upload route short-circuit."""
+
+    def test_repeat_upload_skips_extraction_and_insert(self):
+        """A duplicate is answered from the existing session."""
+        session = stored_session(transcript_fingerprint(TRANSCRIPT), names=["Alex Johnson"])
+
+        with patch("src.routes.sessions.SessionManagementService") as service_class, patch(
+            "src.routes.sessions.ParticipantExtractor"
+        ) as extractor:
+            service = service_class.return_value
+            service.find_duplicate_upload.return_value = duplicate_response(session)
+            response = TestClient(app).post(
+                "/api/v1/sessions/upload",
+                json={"transcript_text": TRANSCRIPT, "session_date": "2024-01-15"},
+                headers={"Idempotency-Key": "retry-1"},
+            )
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "duplicate"
+        assert response.json()["session_id"] == str(session.id)
+        service.find_duplicate_upload.assert_called_once()
+        assert service.find_duplicate_upload.call_args.args[2] == "retry-1"
+        service.create_session_from_upload.assert_not_called()
+        extractor.extract_participants.assert_not_called()
+
+    def test_new_upload_stores_hash_and_key(self):
+        """A new transcript is created with its hash and idempotency key."""
+        with patch("src.routes.sessions.SessionManagementService") as service_class:
+            service = service_class.return_value
+            service.find_duplicate_upload.return_value = None
+            service.create_session_from_upload.return_value = duplicate_response(
+                stored_session("h")
+            )
+            TestClient(app).post(
+                "/api/v1/sessions/upload",
+                json={"transcript_text": TRANSCRIPT, "session_date": "2024-01-15"},
+                headers={"Idempotency-Key": "new-1"},
+            )
+
+        kwargs = service.create_session_from_upload.call_args.kwargs
+        assert kwargs["transcript_hash"] == transcript_fingerprint(TRANSCRIPT)
+        assert kwargs["idempotency_key"] == "new-1"
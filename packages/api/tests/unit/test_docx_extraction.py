@@ -0,0 +1,84 @@
+"""
+Unit tests for in-memory DOCX extraction.
+"""
+
+import io
+import zipfile
+
+import pytest
+from docx import Document
+
+from src.services.docx_extraction import iter_docx_paragraphs
+
+
+def build_docx(paragraphs, table_rows=None) -> bytes:
+    """Build a .docx document in memory with python-docx."""
+    doc = Document()
+    for text in paragraphs:
+        doc.add_paragraph(text)
+    if table_rows:
+        table = doc.add_table(rows=len(table_rows), cols=1)
+        for row, text in zip(table.rows, table_rows):
+            row.cells[0].text = text
+    buffer = io.BytesIO()
+    doc.save(buffer)
+    return buffer.getvalue()
+
+
+class TestDocxExtraction:
+    """Test cases for iter_docx_paragraphs."""
+
+    def test_matches_python_docx_paragraphs(self):
+        """Test extracted paragraphs match python-docx output."""
+        
+        data = build_docx([
+            "Coach Maria: Good morning, Alex.",
+            "",
+            "Alex Johnson: Morning, Maria.\tIt's been eventful.",
+        ])
+        
+        expected = [p.text for p in Document(io.BytesIO(data)).paragraphs]
+        
+        assert list(iter_docx_paragraphs(data)) == expected
+
+    def test_skips_table_paragraphs(self):
+        """Test table cell text is excluded like python-docx paragraphs."""
+        
+        data = build_docx(["Body paragraph"], table_rows=["Cell text"])
+        
+        assert list(iter_docx_paragraphs(data)) == ["Body paragraph"]
+
+    def test_accepts_memoryview(self):
+        """Test extraction from a memoryview over a bytearray buffer."""
+        
+        data = bytearray(build_docx(["First line", "Second line"]))
+        
+        assert list(iter_docx_paragraphs(memoryview(data))) == [
+            "First line",
+            "Second line",
+        ]
+
+    def test_yields_incrementally(self):
+        """Test paragraphs are produced lazily."""
+        
+        data = build_docx([f"Paragraph {i}" for i in range(500)])
+        paragraphs = iter_docx_paragraphs(data)
+        
+        assert next(paragraphs) == "Paragraph 0"
+        assert next(paragraphs) == "Paragraph 1"
+
+    def test_invalid_archive(self):
+        """Test non-zip data is rejected."""
+        
+        with pytest.raises(zipfile.BadZipFile):
+            list(iter_docx_paragraphs(b"This is not a valid DOCX file"))
+
+    def test_missing_document_part(self):
+        """Test archives without word/document.xml are rejected."""
+        
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, "w") as archive:
+            archive.writestr("other.xml", "<root/>")
+        
+        with pytest.raises(KeyError):
+            list(iter_docx_paragraphs(buffer.getvalue()))
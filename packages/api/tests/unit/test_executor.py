@@ -0,0 +1,102 @@
+"""
+Unit tests for the workload executor layer.
+"""
+
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+
+from src.services.executor import WorkloadExecutor
+from src.services.file_processing import FileProcessingService
+
+
+def raise_bad_request(message: str) -> None:
+    """Module-level helper so it can be pickled into worker processes."""
+    raise HTTPException(status_code=400, detail=message)
+
+
+class TestWorkloadExecutor:
+    """Test cases for WorkloadExecutor."""
+
+    @pytest.mark.asyncio
+    async def test_run_cpu_inline(self):
+        """Test CPU work runs inline when the process pool is disabled."""
+        
+        executor = WorkloadExecutor(parse_workers=0, db_workers=1, max_queue_depth=4)
+        
+        result = await executor.run_cpu("upper", str.upper, "coach")
+        
+        assert result == "COACH"
+        stats = executor.stats()
+        assert stats["parse"]["mode"] == "inline"
+        assert stats["stages"]["upper"]["count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_run_io_uses_thread_pool(self):
+        """Test blocking work runs off the event loop thread."""
+        
+        executor = WorkloadExecutor(parse_workers=0, db_workers=2, max_queue_depth=4)
+        
+        try:
+            thread_name = await executor.run_io(
+                "whoami", lambda: threading.current_thread().name
+            )
+        finally:
+            executor.shutdown()
+        
+        assert thread_name.startswith("db-worker")
+        assert threading.current_thread().name != thread_name
+
+    @pytest.mark.asyncio
+    async def test_saturated_pool_returns_429(self):
+        """Test backpressure once the queue depth limit is reached."""
+        
+        executor = WorkloadExecutor(parse_workers=0, db_workers=1, max_queue_depth=1)
+        release = threading.Event()
+        
+        try:
+            blocked = asyncio.ensure_future(
+                executor.run_io("blocking", release.wait, 5)
+            )
+            await asyncio.sleep(0.05)
+            
+            with pytest.raises(HTTPException) as exc_info:
+                await executor.run_io("rejected", lambda: None)
+            
+            release.set()
+            await blocked
+        finally:
+            release.set()
+            executor.shutdown()
+        
+        assert exc_info.value.status_code == 429
+        assert exc_info.value.headers["Retry-After"] == "1"
+        assert executor.stats()["db"]["rejected"] == 1
+        assert executor.stats()["db"]["pending"] == 0
+
+    @pytest.mark.asyncio
+    async def test_process_pool_round_trip(self):
+        """Test parsing runs in worker processes and errors survive pickling."""
+        
+        executor = WorkloadExecutor(parse_workers=1, db_workers=1, max_queue_depth=4)
+        content = ("Coach Anna: Welcome back to the session. " * 5).encode()
+        
+        try:
+            text = await executor.run_cpu(
+                "decode_upload",
+                FileProcessingService._decode_upload,
+                bytearray(content),
+                ".txt",
+            )
+            
+            with pytest.raises(HTTPException) as exc_info:
+                await executor.run_cpu("fail", raise_bad_request, "bad transcript")
+        finally:
+            executor.shutdown()
+        
+        assert text == content.decode().strip()
+        assert exc_info.value.status_code == 400
+        assert exc_info.value.detail == "bad transcript"
+        assert executor.stats()["parse"]["mode"] == "process"
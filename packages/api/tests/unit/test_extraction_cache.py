@@ -0,0 +1,182 @@
+"""
+Unit tests for the memoized participant extraction cache.
+"""
+
+import asyncio
+from unittest.mock import Mock, patch
+
+from fastapi.testclient import TestClient
+
+from src.main import app
+from src.services.extraction_cache import ExtractionCache, serialize
+from src.services.participant_extraction import ParticipantExtractor, ParticipantInfo
+
+TRANSCRIPT = (
+    "Coach Maria: Welcome back, how did the week go for everyone?\n"
+    "Alex Johnson: Busy, but I kept the morning planning habit going.\n"
+)
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class DictBackend:
+    name = "fake"
+
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, ttl):
+        self.values[key] = value
+
+
+def extractor():
+    return Mock(side_effect=lambda text: [ParticipantInfo("Alex Johnson", "client", 0.8)])
+
+
+class TestExtractionCache:
+    """Test cases for local LRU + TTL caching."""
+
+    def test_repeat_text_is_served_from_cache(self):
+        """The extractor runs once per distinct transcript."""
+        cache = ExtractionCache(max_entries=8, ttl=60)
+        compute = extractor()
+
+        first = cache.extract(TRANSCRIPT, compute)
+        second = cache.extract(TRANSCRIPT, compute)
+
+        assert compute.call_count == 1
+        assert [p.name for p in second] == [p.name for p in first] == ["Alex Johnson"]
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["hit_ratio"]) == (1, 1, 0.5)
+
+    def test_returned_results_are_copies(self):
+        """Changing a returned participant does not change the cached one."""
+        cache = ExtractionCache(max_entries=8, ttl=60)
+        cache.extract(TRANSCRIPT, extractor())[0].name = "Changed"
+
+        assert cache.extract(TRANSCRIPT, extractor())[0].name == "Alex Johnson"
+
+    def test_key_depends_on_text_and_version(self):
+        """Any text change or extractor version bump gives a new key."""
+        key = ExtractionCache.key_for(TRANSCRIPT)
+
+        assert ExtractionCache.key_for(TRANSCRIPT + " ") != key
+        with patch.object(ParticipantExtractor, "VERSION", ParticipantExtractor.VERSION + 1):
+            assert ExtractionCache.key_for(TRANSCRIPT) != key
+
+    def test_least_recently_used_is_evicted(self):
+        """The bound drops the entry used longest ago."""
+        cache = ExtractionCache(max_entries=2, ttl=60)
+        compute = extractor()
+        cache.extract("a", compute)
+        cache.extract("b", compute)
+        cache.extract("a", compute)
+        cache.extract("c", compute)
+
+        cache.extract("a", compute)
+        cache.extract("b", compute)
+
+        assert compute.call_count == 4
+        assert cache.stats()["evictions"] == 2
+
+    def test_entries_expire_after_ttl(self):
+        """Results older than the TTL are recomputed."""
+        clock = FakeClock()
+        cache = ExtractionCache(max_entries=8, ttl=60, clock=clock)
+        compute = extractor()
+        cache.extract(TRANSCRIPT, compute)
+
+        clock.now = 61
+        cache.extract(TRANSCRIPT, compute)
+
+        assert compute.call_count == 2
+        assert cache.stats()["expirations"] == 1
+
+    def test_disabled_cache_always_extracts(self):
+        """With the cache off every call runs the extractor."""
+        cache = ExtractionCache(max_entries=8, ttl=60, enabled=False)
+        compute = extractor()
+        cache.extract(TRANSCRIPT, compute)
+        cache.extract(TRANSCRIPT, compute)
+
+        assert compute.call_count == 2
+        assert cache.stats()["entries"] == 0
+
+
+class TestSharedBackend:
+    """Test cases for the shared cache tier."""
+
+    def test_results_are_shared_between_caches(self):
+        """A result computed by one worker is reused by another."""
+        backend = DictBackend()
+        compute = extractor()
+        ExtractionCache(max_entries=8, ttl=60, backend=backend).extract(TRANSCRIPT, compute)
+
+        other = ExtractionCache(max_entries=8, ttl=60, backend=backend)
+        participants = other.extract(TRANSCRIPT, compute)
+
+        assert compute.call_count == 1
+        assert participants[0].role == "client"
+        assert other.stats()["shared_hits"] == 1
+
+    def test_backend_errors_fall_back_to_extraction(self):
+        """An unavailable backend counts an error and never fails extraction."""
+        backend = Mock(get=Mock(side_effect=ConnectionError("down")),
+                       set=Mock(side_effect=ConnectionError("down")))
+        backend.name = "fake"
+        cache = ExtractionCache(max_entries=8, ttl=60, backend=backend)
+
+        participants = cache.extract(TRANSCRIPT, extractor())
+
+        assert participants[0].name == "Alex Johnson"
+        assert cache.stats()["backend_errors"] == 2
+        assert cache.stats()["misses"] == 1
+
+    def test_async_extraction_skips_compute_on_hit(self):
+        """The async path awaits the extractor only on a miss."""
+        backend = DictBackend()
+        backend.values[ExtractionCache.key_for(TRANSCRIPT)] = serialize(
+            [ParticipantInfo("Priya Patel", "client", 0.8)]
+        )
+        cache = ExtractionCache(max_entries=8, ttl=60, backend=backend)
+        compute = Mock()
+
+        participants = run(cache.extract_async(TRANSCRIPT, compute))
+
+        compute.assert_not_called()
+        assert participants[0].name == "Priya Patel"
+
+
+class TestExtractionCacheEndpoint:
+    """Test cases for the cache statistics endpoint."""
+
+    def test_reports_stats(self):
+        with patch("src.routes.internal.settings.internal_endpoints_enabled", True):
+            response = TestClient(app).get("/internal/extraction-cache")
+
+        assert response.status_code == 200
+        for field in ["hits", "misses", "hit_ratio", "evictions", "expirations", "backend"]:
+            assert field in response.json()
+
+    def test_hidden_unless_enabled(self):
+        """Internal endpoints are off by default."""
+        response = TestClient(app).get("/internal/extraction-cache")
+
+        assert response.status_code == 404
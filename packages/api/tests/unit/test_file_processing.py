@@ -2,16 +2,23 @@
 Unit tests for file processing service.
 """
 
+import io
 import pytest
 import tempfile
 import os
-from unittest.mock import Mock, patch, AsyncMock
+from unittest.mock import patch
 
+import chardet
 from fastapi import UploadFile, HTTPException
 
 from src.services.file_processing import FileProcessingService
 
 
+def make_upload_file(filename, content: bytes) -> UploadFile:
+    """Build an UploadFile backed by an in-memory buffer."""
+    return UploadFile(file=io.BytesIO(content), filename=filename)
+
+
 class TestFileProcessingService:
     """Test cases for FileProcessingService."""
 
@@ -29,10 +36,7 @@ class TestFileProcessingService:
         try:
             # Create mock UploadFile
             with open(temp_file_path, 'rb') as file:
-                mock_upload_file = Mock(spec=UploadFile)
-                mock_upload_file.filename = "test.txt"
-                mock_upload_file.read = AsyncMock(return_value=file.read())
-                mock_upload_file.seek = AsyncMock()
+                mock_upload_file = make_upload_file("test.txt", file.read())
                 
                 result = await FileProcessingService.process_uploaded_file(mock_upload_file)
                 
@@ -59,10 +63,7 @@ class TestFileProcessingService:
         
         try:
             with open(temp_file_path, 'rb') as file:
-                mock_upload_file = Mock(spec=UploadFile)
-                mock_upload_file.filename = "test.docx"
-                mock_upload_file.read = AsyncMock(return_value=file.read())
-                mock_upload_file.seek = AsyncMock()
+                mock_upload_file = make_upload_file("test.docx", file.read())
                 
                 result = await FileProcessingService.process_uploaded_file(mock_upload_file)
                 
@@ -80,10 +81,7 @@ class TestFileProcessingService:
         # Create a large content string
         large_content = "A" * (FileProcessingService.MAX_FILE_SIZE + 1)
         
-        mock_upload_file = Mock(spec=UploadFile)
-        mock_upload_file.filename = "large.txt"
-        mock_upload_file.read = AsyncMock(return_value=large_content.encode())
-        mock_upload_file.seek = AsyncMock()
+        mock_upload_file = make_upload_file("large.txt", large_content.encode())
         
         with pytest.raises(HTTPException) as exc_info:
             await FileProcessingService.process_uploaded_file(mock_upload_file)
@@ -91,14 +89,40 @@ class TestFileProcessingService:
         assert exc_info.value.status_code == 413
         assert "too large" in exc_info.value.detail.lower()
 
+    @pytest.mark.asyncio
+    async def test_file_too_large_aborts_early(self):
+        """Test oversize uploads stop reading once the limit is crossed."""
+        
+        chunk_size = FileProcessingService.READ_CHUNK_SIZE
+        large_content = b"A" * (FileProcessingService.MAX_FILE_SIZE * 2)
+        mock_upload_file = make_upload_file("large.txt", large_content)
+        
+        with pytest.raises(HTTPException) as exc_info:
+            await FileProcessingService.process_uploaded_file(mock_upload_file)
+        
+        assert exc_info.value.status_code == 413
+        consumed = mock_upload_file.file.tell()
+        assert consumed <= FileProcessingService.MAX_FILE_SIZE + chunk_size
+
+    @pytest.mark.asyncio
+    async def test_upload_read_in_single_pass(self):
+        """Test the upload is read once in chunks without seeking back."""
+        
+        content = ("Coach Anna: Welcome back to our session. " * 10).encode()
+        mock_upload_file = make_upload_file("single.txt", content)
+        
+        with patch.object(FileProcessingService, "READ_CHUNK_SIZE", 16), \
+             patch.object(mock_upload_file, "seek") as mock_seek:
+            result = await FileProcessingService.process_uploaded_file(mock_upload_file)
+        
+        assert result == content.decode().strip()
+        mock_seek.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_unsupported_file_extension(self):
         """Test unsupported file type validation."""
         
-        mock_upload_file = Mock(spec=UploadFile)
-        mock_upload_file.filename = "test.pdf"
-        mock_upload_file.read = AsyncMock(return_value=b"test content")
-        mock_upload_file.seek = AsyncMock()
+        mock_upload_file = make_upload_file("test.pdf", b"test content")
         
         with pytest.raises(HTTPException) as exc_info:
             await FileProcessingService.process_uploaded_file(mock_upload_file)
@@ -110,10 +134,7 @@ class TestFileProcessingService:
     async def test_no_filename(self):
         """Test error when no filename is provided."""
         
-        mock_upload_file = Mock(spec=UploadFile)
-        mock_upload_file.filename = None
-        mock_upload_file.read = AsyncMock(return_value=b"test content")
-        mock_upload_file.seek = AsyncMock()
+        mock_upload_file = make_upload_file(None, b"test content")
         
         with pytest.raises(HTTPException) as exc_info:
             await FileProcessingService.process_uploaded_file(mock_upload_file)
@@ -127,10 +148,7 @@ class TestFileProcessingService:
         
         short_content = "Short"  # Less than 100 characters
         
-        mock_upload_file = Mock(spec=UploadFile)
-        mock_upload_file.filename = "short.txt"
-        mock_upload_file.read = AsyncMock(return_value=short_content.encode())
-        mock_upload_file.seek = AsyncMock()
+        mock_upload_file = make_upload_file("short.txt", short_content.encode())
         
         with pytest.raises(HTTPException) as exc_info:
             await FileProcessingService.process_uploaded_file(mock_upload_file)
@@ -145,10 +163,7 @@ class TestFileProcessingService:
         # Create content larger than MAX_TEXT_SIZE
         large_content = "A" * (FileProcessingService.MAX_TEXT_SIZE + 1)
         
-        mock_upload_file = Mock(spec=UploadFile)
-        mock_upload_file.filename = "large.txt"
-        mock_upload_file.read = AsyncMock(return_value=large_content.encode())
-        mock_upload_file.seek = AsyncMock()
+        mock_upload_file = make_upload_file("large.txt", large_content.encode())
         
         with pytest.raises(HTTPException) as exc_info:
             await FileProcessingService.process_uploaded_file(mock_upload_file)
@@ -162,10 +177,7 @@ class TestFileProcessingService:
         
         malicious_content = "This transcript contains <script>alert('xss')</script> and some normal coaching content."
         
-        mock_upload_file = Mock(spec=UploadFile)
-        mock_upload_file.filename = "malicious.txt"
-        mock_upload_file.read = AsyncMock(return_value=malicious_content.encode())
-        mock_upload_file.seek = AsyncMock()
+        mock_upload_file = make_upload_file("malicious.txt", malicious_content.encode())
         
         with pytest.raises(HTTPException) as exc_info:
             await FileProcessingService.process_uploaded_file(mock_upload_file)
@@ -179,10 +191,7 @@ class TestFileProcessingService:
         
         content = "Test content with UTF-8 characters: éñíñé"
         
-        mock_upload_file = Mock(spec=UploadFile)
-        mock_upload_file.filename = "utf8.txt"
-        mock_upload_file.read = AsyncMock(return_value=content.encode('utf-8'))
-        mock_upload_file.seek = AsyncMock()
+        mock_upload_file = make_upload_file("utf8.txt", content.encode('utf-8'))
         
         result = await FileProcessingService.process_uploaded_file(mock_upload_file)
         
@@ -194,10 +203,7 @@ class TestFileProcessingService:
         
         content = "Test content with Latin-1 characters"
         
-        mock_upload_file = Mock(spec=UploadFile)
-        mock_upload_file.filename = "latin1.txt"
-        mock_upload_file.read = AsyncMock(return_value=content.encode('latin-1'))
-        mock_upload_file.seek = AsyncMock()
+        mock_upload_file = make_upload_file("latin1.txt", content.encode('latin-1'))
         
         # Mock chardet to return latin-1 encoding
         with patch('src.services.file_processing.chardet.detect') as mock_detect:
@@ -214,10 +220,7 @@ class TestFileProcessingService:
         # Create invalid DOCX content
         invalid_docx_content = b"This is not a valid DOCX file"
         
-        mock_upload_file = Mock(spec=UploadFile)
-        mock_upload_file.filename = "invalid.docx"
-        mock_upload_file.read = AsyncMock(return_value=invalid_docx_content)
-        mock_upload_file.seek = AsyncMock()
+        mock_upload_file = make_upload_file("invalid.docx", invalid_docx_content)
         
         with pytest.raises(HTTPException) as exc_info:
             await FileProcessingService.process_uploaded_file(mock_upload_file)
@@ -273,4 +276,65 @@ class TestFileProcessingService:
                 FileProcessingService._scan_for_malicious_content(pattern)
             
             assert exc_info.value.status_code == 400
-            assert "malicious" in exc_info.value.detail.lower()
\ No newline at end of file
+            assert "malicious" in exc_info.value.detail.lower()
+
+class TestTieredDecoding:
+    """Test cases for tiered .txt encoding detection."""
+
+    TEXT = "Coach Maria: Bienvenue à la séance – “notes” from café réunion.\n" * 20
+
+    def test_bom_decides_encoding(self):
+        """Files with a byte order mark skip detection."""
+        for encoding in ["utf-8-sig", "utf-16", "utf-32"]:
+            with patch('src.services.file_processing.chardet.detect') as mock_detect:
+                decoded = FileProcessingService._decode_text(bytearray(self.TEXT.encode(encoding)))
+
+            assert (decoded.text, decoded.tier) == (self.TEXT, "bom")
+            mock_detect.assert_not_called()
+
+    def test_utf8_skips_detection(self):
+        """Valid UTF-8 is decoded without running chardet."""
+        with patch('src.services.file_processing.chardet.detect') as mock_detect:
+            decoded = FileProcessingService._decode_text(bytearray(self.TEXT.encode('utf-8')))
+
+        assert (decoded.text, decoded.tier) == (self.TEXT, "utf-8")
+        mock_detect.assert_not_called()
+
+    def test_utf16_without_bom(self):
+        """UTF-16 without a BOM is recognized from its NUL bytes."""
+        for encoding in ["utf-16-le", "utf-16-be"]:
+            decoded = FileProcessingService._decode_text(bytearray(self.TEXT.encode(encoding)))
+
+            assert (decoded.text, decoded.encoding) == (self.TEXT, encoding)
+
+    def test_large_cp1252_detected_from_sample(self):
+        """Detection runs on a bounded sample of large legacy-encoded files."""
+        content = bytearray((self.TEXT * 100).encode('cp1252'))
+
+        with patch(
+            'src.services.file_processing.chardet.detect', wraps=chardet.detect
+        ) as mock_detect:
+            decoded = FileProcessingService._decode_text(content)
+
+        assert decoded.text == self.TEXT * 100
+        assert decoded.tier == "sample"
+        assert len(mock_detect.call_args.args[0]) == FileProcessingService.DETECTION_SAMPLE_SIZE
+
+    def test_unsure_sample_falls_back_to_full_detection(self):
+        """A low-confidence sample guess is not trusted."""
+        content = bytearray((self.TEXT * 100).encode('cp1252'))
+        results = [{'encoding': 'ascii', 'confidence': 0.2}, {'encoding': 'cp1252', 'confidence': 0.7}]
+
+        with patch('src.services.file_processing.chardet.detect', side_effect=results) as mock_detect:
+            decoded = FileProcessingService._decode_text(content)
+
+        assert (decoded.encoding, decoded.tier) == ("cp1252", "full")
+        assert len(mock_detect.call_args.args[0]) == len(content)
+
+    def test_undecodable_content_is_replaced(self):
+        """Bytes no detected encoding can decode fall back to UTF-8 with replacement."""
+        with patch('src.services.file_processing.chardet.detect', return_value={'encoding': None}):
+            decoded = FileProcessingService._decode_text(bytearray(b"Coach \xff\xfe\xfa notes"))
+
+        assert decoded.tier == "fallback"
+        assert decoded.text.startswith("Coach ")
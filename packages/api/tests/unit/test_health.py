@@ -2,12 +2,45 @@
 Unit tests for health check endpoints.
 """
 
+import asyncio
+import threading
+
 import pytest
 from unittest.mock import Mock, patch
 from fastapi.testclient import TestClient
 from sqlalchemy.exc import DatabaseError
 
 from src.main import app
+from src.services.health import HealthProber, health_prober
+
+
+def make_prober(check=None, checked_out=0, **options) -> HealthProber:
+    settings = {
+        "interval": 60.0,
+        "cache_ttl": 15.0,
+        "timeout": 1.0,
+        "max_pool_saturation": 1.0,
+    }
+    settings.update(options)
+    return HealthProber(
+        check=check or (lambda: None),
+        pool_usage=lambda: {
+            "checked_out": checked_out,
+            "capacity": 10,
+            "saturation": checked_out / 10,
+        },
+        **settings,
+    )
+
+
+def probed(prober: HealthProber) -> HealthProber:
+    """Run one probe on a private loop, leaving the test's event loop alone."""
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(prober.refresh())
+    finally:
+        loop.close()
+    return prober
 
 
 class TestHealthEndpoints:
@@ -41,16 +74,16 @@ class TestHealthEndpoints:
         assert "version" in data
         assert "system" in data
     
-    @patch('src.routes.health.get_db')
-    def test_health_check_database_failure(self, mock_get_db, client: TestClient):
+    def test_health_check_database_failure(self, client: TestClient):
         """Test health check endpoint with database connection failure."""
         # Arrange
-        mock_session = Mock()
-        mock_session.execute.side_effect = DatabaseError("Connection failed", None, None)
-        mock_get_db.return_value.__next__ = Mock(return_value=mock_session)
+        failing_check = Mock(side_effect=DatabaseError("Connection failed", None, None))
         
         # Act
-        response = client.get("/health")
+        with patch.object(health_prober, "_check", failing_check):
+            health_prober.invalidate()
+            response = client.get("/health")
+        health_prober.invalidate()
         
         # Assert
         assert response.status_code == 503
@@ -79,4 +112,130 @@ class TestHealthEndpoints:
         # Verify system structure
         system_fields = ["api_name", "environment"]
         for field in system_fields:
-            assert field in data["system"]
\ No newline at end of file
+            assert field in data["system"]
+
+class TestHealthProber:
+    """Test cases for the background health prober."""
+
+    @pytest.mark.asyncio
+    async def test_result_is_cached_within_ttl(self):
+        """Repeated reads inside the TTL do not probe again."""
+        check = Mock()
+        prober = make_prober(check=check)
+
+        first = await prober.current()
+        second = await prober.current()
+
+        assert first is second
+        assert first.healthy is True
+        assert check.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_result_is_refreshed(self):
+        """A result older than the TTL triggers a new probe."""
+        check = Mock()
+        prober = make_prober(check=check, cache_ttl=0.0)
+
+        await prober.current()
+        await asyncio.sleep(0.01)
+        await prober.current()
+
+        assert check.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_refreshes_share_one_probe(self):
+        """Callers arriving during a probe wait for the same result."""
+        release = threading.Event()
+        check = Mock(side_effect=lambda: release.wait(1))
+        prober = make_prober(check=check)
+
+        pending = [asyncio.ensure_future(prober.current()) for _ in range(5)]
+        await asyncio.sleep(0.05)
+        release.set()
+        results = await asyncio.gather(*pending)
+
+        assert check.call_count == 1
+        assert all(result is results[0] for result in results)
+
+    @pytest.mark.asyncio
+    async def test_failure_and_timeout(self):
+        """Errors and slow probes are reported as unhealthy."""
+        failing = make_prober(check=Mock(side_effect=RuntimeError("refused")))
+        result = await failing.refresh()
+        assert result.healthy is False
+        assert result.error == "refused"
+
+        release = threading.Event()
+        slow = make_prober(check=lambda: release.wait(1), timeout=0.05)
+        result = await slow.refresh()
+        assert result.healthy is False
+        assert "timed out" in result.error
+
+        # The hung probe blocks new threads until it finishes
+        result = await slow.refresh()
+        assert "still running" in result.error
+        release.set()
+
+    @pytest.mark.asyncio
+    async def test_background_loop(self):
+        """start() probes in the background until stopped."""
+        check = Mock()
+        prober = make_prober(check=check, interval=0.01)
+
+        prober.start()
+        await asyncio.sleep(0.1)
+        await prober.stop()
+
+        assert check.call_count >= 2
+        assert prober.last_result.healthy is True
+
+
+class TestProbeEndpoints:
+    """Test cases for liveness and readiness endpoints."""
+
+    def test_liveness_has_no_dependencies(self):
+        """Liveness succeeds even when the database is down."""
+        prober = make_prober(check=Mock(side_effect=RuntimeError("down")))
+
+        with patch("src.routes.health.health_prober", prober):
+            response = TestClient(app).get("/health/live")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "alive"
+
+    def test_readiness_before_first_probe(self):
+        """Readiness fails fast instead of waiting for a probe."""
+        check = Mock()
+        prober = make_prober(check=check)
+
+        with patch("src.routes.health.health_prober", prober):
+            response = TestClient(app).get("/health/ready")
+
+        assert response.status_code == 503
+        assert "database not probed yet" in response.json()["reasons"]
+        assert check.call_count == 0
+
+    def test_readiness_reflects_cached_probe(self):
+        """Ready after a healthy probe, not ready after a failed one."""
+        healthy = probed(make_prober())
+        failing = probed(make_prober(check=Mock(side_effect=RuntimeError("down"))))
+
+        with patch("src.routes.health.health_prober", healthy):
+            ready = TestClient(app).get("/health/ready")
+        with patch("src.routes.health.health_prober", failing):
+            not_ready = TestClient(app).get("/health/ready")
+
+        assert ready.status_code == 200
+        assert ready.json()["status"] == "ready"
+        assert not_ready.status_code == 503
+        assert "database unhealthy: down" in not_ready.json()["reasons"]
+
+    def test_readiness_fails_when_pool_saturated(self):
+        """An exhausted connection pool takes the instance out of rotation."""
+        prober = probed(make_prober(checked_out=10))
+
+        with patch("src.routes.health.health_prober", prober):
+            response = TestClient(app).get("/health/ready")
+
+        assert response.status_code == 503
+        assert "connection pool saturated" in response.json()["reasons"]
@@ -0,0 +1,137 @@
+"""
+Unit tests for HTTP metrics middleware and Prometheus exposition.
+"""
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from src.monitoring.exposition import render
+from src.monitoring.metrics import MetricsRegistry
+from src.monitoring.middleware import (
+    UNMATCHED_ROUTE,
+    MetricsMiddleware,
+    request_duration_seconds,
+    request_size_bytes,
+    requests_in_flight,
+    response_size_bytes,
+)
+
+
+def make_app() -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(MetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"item_id": item_id}
+
+    @app.post("/echo")
+    async def echo(request: Request):
+        return {"size": len(await request.body())}
+
+    return app
+
+
+class TestExposition:
+    """Test cases for the Prometheus text format."""
+
+    def test_renders_counters_gauges_and_histograms(self):
+        """Each family gets HELP/TYPE lines and labelled samples."""
+        registry = MetricsRegistry()
+        registry.counter("jobs_total", "Jobs run", ["queue"]).labels("default").inc(3)
+        registry.gauge("workers", "Busy workers").labels().set_function(lambda: 2.5)
+        latency = registry.histogram("latency_seconds", "Latency", buckets=(0.1, 1.0))
+        latency.labels().observe(0.05)
+        latency.labels().observe(0.5)
+        latency.labels().observe(5)
+
+        text = render(registry)
+
+        assert "# TYPE jobs_total counter" in text
+        assert 'jobs_total{queue="default"} 3' in text
+        assert "workers 2.5" in text
+        assert "# TYPE latency_seconds histogram" in text
+        assert 'latency_seconds_bucket{le="0.1"} 1' in text
+        assert 'latency_seconds_bucket{le="1"} 2' in text
+        assert 'latency_seconds_bucket{le="+Inf"} 3' in text
+        assert "latency_seconds_sum 5.55" in text
+        assert "latency_seconds_count 3" in text
+        assert text.endswith("\n")
+
+    def test_escapes_label_values(self):
+        """Quotes, backslashes and newlines in labels are escaped."""
+        registry = MetricsRegistry()
+        registry.counter("odd_total", "Odd labels", ["value"]).labels('a"b\\c\nd').inc()
+
+        assert 'odd_total{value="a\\"b\\\\c\\nd"} 1' in render(registry)
+
+    def test_skips_families_without_children(self):
+        """Families that were never observed are left out."""
+        registry = MetricsRegistry()
+        registry.counter("unused_total", "Never incremented", ["reason"])
+
+        assert render(registry) == "\n"
+
+
+class TestMetricsMiddleware:
+    """Test cases for per-route HTTP metrics."""
+
+    def test_records_latency_by_route_template(self):
+        """Path parameters collapse onto the route template."""
+        client = TestClient(make_app())
+        before = request_duration_seconds.labels("GET", "/items/{item_id}", "200")
+        count_before = before.snapshot().count
+
+        client.get("/items/1")
+        client.get("/items/2")
+
+        assert before.snapshot().count == count_before + 2
+
+    def test_records_status_and_unmatched_routes(self):
+        """Unknown paths share one label instead of one per path."""
+        client = TestClient(make_app())
+        unmatched = request_duration_seconds.labels("GET", UNMATCHED_ROUTE, "404")
+        invalid = request_duration_seconds.labels("GET", "/items/{item_id}", "422")
+        unmatched_before = unmatched.snapshot().count
+        invalid_before = invalid.snapshot().count
+
+        client.get("/does-not-exist-1")
+        client.get("/does-not-exist-2")
+        client.get("/items/not-a-number")
+
+        assert unmatched.snapshot().count == unmatched_before + 2
+        assert invalid.snapshot().count == invalid_before + 1
+
+    def test_records_body_sizes(self):
+        """Request and response bodies are measured as they stream."""
+        client = TestClient(make_app())
+        requests = request_size_bytes.labels("POST", "/echo")
+        responses = response_size_bytes.labels("POST", "/echo")
+        request_sum = requests.snapshot().sum
+        response_sum = responses.snapshot().sum
+
+        response = client.post("/echo", content=b"x" * 2048)
+
+        assert requests.snapshot().sum == request_sum + 2048
+        assert responses.snapshot().sum == response_sum + len(response.content)
+
+    def test_in_flight_returns_to_zero(self):
+        """The in-flight gauge is released after each request."""
+        client = TestClient(make_app())
+        before = requests_in_flight.labels("GET").value
+
+        client.get("/items/1")
+
+        assert requests_in_flight.labels("GET").value == before
+
+    def test_metrics_endpoint_serves_exposition(self):
+        """The application's /metrics endpoint uses the text format."""
+        from src.main import app
+
+        client = TestClient(app)
+        client.get("/")
+        response = client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        assert 'http_request_duration_seconds_bucket{method="GET",route="/"' in response.text
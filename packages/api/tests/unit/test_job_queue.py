@@ -0,0 +1,338 @@
+"""
+Unit tests for the job queue, worker and session processing handler.
+"""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+from uuid import uuid4
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from src.jobs.handlers import (
+    STATUS_FAILED,
+    STATUS_PROCESSED,
+    STATUS_PROCESSING,
+    STATUS_RETRYING,
+    SessionProcessingHandler,
+)
+from src.jobs.queue import DatabaseJobQueue, InMemoryJobQueue, Job
+from src.jobs.worker import JobWorker
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class RecordingHandler:
+    """Handler that fails a configurable number of times."""
+
+    kind = "test"
+
+    def __init__(self, failures: int = 0, delay: float = 0.0):
+        self.failures = failures
+        self.delay = delay
+        self.runs = 0
+        self.retried = []
+        self.failed_jobs = []
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.Lock()
+
+    def run(self, job: Job) -> None:
+        with self._lock:
+            self.runs += 1
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        try:
+            if self.delay:
+                threading.Event().wait(self.delay)
+            if self.runs <= self.failures:
+                raise RuntimeError("boom")
+        finally:
+            with self._lock:
+                self.running -= 1
+
+    def retrying(self, job: Job, error: str) -> None:
+        self.retried.append(error)
+
+    def failed(self, job: Job, error: str) -> None:
+        self.failed_jobs.append(error)
+
+
+def make_worker(queue, handler, **options) -> JobWorker:
+    settings = {"concurrency": 2, "poll_interval": 0.01, "visibility_timeout": 30.0}
+    settings.update(options)
+    return JobWorker(queue, [handler], worker_id="worker-1", **settings)
+
+
+class TestInMemoryJobQueue:
+    """Test cases for claim, visibility and fencing semantics."""
+
+    def test_claimed_jobs_are_invisible_until_timeout(self):
+        """A claim hides the job; it reappears after the visibility timeout."""
+        clock = FakeClock()
+        queue = InMemoryJobQueue(clock=clock)
+        job_id = queue.enqueue("test", {})
+
+        first = queue.claim("a", limit=10, visibility_timeout=30)
+        assert [job.id for job in first] == [job_id]
+        assert queue.claim("b", limit=10, visibility_timeout=30) == []
+
+        clock.now += 31
+        second = queue.claim("b", limit=10, visibility_timeout=30)
+        assert [job.attempts for job in second] == [2]
+
+    def test_stale_claim_cannot_complete(self):
+        """Only the latest claim may report an outcome."""
+        clock = FakeClock()
+        queue = InMemoryJobQueue(clock=clock)
+        queue.enqueue("test", {})
+        stale = queue.claim("a", limit=1, visibility_timeout=30)[0]
+        clock.now += 31
+        current = queue.claim("b", limit=1, visibility_timeout=30)[0]
+
+        assert queue.complete(stale) is False
+        assert queue.complete(current) is True
+        assert queue.stats() == {"succeeded": 1}
+
+    def test_retry_is_delayed(self):
+        """A failed attempt becomes claimable only after its retry delay."""
+        clock = FakeClock()
+        queue = InMemoryJobQueue(clock=clock)
+        job_id = queue.enqueue("test", {})
+        job = queue.claim("a", limit=1, visibility_timeout=30)[0]
+
+        assert queue.fail(job, "boom", retry_in=5) is True
+        assert queue.claim("a", limit=1, visibility_timeout=30) == []
+        clock.now += 5
+        assert queue.claim("a", limit=1, visibility_timeout=30)[0].id == job_id
+        assert queue.last_error(job_id) == "boom"
+
+    @pytest.mark.asyncio
+    async def test_async_enqueue(self):
+        """The async enqueue operations queue claimable jobs."""
+        queue = InMemoryJobQueue(clock=FakeClock())
+
+        job_id = await queue.enqueue_async("test", {}, session_id=uuid4())
+        await queue.enqueue_many_async("test", [uuid4()])
+
+        assert queue.status(job_id) == "queued"
+        assert queue.stats() == {"queued": 2}
+
+    def test_claim_respects_limit(self):
+        """Claims return at most ``limit`` jobs, oldest first."""
+        queue = InMemoryJobQueue()
+        ids = [queue.enqueue("test", {"n": n}) for n in range(5)]
+
+        claimed = queue.claim("a", limit=3, visibility_timeout=30)
+
+        assert [job.id for job in claimed] == ids[:3]
+
+
+class TestDatabaseJobQueue:
+    """Test cases for the SQL the database queue issues."""
+
+    def test_claim_uses_skip_locked(self):
+        """Claims lock candidate rows with SKIP LOCKED in a single UPDATE."""
+        session = MagicMock()
+        session.__enter__.return_value = session
+        session.execute.return_value.all.return_value = []
+        queue = DatabaseJobQueue(lambda: session)
+
+        queue.claim("worker-1", limit=4, visibility_timeout=60)
+
+        statement = session.execute.call_args[0][0]
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        assert sql.startswith("UPDATE processing_jobs")
+        assert "FOR UPDATE SKIP LOCKED" in sql
+        assert "RETURNING" in sql
+        session.commit.assert_called_once()
+
+    def test_enqueue_joins_callers_transaction(self):
+        """With a caller's session the insert is not committed separately."""
+        factory = Mock()
+        db = Mock()
+        queue = DatabaseJobQueue(factory)
+
+        queue.enqueue("test", {}, session_id=uuid4(), db=db)
+
+        db.execute.assert_called_once()
+        db.commit.assert_not_called()
+        factory.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_async_enqueue_joins_callers_transaction(self):
+        """Async enqueues insert through the caller's AsyncSession without committing."""
+        factory = Mock()
+        db = AsyncMock()
+        queue = DatabaseJobQueue(factory)
+
+        await queue.enqueue_async("test", {}, session_id=uuid4(), db=db)
+        count = await queue.enqueue_many_async("test", [uuid4(), uuid4()], db=db)
+
+        assert count == 2
+        assert db.execute.await_count == 2
+        db.commit.assert_not_awaited()
+        factory.assert_not_called()
+
+
+class TestJobWorker:
+    """Test cases for JobWorker."""
+
+    @pytest.mark.asyncio
+    async def test_successful_job_completes(self):
+        """A job whose handler succeeds is marked succeeded."""
+        queue = InMemoryJobQueue()
+        job_id = queue.enqueue("test", {})
+        handler = RecordingHandler()
+
+        assert await make_worker(queue, handler).run_once() == 1
+
+        assert queue.status(job_id) == "succeeded"
+        assert handler.runs == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_attempt_is_retried_with_backoff(self):
+        """Failures re-queue the job with exponential backoff."""
+        clock = FakeClock()
+        queue = InMemoryJobQueue(clock=clock)
+        job_id = queue.enqueue("test", {}, max_attempts=3)
+        handler = RecordingHandler(failures=1)
+        worker = make_worker(queue, handler, backoff_base=2.0, backoff_max=60.0)
+
+        await worker.run_once()
+        assert queue.status(job_id) == "queued"
+        assert handler.retried == ["RuntimeError: boom"]
+        assert await worker.run_once() == 0
+
+        clock.now += 2
+        await worker.run_once()
+        assert queue.status(job_id) == "succeeded"
+
+    def test_retry_delay_grows_and_is_capped(self):
+        """Backoff doubles per attempt, jittered down to half, up to the cap."""
+        worker = make_worker(InMemoryJobQueue(), RecordingHandler(), backoff_max=10.0)
+
+        for attempts, full in [(1, 2.0), (3, 8.0), (10, 10.0)]:
+            delay = worker.retry_delay(attempts)
+            assert full / 2 <= delay <= full
+
+    @pytest.mark.asyncio
+    async def test_exhausted_job_fails(self):
+        """The last failed attempt fails the job and notifies the handler."""
+        queue = InMemoryJobQueue()
+        job_id = queue.enqueue("test", {}, max_attempts=1)
+        handler = RecordingHandler(failures=5)
+
+        await make_worker(queue, handler).run_once()
+
+        assert queue.status(job_id) == "failed"
+        assert handler.failed_jobs == ["RuntimeError: boom"]
+        assert handler.retried == []
+
+    @pytest.mark.asyncio
+    async def test_expired_final_claim_fails_without_running(self):
+        """A job reclaimed after its last attempt timed out is not run again."""
+        clock = FakeClock()
+        queue = InMemoryJobQueue(clock=clock)
+        job_id = queue.enqueue("test", {}, max_attempts=1)
+        queue.claim("crashed-worker", limit=1, visibility_timeout=30)
+        clock.now += 31
+        handler = RecordingHandler()
+
+        await make_worker(queue, handler).run_once()
+
+        assert handler.runs == 0
+        assert queue.status(job_id) == "failed"
+        assert handler.failed_jobs
+
+    @pytest.mark.asyncio
+    async def test_unknown_kind_fails(self):
+        """Jobs without a registered handler fail permanently."""
+        queue = InMemoryJobQueue()
+        job_id = queue.enqueue("unknown", {})
+
+        await make_worker(queue, RecordingHandler()).run_once()
+
+        assert queue.status(job_id) == "failed"
+
+    @pytest.mark.asyncio
+    async def test_run_respects_concurrency(self):
+        """No more than ``concurrency`` handlers run at once."""
+        queue = InMemoryJobQueue()
+        for _ in range(6):
+            queue.enqueue("test", {})
+        handler = RecordingHandler(delay=0.02)
+        worker = make_worker(queue, handler, concurrency=2)
+        stop = asyncio.Event()
+
+        task = asyncio.ensure_future(worker.run(stop))
+        for _ in range(200):
+            if queue.stats().get("succeeded") == 6:
+                break
+            await asyncio.sleep(0.01)
+        stop.set()
+        await task
+
+        assert queue.stats() == {"succeeded": 6}
+        assert handler.max_running == 2
+
+
+class TestSessionProcessingHandler:
+    """Test cases for session status transitions."""
+
+    def make_handler(self, steps=()):
+        db = MagicMock()
+        db.__enter__.return_value = db
+        return SessionProcessingHandler(lambda: db, steps=steps), db
+
+    def test_run_moves_session_to_processed(self):
+        """A successful run passes through processing to processed."""
+        step = Mock()
+        handler, db = self.make_handler(steps=[step])
+        job = Job(id=uuid4(), kind=handler.kind, session_id=uuid4(), attempts=1)
+
+        with patch("src.jobs.handlers.SessionRepository") as sessions, patch(
+            "src.jobs.handlers.TranscriptRepository"
+        ) as transcripts:
+            sessions.return_value.update_processing_status.return_value = True
+            transcripts.return_value.get_transcript_text.return_value = "Coach Jane: Hi"
+            handler.run(job)
+
+        statuses = [
+            call.args[1]
+            for call in sessions.return_value.update_processing_status.call_args_list
+        ]
+        assert statuses == [STATUS_PROCESSING, STATUS_PROCESSED]
+        step.assert_called_once_with(db, job.session_id, "Coach Jane: Hi")
+
+    def test_missing_session_raises(self):
+        """A job for a deleted session fails the attempt."""
+        handler, _ = self.make_handler()
+        job = Job(id=uuid4(), kind=handler.kind, session_id=uuid4(), attempts=1)
+
+        with patch("src.jobs.handlers.SessionRepository") as sessions:
+            sessions.return_value.update_processing_status.return_value = False
+            with pytest.raises(LookupError):
+                handler.run(job)
+
+    def test_retry_and_failure_statuses(self):
+        """Retries and final failures are reflected on the session."""
+        handler, _ = self.make_handler()
+        job = Job(id=uuid4(), kind=handler.kind, session_id=uuid4(), attempts=1)
+
+        with patch("src.jobs.handlers.SessionRepository") as sessions:
+            handler.retrying(job, "boom")
+            handler.failed(job, "boom")
+
+        statuses = [
+            call.args[1]
+            for call in sessions.return_value.update_processing_status.call_args_list
+        ]
+        assert statuses == [STATUS_RETRYING, STATUS_FAILED]
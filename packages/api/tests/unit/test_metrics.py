@@ -0,0 +1,139 @@
+"""
+Unit tests for in-process metrics and pool instrumentation.
+"""
+
+import threading
+import time
+
+import pytest
+from sqlalchemy import create_engine, event, exc, text
+
+from src.monitoring.metrics import Counter, Gauge, Histogram, MetricsRegistry
+from src.monitoring.pool import InstrumentedQueuePool, instrument_engine, pool_stats
+
+
+class TestMetrics:
+    """Test cases for counters, gauges and histograms."""
+
+    def test_counter_sums_threads(self):
+        """Increments from many threads are all counted."""
+        counter = Counter()
+
+        def work():
+            for _ in range(1000):
+                counter.inc()
+
+        threads = [threading.Thread(target=work) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert counter.value == 8000
+
+    def test_gauge_inc_dec_and_callback(self):
+        """Gauges track deltas or report a bound callback."""
+        gauge = Gauge()
+        gauge.inc(3)
+        gauge.dec()
+        assert gauge.value == 2
+
+        gauge.set_function(lambda: 7)
+        assert gauge.value == 7
+
+    def test_histogram_buckets_and_quantiles(self):
+        """Observations land in buckets and quantiles interpolate within them."""
+        histogram = Histogram(buckets=(1.0, 2.0, 4.0))
+        for value in (0.5, 1.5, 1.5, 3.0, 10.0):
+            histogram.observe(value)
+
+        snapshot = histogram.snapshot()
+
+        assert snapshot.count == 5
+        assert snapshot.sum == pytest.approx(16.5)
+        assert snapshot.cumulative() == [(1.0, 1), (2.0, 3), (4.0, 4), (float("inf"), 5)]
+        assert 1.0 <= snapshot.quantile(0.5) <= 2.0
+        assert snapshot.quantile(0.99) == 4.0
+
+    def test_registry_returns_existing_family(self):
+        """Registering the same metric twice returns the original family."""
+        metrics = MetricsRegistry()
+        first = metrics.counter("uploads_total", "Uploads", ["kind"])
+
+        assert metrics.counter("uploads_total", "Uploads", ["kind"]) is first
+        with pytest.raises(ValueError):
+            metrics.gauge("uploads_total", "Uploads", ["kind"])
+
+    def test_labels_must_match(self):
+        """Children need one value per label name."""
+        family = MetricsRegistry().counter("requests_total", "Requests", ["route"])
+
+        with pytest.raises(ValueError):
+            family.labels("a", "b")
+
+
+class TestPoolInstrumentation:
+    """Test cases for connection pool telemetry."""
+
+    def make_engine(self, tmp_path, name, **options):
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'pool.db'}",
+            poolclass=InstrumentedQueuePool,
+            **options,
+        )
+        instrument_engine(engine, name)
+        return engine
+
+    def test_checkout_wait_and_gauges(self, tmp_path):
+        """Checkouts are timed and the in-use gauge follows the pool."""
+        engine = self.make_engine(tmp_path, "test-gauges", pool_size=2)
+
+        with engine.connect() as connection:
+            connection.execute(text("SELECT 1"))
+            stats = pool_stats()["test-gauges"]
+            assert stats["checked_out"] == 1
+
+        stats = pool_stats()["test-gauges"]
+        assert stats["checked_out"] == 0
+        assert stats["checked_in"] == 1
+        assert stats["events"]["connect"] == 1
+        assert stats["checkout_wait_ms"]["count"] == 1
+        engine.dispose()
+
+    def test_connect_time_is_not_checkout_wait(self, tmp_path):
+        """Opening a new connection is timed separately from waiting on the pool."""
+        engine = self.make_engine(tmp_path, "test-connect", pool_size=1)
+        event.listen(engine, "do_connect", lambda *args: time.sleep(0.05))
+
+        with engine.connect():
+            pass
+
+        stats = pool_stats()["test-connect"]
+        assert stats["connect_ms"]["sum"] >= 50
+        assert stats["checkout_wait_ms"]["count"] == 1
+        assert stats["checkout_wait_ms"]["sum"] < 50
+        engine.dispose()
+
+    def test_checkout_timeout_counted(self, tmp_path):
+        """Exhausting the pool records a timeout."""
+        engine = self.make_engine(
+            tmp_path, "test-timeout", pool_size=1, max_overflow=0, pool_timeout=0.05
+        )
+
+        with engine.connect():
+            with pytest.raises(exc.TimeoutError):
+                engine.connect()
+
+        assert pool_stats()["test-timeout"]["checkout_timeouts"] == 1
+        engine.dispose()
+
+    def test_recreated_pool_stays_instrumented(self, tmp_path):
+        """dispose() swaps the pool without losing instrumentation."""
+        engine = self.make_engine(tmp_path, "test-recreate", pool_size=1)
+        engine.dispose()
+
+        with engine.connect():
+            pass
+
+        assert pool_stats()["test-recreate"]["checkout_wait_ms"]["count"] == 1
+        engine.dispose()
@@ -3,7 +3,11 @@ Unit tests for participant extraction service.
 """
 
 import pytest
-from src.services.participant_extraction import ParticipantExtractor, ParticipantInfo
+from src.services.participant_extraction import (
+    ParticipantExtractor,
+    ParticipantInfo,
+    _is_plausible_name,
+)
 
 
 class TestParticipantExtractor:
@@ -142,6 +146,44 @@ class TestParticipantExtractor:
         assert len(participants) == 1
         assert "Sarah Wilson" in participants[0].name
 
+    def test_speaker_names_do_not_span_lines(self):
+        """Test that a label is only read from its own line."""
+        
+        transcript = """
+        Anna Lee: we covered goals
+        and next steps
+        Mark Brown: sounds good
+        """
+        
+        names = ParticipantExtractor.extract_simple_names(transcript)
+        
+        assert sorted(names) == ["Anna Lee", "Mark Brown"]
+
+    def test_timestamp_and_honorific_prefixes(self):
+        """Test labels preceded by timestamps or honorifics."""
+        
+        transcript = """
+        [00:01:05] Coach Nina: Let's begin.
+        00:01:12 - Omar Haddad: Ready when you are.
+        Dr. Wilson: I'll observe today.
+        """
+        
+        names = ParticipantExtractor.extract_simple_names(transcript)
+        
+        assert sorted(names) == ["Nina", "Omar Haddad", "Wilson"]
+
+    def test_name_validation_is_memoized(self):
+        """Test repeated names reuse cached validation results."""
+        
+        _is_plausible_name.cache_clear()
+        
+        transcript = "\n".join(["Alice Cooper: Hello there."] * 50)
+        ParticipantExtractor.extract_participants(transcript)
+        
+        info = _is_plausible_name.cache_info()
+        assert info.misses == 1
+        assert info.hits == 49
+
     def test_name_validation_edge_cases(self):
         """Test name validation with edge cases."""
         
@@ -290,6 +332,48 @@ class TestParticipantExtractor:
         assert coach.role == "coach"
         assert coach.confidence > 0.7  # Should have high confidence due to "Therapist" indicator
 
+    def test_role_indicator_window_and_line(self):
+        """Test coach indicators only count within the window on the same line."""
+        
+        participants = [
+            ParticipantInfo("Nina"),
+            ParticipantInfo("Omar"),
+            ParticipantInfo("Paul"),
+        ]
+        transcript = (
+            "Nina is the coach for today.\n"
+            "Omar: I asked my coach\n"
+            "about it. Paul" + " " * 60 + "therapist\n"
+        )
+        
+        ParticipantExtractor._assign_roles(participants, transcript)
+        
+        roles = {p.name: p.role for p in participants}
+        assert roles == {"Nina": "coach", "Omar": "coach", "Paul": "participant"}
+
+    def test_role_names_match_whole_words(self):
+        """Test a name inside a longer word is not treated as an occurrence."""
+        
+        participants = [ParticipantInfo("Ann")]
+        
+        ParticipantExtractor._assign_roles(participants, "Planning with the coach")
+        
+        assert participants[0].role == "participant"
+
+    def test_role_assignment_many_speakers(self):
+        """Test role assignment across a large group workshop."""
+        
+        speakers = [f"Member {chr(65 + i // 26)}{chr(97 + i % 26)}" for i in range(60)]
+        lines = ["Coach Grace: Welcome everyone."]
+        lines += [f"{name}: Glad to be here." for name in speakers]
+        
+        participants = ParticipantExtractor.extract_participants("\n".join(lines))
+        
+        roles = {p.name: p.role for p in participants}
+        assert len(participants) == 61
+        assert roles["Grace"] == "coach"
+        assert all(roles[name] == "participant" for name in speakers)
+
     def test_select_best_participant_logic(self):
         """Test the logic for selecting the best participant from similar names."""
         
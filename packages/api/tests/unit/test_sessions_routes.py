@@ -41,6 +41,7 @@ class TestSessionUploadTextEndpoint:
                 next_steps="Session ready for AI analysis"
             )
             mock_service.create_session_from_upload.return_value = mock_response
+            mock_service.find_duplicate_upload.return_value = None
             
             # Test data
             upload_data = {
@@ -110,6 +111,7 @@ class TestSessionUploadTextEndpoint:
             
             # Mock service error
             mock_service.create_session_from_upload.side_effect = Exception("Service error")
+            mock_service.find_duplicate_upload.return_value = None
             
             upload_data = {
                 "transcript_text": "A" * 200,
@@ -147,6 +149,7 @@ class TestSessionUploadFileEndpoint:
                 next_steps="Session ready for AI analysis"
             )
             mock_service.create_session_from_upload.return_value = mock_response
+            mock_service.find_duplicate_upload.return_value = None
             
             # Create test file
             with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
@@ -0,0 +1,173 @@
+"""
+Unit tests for per-speaker talk metrics.
+"""
+
+from unittest.mock import MagicMock, Mock, patch
+from uuid import uuid4
+
+from src.repositories.clients import BulkResolutionResult, ClientResolution, session_link_rows
+from src.services.batch_ingestion import ParsedTranscript, session_links
+from src.services.participant_extraction import ParticipantExtractor, ParticipantInfo
+from src.services.session_management import SessionManagementService
+from src.services.speaker_metrics import (
+    SpeakerTally,
+    client_metrics,
+    engagement_level,
+    parse_timestamp,
+)
+
+TIMED_TRANSCRIPT = (
+    "[00:00:05] Coach Maria: Welcome back everyone, how was the week for you all?\n"
+    "[00:00:20] Alex Johnson: Busy, but good.\n"
+    "[00:00:25] Priya Patel: I struggled with the morning routine this week.\n"
+    "[00:01:10] Coach Maria: Thanks Priya. Alex?\n"
+    "[00:01:15] Alex Johnson: Kept it going.\n"
+)
+
+
+def by_name(participants):
+    return {p.name: p for p in participants}
+
+
+class TestSpeakerTally:
+    """Test cases for tallying turns."""
+
+    def test_timestamps(self):
+        """Timestamps parse as hours, minutes and seconds with fractions."""
+        assert parse_timestamp("01:02:03") == 3723
+        assert parse_timestamp("12:03") == 723
+        assert parse_timestamp("00:00:01,5") == 1.5
+        assert parse_timestamp(None) is None
+
+    def test_timed_turns_use_gap_to_next_turn(self):
+        """A turn lasts until the next timestamp; the last one is estimated."""
+        tally = SpeakerTally()
+        tally.add_turn("Alex", "00:00:10", 30)
+        tally.add_turn("Priya", "00:00:40", 150)
+        tally.add_turn("Alex", None, 75)
+
+        stats = tally.finish()
+
+        assert (stats["Alex"].word_count, stats["Alex"].turn_count) == (105, 2)
+        # 30s timed, then 75 words at 150 words per minute
+        assert stats["Alex"].seconds == 60
+        # Next turn has no timestamp: 150 words estimated at one minute
+        assert stats["Priya"].seconds == 60
+
+    def test_engagement_levels(self):
+        """Levels compare a speaker's share with an even split."""
+        assert engagement_level(50, 5, 100, 10, 2) == "high"
+        assert engagement_level(15, 2, 100, 10, 2) == "medium"
+        assert engagement_level(2, 1, 100, 20, 2) == "low"
+        assert engagement_level(0, 0, 100, 10, 2) == "unknown"
+
+
+class TestExtractionMetrics:
+    """Test cases for metrics gathered by participant extraction."""
+
+    def test_participants_carry_metrics(self):
+        """Word and turn counts and speaking time come from the speaker scan."""
+        participants = by_name(ParticipantExtractor.extract_participants(TIMED_TRANSCRIPT))
+
+        alex = participants["Alex Johnson"]
+        assert (alex.word_count, alex.turn_count) == (6, 2)
+        # 5s to the next timestamp, then 2 words at 150 words per minute
+        assert alex.speaking_time_seconds == 6
+        assert participants["Priya Patel"].speaking_time_seconds == 45
+        assert all(p.engagement_level != "unknown" for p in participants.values())
+
+    def test_name_variants_are_merged(self):
+        """Turns under an honorific variant count for the same participant."""
+        transcript = (
+            "Alex Johnson: One two three four.\n"
+            "Priya Patel: One two.\n"
+            "Dr. Priya Patel: Three four five six.\n"
+        )
+
+        priya = by_name(ParticipantExtractor.extract_participants(transcript))["Priya Patel"]
+
+        assert (priya.word_count, priya.turn_count) == (6, 2)
+
+    def test_untimed_transcript_is_estimated(self):
+        """Without timestamps, speaking time is estimated from word counts."""
+        transcript = "Alex Johnson: " + "word " * 300 + "\nPriya Patel: Short.\n"
+
+        participants = by_name(ParticipantExtractor.extract_participants(transcript))
+
+        assert participants["Alex Johnson"].speaking_time_seconds == 120
+        assert participants["Alex Johnson"].engagement_level == "high"
+        assert participants["Priya Patel"].engagement_level == "medium"
+
+
+class TestPersistedMetrics:
+    """Test cases for writing metrics with the client links."""
+
+    def test_client_metrics_by_client_id(self):
+        """Metrics are keyed by the client each participant resolved to."""
+        client_id = uuid4()
+        resolutions = {"Alex": ClientResolution("Alex", client_id, "Alex Johnson", False)}
+        participants = [
+            ParticipantInfo("Alex", speaking_time_seconds=42, engagement_level="high"),
+            ParticipantInfo("Unresolved", speaking_time_seconds=7, engagement_level="low"),
+        ]
+
+        assert client_metrics(participants, resolutions) == ({client_id: 42}, {client_id: "high"})
+
+    def test_link_rows_per_session(self):
+        """Batch link rows carry each session's metrics, defaulting the level."""
+        session_id, alex, priya = uuid4(), uuid4(), uuid4()
+
+        rows = session_link_rows(
+            {session_id: [alex, priya]},
+            engagement_level="unknown",
+            speaking_time_seconds={session_id: {alex: 30}},
+            engagement_levels={session_id: {alex: "high"}},
+        )
+
+        metrics = {row["client_id"]: (row["speaking_time_seconds"], row["engagement_level"]) for row in rows}
+        assert metrics == {alex: (30, "high"), priya: (None, "unknown")}
+
+    def test_upload_writes_metrics_in_link_insert(self):
+        """A single upload stores speaking time and engagement with its links."""
+        db = Mock()
+        service = SessionManagementService(db, job_queue=Mock())
+        client_id = uuid4()
+        service.client_repo = Mock()
+        service.client_repo.resolve_clients_bulk.return_value = BulkResolutionResult(
+            resolutions={"Alex Johnson": ClientResolution("Alex Johnson", client_id, "Alex Johnson", True)},
+            round_trips=1,
+        )
+        service.client_session_repo = Mock()
+        participants = [
+            ParticipantInfo("Maria", role="coach", speaking_time_seconds=90, engagement_level="high"),
+            ParticipantInfo("Alex Johnson", speaking_time_seconds=30, engagement_level="medium"),
+        ]
+
+        with patch("src.services.session_management.QueryCounter", return_value=MagicMock()):
+            service._process_participants(participants, uuid4(), uuid4())
+
+        kwargs = service.client_session_repo.create_client_sessions_bulk.call_args.kwargs
+        assert kwargs["speaking_time_seconds"] == {client_id: 30}
+        assert kwargs["engagement_levels"] == {client_id: "medium"}
+
+    def test_batch_links_carry_metrics(self):
+        """Batch sessions are linked with their transcripts' metrics; coaches are skipped."""
+        client_id = uuid4()
+        session = Mock(id=uuid4())
+        transcript = ParsedTranscript(
+            filename="a.txt",
+            session_date=None,
+            participants=[
+                ParticipantInfo("Maria", role="coach", speaking_time_seconds=90),
+                ParticipantInfo("Alex Johnson", speaking_time_seconds=30, engagement_level="low"),
+            ],
+        )
+        resolutions = {
+            "Alex Johnson": ClientResolution("Alex Johnson", client_id, "Alex Johnson", True)
+        }
+
+        links, speaking_times, levels = session_links([session], [transcript], resolutions)
+
+        assert links == {session.id: [client_id]}
+        assert speaking_times == {session.id: {client_id: 30}}
+        assert levels == {session.id: {client_id: "low"}}
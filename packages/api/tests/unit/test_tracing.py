@@ -0,0 +1,153 @@
+"""
+Unit tests for request tracing spans and the tracing middleware.
+"""
+
+import logging
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from src.monitoring.middleware import TracingMiddleware
+from src.monitoring.tracing import current_trace, end_trace, span, start_trace, traced
+from src.services.executor import WorkloadExecutor
+
+
+def make_app(server_timing: bool) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(TracingMiddleware, server_timing=server_timing)
+
+    @app.get("/work")
+    async def work():
+        with span("parse"):
+            pass
+        with span("persist"):
+            with span("commit"):
+                pass
+        return {"ok": True}
+
+    @app.get("/plain")
+    async def plain():
+        return {"ok": True}
+
+    return app
+
+
+class TestSpans:
+    """Test cases for span recording."""
+
+    def test_span_without_trace_is_noop(self):
+        """Spans outside a request record nothing and do not fail."""
+        assert current_trace() is None
+
+        with span("orphan"):
+            pass
+
+        assert current_trace() is None
+
+    def test_nested_spans_use_dotted_paths(self):
+        """Nested spans are named by their path and repeated calls aggregate."""
+        trace, token = start_trace()
+        try:
+            with span("persist"):
+                with span("resolve_clients"):
+                    pass
+                with span("resolve_clients"):
+                    pass
+            with span("commit"):
+                pass
+        finally:
+            end_trace(token)
+
+        breakdown = trace.breakdown()
+        assert [path for path, _, _ in breakdown] == [
+            "persist",
+            "persist.resolve_clients",
+            "commit",
+        ]
+        assert dict((path, calls) for path, _, calls in breakdown)["persist.resolve_clients"] == 2
+        assert "persist.resolve_clients=" in trace.format_log()
+        assert trace.server_timing().startswith("persist;dur=")
+        assert "total;dur=" in trace.server_timing()
+
+    @pytest.mark.asyncio
+    async def test_traced_decorator_supports_coroutines(self):
+        """Both sync and async functions are recorded."""
+
+        @traced("sync_stage")
+        def sync_stage():
+            return 1
+
+        @traced("async_stage")
+        async def async_stage():
+            return 2
+
+        trace, token = start_trace()
+        try:
+            assert sync_stage() == 1
+            assert await async_stage() == 2
+        finally:
+            end_trace(token)
+
+        assert [path for path, _, _ in trace.breakdown()] == ["sync_stage", "async_stage"]
+
+    @pytest.mark.asyncio
+    async def test_run_io_records_spans_from_worker_threads(self):
+        """Spans inside the DB thread pool land in the request's trace."""
+        executor = WorkloadExecutor(parse_workers=0, db_workers=1, max_queue_depth=4)
+
+        def persist():
+            with span("session_insert"):
+                return "done"
+
+        trace, token = start_trace()
+        try:
+            assert await executor.run_io("persist_session", persist) == "done"
+        finally:
+            end_trace(token)
+            executor.shutdown()
+
+        assert [path for path, _, _ in trace.breakdown()] == [
+            "persist_session",
+            "persist_session.session_insert",
+        ]
+
+
+class TestTracingMiddleware:
+    """Test cases for TracingMiddleware."""
+
+    def test_server_timing_header(self):
+        """Stage timings are exposed in Server-Timing when enabled."""
+        client = TestClient(make_app(server_timing=True))
+
+        response = client.get("/work")
+
+        header = response.headers["server-timing"]
+        assert "parse;dur=" in header
+        assert "persist.commit;dur=" in header
+        assert "total;dur=" in header
+
+    def test_server_timing_disabled(self):
+        """No header is added unless enabled."""
+        client = TestClient(make_app(server_timing=False))
+
+        response = client.get("/work")
+
+        assert "server-timing" not in response.headers
+
+    def test_breakdown_logged(self, caplog):
+        """A traced request logs one breakdown line; untraced ones log nothing."""
+        client = TestClient(make_app(server_timing=False))
+
+        with caplog.at_level(logging.INFO, logger="src.monitoring.middleware"):
+            client.get("/work")
+            client.get("/plain")
+
+        messages = [
+            record.getMessage()
+            for record in caplog.records
+            if record.name == "src.monitoring.middleware"
+        ]
+        assert len(messages) == 1
+        assert messages[0].startswith("GET /work 200 in ")
+        assert "persist.commit=" in messages[0]
@@ -0,0 +1,88 @@
+"""
+Unit tests for the streaming speaker turn parser.
+"""
+
+import io
+from itertools import islice
+
+from src.services.transcript_parser import SpeakerTurn, iter_lines, iter_turns
+
+TRANSCRIPT = (
+    "Workshop recording, week 3\n"
+    "Coach Maria: Welcome back, everyone.\n"
+    "How did the week go?\n"
+    "\n"
+    "[00:01:15] Alex Johnson: Busy, but I kept the habit going.\n"
+    "Dr. Priya Patel:   Same here.\n"
+)
+
+
+def chunks(text, size):
+    return (text[start:start + size] for start in range(0, len(text), size))
+
+
+class TestIterTurns:
+    """Test cases for splitting transcripts into speaker turns."""
+
+    def test_turns_with_offsets(self):
+        """Each labelled line starts a turn; offsets cover its raw text."""
+        turns = list(iter_turns(TRANSCRIPT))
+
+        assert [(t.speaker, t.text) for t in turns] == [
+            (None, "Workshop recording, week 3"),
+            ("Maria", "Welcome back, everyone.\nHow did the week go?"),
+            ("Alex Johnson", "Busy, but I kept the habit going."),
+            ("Priya Patel", "Same here."),
+        ]
+        maria = turns[1]
+        assert TRANSCRIPT[maria.start_offset:maria.end_offset] == (
+            "Coach Maria: Welcome back, everyone.\nHow did the week go?"
+        )
+        assert TRANSCRIPT[turns[3].start_offset:turns[3].end_offset] == (
+            "Dr. Priya Patel:   Same here."
+        )
+
+    def test_chunk_boundaries_do_not_matter(self):
+        """Any chunking of the stream yields the same turns."""
+        expected = list(iter_turns(TRANSCRIPT))
+
+        for size in [1, 2, 7, 64]:
+            assert list(iter_turns(chunks(TRANSCRIPT, size))) == expected
+
+    def test_file_objects(self):
+        """Text file objects are read incrementally."""
+        assert list(iter_turns(io.StringIO(TRANSCRIPT))) == list(iter_turns(TRANSCRIPT))
+
+    def test_windows_line_endings(self):
+        """CRLF line endings give the same text, with offsets into the original."""
+        crlf = TRANSCRIPT.replace("\n", "\r\n")
+        turns = list(iter_turns(chunks(crlf, 5)))
+
+        assert [t.text for t in turns] == [t.text for t in iter_turns(TRANSCRIPT)]
+        assert crlf[turns[1].start_offset:turns[1].end_offset] == (
+            "Coach Maria: Welcome back, everyone.\r\nHow did the week go?"
+        )
+
+    def test_generic_labels_are_not_speakers(self):
+        """Labels participant extraction rejects continue the current turn."""
+        text = "Alex Johnson: Opening.\nUnknown: still Alex\n"
+
+        assert list(iter_turns(text)) == [
+            SpeakerTurn("Alex Johnson", 0, len(text) - 1, "Opening.\nUnknown: still Alex")
+        ]
+
+    def test_turns_are_yielded_lazily(self):
+        """Turns are produced before the stream ends."""
+        def endless():
+            turn = 0
+            while True:
+                yield f"Speaker {'AB'[turn % 2]}lex: turn {turn}\n"
+                turn += 1
+
+        first = list(islice(iter_turns(endless()), 3))
+
+        assert [t.text for t in first] == ["turn 0", "turn 1", "turn 2"]
+
+    def test_iter_lines_keeps_final_line(self):
+        """A last line without a terminator is still produced."""
+        assert list(iter_lines(chunks("a\nbc\r\nd", 2))) == [(0, "a"), (2, "bc"), (6, "d")]
@@ -0,0 +1,83 @@
+"""
+Unit tests for compressed transcript storage.
+"""
+
+import hashlib
+from datetime import date
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from src.models.core import SessionTranscript
+from src.repositories.sessions import SessionRepository
+from src.repositories.transcripts import (
+    TranscriptRepository,
+    compress_transcript,
+    decompress_transcript,
+)
+
+
+class TestTranscriptCompression:
+    """Test cases for transcript compression helpers."""
+
+    def test_round_trip(self):
+        """Compressed transcripts decompress to the original text."""
+        text = "Coach Maria: Café talk — how was the week?\n" * 500
+
+        transcript = compress_transcript(text)
+
+        assert decompress_transcript(transcript) == text
+        assert len(transcript.content) < transcript.original_size
+
+    def test_size_and_hash_describe_utf8_text(self):
+        """Size and hash are computed over the UTF-8 encoded text."""
+        text = "Naïve résumé"
+
+        transcript = compress_transcript(text)
+
+        assert transcript.original_size == len(text.encode("utf-8"))
+        assert transcript.content_hash == hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def test_unknown_compression_rejected(self):
+        """Transcripts with an unknown compression scheme are not decoded."""
+        transcript = compress_transcript("hello")
+        transcript.compression = "lz4"
+
+        with pytest.raises(ValueError):
+            decompress_transcript(transcript)
+
+
+class TestTranscriptStorage:
+    """Test cases for where transcripts are stored."""
+
+    def test_create_session_keeps_transcript_out_of_metadata(self):
+        """Session metadata no longer carries the transcript body."""
+        repo = SessionRepository(MagicMock())
+
+        session = repo.create_session(
+            coach_id=uuid4(),
+            transcript_text="Coach Maria: Hello there.",
+            session_date=date(2024, 1, 20),
+            notes="Kickoff",
+        )
+
+        assert session.session_metadata == {"notes": "Kickoff"}
+        assert decompress_transcript(session.transcript) == "Coach Maria: Hello there."
+
+    def test_get_transcript_text(self):
+        """The repository decompresses the stored transcript."""
+        db = MagicMock()
+        db.get.return_value = compress_transcript("stored text")
+
+        text = TranscriptRepository(db).get_transcript_text(uuid4())
+
+        assert text == "stored text"
+        assert db.get.call_args.args[0] is SessionTranscript
+
+    def test_missing_transcript(self):
+        """Sessions without a transcript return None."""
+        db = MagicMock()
+        db.get.return_value = None
+
+        assert TranscriptRepository(db).get_transcript_text(uuid4()) is None